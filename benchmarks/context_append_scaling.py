@@ -0,0 +1,153 @@
+"""Measure how appending to, querying, and comparing contexts scale with history length.
+
+Run from the repository root:
+
+    python benchmarks/context_append_scaling.py
+"""
+
+import argparse
+from collections.abc import Callable
+from functools import partial
+from time import perf_counter
+
+from azathoth.context import Context, ContextEvent
+
+
+def generate_events(event_count: int) -> tuple[ContextEvent, ...]:
+    """Return events spread across a handful of types and producers."""
+
+    return tuple(
+        ContextEvent(
+            event_type=f"step.{index % 8}.completed",
+            payload={"index": index},
+            producer=f"producer-{index % 3}",
+        )
+        for index in range(event_count)
+    )
+
+
+def append_all(events: tuple[ContextEvent, ...]) -> Context:
+    """Append every event to an empty context, one at a time."""
+
+    context = Context()
+
+    for event in events:
+        context = context.append(event)
+
+    return context
+
+
+def append_and_query(events: tuple[ContextEvent, ...]) -> Context:
+    """Append every event, looking up a type the history lacks after each.
+
+    A missing type is the worst case for a scan, which reads every event.
+    """
+
+    context = Context()
+
+    for event in events:
+        context = context.append(event)
+        context.latest("request.received")
+
+    return context
+
+
+def append_and_scan(events: tuple[ContextEvent, ...]) -> Context:
+    """Append every event, scanning for a type the history lacks after each."""
+
+    context = Context()
+
+    for event in events:
+        context = context.append(event)
+        next(
+            (
+                previous
+                for previous in reversed(context.events)
+                if previous.event_type == "request.received"
+            ),
+            None,
+        )
+
+    return context
+
+
+def copy_all(events: tuple[ContextEvent, ...]) -> Context:
+    """Append every event by copying the whole event tuple, as contexts once did."""
+
+    context = Context()
+
+    for event in events:
+        context = context.model_copy(update={"events": (*context.events, event)})
+
+    return context
+
+
+def compare_branches(base: Context, event: ContextEvent) -> bool:
+    """Compare two contexts appended from the same history, as step merges do."""
+
+    return base.append(event) == base.append(event)
+
+
+def measure(operation: Callable[[], object], *, repeats: int) -> float:
+    """Return the best wall-clock time of an operation, in milliseconds."""
+
+    best = float("inf")
+
+    for _ in range(repeats):
+        started = perf_counter()
+        operation()
+        best = min(best, perf_counter() - started)
+
+    return best * 1000.0
+
+
+def main() -> None:
+    """Print append, query, tuple-copy, and comparison times for growing histories.
+
+    Tuple copying and scanning are quadratic, so they are only measured
+    up to `--copy-limit` events.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=(1_000, 10_000, 100_000),
+    )
+    parser.add_argument("--copy-limit", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    headings = ("append", "tuple copy", "+ latest", "+ scan", "compare")
+
+    print(f"{'events':>8}  " + "  ".join(f"{heading:>11}" for heading in headings) + "  (ms)")
+
+    for event_count in arguments.sizes:
+        events = generate_events(event_count)
+        base = append_all(events)
+
+        quadratic = event_count <= arguments.copy_limit
+
+        timings = (
+            measure(partial(append_all, events), repeats=arguments.repeats),
+            measure(partial(copy_all, events), repeats=arguments.repeats) if quadratic else None,
+            measure(partial(append_and_query, events), repeats=arguments.repeats),
+            (
+                measure(partial(append_and_scan, events), repeats=arguments.repeats)
+                if quadratic
+                else None
+            ),
+            measure(partial(compare_branches, base, events[0]), repeats=arguments.repeats),
+        )
+
+        print(
+            f"{event_count:>8}  "
+            + "  ".join(
+                f"{'-':>11}" if timing is None else f"{timing:>11.2f}" for timing in timings
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
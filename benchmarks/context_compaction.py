@@ -0,0 +1,119 @@
+"""Measure how compaction bounds long-lived context histories.
+
+Run from the repository root:
+
+    python benchmarks/context_compaction.py
+"""
+
+import argparse
+from collections.abc import Callable
+from functools import partial
+from time import perf_counter
+
+from azathoth.context import Context, ContextCompactionPolicy, ContextEvent
+
+
+def generate_events(event_count: int) -> tuple[ContextEvent, ...]:
+    """Return agent-style events, each carrying a modest payload."""
+
+    return tuple(
+        ContextEvent(
+            event_type=f"step.{index % 8}.completed",
+            payload={"index": index, "text": f"observation {index} " * 8},
+            producer=f"producer-{index % 3}",
+        )
+        for index in range(event_count)
+    )
+
+
+def append_all(events: tuple[ContextEvent, ...]) -> Context:
+    """Append every event to an empty context, one at a time."""
+
+    context = Context()
+
+    for event in events:
+        context = context.append(event)
+
+    return context
+
+
+def append_and_compact(
+    events: tuple[ContextEvent, ...],
+    policy: ContextCompactionPolicy,
+    *,
+    interval: int,
+) -> Context:
+    """Append every event, compacting after each `interval` events."""
+
+    context = Context()
+
+    for position, event in enumerate(events, start=1):
+        context = context.append(event)
+
+        if position % interval == 0:
+            context = context.compact(policy)
+
+    return context
+
+
+def measure(operation: Callable[[], object], *, repeats: int) -> float:
+    """Return the best wall-clock time of an operation, in milliseconds."""
+
+    best = float("inf")
+
+    for _ in range(repeats):
+        started = perf_counter()
+        operation()
+        best = min(best, perf_counter() - started)
+
+    return best * 1000.0
+
+
+def main() -> None:
+    """Print retained events, payload sizes, and timings with and without compaction.
+
+    The compacted history keeps the latest `--keep` events of each type
+    and compacts every `--interval` appends. Its payload still grows with
+    the ids its checkpoint records.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=(1_000, 10_000, 100_000),
+    )
+    parser.add_argument("--keep", type=int, default=8)
+    parser.add_argument("--interval", type=int, default=1_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    policy = ContextCompactionPolicy(keep_latest_per_type=arguments.keep)
+
+    print(
+        f"{'events':>8}  {'kept':>6}  {'full KiB':>10}  {'compact KiB':>11}"
+        f"  {'append ms':>10}  {'+ compact ms':>12}"
+    )
+
+    for event_count in arguments.sizes:
+        events = generate_events(event_count)
+        full = append_all(events)
+        compacted = append_and_compact(events, policy, interval=arguments.interval)
+
+        append = measure(partial(append_all, events), repeats=arguments.repeats)
+        compact = measure(
+            partial(append_and_compact, events, policy, interval=arguments.interval),
+            repeats=arguments.repeats,
+        )
+
+        print(
+            f"{event_count:>8}  {len(compacted.events):>6}"
+            f"  {len(full.model_dump_json()) / 1024:>10.1f}"
+            f"  {len(compacted.model_dump_json()) / 1024:>11.1f}"
+            f"  {append:>10.1f}  {compact:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
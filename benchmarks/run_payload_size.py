@@ -0,0 +1,141 @@
+"""Measure how persisted workflow run payloads scale with step count.
+
+Run from the repository root:
+
+    python benchmarks/run_payload_size.py
+"""
+
+import argparse
+import asyncio
+from collections.abc import Callable
+from functools import partial
+from time import perf_counter
+from uuid import UUID
+
+from azathoth.context import Context, ContextEvent
+from azathoth.strategies import EventFieldStrategy, StrategyMetadata
+from azathoth.workflows import (
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowMetadata,
+    WorkflowRun,
+    WorkflowRunner,
+    WorkflowSchedulingMode,
+    WorkflowValueBinding,
+)
+
+WORKFLOW = WorkflowMetadata(
+    id=UUID(int=0),
+    name="Generated workflow",
+    description="A generated workflow for run payload measurements.",
+)
+
+
+def chained_candidate(step_count: int) -> WorkflowCandidate:
+    """Build a chain of steps that each record one produced event."""
+
+    strategy = EventFieldStrategy(
+        metadata=StrategyMetadata(
+            name="Read request",
+            description="Read the latest request.",
+        ),
+        event_type="request",
+        field_name="text",
+        output_event_type="request.read",
+    )
+    step_ids = tuple(UUID(int=position + 1) for position in range(step_count))
+
+    return WorkflowCandidate(
+        metadata=WORKFLOW,
+        steps=tuple(
+            WorkflowCandidateStep(
+                id=step_id,
+                strategy=strategy,
+                depends_on=step_ids[position - 1 : position],
+                outputs=(WorkflowValueBinding(name="value"),),
+            )
+            for position, step_id in enumerate(step_ids)
+        ),
+    )
+
+
+def full_payload_size(run: WorkflowRun) -> int:
+    """Return the payload size if every step execution recorded both contexts."""
+
+    return (
+        len(run.initial_context.model_dump_json())
+        + len(run.final_context.model_dump_json())
+        + sum(len(step.model_dump_json()) for step in run.steps)
+        + sum(
+            len(attempt.execution.final_context.model_dump_json())
+            for step in run.steps
+            for attempt in step.attempts
+            if attempt.execution is not None
+        )
+        + sum(
+            len(step.execution.final_context.model_dump_json())
+            for step in run.steps
+            if step.execution is not None
+        )
+    )
+
+
+def measure(operation: Callable[[], object], *, repeats: int) -> float:
+    """Return the best wall-clock time of an operation, in milliseconds."""
+
+    best = float("inf")
+
+    for _ in range(repeats):
+        started = perf_counter()
+        operation()
+        best = min(best, perf_counter() - started)
+
+    return best * 1000.0
+
+
+def main() -> None:
+    """Print run payload sizes and serialization times for growing workflows.
+
+    The full size counts what a run held before step executions shared
+    their contexts: every step's initial and final context, in full.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=(10, 100, 500),
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    runner = WorkflowRunner(scheduling=WorkflowSchedulingMode.SEQUENTIAL)
+    context = Context().append(
+        ContextEvent(
+            event_type="request",
+            payload={"text": "Why was I charged twice?"},
+            producer="benchmark",
+        )
+    )
+
+    print(f"{'steps':>7}  {'full KiB':>10}  {'shared KiB':>10}  {'dump ms':>10}  {'load ms':>10}")
+
+    for step_count in arguments.sizes:
+        run = asyncio.run(runner.run(chained_candidate(step_count), context))
+        payload = run.model_dump_json()
+
+        dump = measure(run.model_dump_json, repeats=arguments.repeats)
+        load = measure(
+            partial(WorkflowRun.model_validate_json, payload),
+            repeats=arguments.repeats,
+        )
+
+        print(
+            f"{step_count:>7}  {full_payload_size(run) / 1024:>10.1f}"
+            f"  {len(payload) / 1024:>10.1f}  {dump:>10.1f}  {load:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
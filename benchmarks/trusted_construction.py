@@ -0,0 +1,158 @@
+"""Measure what validating framework-built models costs a workflow run.
+
+Run from the repository root:
+
+    python benchmarks/trusted_construction.py
+"""
+
+import argparse
+import asyncio
+from collections.abc import Callable
+from functools import partial
+from time import perf_counter
+from uuid import UUID
+
+from pydantic import JsonValue
+
+from azathoth.context import Context
+from azathoth.models import strict_validation
+from azathoth.strategies import StrategyMetadata, StrategyOutcome
+from azathoth.workflows import (
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowInputBinding,
+    WorkflowMetadata,
+    WorkflowRunner,
+    WorkflowSchedulingMode,
+    WorkflowValueBinding,
+    WorkflowValueReference,
+)
+
+WORKFLOW = WorkflowMetadata(
+    id=UUID(int=0),
+    name="Generated workflow",
+    description="A generated workflow for validation cost measurements.",
+)
+
+
+class PrebuiltOutcomeStrategy:
+    """Return one prebuilt outcome, so timings cover only framework work."""
+
+    def __init__(self, output: JsonValue) -> None:
+        self._metadata = StrategyMetadata(
+            name="Produce records",
+            description="Produce a list of records.",
+        )
+        self._outcome = StrategyOutcome(output=output)
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Return the prebuilt outcome."""
+
+        return self._outcome
+
+
+def chained_candidate(step_count: int, *, records: int) -> WorkflowCandidate:
+    """Build a chain of steps that each bind the previous step's records."""
+
+    strategy = PrebuiltOutcomeStrategy(
+        [{"index": index, "text": f"record {index}"} for index in range(records)],
+    )
+    step_ids = tuple(UUID(int=position + 1) for position in range(step_count))
+
+    return WorkflowCandidate(
+        metadata=WORKFLOW,
+        steps=tuple(
+            WorkflowCandidateStep(
+                id=step_id,
+                strategy=strategy,
+                depends_on=step_ids[position - 1 : position],
+                inputs=tuple(
+                    WorkflowInputBinding(
+                        name="records",
+                        source=WorkflowValueReference(
+                            producer_step_id=dependency_id,
+                            name="records",
+                        ),
+                    )
+                    for dependency_id in step_ids[position - 1 : position]
+                ),
+                outputs=(WorkflowValueBinding(name="records"),),
+            )
+            for position, step_id in enumerate(step_ids)
+        ),
+    )
+
+
+def run_workflow(
+    loop: asyncio.AbstractEventLoop,
+    runner: WorkflowRunner,
+    candidate: WorkflowCandidate,
+) -> object:
+    """Run a workflow to completion on an existing event loop.
+
+    `asyncio.run` formats the finished run when it shuts down, which
+    costs more than large runs take to execute.
+    """
+
+    return loop.run_until_complete(runner.run(candidate, Context()))
+
+
+def measure(operation: Callable[[], object], *, repeats: int) -> float:
+    """Return the best wall-clock time of an operation, in milliseconds."""
+
+    best = float("inf")
+
+    for _ in range(repeats):
+        started = perf_counter()
+        operation()
+        best = min(best, perf_counter() - started)
+
+    return best * 1000.0
+
+
+def main() -> None:
+    """Print run times with trusted construction and with strict validation.
+
+    Each step outputs a list of records that the next step binds as an
+    input, so every step records the list three times: as its output, as
+    a workflow value, and in the next step's input event.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument(
+        "--records",
+        type=int,
+        nargs="+",
+        default=(1, 10, 100, 1_000),
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    runner = WorkflowRunner(scheduling=WorkflowSchedulingMode.SEQUENTIAL)
+    loop = asyncio.new_event_loop()
+
+    print(f"{'records':>8}  {'trusted':>10}  {'strict':>10}  (ms)")
+
+    for records in arguments.records:
+        candidate = chained_candidate(arguments.steps, records=records)
+        run = partial(run_workflow, loop, runner, candidate)
+
+        trusted = measure(run, repeats=arguments.repeats)
+
+        with strict_validation():
+            strict = measure(run, repeats=arguments.repeats)
+
+        print(f"{records:>8}  {trusted:>10.1f}  {strict:>10.1f}")
+
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""Measure how workflow graph validation and layering scale with step count.
+
+Run from the repository root:
+
+    python benchmarks/workflow_graph_scaling.py
+"""
+
+import argparse
+from collections.abc import Callable
+from functools import partial
+from random import Random
+from time import perf_counter
+from uuid import UUID
+
+from azathoth.prompting import PromptStrategySpec
+from azathoth.providers import ModelRequirements, Prompt
+from azathoth.strategies import EventFieldStrategy, StrategyMetadata
+from azathoth.workflows import (
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowExecutionPlan,
+    WorkflowInputBinding,
+    WorkflowMetadata,
+    WorkflowSpecification,
+    WorkflowStepSpecification,
+    WorkflowValueBinding,
+    WorkflowValueReference,
+)
+
+WORKFLOW = WorkflowMetadata(
+    id=UUID(int=0),
+    name="Generated workflow",
+    description="A generated workflow for graph scaling measurements.",
+)
+
+
+def generate_dependencies(
+    step_count: int,
+    *,
+    fan_in: int,
+    seed: int,
+) -> tuple[tuple[UUID, tuple[UUID, ...]], ...]:
+    """Return `(step_id, depends_on)` pairs for a random layered DAG."""
+
+    random = Random(seed)
+    step_ids = tuple(UUID(int=position + 1) for position in range(step_count))
+
+    return tuple(
+        (
+            step_id,
+            tuple(random.sample(step_ids[:position], min(position, fan_in))),
+        )
+        for position, step_id in enumerate(step_ids)
+    )
+
+
+def inputs(depends_on: tuple[UUID, ...]) -> tuple[WorkflowInputBinding, ...]:
+    """Bind the value of every dependency, so every reference is validated."""
+
+    return tuple(
+        WorkflowInputBinding(
+            name=f"input_{index}",
+            source=WorkflowValueReference(
+                producer_step_id=dependency_id,
+                name="value",
+            ),
+        )
+        for index, dependency_id in enumerate(depends_on)
+    )
+
+
+def specification_steps(
+    dependencies: tuple[tuple[UUID, tuple[UUID, ...]], ...],
+) -> tuple[WorkflowStepSpecification, ...]:
+    """Build prompt-backed specification steps over the generated graph."""
+
+    return tuple(
+        WorkflowStepSpecification(
+            id=step_id,
+            specification=PromptStrategySpec(
+                metadata=StrategyMetadata(
+                    name=f"Step {step_id.int}",
+                    description="Execute one generated step.",
+                ),
+                prompt=Prompt(text="Perform one generated step."),
+                model_requirements=ModelRequirements(),
+            ),
+            depends_on=depends_on,
+            inputs=inputs(depends_on),
+            outputs=(WorkflowValueBinding(name="value"),),
+        )
+        for step_id, depends_on in dependencies
+    )
+
+
+def candidate_steps(
+    dependencies: tuple[tuple[UUID, tuple[UUID, ...]], ...],
+) -> tuple[WorkflowCandidateStep, ...]:
+    """Build executable candidate steps over the generated graph."""
+
+    strategy = EventFieldStrategy(
+        metadata=StrategyMetadata(
+            name="Read request",
+            description="Read the latest request.",
+        ),
+        event_type="request",
+        field_name="text",
+    )
+
+    return tuple(
+        WorkflowCandidateStep(
+            id=step_id,
+            strategy=strategy,
+            depends_on=depends_on,
+            inputs=inputs(depends_on),
+            outputs=(WorkflowValueBinding(name="value"),),
+        )
+        for step_id, depends_on in dependencies
+    )
+
+
+def measure(operation: Callable[[], object], *, repeats: int) -> float:
+    """Return the best wall-clock time of an operation, in milliseconds."""
+
+    best = float("inf")
+
+    for _ in range(repeats):
+        started = perf_counter()
+        operation()
+        best = min(best, perf_counter() - started)
+
+    return best * 1000.0
+
+
+def main() -> None:
+    """Print validation, layering, and compilation times for growing workflows.
+
+    Steps are built once per size, so the timings cover only the
+    workflow-level graph work.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=(100, 500, 1000, 2000, 5000),
+    )
+    parser.add_argument("--fan-in", type=int, default=3)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    headings = ("specification", "spec layers", "candidate", "cand layers", "plan")
+
+    print(f"{'steps':>7}  " + "  ".join(f"{heading:>13}" for heading in headings) + "  (ms)")
+
+    for step_count in arguments.sizes:
+        dependencies = generate_dependencies(
+            step_count,
+            fan_in=arguments.fan_in,
+            seed=arguments.seed,
+        )
+        build_specification = partial(
+            WorkflowSpecification,
+            metadata=WORKFLOW,
+            steps=specification_steps(dependencies),
+        )
+        build_candidate = partial(
+            WorkflowCandidate,
+            metadata=WORKFLOW,
+            steps=candidate_steps(dependencies),
+        )
+        specification = build_specification()
+        candidate = build_candidate()
+
+        timings = tuple(
+            measure(operation, repeats=arguments.repeats)
+            for operation in (
+                build_specification,
+                specification.execution_layers,
+                build_candidate,
+                candidate.execution_layers,
+                partial(WorkflowExecutionPlan.compile, candidate),
+            )
+        )
+
+        print(f"{step_count:>7}  " + "  ".join(f"{timing:>13.1f}" for timing in timings))
+
+
+if __name__ == "__main__":
+    main()
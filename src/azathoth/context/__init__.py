@@ -1,5 +1,6 @@
 """Event-backed working context."""
 
-from azathoth.context.models import Context, ContextEvent
+from azathoth.context.compaction import ContextCompactionPolicy
+from azathoth.context.models import Context, ContextEvent, ContextEventSequence
 
-__all__ = ["Context", "ContextEvent"]
+__all__ = ["Context", "ContextCompactionPolicy", "ContextEvent", "ContextEventSequence"]
@@ -0,0 +1,33 @@
+"""Policies for compacting long-lived contexts."""
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class ContextCompactionPolicy(BaseModel):
+    """Select the events that compacting a context removes.
+
+    `keep_latest_per_type` keeps only the most recent events of each
+    type. `drop_consumed_producers` removes events from the named
+    producers once a later event names them as its provenance. An event
+    is removed if either rule removes it.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    keep_latest_per_type: int | None = Field(default=None, ge=1)
+    drop_consumed_producers: tuple[str, ...] = ()
+
+    @model_validator(mode="after")
+    def validate_rules(self) -> "ContextCompactionPolicy":
+        """Ensure the policy removes something."""
+
+        if self.keep_latest_per_type is None and not self.drop_consumed_producers:
+            raise ValueError(
+                "Context compaction policies require keep_latest_per_type "
+                "or drop_consumed_producers."
+            )
+
+        if any(not producer for producer in self.drop_consumed_producers):
+            raise ValueError("Context compaction producers cannot be empty.")
+
+        return self
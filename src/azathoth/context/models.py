@@ -1,9 +1,23 @@
 """Event-backed context models used during Azathoth executions."""
 
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import UTC, datetime
+from typing import Annotated, Any, TypeAlias, overload
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, ConfigDict, Field, JsonValue
+from pydantic import BaseModel, ConfigDict, Field, GetCoreSchemaHandler, JsonValue
+from pydantic_core import core_schema
+
+from azathoth.context.compaction import ContextCompactionPolicy
+from azathoth.models import construct_trusted
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+
+_Node: TypeAlias = tuple[Any, ...]
 
 
 def utc_now() -> datetime:
@@ -26,28 +40,613 @@ class ContextEvent(BaseModel):
     occurred_at: datetime = Field(default_factory=utc_now)
 
 
+def _push_leaf(
+    node: _Node | None,
+    leaf: _Node,
+    *,
+    level: int,
+    index: int,
+) -> _Node:
+    """Return a copy of a trie node with a full leaf stored at an index.
+
+    Only nodes on the path to the leaf are copied. Every other node is
+    shared with the original trie.
+    """
+
+    if level == 0:
+        return leaf
+
+    slot = (index >> level) & _MASK
+    children = node if node is not None else ()
+    child = children[slot] if slot < len(children) else None
+
+    return (
+        *children[:slot],
+        _push_leaf(child, leaf, level=level - _BITS, index=index),
+        *children[slot + 1 :],
+    )
+
+
+def _leaves(
+    node: _Node,
+    *,
+    level: int,
+    reverse: bool = False,
+) -> Iterator[_Node]:
+    """Yield the leaves below a trie node in order, or in reverse order."""
+
+    if level == 0:
+        yield node
+        return
+
+    for child in reversed(node) if reverse else node:
+        yield from _leaves(child, level=level - _BITS, reverse=reverse)
+
+
+def _nodes_equal(
+    left: _Node,
+    right: _Node,
+    *,
+    level: int,
+) -> bool:
+    """Return whether two trie nodes hold equal events.
+
+    Subtrees both tries share are equal without being compared.
+    """
+
+    if left is right:
+        return True
+
+    if len(left) != len(right):
+        return False
+
+    if level == 0:
+        return left == right
+
+    return all(
+        _nodes_equal(left_child, right_child, level=level - _BITS)
+        for left_child, right_child in zip(left, right, strict=True)
+    )
+
+
+class ContextEventSequence(Sequence[ContextEvent]):
+    """An immutable sequence of events that shares structure with its ancestors.
+
+    Events are stored in a persistent 32-way trie plus a tail leaf of up
+    to 32 events. Appending copies the tail, and every 32 events the path
+    to a new leaf, so a sequence and every sequence appended from it share
+    their earlier events. Appends and indexing take time proportional to
+    the trie depth, which grows by one every 32-fold.
+
+    The shape of a sequence depends only on its length, so sequences
+    sharing structure compare without visiting the events they share.
+    Sequences compare and hash like the tuple of their events.
+
+    Type, producer, and time queries use indexes built on first use. A
+    sequence appended from an indexed one extends its ancestor's indexes
+    with the events appended since, rather than rebuilding them. Indexing
+    a sequence also indexes the unindexed sequences it was appended from
+    within its tail, so a context that is only ever queried through the
+    branches appended from it still gets indexed.
+    """
+
+    __slots__ = (
+        "_count",
+        "_hash",
+        "_index",
+        "_indexed",
+        "_level",
+        "_parent",
+        "_root",
+        "_tail",
+    )
+
+    def __init__(
+        self,
+        events: Iterable[ContextEvent] = (),
+    ) -> None:
+        items = tuple(events)
+        leaves: list[_Node] = [
+            items[start : start + _WIDTH] for start in range(0, len(items), _WIDTH)
+        ]
+        tail = leaves.pop() if leaves else ()
+        level = _BITS
+
+        while len(leaves) > _WIDTH:
+            leaves = [
+                tuple(leaves[start : start + _WIDTH]) for start in range(0, len(leaves), _WIDTH)
+            ]
+            level += _BITS
+
+        self._count = len(items)
+        self._level = level
+        self._root: _Node = tuple(leaves)
+        self._tail: _Node = tail
+        self._hash: int | None = None
+        self._index: _EventIndex | None = None
+        self._indexed: ContextEventSequence | None = None
+        self._parent: ContextEventSequence | None = None
+
+    @classmethod
+    def _from_trie(
+        cls,
+        *,
+        count: int,
+        level: int,
+        root: _Node,
+        tail: _Node,
+        indexed: "ContextEventSequence | None",
+        parent: "ContextEventSequence | None" = None,
+    ) -> "ContextEventSequence":
+        """Return a sequence over an existing trie without rebuilding it."""
+
+        sequence = cls.__new__(cls)
+        sequence._count = count
+        sequence._level = level
+        sequence._root = root
+        sequence._tail = tail
+        sequence._hash = None
+        sequence._index = None
+        sequence._indexed = indexed
+        sequence._parent = parent
+
+        return sequence
+
+    def append(self, event: ContextEvent) -> "ContextEventSequence":
+        """Return a new sequence ending with the additional event."""
+
+        #
+        # An unindexed parent is kept only while appends fill its tail,
+        # so appended sequences never hold more than one tail's worth of
+        # ancestors alive. Beyond that, only the nearest indexed ancestor
+        # is kept.
+        #
+        indexed = self if self._index is not None else self._indexed
+
+        if len(self._tail) < _WIDTH:
+            return self._from_trie(
+                count=self._count + 1,
+                level=self._level,
+                root=self._root,
+                tail=(*self._tail, event),
+                indexed=indexed,
+                parent=self if self._index is None else None,
+            )
+
+        #
+        # A full tail becomes a leaf of the trie. A full trie first grows
+        # a new root above the old one.
+        #
+        index = self._count - _WIDTH
+        level = self._level
+        root = self._root
+
+        if index == 1 << (level + _BITS):
+            root = (root,)
+            level += _BITS
+
+        return self._from_trie(
+            count=self._count + 1,
+            level=level,
+            root=_push_leaf(root, self._tail, level=level, index=index),
+            tail=(event,),
+            indexed=indexed,
+        )
+
+    def by_type(self, event_type: str) -> "ContextEventSequence":
+        """Return the events of one type, in sequence order."""
+
+        return self._indexes().by_type.get(event_type, _NO_EVENTS)
+
+    def by_producer(self, producer: str) -> "ContextEventSequence":
+        """Return the events of one producer, in sequence order."""
+
+        return self._indexes().by_producer.get(producer, _NO_EVENTS)
+
+    def between(
+        self,
+        start: datetime,
+        end: datetime,
+    ) -> tuple[ContextEvent, ...]:
+        """Return events that occurred from `start` up to, but excluding, `end`.
+
+        Events are returned in occurrence order. Events that occurred at
+        the same time keep their sequence order.
+        """
+
+        timeline = self._timeline()
+
+        first = bisect_left(timeline, start, key=_occurred_at)
+        last = bisect_left(timeline, end, lo=first, key=_occurred_at)
+
+        return timeline[first:last]
+
+    def _indexes(self) -> "_EventIndex":
+        """Return the type and producer indexes, building them on first use."""
+
+        if self._index is None:
+            ancestor = self._parent if self._parent is not None else self._indexed
+            ancestor_index = ancestor._indexes() if ancestor is not None else None
+
+            self._index = (
+                ancestor_index.extended(self._between(ancestor_index.count, self._count))
+                if ancestor_index is not None
+                else _EventIndex().extended(self)
+            )
+            self._indexed = None
+            self._parent = None
+
+        return self._index
+
+    def _timeline(self) -> "ContextEventSequence":
+        """Return every event in occurrence order, extending the time index.
+
+        Events appended in occurrence order extend the index. An event
+        that occurred before the latest indexed one makes the next time
+        query sort the whole sequence again.
+        """
+
+        index = self._indexes()
+        timeline = index.timeline
+
+        if timeline is not None and len(timeline) < self._count:
+            for event in self._between(len(timeline), self._count):
+                if timeline and event.occurred_at < timeline[-1].occurred_at:
+                    timeline = None
+                    break
+
+                timeline = timeline.append(event)
+
+        if timeline is None:
+            timeline = ContextEventSequence(sorted(self, key=_occurred_at))
+
+        index.timeline = timeline
+
+        return timeline
+
+    def _leaf(self, index: int) -> tuple[_Node, int]:
+        """Return the leaf holding an index and the index of its first event."""
+
+        tail_start = self._count - len(self._tail)
+
+        if index >= tail_start:
+            return self._tail, tail_start
+
+        node = self._root
+
+        for level in range(self._level, 0, -_BITS):
+            node = node[(index >> level) & _MASK]
+
+        return node, index & ~_MASK
+
+    def _between(
+        self,
+        start: int,
+        stop: int,
+    ) -> Iterator[ContextEvent]:
+        """Yield the events from `start` up to, but excluding, `stop`."""
+
+        index = start
+
+        while index < stop:
+            leaf, leaf_start = self._leaf(index)
+            events = leaf[index - leaf_start : stop - leaf_start]
+
+            yield from events
+
+            index += len(events)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> ContextEvent: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[ContextEvent, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> ContextEvent | tuple[ContextEvent, ...]:
+        """Return one event, or a tuple of the events in a slice."""
+
+        if isinstance(index, slice):
+            positions = range(self._count)[index]
+
+            if positions.step == 1:
+                return tuple(self._between(positions.start, positions.stop))
+
+            return tuple(self[position] for position in positions)
+
+        if index < 0:
+            index += self._count
+
+        if not 0 <= index < self._count:
+            raise IndexError("Context event index out of range.")
+
+        leaf, leaf_start = self._leaf(index)
+
+        event: ContextEvent = leaf[index - leaf_start]
+
+        return event
+
+    def __iter__(self) -> Iterator[ContextEvent]:
+        for leaf in _leaves(self._root, level=self._level):
+            yield from leaf
+
+        yield from self._tail
+
+    def __reversed__(self) -> Iterator[ContextEvent]:
+        yield from reversed(self._tail)
+
+        for leaf in _leaves(self._root, level=self._level, reverse=True):
+            yield from reversed(leaf)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ContextEventSequence):
+            return (
+                self is other
+                or self._count == other._count
+                and self._tail == other._tail
+                and _nodes_equal(self._root, other._root, level=self._level)
+            )
+
+        if isinstance(other, tuple):
+            return len(other) == self._count and all(
+                event == other_event for event, other_event in zip(self, other, strict=True)
+            )
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({tuple(self)!r})"
+
+    def __reduce__(self) -> tuple[type["ContextEventSequence"], tuple[tuple[ContextEvent, ...]]]:
+        return (type(self), (tuple(self),))
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls,
+        source_type: Any,
+        handler: GetCoreSchemaHandler,
+    ) -> core_schema.CoreSchema:
+        """Validate sequences of events and serialize them as tuples."""
+
+        events_schema = handler.generate_schema(tuple[ContextEvent, ...])
+        from_events = core_schema.no_info_after_validator_function(cls, events_schema)
+
+        return core_schema.json_or_python_schema(
+            json_schema=from_events,
+            python_schema=core_schema.union_schema(
+                [core_schema.is_instance_schema(cls), from_events],
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                tuple,
+                return_schema=events_schema,
+            ),
+        )
+
+
+def _occurred_at(event: ContextEvent) -> datetime:
+    """Return when an event occurred."""
+
+    return event.occurred_at
+
+
+_NO_EVENTS = ContextEventSequence()
+
+_COMPACTED_EVENT_TYPE = "context.compacted"
+_COMPACTION_PRODUCER = "context-compaction"
+
+
+def _is_checkpoint(event: ContextEvent) -> bool:
+    """Return whether an event records an earlier compaction."""
+
+    return event.event_type == _COMPACTED_EVENT_TYPE and event.producer == _COMPACTION_PRODUCER
+
+
+def _checkpoint(
+    removed: Sequence[ContextEvent],
+    checkpoints: Sequence[ContextEvent],
+) -> ContextEvent:
+    """Return one event recording removed events and earlier checkpoints.
+
+    The checkpoint lists the ids of every event compacted so far, in
+    history order, and counts them by type.
+    """
+
+    event_ids: list[JsonValue] = []
+    event_counts: Counter[str] = Counter()
+
+    for checkpoint in checkpoints:
+        earlier_ids = checkpoint.payload.get("event_ids")
+        earlier_counts = checkpoint.payload.get("event_counts")
+
+        if isinstance(earlier_ids, list):
+            event_ids.extend(earlier_ids)
+
+        if isinstance(earlier_counts, dict):
+            event_counts.update(
+                {
+                    event_type: count
+                    for event_type, count in earlier_counts.items()
+                    if isinstance(count, int)
+                }
+            )
+
+    event_ids.extend(str(event.id) for event in removed)
+    event_counts.update(event.event_type for event in removed)
+
+    return construct_trusted(
+        ContextEvent,
+        event_type=_COMPACTED_EVENT_TYPE,
+        payload={
+            "event_ids": event_ids,
+            "event_counts": dict(event_counts),
+        },
+        producer=_COMPACTION_PRODUCER,
+        occurred_at=max(event.occurred_at for event in (*checkpoints, *removed)),
+    )
+
+
+class _EventIndex:
+    """Events of one sequence grouped by type and producer, and ordered by time.
+
+    Each group is itself a `ContextEventSequence`, so extending an index
+    shares every group with the index it extends.
+    """
+
+    __slots__ = ("by_producer", "by_type", "count", "timeline")
+
+    def __init__(
+        self,
+        *,
+        count: int = 0,
+        by_type: dict[str, ContextEventSequence] | None = None,
+        by_producer: dict[str, ContextEventSequence] | None = None,
+        timeline: ContextEventSequence | None = _NO_EVENTS,
+    ) -> None:
+        self.count = count
+        self.by_type = by_type if by_type is not None else {}
+        self.by_producer = by_producer if by_producer is not None else {}
+
+        #
+        # The first events of the sequence in occurrence order, extended
+        # by time queries. None when they must be sorted again.
+        #
+        self.timeline = timeline
+
+    def extended(
+        self,
+        events: Iterable[ContextEvent],
+    ) -> "_EventIndex":
+        """Return a new index that also covers events appended after these."""
+
+        by_type = dict(self.by_type)
+        by_producer = dict(self.by_producer)
+        count = self.count
+
+        for event in events:
+            by_type[event.event_type] = by_type.get(event.event_type, _NO_EVENTS).append(event)
+            by_producer[event.producer] = by_producer.get(event.producer, _NO_EVENTS).append(event)
+            count += 1
+
+        return _EventIndex(
+            count=count,
+            by_type=by_type,
+            by_producer=by_producer,
+            timeline=self.timeline,
+        )
+
+
 class Context(BaseModel):
     """An immutable, ordered history of context events."""
 
     model_config = ConfigDict(frozen=True)
 
-    events: tuple[ContextEvent, ...] = ()
+    events: Annotated[Sequence[ContextEvent], ContextEventSequence] = Field(
+        default_factory=ContextEventSequence,
+    )
+
+    def _sequence(self) -> ContextEventSequence:
+        """Return the events as a sequence, wrapping models built without validation."""
+
+        if isinstance(self.events, ContextEventSequence):
+            return self.events
+
+        return ContextEventSequence(self.events)
 
     def append(self, event: ContextEvent) -> "Context":
-        """Return a new context containing the additional event."""
+        """Return a new context containing the additional event.
+
+        The new context shares every existing event with this one, so
+        appending does not copy the history.
+        """
+
+        return self.model_copy(update={"events": self._sequence().append(event)})
+
+    def compact(self, policy: ContextCompactionPolicy) -> "Context":
+        """Return a context without the events the policy removes.
+
+        Removed events are replaced by one `context.compacted` checkpoint
+        event at the start of the context. Its payload lists the ids of
+        the removed events and counts them by type, so events that name
+        them as provenance remain traceable. Compacting again folds the
+        existing checkpoint into the new one.
+
+        Returns this context when the policy removes nothing.
+        """
+
+        events = self._sequence()
+        consumed = (
+            {event.provenance for event in events if event.provenance is not None}
+            if policy.drop_consumed_producers
+            else set()
+        )
+        kept_by_type: dict[str, int] = {}
+        retained: list[ContextEvent] = []
+        removed: list[ContextEvent] = []
+        checkpoints: list[ContextEvent] = []
+
+        for event in reversed(events):
+            if _is_checkpoint(event):
+                checkpoints.append(event)
+                continue
+
+            dropped = event.producer in policy.drop_consumed_producers and str(event.id) in consumed
+            surplus = (
+                policy.keep_latest_per_type is not None
+                and kept_by_type.get(event.event_type, 0) >= policy.keep_latest_per_type
+            )
 
-        return self.model_copy(update={"events": (*self.events, event)})
+            if dropped or surplus:
+                removed.append(event)
+            else:
+                kept_by_type[event.event_type] = kept_by_type.get(event.event_type, 0) + 1
+                retained.append(event)
+
+        if not removed:
+            return self
+
+        checkpoint = _checkpoint(removed[::-1], checkpoints[::-1])
+
+        return self.model_copy(
+            update={"events": ContextEventSequence((checkpoint, *reversed(retained)))},
+        )
 
     def by_type(self, event_type: str) -> tuple[ContextEvent, ...]:
         """Return all events matching the supplied event type."""
 
-        return tuple(event for event in self.events if event.event_type == event_type)
+        return tuple(self._sequence().by_type(event_type))
+
+    def by_producer(self, producer: str) -> tuple[ContextEvent, ...]:
+        """Return all events contributed by the supplied producer."""
+
+        return tuple(self._sequence().by_producer(producer))
+
+    def between(
+        self,
+        start: datetime,
+        end: datetime,
+    ) -> tuple[ContextEvent, ...]:
+        """Return events that occurred from `start` up to, but excluding, `end`.
+
+        Events are returned in occurrence order, which may differ from the
+        order they were appended in.
+        """
+
+        if end <= start:
+            return ()
+
+        return self._sequence().between(start, end)
 
     def latest(self, event_type: str) -> ContextEvent | None:
         """Return the most recent matching event, if one exists."""
 
-        for event in reversed(self.events):
-            if event.event_type == event_type:
-                return event
+        events = self._sequence().by_type(event_type)
 
-        return None
+        return events[-1] if events else None
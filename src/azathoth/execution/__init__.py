@@ -1,9 +1,10 @@
 """Strategy execution services and results."""
 
 from azathoth.execution.executor import StrategyExecutor
-from azathoth.execution.models import ExecutionResult
+from azathoth.execution.models import ExecutionResult, shared_context_events
 
 __all__ = [
     "ExecutionResult",
     "StrategyExecutor",
+    "shared_context_events",
 ]
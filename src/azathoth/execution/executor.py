@@ -6,6 +6,7 @@ from typing import TypeAlias
 
 from azathoth.context import Context, ContextEvent
 from azathoth.execution.models import ExecutionResult
+from azathoth.models import construct_trusted
 from azathoth.strategies import Strategy
 
 Clock: TypeAlias = Callable[[], datetime]
@@ -44,11 +45,7 @@ class StrategyExecutor:
             occurred_at=started_at,
         )
 
-        execution_context = context.append(started_event)
-        outcome = await strategy.run(execution_context)
-
-        for event in outcome.events:
-            execution_context = execution_context.append(event)
+        outcome = await strategy.run(context.append(started_event))
 
         completed_at = self._clock()
 
@@ -63,16 +60,15 @@ class StrategyExecutor:
             occurred_at=completed_at,
         )
 
-        final_context = execution_context.append(completed_event)
-
-        return ExecutionResult(
+        return construct_trusted(
+            ExecutionResult,
             strategy_id=metadata.id,
             strategy_name=metadata.name,
             strategy_version=metadata.version,
             output=outcome.output,
             metrics=outcome.metrics,
             initial_context=context,
-            final_context=final_context,
+            produced_events=(started_event, *outcome.events, completed_event),
             started_at=started_at,
             completed_at=completed_at,
         )
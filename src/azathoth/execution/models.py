@@ -1,16 +1,39 @@
 """Models describing completed Azathoth strategy executions."""
 
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, JsonValue
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    JsonValue,
+    SerializerFunctionWrapHandler,
+    field_serializer,
+    model_validator,
+)
 
-from azathoth.context import Context
+from azathoth.context import Context, ContextEvent
 from azathoth.strategies import StrategyExecutionMetrics
 
+#
+# The context whose events executions serialize by reference, while a
+# `shared_context_events` block is active.
+#
+_shared_context: ContextVar[Context | None] = ContextVar("_shared_context", default=None)
+
 
 class ExecutionResult(BaseModel):
-    """The complete recorded result of executing one strategy."""
+    """The complete recorded result of executing one strategy.
+
+    A result records the context its strategy started from and only the
+    events the execution produced. The final context is rebuilt from
+    them on access, so results share their starting context's storage
+    rather than holding a second copy of it.
+    """
 
     model_config = ConfigDict(frozen=True)
 
@@ -20,6 +43,135 @@ class ExecutionResult(BaseModel):
     output: JsonValue
     metrics: StrategyExecutionMetrics | None = None
     initial_context: Context
-    final_context: Context
+    produced_events: tuple[ContextEvent, ...] = ()
     started_at: datetime
     completed_at: datetime
+
+    @model_validator(mode="before")
+    @classmethod
+    def _restore_contexts(cls, data: Any) -> Any:
+        """Accept final contexts and restore initial contexts that share events.
+
+        Results were once recorded with a full final context, which must
+        extend the initial context. That form is deprecated and accepted
+        only so persisted payloads keep loading. Initial contexts
+        serialized by reference need the context they share events with.
+        """
+
+        if not isinstance(data, dict):
+            return data
+
+        initial = data.get("initial_context")
+
+        if isinstance(initial, dict) and "shared_event_count" in initial:
+            shared = _shared_context.get()
+
+            if shared is None:
+                raise ValueError(
+                    "Execution contexts that share events can only be restored "
+                    "alongside the context they share."
+                )
+
+            shared_event_count = initial["shared_event_count"]
+
+            if not isinstance(shared_event_count, int) or not (
+                0 <= shared_event_count <= len(shared.events)
+            ):
+                raise ValueError("Shared execution context events are out of range.")
+
+            data = {
+                **data,
+                "initial_context": Context(
+                    events=(
+                        *shared.events[:shared_event_count],
+                        *initial.get("events", ()),
+                    ),
+                ),
+            }
+
+        if "final_context" not in data:
+            return data
+
+        if "produced_events" in data:
+            raise ValueError("Execution results record either produced events or a final context.")
+
+        initial_context = Context.model_validate(data.get("initial_context"))
+        final_context = Context.model_validate(data["final_context"])
+        initial_event_count = len(initial_context.events)
+
+        if final_context.events[:initial_event_count] != initial_context.events:
+            raise ValueError("Execution final contexts must extend their initial context.")
+
+        return {key: value for key, value in data.items() if key != "final_context"} | {
+            "initial_context": initial_context,
+            "produced_events": final_context.events[initial_event_count:],
+        }
+
+    @field_serializer("initial_context", mode="wrap")
+    def _serialize_initial_context(
+        self,
+        initial_context: Context,
+        handler: SerializerFunctionWrapHandler,
+    ) -> Any:
+        """Write events shared with an active shared context as a count."""
+
+        shared = _shared_context.get()
+
+        if shared is None:
+            return handler(initial_context)
+
+        shared_event_count = _shared_prefix_length(initial_context.events, shared.events)
+
+        return handler(Context(events=initial_context.events[shared_event_count:])) | {
+            "shared_event_count": shared_event_count,
+        }
+
+    @property
+    def final_context(self) -> Context:
+        """Return the initial context with every produced event appended."""
+
+        final_context = self.initial_context
+
+        for event in self.produced_events:
+            final_context = final_context.append(event)
+
+        return final_context
+
+
+@contextmanager
+def shared_context_events(context: Context) -> Iterator[None]:
+    """Serialize and restore execution results relative to a shared context.
+
+    Within the block, an execution result writes the leading events its
+    initial context shares with `context` as a count rather than in
+    full, and restores them from `context` when validated. Workflow runs
+    share their final context this way, since steps usually start from a
+    prefix of it.
+    """
+
+    token = _shared_context.set(context)
+
+    try:
+        yield
+    finally:
+        _shared_context.reset(token)
+
+
+def _shared_prefix_length(
+    events: Sequence[ContextEvent],
+    shared: Sequence[ContextEvent],
+) -> int:
+    """Return how many leading events two event sequences have in common."""
+
+    if events is shared:
+        return len(events)
+
+    count = 0
+
+    for event, shared_event in zip(events, shared, strict=False):
+        if event is not shared_event and event != shared_event:
+            break
+
+        count += 1
+
+    return count
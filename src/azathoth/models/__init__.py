@@ -0,0 +1,13 @@
+"""Shared construction helpers for Azathoth models."""
+
+from azathoth.models.trusted import (
+    construct_trusted,
+    strict_validation,
+    strict_validation_enabled,
+)
+
+__all__ = [
+    "construct_trusted",
+    "strict_validation",
+    "strict_validation_enabled",
+]
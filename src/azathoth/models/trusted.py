@@ -0,0 +1,152 @@
+"""Construction of models the framework builds from values it already trusts."""
+
+import os
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+from functools import cache
+from typing import Any, TypeVar, cast
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+#
+# Strict validation is off unless enabled for a block, or for the whole
+# process with AZATHOTH_STRICT_VALIDATION=1.
+#
+_strict_validation: ContextVar[bool] = ContextVar(
+    "_strict_validation",
+    default=os.environ.get("AZATHOTH_STRICT_VALIDATION") == "1",
+)
+
+
+@contextmanager
+def strict_validation(enabled: bool = True) -> Iterator[None]:
+    """Fully validate trusted constructions within the block.
+
+    Strict validation is a debugging aid. It catches framework code that
+    builds a model from values the model would reject.
+    """
+
+    token = _strict_validation.set(enabled)
+
+    try:
+        yield
+    finally:
+        _strict_validation.reset(token)
+
+
+def strict_validation_enabled() -> bool:
+    """Return whether trusted constructions are currently fully validated."""
+
+    return _strict_validation.get()
+
+
+def construct_trusted(model: type[ModelT], /, **values: Any) -> ModelT:
+    """Build a model from values the framework produced itself.
+
+    Field validation and coercion are skipped, so values must already
+    have their field types. Checks that span fields, the model's `after`
+    validators, still run, so a trusted model keeps its invariants. With
+    strict validation enabled, the model is validated as usual.
+
+    Values that come from users, providers, or storage must be validated
+    instead.
+    """
+
+    if _strict_validation.get():
+        return model(**values)
+
+    plan = _construction_plan(model)
+
+    if plan is None:
+        return model(**values)
+
+    fields: dict[str, Any] = {}
+
+    for name, default, factory in plan.fields:
+        if name in values:
+            fields[name] = values[name]
+        elif factory is not None:
+            fields[name] = factory()
+        elif default is not PydanticUndefined:
+            fields[name] = default
+
+    #
+    # This is what `model_construct` does, without the per-call alias and
+    # default-factory signature handling that makes it slower than
+    # validating small models.
+    #
+    instance = model.__new__(model)
+    _object_setattr(instance, "__dict__", fields)
+    _object_setattr(instance, "__pydantic_fields_set__", set(values))
+    _object_setattr(instance, "__pydantic_extra__", None)
+    _object_setattr(instance, "__pydantic_private__", None)
+
+    for name in plan.checks:
+        getattr(instance, name)()
+
+    return instance
+
+
+@dataclass(frozen=True)
+class _ConstructionPlan:
+    """How to build one model type without validating its fields."""
+
+    fields: tuple[tuple[str, Any, Callable[[], Any] | None], ...]
+    checks: tuple[str, ...]
+
+
+_object_setattr = object.__setattr__
+
+#
+# Defaults that are shared between instances rather than copied.
+#
+_IMMUTABLE_DEFAULTS = (bool, bytes, Enum, float, frozenset, int, str, tuple, type(None))
+
+
+@cache
+def _construction_plan(model: type[BaseModel]) -> _ConstructionPlan | None:
+    """Return how to construct a model, or `None` if it must be validated.
+
+    Models with aliases, private attributes, extra fields, or post-init
+    hooks, and fields whose defaults are mutable or depend on other
+    fields, are always validated.
+    """
+
+    if (
+        model.__pydantic_root_model__
+        or model.__pydantic_post_init__
+        or model.__private_attributes__
+        or model.model_config.get("extra") == "allow"
+    ):
+        return None
+
+    fields: list[tuple[str, Any, Callable[[], Any] | None]] = []
+
+    for name, field in model.__pydantic_fields__.items():
+        if field.alias is not None or field.validation_alias is not None:
+            return None
+
+        if field.default_factory is not None:
+            if field.default_factory_takes_validated_data:
+                return None
+
+            fields.append((name, PydanticUndefined, cast(Callable[[], Any], field.default_factory)))
+        elif field.is_required() or isinstance(field.default, _IMMUTABLE_DEFAULTS):
+            fields.append((name, field.default, None))
+        else:
+            return None
+
+    return _ConstructionPlan(
+        fields=tuple(fields),
+        checks=tuple(
+            name
+            for name, decorator in model.__pydantic_decorators__.model_validators.items()
+            if decorator.info.mode == "after"
+        ),
+    )
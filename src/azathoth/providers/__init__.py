@@ -2,6 +2,10 @@
 
 from azathoth.providers.catalog import ModelCatalog
 from azathoth.providers.catalog_loader import ModelCatalogLoader
+from azathoth.providers.deadline import (
+    provider_deadline,
+    remaining_provider_time,
+)
 from azathoth.providers.deterministic import DeterministicLanguageModel
 from azathoth.providers.exceptions import (
     ModelExecutionError,
@@ -57,5 +61,7 @@ __all__ = [
     "Prompt",
     "SQLiteModelRepository",
     "UnsupportedModelRequestError",
+    "provider_deadline",
+    "remaining_provider_time",
     "require_model_repository",
 ]
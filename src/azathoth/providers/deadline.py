@@ -0,0 +1,44 @@
+"""Deadlines propagated from callers to provider requests."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+
+_deadline: ContextVar[float | None] = ContextVar(
+    "azathoth_provider_deadline",
+    default=None,
+)
+
+
+@contextmanager
+def provider_deadline(
+    deadline: float | None,
+) -> Iterator[None]:
+    """Bound provider requests in this context by a `time.monotonic` deadline.
+
+    Nested deadlines can only tighten the deadline already in effect.
+    """
+
+    current = _deadline.get()
+
+    if deadline is None or (current is not None and current <= deadline):
+        deadline = current
+
+    token = _deadline.set(deadline)
+
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_provider_time() -> float | None:
+    """Return the seconds left before the active provider deadline."""
+
+    deadline = _deadline.get()
+
+    if deadline is None:
+        return None
+
+    return deadline - monotonic()
@@ -5,6 +5,7 @@ from time import perf_counter
 import httpx
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
+from azathoth.providers.deadline import remaining_provider_time
 from azathoth.providers.exceptions import ModelExecutionError
 from azathoth.providers.models import ModelResponse, Prompt
 from azathoth.providers.openrouter_models import OpenRouterConfiguration
@@ -70,10 +71,27 @@ class OpenRouterLanguageModel:
     ) -> ModelResponse:
         """Complete a rendered prompt through OpenRouter."""
 
+        timeout_seconds = self._configuration.timeout_seconds
+        remaining_seconds = remaining_provider_time()
+
+        if remaining_seconds is not None:
+            if remaining_seconds <= 0.0:
+                raise ModelExecutionError(
+                    f"OpenRouter request for model {self._model!r} exceeded its deadline."
+                )
+
+            timeout_seconds = min(
+                timeout_seconds,
+                remaining_seconds,
+            )
+
         started_at = perf_counter()
 
         try:
-            response = await self._send(prompt)
+            response = await self._send(
+                prompt,
+                timeout_seconds=timeout_seconds,
+            )
             response.raise_for_status()
         except httpx.HTTPError as exc:
             raise ModelExecutionError(
@@ -104,6 +122,8 @@ class OpenRouterLanguageModel:
     async def _send(
         self,
         prompt: Prompt,
+        *,
+        timeout_seconds: float,
     ) -> httpx.Response:
         """Send one OpenRouter chat completion request."""
 
@@ -111,7 +131,7 @@ class OpenRouterLanguageModel:
 
         async with httpx.AsyncClient(
             base_url=base_url,
-            timeout=self._configuration.timeout_seconds,
+            timeout=timeout_seconds,
             transport=self._transport,
             headers={
                 "Authorization": (f"Bearer {self._configuration.api_key.get_secret_value()}"),
@@ -11,15 +11,21 @@ from azathoth.strategies.models import (
     StrategyMetadata,
     StrategyOutcome,
 )
-from azathoth.strategies.protocols import Strategy
+from azathoth.strategies.protocols import (
+    Strategy,
+    StrategyElementSink,
+    StreamingStrategy,
+)
 
 __all__ = [
     "EventFieldStrategy",
     "RequiredEventNotFoundError",
     "RequiredFieldNotFoundError",
     "Strategy",
+    "StrategyElementSink",
     "StrategyError",
     "StrategyExecutionMetrics",
     "StrategyMetadata",
     "StrategyOutcome",
+    "StreamingStrategy",
 ]
@@ -1,10 +1,15 @@
 """Protocols implemented by executable Azathoth strategies."""
 
-from typing import Protocol
+from collections.abc import Callable
+from typing import Protocol, TypeAlias, runtime_checkable
+
+from pydantic import JsonValue
 
 from azathoth.context import Context
 from azathoth.strategies.models import StrategyMetadata, StrategyOutcome
 
+StrategyElementSink: TypeAlias = Callable[[JsonValue], None]
+
 
 class Strategy(Protocol):
     """An executable operation that can act on structured context."""
@@ -19,3 +24,21 @@ class Strategy(Protocol):
         """Execute the strategy against the supplied context."""
 
         ...
+
+
+@runtime_checkable
+class StreamingStrategy(Strategy, Protocol):
+    """A strategy whose list output can be observed element by element."""
+
+    async def run_streaming(
+        self,
+        context: Context,
+        emit: StrategyElementSink,
+    ) -> StrategyOutcome:
+        """Execute the strategy, emitting each output element once it is complete.
+
+        The emitted elements must be the elements of the returned output
+        list, in order. The outcome is the one `run` would return.
+        """
+
+        ...
@@ -10,6 +10,7 @@ from azathoth.tools.definition import (
 from azathoth.tools.exceptions import (
     ToolEntrypointError,
     ToolExecutionError,
+    ToolInputError,
     UnsupportedToolRuntimeError,
 )
 from azathoth.tools.execution import PythonToolExecutor
@@ -46,6 +47,7 @@ __all__ = [
     "ToolDefinition",
     "ToolEntrypointError",
     "ToolExecutionError",
+    "ToolInputError",
     "ToolExecutor",
     "ToolImplementation",
     "ToolImplementationCatalog",
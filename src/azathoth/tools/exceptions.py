@@ -9,5 +9,9 @@ class UnsupportedToolRuntimeError(ToolExecutionError):
     """Raised when an executor cannot execute an implementation runtime."""
 
 
+class ToolInputError(ToolExecutionError):
+    """Raised when workflow-bound tool inputs are malformed."""
+
+
 class ToolEntrypointError(ToolExecutionError):
     """Raised when a tool implementation has an invalid entrypoint."""
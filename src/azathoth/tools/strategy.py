@@ -7,7 +7,7 @@ from azathoth.strategies import (
     StrategyMetadata,
     StrategyOutcome,
 )
-from azathoth.tools.exceptions import ToolExecutionError
+from azathoth.tools.exceptions import ToolInputError
 from azathoth.tools.implementation import ToolImplementation
 from azathoth.tools.protocols import ToolExecutor
 
@@ -73,17 +73,13 @@ class ToolStrategy:
             name = event.payload.get("name")
 
             if not isinstance(name, str) or not name:
-                raise ToolExecutionError(
-                    "Workflow-bound tool inputs require a non-empty string name."
-                )
+                raise ToolInputError("Workflow-bound tool inputs require a non-empty string name.")
 
             if "value" not in event.payload:
-                raise ToolExecutionError(
-                    f"Workflow-bound tool input {name!r} is missing its value."
-                )
+                raise ToolInputError(f"Workflow-bound tool input {name!r} is missing its value.")
 
             if name in inputs:
-                raise ToolExecutionError(
+                raise ToolInputError(
                     f"Workflow-bound tool input {name!r} was bound more than once."
                 )
 
@@ -1,6 +1,8 @@
 from azathoth.workflows.attempt import (
+    WorkflowHedgeRole,
     WorkflowStepAttempt,
     WorkflowStepFailure,
+    WorkflowStepFailureKind,
 )
 from azathoth.workflows.benchmark import (
     WorkflowBenchmarkCandidateScorecard,
@@ -15,21 +17,43 @@ from azathoth.workflows.benchmark import (
     WorkflowBenchmarkRunner,
     WorkflowBenchmarkScorer,
 )
+from azathoth.workflows.budget import (
+    WorkflowCostBudget,
+    WorkflowCostBudgetExceededError,
+    WorkflowCostLedger,
+    project_workflow_strategy_cost,
+)
+from azathoth.workflows.cache import (
+    WorkflowCachedStepResult,
+    workflow_step_cache_key,
+)
 from azathoth.workflows.candidate import (
     WorkflowCandidate,
     WorkflowCandidateStep,
 )
 from azathoth.workflows.catalog import WorkflowCatalog
 from azathoth.workflows.catalog_loader import WorkflowCatalogLoader
+from azathoth.workflows.checkpoint import WorkflowRunCheckpoint
+from azathoth.workflows.checkpoint_repository import (
+    WorkflowRunCheckpointRepository,
+)
 from azathoth.workflows.condition import (
     WorkflowCondition,
     WorkflowConditionEvaluationError,
     WorkflowConditionOperator,
 )
 from azathoth.workflows.evaluation import WorkflowEvaluation
+from azathoth.workflows.events import (
+    WorkflowAttemptCompleted,
+    WorkflowRunCompleted,
+    WorkflowRunEvent,
+    WorkflowStepCommitted,
+    WorkflowStepStarted,
+)
 from azathoth.workflows.execution import (
     WorkflowRun,
     WorkflowStepRun,
+    WorkflowStepSkipReason,
     WorkflowStepStatus,
 )
 from azathoth.workflows.experiment import (
@@ -57,6 +81,24 @@ from azathoth.workflows.generation import (
     WorkflowGenerationError,
     generate_workflow_candidate,
 )
+from azathoth.workflows.graph import (
+    WorkflowGraph,
+    WorkflowGraphCycleError,
+)
+from azathoth.workflows.hedging import WorkflowHedgePolicy
+from azathoth.workflows.latency import (
+    WorkflowLatencyProfile,
+    WorkflowStepLatency,
+    WorkflowStrategyLatency,
+)
+from azathoth.workflows.map import (
+    WorkflowMapInputError,
+    WorkflowMapStrategy,
+)
+from azathoth.workflows.memory_checkpoint_repository import (
+    InMemoryWorkflowRunCheckpointRepository,
+    require_workflow_run_checkpoint_repository,
+)
 from azathoth.workflows.memory_experiment_repository import (
     InMemoryWorkflowExperimentRepository,
     require_workflow_experiment_repository,
@@ -77,10 +119,18 @@ from azathoth.workflows.memory_run_repository import (
     InMemoryWorkflowRunRepository,
     require_workflow_run_repository,
 )
+from azathoth.workflows.memory_step_cache import (
+    InMemoryWorkflowStepCache,
+    require_workflow_step_cache,
+)
 from azathoth.workflows.models import (
     WorkflowMetadata,
     WorkflowSpecification,
 )
+from azathoth.workflows.plan import (
+    WorkflowExecutionPlan,
+    WorkflowPlanStep,
+)
 from azathoth.workflows.ranker import WorkflowRanker
 from azathoth.workflows.ranking import (
     RankedWorkflow,
@@ -90,8 +140,16 @@ from azathoth.workflows.reliability import (
     WorkflowReliabilityMetrics,
 )
 from azathoth.workflows.repository import WorkflowRepository
+from azathoth.workflows.resources import (
+    WorkflowResourceLimits,
+    workflow_step_resource_class,
+    workflow_strategy_resource_class,
+)
 from azathoth.workflows.retry import (
+    WorkflowRetryBudget,
+    WorkflowRetryJitter,
     WorkflowRetryPolicy,
+    is_retryable_workflow_error,
 )
 from azathoth.workflows.run_evaluation import WorkflowRunEvaluation
 from azathoth.workflows.run_evaluation_repository import (
@@ -99,8 +157,13 @@ from azathoth.workflows.run_evaluation_repository import (
 )
 from azathoth.workflows.run_repository import WorkflowRunRepository
 from azathoth.workflows.runner import (
+    WorkflowConcurrencyPool,
     WorkflowRunner,
 )
+from azathoth.workflows.scheduling import (
+    WorkflowSchedulingMode,
+    WorkflowStepPrioritization,
+)
 from azathoth.workflows.scorecard import (
     WorkflowScorecard,
 )
@@ -108,6 +171,13 @@ from azathoth.workflows.scoring import (
     WorkflowScorer,
     WorkflowScoringPolicy,
 )
+from azathoth.workflows.speculation import (
+    WorkflowConditionHitRate,
+    WorkflowSpeculationPolicy,
+)
+from azathoth.workflows.sqlite_checkpoint_repository import (
+    SQLiteWorkflowRunCheckpointRepository,
+)
 from azathoth.workflows.sqlite_experiment_repository import (
     SQLiteWorkflowExperimentRepository,
 )
@@ -121,13 +191,21 @@ from azathoth.workflows.sqlite_run_evaluation_repository import (
 from azathoth.workflows.sqlite_run_repository import (
     SQLiteWorkflowRunRepository,
 )
+from azathoth.workflows.sqlite_step_cache import SQLiteWorkflowStepCache
 from azathoth.workflows.statistics import (
     WorkflowRunStatistics,
 )
+from azathoth.workflows.step_cache import WorkflowStepCache
 from azathoth.workflows.steps import (
+    MapStepSpecification,
     ToolStepSpecification,
     WorkflowStepSpecification,
 )
+from azathoth.workflows.tiered_step_cache import TieredWorkflowStepCache
+from azathoth.workflows.timeout import (
+    WorkflowDeadlineExceededError,
+    WorkflowStepTimeoutError,
+)
 from azathoth.workflows.value import (
     WorkflowInputBinding,
     WorkflowValue,
@@ -139,16 +217,23 @@ from azathoth.workflows.value import (
 __all__ = [
     "InMemoryWorkflowRunFeedbackRepository",
     "InMemoryWorkflowRepository",
+    "InMemoryWorkflowRunCheckpointRepository",
     "InMemoryWorkflowRunEvaluationRepository",
     "InMemoryWorkflowExperimentRepository",
     "InMemoryWorkflowRunRepository",
+    "InMemoryWorkflowStepCache",
+    "MapStepSpecification",
     "RankedWorkflow",
     "SQLiteWorkflowExperimentRepository",
     "SQLiteWorkflowRepository",
+    "SQLiteWorkflowRunCheckpointRepository",
     "SQLiteWorkflowRunEvaluationRepository",
     "SQLiteWorkflowRunFeedbackRepository",
     "SQLiteWorkflowRunRepository",
+    "SQLiteWorkflowStepCache",
+    "TieredWorkflowStepCache",
     "ToolStepSpecification",
+    "WorkflowAttemptCompleted",
     "WorkflowBenchmarkCandidateScorecard",
     "WorkflowBenchmarkCaseResult",
     "WorkflowBenchmarkComparator",
@@ -160,14 +245,22 @@ __all__ = [
     "WorkflowBenchmarkResult",
     "WorkflowBenchmarkRunner",
     "WorkflowBenchmarkScorer",
+    "WorkflowCachedStepResult",
     "WorkflowCandidate",
     "WorkflowCandidateStep",
     "WorkflowCatalog",
     "WorkflowCatalogLoader",
+    "WorkflowConcurrencyPool",
     "WorkflowCondition",
     "WorkflowConditionEvaluationError",
+    "WorkflowConditionHitRate",
     "WorkflowConditionOperator",
+    "WorkflowCostBudget",
+    "WorkflowCostBudgetExceededError",
+    "WorkflowCostLedger",
+    "WorkflowDeadlineExceededError",
     "WorkflowEvaluation",
+    "WorkflowExecutionPlan",
     "WorkflowExperimentObservation",
     "WorkflowExperimentRecord",
     "WorkflowExperimentRepository",
@@ -175,39 +268,72 @@ __all__ = [
     "WorkflowExperimentRunner",
     "WorkflowFailurePolicy",
     "WorkflowGenerationError",
+    "WorkflowGraph",
+    "WorkflowGraphCycleError",
+    "WorkflowHedgePolicy",
+    "WorkflowHedgeRole",
     "WorkflowInputBinding",
+    "WorkflowLatencyProfile",
+    "WorkflowMapInputError",
+    "WorkflowMapStrategy",
     "WorkflowMetadata",
+    "WorkflowPlanStep",
     "WorkflowRanker",
     "WorkflowRanking",
     "WorkflowReliabilityMetrics",
     "WorkflowRepository",
+    "WorkflowResourceLimits",
+    "WorkflowRetryBudget",
+    "WorkflowRetryJitter",
     "WorkflowRetryPolicy",
     "WorkflowRun",
+    "WorkflowRunCheckpoint",
+    "WorkflowRunCheckpointRepository",
+    "WorkflowRunCompleted",
     "WorkflowRunEvaluation",
     "WorkflowRunEvaluationRepository",
+    "WorkflowRunEvent",
     "WorkflowRunFeedback",
     "WorkflowRunFeedbackDisposition",
     "WorkflowRunFeedbackRepository",
     "WorkflowRunner",
     "WorkflowRunRepository",
     "WorkflowRunStatistics",
+    "WorkflowSchedulingMode",
     "WorkflowScorecard",
     "WorkflowScorer",
     "WorkflowScoringPolicy",
     "WorkflowSpecification",
+    "WorkflowSpeculationPolicy",
     "WorkflowStepAttempt",
+    "WorkflowStepCache",
+    "WorkflowStepCommitted",
     "WorkflowStepFailure",
+    "WorkflowStepFailureKind",
+    "WorkflowStepLatency",
+    "WorkflowStepPrioritization",
     "WorkflowStepRun",
+    "WorkflowStepSkipReason",
     "WorkflowStepSpecification",
+    "WorkflowStepStarted",
     "WorkflowStepStatus",
+    "WorkflowStepTimeoutError",
+    "WorkflowStrategyLatency",
     "WorkflowValue",
     "WorkflowValueBinding",
     "WorkflowValueReference",
     "WorkflowValueResolutionError",
     "generate_workflow_candidate",
+    "is_retryable_workflow_error",
+    "project_workflow_strategy_cost",
     "require_workflow_experiment_repository",
     "require_workflow_repository",
+    "require_workflow_run_checkpoint_repository",
     "require_workflow_run_evaluation_repository",
     "require_workflow_run_feedback_repository",
     "require_workflow_run_repository",
+    "require_workflow_step_cache",
+    "workflow_step_cache_key",
+    "workflow_step_resource_class",
+    "workflow_strategy_resource_class",
 ]
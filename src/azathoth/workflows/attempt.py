@@ -1,12 +1,28 @@
 """Recorded workflow step execution attempts."""
 
 from datetime import datetime
+from enum import StrEnum
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from azathoth.execution import ExecutionResult
 
 
+class WorkflowStepFailureKind(StrEnum):
+    """Why a workflow step attempt failed."""
+
+    ERROR = "error"
+    TIMEOUT = "timeout"
+    CANCELLED = "cancelled"
+
+
+class WorkflowHedgeRole(StrEnum):
+    """The part an attempt played in a hedged workflow step attempt."""
+
+    PRIMARY = "primary"
+    HEDGE = "hedge"
+
+
 class WorkflowStepFailure(BaseModel):
     """Durable information describing a failed workflow step attempt."""
 
@@ -14,6 +30,7 @@ class WorkflowStepFailure(BaseModel):
 
     exception_type: str = Field(min_length=1)
     message: str
+    kind: WorkflowStepFailureKind = WorkflowStepFailureKind.ERROR
 
 
 class WorkflowStepAttempt(BaseModel):
@@ -28,6 +45,9 @@ class WorkflowStepAttempt(BaseModel):
 
     execution: ExecutionResult | None = None
     failure: WorkflowStepFailure | None = None
+    speculative: bool = False
+    hedge_role: WorkflowHedgeRole | None = None
+    cached: bool = False
 
     @model_validator(mode="after")
     def validate_result(self) -> "WorkflowStepAttempt":
@@ -52,6 +72,21 @@ class WorkflowStepAttempt(BaseModel):
 
         return self
 
+    @model_validator(mode="after")
+    def validate_cached(self) -> "WorkflowStepAttempt":
+        """Ensure only successful attempts are served from a cache."""
+
+        if self.cached and self.execution is None:
+            raise ValueError("Cached workflow step attempts must contain an execution result.")
+
+        return self
+
+    @property
+    def cancelled(self) -> bool:
+        """Return whether the attempt was cancelled before it finished."""
+
+        return self.failure is not None and self.failure.kind is WorkflowStepFailureKind.CANCELLED
+
     @property
     def succeeded(self) -> bool:
         """Return whether the workflow step attempt succeeded."""
@@ -1,6 +1,7 @@
 """Execution, scoring, comparison, and ranking for workflow benchmarks."""
 
 from collections.abc import Callable, Mapping
+from typing import TypeVar
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
@@ -10,8 +11,10 @@ from azathoth.evaluation import (
     BenchmarkCase,
     BenchmarkDataset,
     EvaluationResult,
+    EvaluationStatus,
     ExactMatchEvaluator,
 )
+from azathoth.workflows.budget import WorkflowCostBudget, WorkflowCostLedger
 from azathoth.workflows.candidate import WorkflowCandidate
 from azathoth.workflows.execution import WorkflowRun
 from azathoth.workflows.ranker import WorkflowRanker
@@ -21,6 +24,27 @@ from azathoth.workflows.scoring import (
     WorkflowScorer,
     WorkflowScoringPolicy,
 )
+from azathoth.workflows.tasks import await_tasks
+from azathoth.workflows.value import WorkflowValueReference
+
+_T = TypeVar("_T")
+
+
+def _output_targets(
+    candidate: WorkflowCandidate,
+    output_name: str,
+) -> tuple[WorkflowValueReference, ...]:
+    """Return every value a candidate produces under a benchmark output name."""
+
+    return tuple(
+        WorkflowValueReference(
+            producer_step_id=step.id,
+            name=output.name,
+        )
+        for step in candidate.steps
+        for output in step.outputs
+        if output.name == output_name
+    )
 
 
 class WorkflowBenchmarkCaseResult(BaseModel):
@@ -182,15 +206,32 @@ class WorkflowBenchmarkRanking(BaseModel):
 
 
 class WorkflowBenchmarkRunner:
-    """Execute workflow candidates across durable benchmark datasets."""
+    """Execute workflow candidates across durable benchmark datasets.
+
+    With `prune_to_outputs`, each case runs only the steps needed to produce
+    the benchmark's output values. Other steps are recorded as skipped.
+    """
 
     def __init__(
         self,
         runner: WorkflowRunner | None = None,
         evaluator: ExactMatchEvaluator | None = None,
+        *,
+        cost_budget: WorkflowCostBudget | None = None,
+        prune_to_outputs: bool = False,
     ) -> None:
         self._runner = runner if runner is not None else WorkflowRunner()
         self._evaluator = evaluator if evaluator is not None else ExactMatchEvaluator()
+        self._cost_budget = cost_budget
+        self._prune_to_outputs = prune_to_outputs
+
+    def _cost_ledger(self) -> WorkflowCostLedger | None:
+        """Return a fresh ledger shared by every case of one benchmark."""
+
+        if self._cost_budget is None:
+            return None
+
+        return WorkflowCostLedger(self._cost_budget)
 
     async def run(
         self,
@@ -199,52 +240,174 @@ class WorkflowBenchmarkRunner:
         *,
         output_name: str,
     ) -> WorkflowBenchmarkResult:
-        """Execute and evaluate every case in a benchmark dataset."""
+        """Execute and evaluate every case in a benchmark dataset.
+
+        Cases execute concurrently when the runner has a `max_concurrency`
+        limit, and one at a time otherwise. They are evaluated in dataset
+        order. When pruning to outputs, only the steps needed to produce
+        `output_name` execute. The runner's concurrency limits and the
+        benchmark's cost budget bound every case together.
+        """
+
+        candidates = tuple(candidate_factory(case) for case in dataset.cases)
+        cost_ledger = self._cost_ledger()
+        pool = self._runner.concurrency_pool()
+
+        runs = await await_tasks(
+            (
+                self._runner.run(
+                    candidate,
+                    Context(),
+                    targets=(
+                        _output_targets(candidate, output_name) if self._prune_to_outputs else None
+                    ),
+                    cost_ledger=cost_ledger,
+                    pool=pool,
+                )
+                for candidate in candidates
+            ),
+            concurrent=pool.bounded,
+        )
 
         results: list[WorkflowBenchmarkCaseResult] = []
 
-        for case in dataset.cases:
-            candidate = candidate_factory(case)
-
-            run = await self._runner.run(
-                candidate,
-                Context(),
+        for case, run in zip(dataset.cases, runs, strict=True):
+            results.append(
+                await self._evaluate(
+                    case,
+                    run,
+                    output_name=output_name,
+                )
             )
 
-            values = run.values_named(output_name)
+        return WorkflowBenchmarkResult(
+            dataset_id=dataset.id,
+            cases=tuple(results),
+        )
+
+    async def run_population(
+        self,
+        dataset: BenchmarkDataset,
+        candidate_factories: tuple[Callable[[BenchmarkCase], WorkflowCandidate], ...],
+        *,
+        output_name: str,
+    ) -> tuple[WorkflowBenchmarkResult, ...]:
+        """Execute and evaluate every case for several candidate factories.
+
+        The candidates for each case execute as one population, so steps
+        they share execute once per case. Cases execute concurrently when
+        the runner has a `max_concurrency` limit, and one at a time
+        otherwise. Results follow factory order. The runner's concurrency limits and
+        the benchmark's cost budget bound every case of every candidate
+        together.
+        """
+
+        results: list[list[WorkflowBenchmarkCaseResult]] = [[] for _ in candidate_factories]
+        case_candidates = tuple(
+            tuple(candidate_factory(case) for candidate_factory in candidate_factories)
+            for case in dataset.cases
+        )
+        cost_ledger = self._cost_ledger()
+        pool = self._runner.concurrency_pool()
+
+        populations = await await_tasks(
+            (
+                self._runner.run_population(
+                    candidates,
+                    Context(),
+                    targets=(
+                        tuple(_output_targets(candidate, output_name) for candidate in candidates)
+                        if self._prune_to_outputs
+                        else None
+                    ),
+                    cost_ledger=cost_ledger,
+                    pool=pool,
+                )
+                for candidates in case_candidates
+            ),
+            concurrent=pool.bounded,
+        )
 
-            if len(values) != 1:
-                raise ValueError(
-                    f"Benchmark workflow must produce exactly one value named {output_name!r}."
+        for case, runs in zip(dataset.cases, populations, strict=True):
+            for case_results, run in zip(results, runs, strict=True):
+                case_results.append(
+                    await self._evaluate(
+                        case,
+                        run,
+                        output_name=output_name,
+                    )
                 )
 
-            evaluation = await self._evaluator.evaluate(
-                case.expected,
-                values[0].value,
+        return tuple(
+            WorkflowBenchmarkResult(
+                dataset_id=dataset.id,
+                cases=tuple(case_results),
             )
+            for case_results in results
+        )
 
-            results.append(
-                WorkflowBenchmarkCaseResult(
-                    case_id=case.id,
-                    run=run,
-                    evaluation=evaluation,
-                )
+    async def _evaluate(
+        self,
+        case: BenchmarkCase,
+        run: WorkflowRun,
+        *,
+        output_name: str,
+    ) -> WorkflowBenchmarkCaseResult:
+        """Evaluate the named output of one benchmark case run.
+
+        A case whose cost budget ran out before it produced its output
+        fails rather than stopping the benchmark.
+        """
+
+        values = run.values_named(output_name)
+
+        if not values and run.statistics.budget_exhausted_steps:
+            return WorkflowBenchmarkCaseResult(
+                case_id=case.id,
+                run=run,
+                evaluation=EvaluationResult(
+                    evaluator_name=self._evaluator.metadata.name,
+                    evaluator_version=self._evaluator.metadata.version,
+                    score=0.0,
+                    status=EvaluationStatus.FAILED,
+                    reason="Workflow cost budget was exhausted before the output was produced.",
+                ),
             )
 
-        return WorkflowBenchmarkResult(
-            dataset_id=dataset.id,
-            cases=tuple(results),
+        if len(values) != 1:
+            raise ValueError(
+                f"Benchmark workflow must produce exactly one value named {output_name!r}."
+            )
+
+        evaluation = await self._evaluator.evaluate(
+            case.expected,
+            values[0].value,
+        )
+
+        return WorkflowBenchmarkCaseResult(
+            case_id=case.id,
+            run=run,
+            evaluation=evaluation,
         )
 
 
 class WorkflowBenchmarkComparator:
-    """Compare named workflow candidates against one benchmark dataset."""
+    """Compare named workflow candidates against one benchmark dataset.
+
+    With `share_steps`, the candidates built for each case execute as one
+    population, so steps they share execute once per case. Sharing matches
+    steps by strategy identity, model, and context, so factories must give
+    differently behaving strategies distinct identities.
+    """
 
     def __init__(
         self,
         runner: WorkflowBenchmarkRunner | None = None,
+        *,
+        share_steps: bool = False,
     ) -> None:
         self._runner = runner if runner is not None else WorkflowBenchmarkRunner()
+        self._share_steps = share_steps
 
     async def compare(
         self,
@@ -258,25 +421,35 @@ class WorkflowBenchmarkComparator:
     ) -> WorkflowBenchmarkComparison:
         """Execute every named candidate factory against one dataset."""
 
-        candidates: list[WorkflowBenchmarkComparisonEntry] = []
-
-        for name, candidate_factory in candidate_factories.items():
-            result = await self._runner.run(
+        if self._share_steps:
+            results = await self._runner.run_population(
                 dataset,
-                candidate_factory,
+                tuple(candidate_factories.values()),
                 output_name=output_name,
             )
+        else:
+            sequential: list[WorkflowBenchmarkResult] = []
+
+            for candidate_factory in candidate_factories.values():
+                sequential.append(
+                    await self._runner.run(
+                        dataset,
+                        candidate_factory,
+                        output_name=output_name,
+                    )
+                )
+
+            results = tuple(sequential)
 
-            candidates.append(
+        return WorkflowBenchmarkComparison(
+            dataset_id=dataset.id,
+            candidates=tuple(
                 WorkflowBenchmarkComparisonEntry(
                     name=name,
                     result=result,
                 )
-            )
-
-        return WorkflowBenchmarkComparison(
-            dataset_id=dataset.id,
-            candidates=tuple(candidates),
+                for name, result in zip(candidate_factories, results, strict=True)
+            ),
         )
 
 
@@ -0,0 +1,199 @@
+"""Cost budgets that cap what workflow runs spend on model calls."""
+
+from math import ceil
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from azathoth.context import Context
+from azathoth.prompting import (
+    ContextPromptStrategy,
+    ModelBinding,
+    PromptBindingError,
+    PromptStrategy,
+)
+from azathoth.providers import ModelCatalog, ModelMetadata
+from azathoth.strategies import Strategy
+from azathoth.workflows.map import WorkflowMapInputError, WorkflowMapStrategy
+
+
+class WorkflowCostBudget(BaseModel):
+    """Cap the estimated cost of the model calls workflow runs make.
+
+    Steps are projected before they start from the prompt they send and
+    the output they are expected to produce, priced from the model
+    catalog. A step whose projection would take spend past
+    `max_cost_usd` is not started. Optional steps are skipped, and
+    required steps fail.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    max_cost_usd: float = Field(gt=0.0)
+    expected_output_tokens: int = Field(default=1024, gt=0)
+    characters_per_token: float = Field(default=4.0, gt=0.0)
+
+    def project_cost_usd(
+        self,
+        model: ModelMetadata,
+        *,
+        prompt_characters: int,
+    ) -> float:
+        """Project the cost of one call to a model with a prompt of a given length.
+
+        Expected output is capped at the model's output limit. Models
+        without catalog pricing project nothing.
+        """
+
+        if model.pricing is None:
+            return 0.0
+
+        input_tokens = ceil(prompt_characters / self.characters_per_token)
+        output_tokens = (
+            self.expected_output_tokens
+            if model.maximum_output_tokens is None
+            else min(self.expected_output_tokens, model.maximum_output_tokens)
+        )
+
+        return (
+            input_tokens * model.pricing.input_usd_per_million_tokens
+            + output_tokens * model.pricing.output_usd_per_million_tokens
+        ) / 1_000_000
+
+
+class WorkflowCostBudgetExceededError(RuntimeError):
+    """Raised when a required workflow step cannot fit in the remaining budget."""
+
+
+class WorkflowCostLedger:
+    """Track spend against one cost budget across the runs that share it.
+
+    Steps reserve their projected cost before they start and settle
+    their reported cost once they finish, so steps in flight together
+    cannot overrun the budget between them.
+    """
+
+    def __init__(
+        self,
+        budget: WorkflowCostBudget,
+    ) -> None:
+        self._budget = budget
+        self._spent_usd = 0.0
+        self._reserved_usd = 0.0
+
+    @property
+    def budget(self) -> WorkflowCostBudget:
+        """Return the budget this ledger enforces."""
+
+        return self._budget
+
+    @property
+    def spent_usd(self) -> float:
+        """Return the cost settled so far."""
+
+        return self._spent_usd
+
+    @property
+    def reserved_usd(self) -> float:
+        """Return the projected cost of steps still executing."""
+
+        return self._reserved_usd
+
+    @property
+    def exhausted(self) -> bool:
+        """Return whether settled spend has reached the budget."""
+
+        return self._spent_usd >= self._budget.max_cost_usd
+
+    def reserve(
+        self,
+        projected_usd: float,
+    ) -> bool:
+        """Reserve a projected cost, returning whether the budget allowed it.
+
+        Projections of nothing are always allowed, so steps that cost
+        nothing still run once the budget is spent.
+        """
+
+        if (
+            projected_usd > 0.0
+            and self._spent_usd + self._reserved_usd + projected_usd > self._budget.max_cost_usd
+        ):
+            return False
+
+        self._reserved_usd += projected_usd
+
+        return True
+
+    def settle(
+        self,
+        projected_usd: float,
+        spent_usd: float,
+    ) -> None:
+        """Replace a reserved projection with the cost actually spent."""
+
+        self._reserved_usd = max(self._reserved_usd - projected_usd, 0.0)
+        self._spent_usd += spent_usd
+
+
+def _prompt_text(
+    strategy: Strategy,
+    context: Context,
+) -> str:
+    """Return the prompt a strategy would send against a context, if known."""
+
+    if isinstance(strategy, PromptStrategy):
+        return strategy.prompt.text
+
+    if isinstance(strategy, ContextPromptStrategy):
+        #
+        # A template that cannot render yet still sends at least its text.
+        #
+        try:
+            return strategy.template.render(context).text
+        except (PromptBindingError, KeyError, ValueError):
+            return strategy.template.text
+
+    return ""
+
+
+def project_workflow_strategy_cost(
+    strategy: Strategy,
+    context: Context,
+    *,
+    budget: WorkflowCostBudget,
+    catalog: ModelCatalog,
+) -> float:
+    """Project the cost of executing a strategy once against a context.
+
+    Model-bound strategies cost one call to their catalog model. Map
+    strategies cost their element strategy once per bound element. Other
+    strategies, and models the catalog does not price, project nothing.
+    """
+
+    if isinstance(strategy, WorkflowMapStrategy):
+        try:
+            elements = strategy.element_count(context)
+        except WorkflowMapInputError:
+            return 0.0
+
+        return elements * project_workflow_strategy_cost(
+            strategy.strategy,
+            context,
+            budget=budget,
+            catalog=catalog,
+        )
+
+    model_binding = getattr(strategy, "model_binding", None)
+
+    if not isinstance(model_binding, ModelBinding):
+        return 0.0
+
+    model = catalog.get(model_binding.identifier)
+
+    if model is None:
+        return 0.0
+
+    return budget.project_cost_usd(
+        model,
+        prompt_characters=len(_prompt_text(strategy, context)),
+    )
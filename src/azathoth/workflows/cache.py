@@ -0,0 +1,155 @@
+"""Content-addressed results of deterministic workflow steps."""
+
+import json
+from collections.abc import Callable
+from copy import deepcopy
+from datetime import UTC, datetime, timedelta
+from hashlib import sha256
+from typing import TypeAlias
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, JsonValue
+
+from azathoth.context import Context, ContextEvent
+from azathoth.execution import ExecutionResult
+from azathoth.models import construct_trusted
+from azathoth.strategies import StrategyExecutionMetrics, StrategyMetadata
+
+Clock: TypeAlias = Callable[[], datetime]
+
+
+def utc_now() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+
+    return datetime.now(UTC)
+
+
+def workflow_step_cache_key(
+    metadata: StrategyMetadata,
+    context: Context,
+    *,
+    model: str | None = None,
+) -> str:
+    """Return the content address of executing a strategy against a context.
+
+    The key covers the strategy identity and version, the model the
+    strategy is bound to, and the type, producer, and payload of every
+    context event, including the `workflow.input.bound` events of the
+    step. Event identifiers and timestamps are ignored.
+    """
+
+    canonical = json.dumps(
+        {
+            "strategy_id": str(metadata.id),
+            "strategy_version": metadata.version,
+            "model": model,
+            "events": [
+                {
+                    "event_type": event.event_type,
+                    "producer": event.producer,
+                    "payload": event.payload,
+                }
+                for event in context.events
+            ],
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+    return sha256(canonical.encode()).hexdigest()
+
+
+class WorkflowCachedStepResult(BaseModel):
+    """The reusable outcome of one successful workflow step execution."""
+
+    model_config = ConfigDict(frozen=True)
+
+    key: str = Field(min_length=1)
+    strategy_id: UUID
+    strategy_name: str
+    strategy_version: str
+    output: JsonValue
+    metrics: StrategyExecutionMetrics | None = None
+    events: tuple[ContextEvent, ...] = ()
+    started_at: datetime
+    completed_at: datetime
+    cached_at: datetime
+
+    @classmethod
+    def from_execution(
+        cls,
+        key: str,
+        execution: ExecutionResult,
+        *,
+        cached_at: datetime,
+    ) -> "WorkflowCachedStepResult":
+        """Capture the output and produced events of an execution."""
+
+        return cls(
+            key=key,
+            strategy_id=execution.strategy_id,
+            strategy_name=execution.strategy_name,
+            strategy_version=execution.strategy_version,
+            output=execution.output,
+            metrics=execution.metrics,
+            events=execution.produced_events,
+            started_at=execution.started_at,
+            completed_at=execution.completed_at,
+            cached_at=cached_at,
+        )
+
+    def expired(
+        self,
+        now: datetime,
+        ttl_seconds: float | None,
+    ) -> bool:
+        """Return whether the result has outlived a time-to-live."""
+
+        return ttl_seconds is not None and now - self.cached_at >= timedelta(seconds=ttl_seconds)
+
+    def replay(
+        self,
+        context: Context,
+        *,
+        occurred_at: datetime | None = None,
+    ) -> ExecutionResult:
+        """Return the cached execution as if it had run against a context.
+
+        Replayed executions keep the metrics of the original execution, so
+        scoring reflects what the workflow costs rather than what the cache
+        saved. Each replay gets its own copy of the output, so mutating one
+        replay's output cannot change the cached result or other replays.
+
+        Each cached event is replayed as a new event, with a fresh id and
+        `occurred_at` (the current time by default), so every context keeps
+        one id per event. A replayed event copies its original's type,
+        producer, payload, and confidence, and names the original's id as
+        its provenance.
+        """
+
+        replayed_at = occurred_at if occurred_at is not None else utc_now()
+
+        return construct_trusted(
+            ExecutionResult,
+            strategy_id=self.strategy_id,
+            strategy_name=self.strategy_name,
+            strategy_version=self.strategy_version,
+            output=deepcopy(self.output),
+            metrics=self.metrics,
+            initial_context=context,
+            produced_events=tuple(
+                construct_trusted(
+                    ContextEvent,
+                    event_type=event.event_type,
+                    payload=deepcopy(event.payload),
+                    producer=event.producer,
+                    provenance=str(event.id),
+                    confidence=event.confidence,
+                    occurred_at=replayed_at,
+                )
+                for event in self.events
+            ),
+            started_at=self.started_at,
+            completed_at=self.completed_at,
+        )
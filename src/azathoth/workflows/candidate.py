@@ -6,6 +6,8 @@ from uuid import UUID
 from azathoth.strategies import Strategy
 from azathoth.workflows.condition import WorkflowCondition
 from azathoth.workflows.failure import WorkflowFailurePolicy
+from azathoth.workflows.graph import WorkflowGraph, WorkflowGraphCycleError
+from azathoth.workflows.hedging import WorkflowHedgePolicy
 from azathoth.workflows.models import WorkflowMetadata
 from azathoth.workflows.retry import WorkflowRetryPolicy
 from azathoth.workflows.value import WorkflowInputBinding, WorkflowValueBinding
@@ -25,6 +27,23 @@ class WorkflowCandidateStep:
         default_factory=WorkflowRetryPolicy,
     )
     failure_policy: WorkflowFailurePolicy = WorkflowFailurePolicy.FAIL_WORKFLOW
+    timeout_seconds: float | None = None
+    hedge_policy: WorkflowHedgePolicy | None = None
+    hedge_strategy: Strategy | None = None
+    cacheable: bool = True
+    resource_class: str | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the step timeout, hedging, and resource configuration."""
+
+        if self.timeout_seconds is not None and self.timeout_seconds <= 0.0:
+            raise ValueError("Workflow candidate step timeouts must be positive.")
+
+        if self.hedge_strategy is not None and self.hedge_policy is None:
+            raise ValueError("Workflow candidate hedge strategies require a hedge policy.")
+
+        if self.resource_class == "":
+            raise ValueError("Workflow candidate step resource classes cannot be empty.")
 
 
 @dataclass(frozen=True)
@@ -33,6 +52,7 @@ class WorkflowCandidate:
 
     metadata: WorkflowMetadata
     steps: tuple[WorkflowCandidateStep, ...]
+    _graph: WorkflowGraph = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate executable workflow topology."""
@@ -46,8 +66,6 @@ class WorkflowCandidate:
         if len(step_ids) != len(known_ids):
             raise ValueError("Workflow candidate step identifiers must be unique.")
 
-        dependencies_by_step = {step.id: step.depends_on for step in self.steps}
-
         for step in self.steps:
             if step.id in step.depends_on:
                 raise ValueError("Workflow candidate steps cannot depend on themselves.")
@@ -60,51 +78,24 @@ class WorkflowCandidate:
                     "Workflow candidate dependencies must reference steps in the same candidate."
                 )
 
-        visiting: set[UUID] = set()
-        visited: set[UUID] = set()
-
-        def visit(step_id: UUID) -> None:
-            if step_id in visited:
-                return
-
-            if step_id in visiting:
-                raise ValueError("Workflow candidate dependency graph must be acyclic.")
+        try:
+            graph = WorkflowGraph.build(tuple((step.id, step.depends_on) for step in self.steps))
+        except WorkflowGraphCycleError as error:
+            raise ValueError("Workflow candidate dependency graph must be acyclic.") from error
 
-            visiting.add(step_id)
+        object.__setattr__(self, "_graph", graph)
 
-            for dependency_id in dependencies_by_step[step_id]:
-                visit(dependency_id)
+    @property
+    def graph(self) -> WorkflowGraph:
+        """Return the analyzed dependency graph of the candidate."""
 
-            visiting.remove(step_id)
-            visited.add(step_id)
-
-        for step_id in step_ids:
-            visit(step_id)
+        return self._graph
 
     def execution_layers(
         self,
     ) -> tuple[tuple[WorkflowCandidateStep, ...], ...]:
         """Return dependency-safe executable steps grouped into layers."""
 
-        remaining = list(self.steps)
-        completed_ids: set[UUID] = set()
-        layers: list[tuple[WorkflowCandidateStep, ...]] = []
-
-        while remaining:
-            ready = tuple(
-                step for step in remaining if set(step.depends_on).issubset(completed_ids)
-            )
-
-            if not ready:
-                raise RuntimeError(
-                    "Validated workflow candidate topology could not produce an execution layer."
-                )
-
-            layers.append(ready)
-
-            ready_ids = {step.id for step in ready}
-            completed_ids.update(ready_ids)
-
-            remaining = [step for step in remaining if step.id not in ready_ids]
-
-        return tuple(layers)
+        return tuple(
+            tuple(self.steps[position] for position in layer) for layer in self._graph.layers
+        )
@@ -0,0 +1,48 @@
+"""Checkpoints of partially executed workflow runs."""
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, model_validator
+
+from azathoth.context import Context
+from azathoth.workflows.execution import WorkflowStepRun
+from azathoth.workflows.models import WorkflowMetadata
+
+
+class WorkflowRunCheckpoint(BaseModel):
+    """The committed progress of a workflow run that has not completed.
+
+    Steps are stored in commit order. The merged context is rebuilt from
+    the execution results of committed steps.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    run_id: UUID
+    workflow: WorkflowMetadata
+    initial_context: Context
+    started_at: datetime
+    steps: tuple[WorkflowStepRun, ...] = ()
+
+    @model_validator(mode="after")
+    def validate_steps(self) -> "WorkflowRunCheckpoint":
+        """Ensure each workflow step is committed at most once."""
+
+        step_ids = tuple(step.step_id for step in self.steps)
+
+        if len(step_ids) != len(set(step_ids)):
+            raise ValueError("Workflow run checkpoints cannot commit a step more than once.")
+
+        return self
+
+    def step(
+        self,
+        step_id: UUID,
+    ) -> WorkflowStepRun | None:
+        """Return the committed run of one workflow step."""
+
+        return next(
+            (step for step in self.steps if step.step_id == step_id),
+            None,
+        )
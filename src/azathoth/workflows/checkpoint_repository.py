@@ -0,0 +1,51 @@
+"""Persistence contracts for workflow run checkpoints."""
+
+from typing import Protocol
+from uuid import UUID
+
+from azathoth.workflows.checkpoint import WorkflowRunCheckpoint
+from azathoth.workflows.execution import WorkflowStepRun
+
+
+class WorkflowRunCheckpointRepository(Protocol):
+    """Persist the committed progress of unfinished workflow runs."""
+
+    def start(
+        self,
+        checkpoint: WorkflowRunCheckpoint,
+    ) -> None:
+        """Persist a new checkpoint for a workflow run."""
+
+        ...
+
+    def commit_step(
+        self,
+        run_id: UUID,
+        step: WorkflowStepRun,
+    ) -> None:
+        """Append one committed step to a workflow run checkpoint."""
+
+        ...
+
+    def get(
+        self,
+        run_id: UUID,
+    ) -> WorkflowRunCheckpoint | None:
+        """Return a workflow run checkpoint by run identifier."""
+
+        ...
+
+    def checkpoints(
+        self,
+    ) -> tuple[WorkflowRunCheckpoint, ...]:
+        """Return all persisted checkpoints in the order runs started."""
+
+        ...
+
+    def discard(
+        self,
+        run_id: UUID,
+    ) -> None:
+        """Remove the checkpoint of a workflow run, if one exists."""
+
+        ...
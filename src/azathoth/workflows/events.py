@@ -0,0 +1,58 @@
+"""Progress events emitted while a workflow run executes."""
+
+from datetime import datetime
+from typing import Literal, TypeAlias
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+from azathoth.workflows.attempt import WorkflowStepAttempt
+from azathoth.workflows.execution import WorkflowRun, WorkflowStepRun
+
+
+class WorkflowStepStarted(BaseModel):
+    """A workflow step began executing."""
+
+    model_config = ConfigDict(frozen=True)
+
+    event_type: Literal["workflow.step.started"] = "workflow.step.started"
+
+    step_id: UUID
+    started_at: datetime
+    speculative: bool = False
+
+
+class WorkflowAttemptCompleted(BaseModel):
+    """A workflow step attempt finished, successfully or not."""
+
+    model_config = ConfigDict(frozen=True)
+
+    event_type: Literal["workflow.attempt.completed"] = "workflow.attempt.completed"
+
+    step_id: UUID
+    attempt: WorkflowStepAttempt
+
+
+class WorkflowStepCommitted(BaseModel):
+    """A workflow step was recorded, and its values became available."""
+
+    model_config = ConfigDict(frozen=True)
+
+    event_type: Literal["workflow.step.committed"] = "workflow.step.committed"
+
+    step: WorkflowStepRun
+
+
+class WorkflowRunCompleted(BaseModel):
+    """A workflow run finished and was assembled."""
+
+    model_config = ConfigDict(frozen=True)
+
+    event_type: Literal["workflow.run.completed"] = "workflow.run.completed"
+
+    run: WorkflowRun
+
+
+WorkflowRunEvent: TypeAlias = (
+    WorkflowStepStarted | WorkflowAttemptCompleted | WorkflowStepCommitted | WorkflowRunCompleted
+)
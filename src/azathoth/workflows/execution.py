@@ -2,13 +2,22 @@
 
 from datetime import UTC, datetime
 from enum import StrEnum
+from typing import Any
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ModelWrapValidatorHandler,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+    model_validator,
+)
 
 from azathoth.context import Context
-from azathoth.execution import ExecutionResult
-from azathoth.workflows.attempt import WorkflowStepAttempt
+from azathoth.execution import ExecutionResult, shared_context_events
+from azathoth.workflows.attempt import WorkflowHedgeRole, WorkflowStepAttempt
 from azathoth.workflows.evaluation import WorkflowEvaluation
 from azathoth.workflows.models import WorkflowMetadata
 from azathoth.workflows.reliability import WorkflowReliabilityMetrics
@@ -24,6 +33,15 @@ class WorkflowStepStatus(StrEnum):
     SKIPPED = "skipped"
 
 
+class WorkflowStepSkipReason(StrEnum):
+    """Why a workflow step was skipped."""
+
+    CONDITION = "condition"
+    BLOCKED = "blocked"
+    NOT_REQUIRED = "not_required"
+    BUDGET_EXHAUSTED = "budget_exhausted"
+
+
 class WorkflowStepRun(BaseModel):
     """The recorded result of one workflow step."""
 
@@ -35,6 +53,8 @@ class WorkflowStepRun(BaseModel):
     execution: ExecutionResult | None = None
     attempts: tuple[WorkflowStepAttempt, ...] = ()
     values: tuple[WorkflowValue, ...] = ()
+    skip_reason: WorkflowStepSkipReason | None = None
+    discarded_attempts: tuple[WorkflowStepAttempt, ...] = ()
 
     @model_validator(mode="after")
     def validate_execution_status(self) -> "WorkflowStepRun":
@@ -56,7 +76,14 @@ class WorkflowStepRun(BaseModel):
                     "Executed workflow steps must end with a successful execution attempt."
                 )
 
-            if final_attempt.execution != self.execution:
+            #
+            # The runner records the final attempt's execution itself, so
+            # only restored runs need the full comparison.
+            #
+            if (
+                final_attempt.execution is not self.execution
+                and final_attempt.execution != self.execution
+            ):
                 raise ValueError(
                     "Executed workflow step result must match the final successful attempt."
                 )
@@ -88,8 +115,24 @@ class WorkflowStepRun(BaseModel):
             if self.values:
                 raise ValueError("Skipped workflow steps cannot produce workflow values.")
 
+        if self.status is not WorkflowStepStatus.SKIPPED:
+            if self.skip_reason is not None:
+                raise ValueError("Only skipped workflow steps can record a skip reason.")
+
+            if self.discarded_attempts:
+                raise ValueError("Only skipped workflow steps can record discarded attempts.")
+
+        if any(not attempt.speculative for attempt in self.discarded_attempts):
+            raise ValueError("Discarded workflow step attempts must be speculative.")
+
         return self
 
+    @property
+    def attempt_rounds(self) -> int:
+        """Return the number of attempts excluding hedges of the same attempt."""
+
+        return len({attempt.attempt_number for attempt in self.attempts})
+
 
 class WorkflowRun(BaseModel):
     """The complete recorded result of executing one workflow candidate."""
@@ -124,16 +167,25 @@ class WorkflowRun(BaseModel):
         attempts = tuple(attempt for step in self.steps for attempt in step.attempts)
 
         successful_attempts = sum(attempt.succeeded for attempt in attempts)
-        failed_attempts = len(attempts) - successful_attempts
+        cancelled_attempts = sum(attempt.cancelled for attempt in attempts)
+        failed_attempts = len(attempts) - successful_attempts - cancelled_attempts
 
+        #
+        # Hedges share the attempt number of the attempt they duplicate,
+        # so they are never counted as retries.
+        #
         retry_count = sum(
             max(
-                len(step.attempts) - 1,
+                step.attempt_rounds - 1,
                 0,
             )
             for step in self.steps
         )
 
+        discarded_attempts = tuple(
+            attempt for step in self.steps for attempt in step.discarded_attempts
+        )
+
         duration_seconds = (self.completed_at - self.started_at).total_seconds()
 
         return WorkflowRunStatistics(
@@ -144,7 +196,23 @@ class WorkflowRun(BaseModel):
             total_attempts=len(attempts),
             successful_attempts=successful_attempts,
             failed_attempts=failed_attempts,
+            cancelled_attempts=cancelled_attempts,
             retry_count=retry_count,
+            hedged_attempts=sum(
+                attempt.hedge_role is WorkflowHedgeRole.HEDGE for attempt in attempts
+            ),
+            cached_attempts=sum(attempt.cached for attempt in attempts),
+            discarded_attempts=len(discarded_attempts),
+            budget_exhausted_steps=sum(
+                step.skip_reason is WorkflowStepSkipReason.BUDGET_EXHAUSTED for step in self.steps
+            ),
+            discarded_cost_usd=sum(
+                metrics.estimated_cost_usd
+                for attempt in discarded_attempts
+                if attempt.execution is not None
+                if attempt.execution.metrics is not None
+                if (metrics := attempt.execution.metrics).estimated_cost_usd is not None
+            ),
             duration_seconds=duration_seconds,
         )
 
@@ -171,14 +239,12 @@ class WorkflowRun(BaseModel):
             )
 
         first_attempt_successes = sum(
-            step.status is WorkflowStepStatus.EXECUTED
-            and len(step.attempts) == 1
-            and step.attempts[0].succeeded
+            step.status is WorkflowStepStatus.EXECUTED and step.attempt_rounds == 1
             for step in self.steps
         )
 
         retried_steps = sum(
-            len(step.attempts) > 1
+            step.attempt_rounds > 1
             for step in self.steps
             if step.status
             in (
@@ -271,6 +337,37 @@ class WorkflowRun(BaseModel):
 
         return tuple(value for value in self.values if value.producer_step_id == producer_step_id)
 
+    @model_validator(mode="wrap")
+    @classmethod
+    def _restore_shared_events(
+        cls,
+        data: Any,
+        handler: ModelWrapValidatorHandler["WorkflowRun"],
+    ) -> "WorkflowRun":
+        """Restore step execution contexts that share the final context's events."""
+
+        if not isinstance(data, dict) or "final_context" not in data:
+            return handler(data)
+
+        final_context = Context.model_validate(data["final_context"])
+
+        with shared_context_events(final_context):
+            return handler({**data, "final_context": final_context})
+
+    @model_serializer(mode="wrap")
+    def _serialize_shared_events(
+        self,
+        handler: SerializerFunctionWrapHandler,
+    ) -> Any:
+        """Write step execution contexts by reference to the final context.
+
+        Steps usually start from a prefix of the run's final context, so a
+        run serializes most events once rather than once per step.
+        """
+
+        with shared_context_events(self.final_context):
+            return handler(self)
+
     @model_validator(mode="after")
     def validate_timestamps(self) -> "WorkflowRun":
         """Ensure workflow completion does not precede workflow start."""
@@ -1,5 +1,7 @@
 """Workflow experiment orchestration."""
 
+from uuid import UUID
+
 from pydantic import JsonValue
 
 from azathoth.context import Context
@@ -28,7 +30,15 @@ from azathoth.workflows.scoring import (
 
 
 class WorkflowExperimentRunner:
-    """Execute, evaluate, score, and rank workflow candidates."""
+    """Execute, evaluate, score, and rank workflow candidates.
+
+    Candidates execute one at a time. With `share_steps`, they execute
+    concurrently as one population, so steps they share execute once. Sharing matches
+    steps by strategy identity, model, and context, so candidates must give
+    differently behaving strategies distinct identities. Incremental
+    experiments instead run the first candidate of each workflow in full,
+    then rerun later candidates of the same workflow from it.
+    """
 
     def __init__(
         self,
@@ -36,6 +46,8 @@ class WorkflowExperimentRunner:
         scorer: WorkflowScorer,
         runner: WorkflowRunner | None = None,
         ranker: WorkflowRanker | None = None,
+        incremental: bool = False,
+        share_steps: bool = False,
     ) -> None:
         self._runner = runner if runner is not None else WorkflowRunner()
 
@@ -43,6 +55,10 @@ class WorkflowExperimentRunner:
 
         self._ranker = ranker if ranker is not None else WorkflowRanker()
 
+        self._incremental = incremental
+
+        self._share_steps = share_steps
+
     async def run(
         self,
         *,
@@ -53,14 +69,30 @@ class WorkflowExperimentRunner:
     ) -> WorkflowExperimentResult:
         """Execute, evaluate, score, and rank workflow candidates."""
 
-        scorecards = []
-
-        for workflow in workflows:
-            run = await self._runner.run(
-                workflow=workflow,
+        if self._incremental:
+            runs = await self._run_incrementally(
+                workflows=workflows,
                 context=context,
             )
+        elif self._share_steps:
+            runs = await self._runner.run_population(
+                workflows=workflows,
+                context=context,
+            )
+        else:
+            runs = tuple(
+                [
+                    await self._runner.run(
+                        workflow=workflow,
+                        context=context,
+                    )
+                    for workflow in workflows
+                ]
+            )
 
+        scorecards = []
+
+        for run in runs:
             evaluation = await evaluator.evaluate(
                 expected=expected_outcome,
                 actual=self._output_from_run(run),
@@ -82,6 +114,36 @@ class WorkflowExperimentRunner:
             ranking=ranking,
         )
 
+    async def _run_incrementally(
+        self,
+        *,
+        workflows: tuple[WorkflowCandidate, ...],
+        context: Context,
+    ) -> tuple[WorkflowRun, ...]:
+        """Execute candidates in order, rerunning each from its workflow's first run."""
+
+        runs: list[WorkflowRun] = []
+        parents: dict[UUID, WorkflowRun] = {}
+
+        for workflow in workflows:
+            parent = parents.get(workflow.metadata.id)
+
+            if parent is None:
+                run = await self._runner.run(
+                    workflow=workflow,
+                    context=context,
+                )
+                parents[workflow.metadata.id] = run
+            else:
+                run = await self._runner.rerun(
+                    parent=parent,
+                    workflow=workflow,
+                )
+
+            runs.append(run)
+
+        return tuple(runs)
+
     @staticmethod
     def _output_from_run(
         run: WorkflowRun,
@@ -1,6 +1,6 @@
 """Generate executable workflow candidates."""
 
-from azathoth.prompting import generate_prompt_candidates
+from azathoth.prompting import PromptStrategySpec, generate_prompt_candidates
 from azathoth.providers import (
     LanguageModelRegistry,
     ModelCatalog,
@@ -19,8 +19,9 @@ from azathoth.workflows.candidate import (
     WorkflowCandidate,
     WorkflowCandidateStep,
 )
+from azathoth.workflows.map import WorkflowMapStrategy
 from azathoth.workflows.models import WorkflowSpecification
-from azathoth.workflows.steps import ToolStepSpecification
+from azathoth.workflows.steps import MapStepSpecification, ToolStepSpecification
 
 
 class WorkflowGenerationError(Exception):
@@ -40,14 +41,32 @@ def generate_workflow_candidate(
     executable_steps: list[WorkflowCandidateStep] = []
 
     for workflow_step in specification.steps:
-        step_specification = workflow_step.specification
+        map_specification: MapStepSpecification | None = None
+        step_specification: PromptStrategySpec | ToolStepSpecification
+
+        if isinstance(workflow_step.specification, MapStepSpecification):
+            map_specification = workflow_step.specification
+            step_specification = map_specification.specification
+        else:
+            step_specification = workflow_step.specification
 
         strategy: Strategy
+        hedge_strategy: Strategy | None = None
+        alternate_model = (
+            workflow_step.hedge_policy.alternate_model
+            if workflow_step.hedge_policy is not None
+            else None
+        )
 
         if isinstance(
             step_specification,
             ToolStepSpecification,
         ):
+            if alternate_model is not None:
+                raise WorkflowGenerationError(
+                    "Only prompt-backed workflow steps can hedge on an alternate model."
+                )
+
             strategy = _generate_tool_strategy(
                 step_specification,
                 tool_resolver=tool_resolver,
@@ -68,6 +87,39 @@ def generate_workflow_candidate(
 
             strategy = prompt_candidates[0]
 
+            if alternate_model is not None:
+                hedge_strategy = next(
+                    (
+                        candidate
+                        for candidate in prompt_candidates
+                        if candidate.model_binding is not None
+                        and candidate.model_binding.identifier == alternate_model
+                    ),
+                    None,
+                )
+
+                if hedge_strategy is None:
+                    raise WorkflowGenerationError(
+                        f"Alternate hedge model {alternate_model!r} is not an executable "
+                        f"candidate for workflow step {workflow_step.id}."
+                    )
+
+        if map_specification is not None:
+            strategy = WorkflowMapStrategy(
+                strategy,
+                input_name=map_specification.input_name,
+                max_concurrency=map_specification.max_concurrency,
+                streaming=map_specification.streaming,
+            )
+
+            if hedge_strategy is not None:
+                hedge_strategy = WorkflowMapStrategy(
+                    hedge_strategy,
+                    input_name=map_specification.input_name,
+                    max_concurrency=map_specification.max_concurrency,
+                    streaming=map_specification.streaming,
+                )
+
         executable_steps.append(
             WorkflowCandidateStep(
                 id=workflow_step.id,
@@ -78,6 +130,11 @@ def generate_workflow_candidate(
                 conditions=workflow_step.conditions,
                 retry_policy=workflow_step.retry_policy,
                 failure_policy=workflow_step.failure_policy,
+                timeout_seconds=workflow_step.timeout_seconds,
+                hedge_policy=workflow_step.hedge_policy,
+                hedge_strategy=hedge_strategy,
+                cacheable=workflow_step.cacheable,
+                resource_class=workflow_step.resource_class,
             )
         )
 
@@ -0,0 +1,107 @@
+"""Dependency graph analysis shared by workflow specifications and candidates."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from uuid import UUID
+
+
+class WorkflowGraphCycleError(ValueError):
+    """Raised when workflow dependencies form a cycle."""
+
+
+@dataclass(frozen=True)
+class WorkflowGraph:
+    """The dependency structure of a workflow, analyzed in one pass.
+
+    Positions index steps in declared order. Bitsets use bit `position`
+    for the step at that position.
+
+    `depths` holds the length of each step's longest dependency chain,
+    which is its execution layer. `layers` groups positions by depth, in
+    declared order within each layer. `ancestor_masks` holds every step
+    each step transitively depends on.
+    """
+
+    step_ids: tuple[UUID, ...]
+    positions: dict[UUID, int]
+    depths: tuple[int, ...]
+    layers: tuple[tuple[int, ...], ...]
+    ancestor_masks: tuple[int, ...]
+
+    @classmethod
+    def build(
+        cls,
+        steps: Sequence[tuple[UUID, tuple[UUID, ...]]],
+    ) -> "WorkflowGraph":
+        """Analyze `(step_id, depends_on)` pairs with unique, known ids.
+
+        Kahn's algorithm visits every step once, so cycle detection,
+        layering, and transitive closure take one pass over the edges.
+        """
+
+        step_ids = tuple(step_id for step_id, _ in steps)
+        positions = {step_id: position for position, step_id in enumerate(step_ids)}
+        dependencies = tuple(
+            tuple(positions[dependency_id] for dependency_id in depends_on)
+            for _, depends_on in steps
+        )
+
+        dependents: list[list[int]] = [[] for _ in steps]
+        remaining = [len(step_dependencies) for step_dependencies in dependencies]
+
+        for position, step_dependencies in enumerate(dependencies):
+            for dependency in step_dependencies:
+                dependents[dependency].append(position)
+
+        depths = [0] * len(steps)
+        ancestor_masks = [0] * len(steps)
+        ordered = [position for position, count in enumerate(remaining) if count == 0]
+
+        #
+        # Every dependency of a step is visited before the step itself,
+        # so its depth and ancestors are final when the step is reached.
+        #
+        for position in ordered:
+            ancestor_mask = 0
+
+            for dependency in dependencies[position]:
+                ancestor_mask |= ancestor_masks[dependency] | (1 << dependency)
+
+            ancestor_masks[position] = ancestor_mask
+
+            for dependent in dependents[position]:
+                depths[dependent] = max(depths[dependent], depths[position] + 1)
+                remaining[dependent] -= 1
+
+                if remaining[dependent] == 0:
+                    ordered.append(dependent)
+
+        if len(ordered) != len(steps):
+            raise WorkflowGraphCycleError("Workflow dependency graph must be acyclic.")
+
+        layers: list[list[int]] = [[] for _ in range(max(depths, default=-1) + 1)]
+
+        for position, depth in enumerate(depths):
+            layers[depth].append(position)
+
+        return cls(
+            step_ids=step_ids,
+            positions=positions,
+            depths=tuple(depths),
+            layers=tuple(tuple(layer) for layer in layers),
+            ancestor_masks=tuple(ancestor_masks),
+        )
+
+    def is_upstream(
+        self,
+        ancestor_id: UUID,
+        step_id: UUID,
+    ) -> bool:
+        """Return whether a step transitively depends on another step."""
+
+        ancestor = self.positions.get(ancestor_id)
+
+        if ancestor is None:
+            return False
+
+        return bool(self.ancestor_masks[self.positions[step_id]] >> ancestor & 1)
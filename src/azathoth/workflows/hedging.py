@@ -0,0 +1,30 @@
+"""Hedged execution of slow workflow steps."""
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class WorkflowHedgePolicy(BaseModel):
+    """Configure duplicate attempts for workflow steps that run slowly.
+
+    A hedge starts once the primary attempt has been running for the
+    configured latency percentile of the step, or for a fixed delay when
+    too few latencies were recorded.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    delay_seconds: float | None = Field(default=None, ge=0.0)
+    latency_percentile: float | None = Field(default=None, gt=0.0, lt=100.0)
+    minimum_observations: int = Field(default=10, ge=1)
+    alternate_model: str | None = Field(default=None, min_length=1)
+
+    @model_validator(mode="after")
+    def validate_threshold(self) -> "WorkflowHedgePolicy":
+        """Ensure the policy can decide when to hedge."""
+
+        if self.delay_seconds is None and self.latency_percentile is None:
+            raise ValueError(
+                "Workflow hedge policies require a delay_seconds or latency_percentile."
+            )
+
+        return self
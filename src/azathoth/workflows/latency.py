@@ -0,0 +1,187 @@
+"""Recorded workflow step latencies."""
+
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from math import ceil
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, model_validator
+
+from azathoth.workflows.attempt import WorkflowHedgeRole
+from azathoth.workflows.execution import WorkflowRun
+
+
+class _RecordedLatency(BaseModel):
+    """Sorted successful attempt durations."""
+
+    model_config = ConfigDict(frozen=True)
+
+    durations_seconds: tuple[float, ...] = ()
+
+    @model_validator(mode="after")
+    def validate_durations(self) -> "_RecordedLatency":
+        """Ensure durations are non-negative and sorted."""
+
+        if any(duration < 0.0 for duration in self.durations_seconds):
+            raise ValueError("Workflow step latencies cannot be negative.")
+
+        if list(self.durations_seconds) != sorted(self.durations_seconds):
+            raise ValueError("Workflow step latencies must be sorted.")
+
+        return self
+
+    @property
+    def observations(self) -> int:
+        """Return the number of recorded durations."""
+
+        return len(self.durations_seconds)
+
+    def percentile(
+        self,
+        percentile: float,
+    ) -> float | None:
+        """Return the nearest-rank duration percentile."""
+
+        if not 0.0 < percentile <= 100.0:
+            raise ValueError("Workflow latency percentiles must be in (0, 100].")
+
+        if not self.durations_seconds:
+            return None
+
+        rank = ceil(percentile / 100.0 * len(self.durations_seconds))
+
+        return self.durations_seconds[max(rank, 1) - 1]
+
+
+class WorkflowStepLatency(_RecordedLatency):
+    """Successful attempt durations recorded for one workflow step."""
+
+    step_id: UUID
+
+
+class WorkflowStrategyLatency(_RecordedLatency):
+    """Successful attempt durations recorded for one strategy in any step."""
+
+    strategy_id: UUID
+
+
+class WorkflowLatencyProfile(BaseModel):
+    """Latency distributions of workflow steps and strategies in recorded runs."""
+
+    model_config = ConfigDict(frozen=True)
+
+    latencies: tuple[WorkflowStepLatency, ...] = ()
+    strategy_latencies: tuple[WorkflowStrategyLatency, ...] = ()
+
+    @classmethod
+    def from_runs(
+        cls,
+        runs: Iterable[WorkflowRun],
+    ) -> "WorkflowLatencyProfile":
+        """Collect successful attempt durations from recorded workflow runs.
+
+        Durations are grouped by step and by the strategy that produced
+        the recorded execution. Hedge attempts run a different strategy or
+        start late, and cached attempts never call the strategy, so neither
+        is observed.
+        """
+
+        durations: defaultdict[UUID, list[float]] = defaultdict(list)
+        strategy_durations: defaultdict[UUID, list[float]] = defaultdict(list)
+
+        for run in runs:
+            for step in run.steps:
+                for attempt in step.attempts:
+                    if (
+                        not attempt.succeeded
+                        or attempt.cached
+                        or attempt.hedge_role is WorkflowHedgeRole.HEDGE
+                    ):
+                        continue
+
+                    duration = (attempt.completed_at - attempt.started_at).total_seconds()
+                    durations[step.step_id].append(duration)
+
+                    if attempt.execution is not None:
+                        strategy_durations[attempt.execution.strategy_id].append(duration)
+
+        return cls(
+            latencies=tuple(
+                WorkflowStepLatency(
+                    step_id=step_id,
+                    durations_seconds=tuple(sorted(step_durations)),
+                )
+                for step_id, step_durations in durations.items()
+            ),
+            strategy_latencies=tuple(
+                WorkflowStrategyLatency(
+                    strategy_id=strategy_id,
+                    durations_seconds=tuple(sorted(step_durations)),
+                )
+                for strategy_id, step_durations in strategy_durations.items()
+            ),
+        )
+
+    def latency(
+        self,
+        step_id: UUID,
+    ) -> WorkflowStepLatency | None:
+        """Return the recorded latencies for one workflow step."""
+
+        return next(
+            (latency for latency in self.latencies if latency.step_id == step_id),
+            None,
+        )
+
+    def strategy_latency(
+        self,
+        strategy_id: UUID,
+    ) -> WorkflowStrategyLatency | None:
+        """Return the recorded latencies for one strategy."""
+
+        return next(
+            (latency for latency in self.strategy_latencies if latency.strategy_id == strategy_id),
+            None,
+        )
+
+    def percentile(
+        self,
+        step_id: UUID,
+        percentile: float,
+        *,
+        minimum_observations: int = 1,
+    ) -> float | None:
+        """Return a step latency percentile once enough runs were observed."""
+
+        latency = self.latency(step_id)
+
+        if latency is None or latency.observations < max(minimum_observations, 1):
+            return None
+
+        return latency.percentile(percentile)
+
+    def expected_durations(
+        self,
+        steps: Sequence[tuple[UUID, UUID]],
+        *,
+        percentile: float = 50.0,
+    ) -> tuple[float | None, ...]:
+        """Return a latency percentile for each `(step_id, strategy_id)` pair.
+
+        Steps never observed fall back to what their strategy recorded in
+        any step, and are `None` when neither was observed.
+        """
+
+        by_step = {latency.step_id: latency for latency in self.latencies}
+        by_strategy = {latency.strategy_id: latency for latency in self.strategy_latencies}
+        durations: list[float | None] = []
+
+        for step_id, strategy_id in steps:
+            latency: _RecordedLatency | None = by_step.get(step_id)
+
+            if latency is None:
+                latency = by_strategy.get(strategy_id)
+
+            durations.append(latency.percentile(percentile) if latency is not None else None)
+
+        return tuple(durations)
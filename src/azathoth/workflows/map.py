@@ -0,0 +1,464 @@
+"""Apply one strategy to every element of a list-valued workflow input."""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from time import monotonic
+from typing import TypeAlias
+from uuid import UUID, uuid4, uuid5
+
+from pydantic import JsonValue
+
+from azathoth.context import Context, ContextEvent
+from azathoth.models import construct_trusted
+from azathoth.prompting import ModelBinding
+from azathoth.strategies import (
+    Strategy,
+    StrategyError,
+    StrategyExecutionMetrics,
+    StrategyMetadata,
+    StrategyOutcome,
+)
+from azathoth.workflows.value import WorkflowValueReference
+
+_WORKFLOW_INPUT_EVENT_TYPE = "workflow.input.bound"
+_WORKFLOW_INPUT_EVENT_PRODUCER = "workflow-runner"
+
+WorkflowMapAdmission: TypeAlias = Callable[[], AbstractAsyncContextManager[object]]
+
+WorkflowMapStartedElement: TypeAlias = Callable[
+    [int, JsonValue],
+    asyncio.Task[StrategyOutcome] | None,
+]
+
+
+class WorkflowMapInputError(StrategyError):
+    """Raised when a map step input is not bound to a list."""
+
+
+def _element_event(
+    source_payload: dict[str, JsonValue],
+    *,
+    source_event_id: UUID,
+    element: JsonValue,
+    index: int,
+) -> ContextEvent:
+    """Return the bound input event one element of a mapped input runs against."""
+
+    return construct_trusted(
+        ContextEvent,
+        event_type=_WORKFLOW_INPUT_EVENT_TYPE,
+        payload={
+            **source_payload,
+            "value": element,
+            "index": index,
+            "source_event_id": str(source_event_id),
+        },
+        producer=_WORKFLOW_INPUT_EVENT_PRODUCER,
+    )
+
+
+class WorkflowMapStrategy:
+    """Run a strategy once per element of a bound list input.
+
+    Each element runs against the step context with the mapped input
+    rebound to that element and its index, as the latest bound input.
+    Outputs are collected into a list and produced events are appended
+    in element order, whatever order the elements finish in.
+    """
+
+    def __init__(
+        self,
+        strategy: Strategy,
+        *,
+        input_name: str,
+        max_concurrency: int | None = None,
+        streaming: bool = False,
+    ) -> None:
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("Workflow map max_concurrency must be at least 1.")
+
+        metadata = strategy.metadata
+
+        self._strategy = strategy
+        self._input_name = input_name
+        self._max_concurrency = max_concurrency
+        self._streaming = streaming
+        self._metadata = StrategyMetadata(
+            id=uuid5(metadata.id, "workflow.map"),
+            name=f"Map {metadata.name}",
+            description=metadata.description,
+            version=metadata.version,
+        )
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return metadata distinct from the strategy applied to each element."""
+
+        return self._metadata
+
+    @property
+    def strategy(self) -> Strategy:
+        """Return the strategy applied to each element."""
+
+        return self._strategy
+
+    @property
+    def input_name(self) -> str:
+        """Return the name of the mapped input."""
+
+        return self._input_name
+
+    @property
+    def streaming(self) -> bool:
+        """Return whether elements may start while the mapped input streams in."""
+
+        return self._streaming
+
+    @property
+    def model_binding(self) -> ModelBinding | None:
+        """Return the model the element strategy is bound to."""
+
+        model_binding = getattr(self._strategy, "model_binding", None)
+
+        return model_binding if isinstance(model_binding, ModelBinding) else None
+
+    async def run(
+        self,
+        context: Context,
+        *,
+        admission: WorkflowMapAdmission | None = None,
+    ) -> StrategyOutcome:
+        """Run the element strategy over the bound list input.
+
+        Each element call enters `admission`, when given, once it is
+        within the map's own concurrency limit. The workflow runner uses
+        it to hold the step's resource and run-wide slots per element.
+        """
+
+        return await self.run_elements(
+            context,
+            admission=self.element_admission(admission),
+        )
+
+    def element_count(
+        self,
+        context: Context,
+    ) -> int:
+        """Return how many elements the mapped input is bound to in a context."""
+
+        _, elements = self._bound_elements(context)
+
+        return len(elements)
+
+    def element_admission(
+        self,
+        admission: WorkflowMapAdmission | None = None,
+    ) -> WorkflowMapAdmission | None:
+        """Return what the element calls of one execution enter.
+
+        Element calls enter the map's own concurrency limit, then
+        `admission`. Calls sharing the returned admission share the limit.
+        """
+
+        if self._max_concurrency is None:
+            return admission
+
+        limiter = asyncio.Semaphore(self._max_concurrency)
+
+        if admission is None:
+            return lambda: limiter
+
+        @asynccontextmanager
+        async def admit() -> AsyncIterator[None]:
+            async with limiter, admission():
+                yield
+
+        return admit
+
+    async def run_element(
+        self,
+        context: Context,
+        *,
+        admission: WorkflowMapAdmission | None = None,
+    ) -> StrategyOutcome:
+        """Run the element strategy once, within `admission` as given."""
+
+        if admission is None:
+            return await self._strategy.run(context)
+
+        async with admission():
+            return await self._strategy.run(context)
+
+    async def run_elements(
+        self,
+        context: Context,
+        *,
+        admission: WorkflowMapAdmission | None = None,
+        started: WorkflowMapStartedElement | None = None,
+    ) -> StrategyOutcome:
+        """Run every element within `admission` as given.
+
+        `started` may return an execution already started for an element
+        at an index, which is awaited instead of running the element
+        again. Each other element runs against a fresh bound input event
+        that records the id of the event it was taken from.
+        """
+
+        source, elements = self._bound_elements(context)
+        events = tuple(event for event in context.events if event is not source)
+
+        async def run_element(
+            index: int,
+            element: JsonValue,
+        ) -> StrategyOutcome:
+            execution = started(index, element) if started is not None else None
+
+            if execution is not None:
+                return await execution
+
+            return await self.run_element(
+                Context(
+                    events=(
+                        *events,
+                        _element_event(
+                            source.payload,
+                            source_event_id=source.id,
+                            element=element,
+                            index=index,
+                        ),
+                    ),
+                ),
+                admission=admission,
+            )
+
+        started_at = monotonic()
+        tasks = tuple(
+            asyncio.create_task(run_element(index, element))
+            for index, element in enumerate(elements)
+        )
+
+        try:
+            outcomes = await asyncio.gather(*tasks)
+            elapsed_ms = round((monotonic() - started_at) * 1000)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return StrategyOutcome(
+            output=[outcome.output for outcome in outcomes],
+            events=tuple(event for outcome in outcomes for event in outcome.events),
+            metrics=_combined_metrics(outcomes, latency_ms=elapsed_ms),
+        )
+
+    def _bound_elements(
+        self,
+        context: Context,
+    ) -> tuple[ContextEvent, list[JsonValue]]:
+        """Return the latest bound event of the mapped input and its elements."""
+
+        source = next(
+            (
+                event
+                for event in reversed(context.by_type(_WORKFLOW_INPUT_EVENT_TYPE))
+                if event.producer == _WORKFLOW_INPUT_EVENT_PRODUCER
+                and event.payload.get("name") == self._input_name
+            ),
+            None,
+        )
+
+        if source is None:
+            raise WorkflowMapInputError(f"Workflow map input {self._input_name!r} was not bound.")
+
+        elements = source.payload.get("value")
+
+        if not isinstance(elements, list):
+            raise WorkflowMapInputError(
+                f"Workflow map input {self._input_name!r} must be bound to a list."
+            )
+
+        return source, elements
+
+
+class WorkflowStreamedMap:
+    """Run a streaming map step whose input was streamed by its producer.
+
+    The workflow runner starts elements as the producing step emits them,
+    then executes the map step through this object once its input commits.
+    A started element is reused only when the element it ran against
+    equals the element finally bound at its index. Every other element
+    runs as it would without streaming.
+
+    Started elements run against the producer's context rather than the
+    map step's, so streaming map steps must depend only on their element.
+    Their bound input event is the one `run_elements` would build. The
+    map step's own bound input event does not exist yet, so the streamed
+    map reserves its id as `source_event_id`, and the runner gives that id
+    to the event when it binds the committed input. Every element call
+    enters `admission`, as in `WorkflowMapStrategy.run`.
+    """
+
+    def __init__(
+        self,
+        strategy: WorkflowMapStrategy,
+        *,
+        source: WorkflowValueReference,
+        admission: WorkflowMapAdmission | None = None,
+    ) -> None:
+        self._strategy = strategy
+        self._source = source
+        self._admission = strategy.element_admission(admission)
+        self._source_event_id = uuid4()
+        self._started: dict[int, tuple[JsonValue, asyncio.Task[StrategyOutcome]]] = {}
+        self._tasks: list[asyncio.Task[StrategyOutcome]] = []
+
+    @property
+    def input_name(self) -> str:
+        """Return the name of the streamed input."""
+
+        return self._strategy.input_name
+
+    @property
+    def source_event_id(self) -> UUID:
+        """Return the id reserved for the map step's bound input event."""
+
+        return self._source_event_id
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return the metadata of the streaming map strategy."""
+
+        return self._strategy.metadata
+
+    @property
+    def model_binding(self) -> ModelBinding | None:
+        """Return the model the element strategy is bound to."""
+
+        return self._strategy.model_binding
+
+    def start(
+        self,
+        index: int,
+        element: JsonValue,
+        context: Context,
+    ) -> None:
+        """Start one element against the context of the producing step.
+
+        The element's bound input event has exactly the payload
+        `run_elements` gives it once the input commits. An element already
+        started at the same index is kept when equal and cancelled
+        otherwise, as happens when a producer is retried.
+        """
+
+        started = self._started.get(index)
+
+        if started is not None:
+            if started[0] == element:
+                return
+
+            started[1].cancel()
+
+        task = asyncio.create_task(
+            self._strategy.run_element(
+                context.append(
+                    _element_event(
+                        {
+                            "name": self._strategy.input_name,
+                            "value": element,
+                            "producer_step_id": str(self._source.producer_step_id),
+                            "source_name": self._source.name,
+                        },
+                        source_event_id=self._source_event_id,
+                        element=element,
+                        index=index,
+                    )
+                ),
+                admission=self._admission,
+            )
+        )
+
+        self._started[index] = (element, task)
+        self._tasks.append(task)
+
+    async def run(
+        self,
+        context: Context,
+    ) -> StrategyOutcome:
+        """Run the map step, reusing elements started while its input streamed."""
+
+        return await self._strategy.run_elements(
+            context,
+            admission=self._admission,
+            started=self._take,
+        )
+
+    def _take(
+        self,
+        index: int,
+        element: JsonValue,
+    ) -> asyncio.Task[StrategyOutcome] | None:
+        """Claim the execution started for an element, if it ran the same element."""
+
+        started = self._started.pop(index, None)
+
+        if started is None or started[0] != element:
+            return None
+
+        return started[1]
+
+    async def close(self) -> None:
+        """Cancel element executions the map step did not use."""
+
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+def _combined_metrics(
+    outcomes: list[StrategyOutcome],
+    *,
+    latency_ms: int,
+) -> StrategyExecutionMetrics | None:
+    """Sum the token and cost metrics every element reported.
+
+    Elements run concurrently, so latency is the wall-clock time of the
+    elements rather than their sum. A measurement is kept only when every
+    element reported it, and a provider or model only when every element
+    agreed on it.
+    """
+
+    metrics = [outcome.metrics for outcome in outcomes]
+
+    if not metrics or any(element is None for element in metrics):
+        return None
+
+    reported = [element for element in metrics if element is not None]
+
+    def total(field: str) -> int | None:
+        values = [getattr(element, field) for element in reported]
+
+        return sum(values) if None not in values else None
+
+    def shared(field: str) -> str | None:
+        values = {getattr(element, field) for element in reported}
+
+        return values.pop() if len(values) == 1 else None
+
+    costs = [element.estimated_cost_usd for element in reported]
+
+    return StrategyExecutionMetrics(
+        provider=shared("provider"),
+        model=shared("model"),
+        prompt_tokens=total("prompt_tokens"),
+        completion_tokens=total("completion_tokens"),
+        total_tokens=total("total_tokens"),
+        latency_ms=(
+            latency_ms if None not in {element.latency_ms for element in reported} else None
+        ),
+        estimated_cost_usd=(
+            sum(cost for cost in costs if cost is not None) if None not in costs else None
+        ),
+    )
@@ -0,0 +1,76 @@
+"""Deterministic in-memory persistence for workflow run checkpoints."""
+
+from uuid import UUID
+
+from azathoth.workflows.checkpoint import WorkflowRunCheckpoint
+from azathoth.workflows.checkpoint_repository import WorkflowRunCheckpointRepository
+from azathoth.workflows.execution import WorkflowStepRun
+
+
+class InMemoryWorkflowRunCheckpointRepository:
+    """Store workflow run checkpoints in the order runs started."""
+
+    def __init__(self) -> None:
+        self._checkpoints: dict[UUID, WorkflowRunCheckpoint] = {}
+
+    def start(
+        self,
+        checkpoint: WorkflowRunCheckpoint,
+    ) -> None:
+        """Persist a new checkpoint without replacing existing progress."""
+
+        if checkpoint.run_id in self._checkpoints:
+            raise ValueError(f"Workflow run checkpoint {checkpoint.run_id} already exists.")
+
+        self._checkpoints[checkpoint.run_id] = checkpoint
+
+    def commit_step(
+        self,
+        run_id: UUID,
+        step: WorkflowStepRun,
+    ) -> None:
+        """Append one committed step to a workflow run checkpoint."""
+
+        checkpoint = self._checkpoints.get(run_id)
+
+        if checkpoint is None:
+            raise ValueError(f"Workflow run {run_id} has no checkpoint.")
+
+        self._checkpoints[run_id] = WorkflowRunCheckpoint(
+            run_id=checkpoint.run_id,
+            workflow=checkpoint.workflow,
+            initial_context=checkpoint.initial_context,
+            started_at=checkpoint.started_at,
+            steps=(*checkpoint.steps, step),
+        )
+
+    def get(
+        self,
+        run_id: UUID,
+    ) -> WorkflowRunCheckpoint | None:
+        """Return a workflow run checkpoint by run identifier."""
+
+        return self._checkpoints.get(run_id)
+
+    def checkpoints(
+        self,
+    ) -> tuple[WorkflowRunCheckpoint, ...]:
+        """Return all checkpoints in the order runs started."""
+
+        return tuple(self._checkpoints.values())
+
+    def discard(
+        self,
+        run_id: UUID,
+    ) -> None:
+        """Remove the checkpoint of a workflow run, if one exists."""
+
+        self._checkpoints.pop(run_id, None)
+
+
+def require_workflow_run_checkpoint_repository(
+    repository: WorkflowRunCheckpointRepository,
+) -> WorkflowRunCheckpointRepository:
+    """Return a repository after static protocol validation."""
+
+    return repository
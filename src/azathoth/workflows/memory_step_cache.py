@@ -0,0 +1,72 @@
+"""In-memory least-recently-used cache of workflow step results."""
+
+from collections import OrderedDict
+
+from azathoth.workflows.cache import Clock, WorkflowCachedStepResult, utc_now
+from azathoth.workflows.step_cache import WorkflowStepCache
+
+
+class InMemoryWorkflowStepCache:
+    """Keep recently used workflow step results in process memory.
+
+    Once `max_entries` is reached, the least recently used entry is
+    evicted. Entries older than `ttl_seconds` are never returned.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = None,
+        ttl_seconds: float | None = None,
+        clock: Clock = utc_now,
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("Workflow step cache max_entries must be at least 1.")
+
+        if ttl_seconds is not None and ttl_seconds <= 0.0:
+            raise ValueError("Workflow step cache ttl_seconds must be positive.")
+
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._results: OrderedDict[str, WorkflowCachedStepResult] = OrderedDict()
+
+    def get(
+        self,
+        key: str,
+    ) -> WorkflowCachedStepResult | None:
+        """Return an unexpired cached result and mark it recently used."""
+
+        result = self._results.get(key)
+
+        if result is None:
+            return None
+
+        if result.expired(self._clock(), self._ttl_seconds):
+            del self._results[key]
+            return None
+
+        self._results.move_to_end(key)
+
+        return result
+
+    def put(
+        self,
+        result: WorkflowCachedStepResult,
+    ) -> None:
+        """Store a result, evicting the least recently used when full."""
+
+        self._results[result.key] = result
+        self._results.move_to_end(result.key)
+
+        if self._max_entries is not None:
+            while len(self._results) > self._max_entries:
+                self._results.popitem(last=False)
+
+
+def require_workflow_step_cache(
+    cache: WorkflowStepCache,
+) -> WorkflowStepCache:
+    """Return a cache after static protocol validation."""
+
+    return cache
@@ -5,7 +5,8 @@ from uuid import UUID, uuid4
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
-from azathoth.workflows.steps import WorkflowStepSpecification
+from azathoth.workflows.graph import WorkflowGraph
+from azathoth.workflows.steps import MapStepSpecification, WorkflowStepSpecification
 
 
 class WorkflowMetadata(BaseModel):
@@ -59,28 +60,7 @@ class WorkflowSpecification(BaseModel):
                         "Workflow step dependencies must reference steps in the same workflow."
                     )
 
-        visiting: set[UUID] = set()
-        visited: set[UUID] = set()
-
-        def visit(step_id: UUID) -> None:
-            """Visit one workflow step while detecting dependency cycles."""
-
-            if step_id in visited:
-                return
-
-            if step_id in visiting:
-                raise ValueError("Workflow dependency graph must be acyclic.")
-
-            visiting.add(step_id)
-
-            for dependency_id in steps_by_id[step_id].depends_on:
-                visit(dependency_id)
-
-            visiting.remove(step_id)
-            visited.add(step_id)
-
-        for step in self.steps:
-            visit(step.id)
+        graph = WorkflowGraph.build(tuple((step.id, step.depends_on) for step in self.steps))
 
         for step in self.steps:
             output_names = tuple(binding.name for binding in step.outputs)
@@ -97,7 +77,18 @@ class WorkflowSpecification(BaseModel):
                     "Workflow step input names must be unique within each consumer step."
                 )
 
-            upstream_step_ids = self._upstream_step_ids(step)
+            if (
+                isinstance(step.specification, MapStepSpecification)
+                and step.specification.input_name not in input_names
+            ):
+                raise ValueError("Map workflow steps must bind their mapped input.")
+
+            if (
+                isinstance(step.specification, MapStepSpecification)
+                and step.specification.streaming
+                and len(input_names) != 1
+            ):
+                raise ValueError("Streaming map workflow steps must bind only their mapped input.")
 
             for input_binding in step.inputs:
                 producer_step_id = input_binding.source.producer_step_id
@@ -118,7 +109,7 @@ class WorkflowSpecification(BaseModel):
                         "an output declared by the producer step."
                     )
 
-                if producer_step_id not in upstream_step_ids:
+                if not graph.is_upstream(producer_step_id, step.id):
                     raise ValueError(
                         "Workflow input bindings must reference "
                         "values produced by upstream workflow steps."
@@ -142,7 +133,7 @@ class WorkflowSpecification(BaseModel):
                         "an output declared by the producer step."
                     )
 
-                if producer_step_id not in upstream_step_ids:
+                if not graph.is_upstream(producer_step_id, step.id):
                     raise ValueError(
                         "Workflow conditions must reference "
                         "values produced by upstream workflow steps."
@@ -155,49 +146,6 @@ class WorkflowSpecification(BaseModel):
     ) -> tuple[tuple[WorkflowStepSpecification, ...], ...]:
         """Return dependency-safe workflow steps grouped into layers."""
 
-        remaining = list(self.steps)
-        completed_ids: set[UUID] = set()
-        layers: list[tuple[WorkflowStepSpecification, ...]] = []
-
-        while remaining:
-            ready = tuple(
-                step for step in remaining if set(step.depends_on).issubset(completed_ids)
-            )
-
-            if not ready:
-                raise RuntimeError(
-                    "Validated workflow dependency graph could not produce an execution layer."
-                )
-
-            layers.append(ready)
-
-            ready_ids = {step.id for step in ready}
-            completed_ids.update(ready_ids)
-
-            remaining = [step for step in remaining if step.id not in ready_ids]
-
-        return tuple(layers)
-
-    def _upstream_step_ids(
-        self,
-        step: WorkflowStepSpecification,
-    ) -> set[UUID]:
-        """Return all transitive dependencies of a workflow step."""
-
-        steps_by_id = {workflow_step.id: workflow_step for workflow_step in self.steps}
-
-        upstream: set[UUID] = set()
-        pending = list(step.depends_on)
-
-        while pending:
-            dependency_id = pending.pop()
-
-            if dependency_id in upstream:
-                continue
-
-            upstream.add(dependency_id)
-
-            dependency = steps_by_id[dependency_id]
-            pending.extend(dependency.depends_on)
+        graph = WorkflowGraph.build(tuple((step.id, step.depends_on) for step in self.steps))
 
-        return upstream
+        return tuple(tuple(self.steps[position] for position in layer) for layer in graph.layers)
@@ -0,0 +1,355 @@
+"""Compiled, reusable workflow execution plans."""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, replace
+from uuid import UUID
+
+from azathoth.workflows.candidate import (
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+)
+from azathoth.workflows.condition import WorkflowCondition
+from azathoth.workflows.value import (
+    WorkflowInputBinding,
+    WorkflowValueBinding,
+    WorkflowValueReference,
+)
+
+_Structure = tuple[
+    tuple[
+        UUID,
+        tuple[UUID, ...],
+        tuple[WorkflowInputBinding, ...],
+        tuple[WorkflowValueBinding, ...],
+        tuple[WorkflowCondition, ...],
+    ],
+    ...,
+]
+
+
+def _structure(candidate: WorkflowCandidate) -> _Structure:
+    """Return the candidate fields that determine its execution plan."""
+
+    return tuple(
+        (
+            step.id,
+            step.depends_on,
+            step.inputs,
+            step.outputs,
+            step.conditions,
+        )
+        for step in candidate.steps
+    )
+
+
+def _mask_positions(mask: int) -> tuple[int, ...]:
+    """Return the positions set in a step bitset in ascending order."""
+
+    #
+    # Scanning the binary digits stays linear in the mask width, where
+    # clearing one bit at a time would copy the mask for every bit.
+    #
+    bits = bin(mask)[:1:-1]
+    positions: list[int] = []
+    position = bits.find("1")
+
+    while position != -1:
+        positions.append(position)
+        position = bits.find("1", position + 1)
+
+    return tuple(positions)
+
+
+@dataclass(frozen=True)
+class WorkflowPlanStep:
+    """One workflow step with its dependencies and values resolved to slots.
+
+    Positions index `WorkflowExecutionPlan.steps`. Bitsets use bit
+    `position` for the step at that position.
+
+    An input or condition slot is `None` when its producer can never be
+    visible to the step, because the producer is not in an earlier layer.
+
+    `speculation_mask` holds the producers the step waits for only to
+    evaluate its conditions. `ancestor_mask` holds every step it waits for
+    transitively.
+    """
+
+    step: WorkflowCandidateStep
+    position: int
+    layer_index: int
+    dependency_mask: int
+    wait_mask: int
+    speculation_mask: int
+    ancestor_mask: int
+    input_slots: tuple[tuple[WorkflowInputBinding, int | None], ...]
+    condition_slots: tuple[tuple[WorkflowCondition, int | None], ...]
+    output_slots: tuple[tuple[WorkflowValueBinding, int], ...]
+
+    @property
+    def ancestor_positions(self) -> tuple[int, ...]:
+        """Return the positions of every step this step transitively waits for."""
+
+        return _mask_positions(self.ancestor_mask)
+
+
+@dataclass(frozen=True)
+class WorkflowExecutionPlan:
+    """Structural execution work compiled once for a workflow candidate.
+
+    Steps are stored in canonical order: dependency layer first, then
+    declared order within the layer.
+    """
+
+    candidate: WorkflowCandidate
+    steps: tuple[WorkflowPlanStep, ...]
+    layers: tuple[tuple[int, ...], ...]
+    slot_count: int
+    slot_producers: tuple[int, ...]
+    structure: _Structure
+
+    @classmethod
+    def compile(
+        cls,
+        candidate: WorkflowCandidate,
+    ) -> "WorkflowExecutionPlan":
+        """Compile the execution plan for one workflow candidate."""
+
+        #
+        # The candidate's graph assigns each step the length of its
+        # longest dependency chain, which is its dependency layer.
+        #
+        graph = candidate.graph
+        declared_position = graph.positions
+        depth = graph.depths
+        declared_layers = graph.layers
+
+        ordered_steps = tuple(
+            candidate.steps[position] for layer in declared_layers for position in layer
+        )
+        position_by_id = {step.id: position for position, step in enumerate(ordered_steps)}
+        layer_by_id = {step.id: depth[declared_position[step.id]] for step in ordered_steps}
+
+        slot_by_reference: dict[tuple[UUID, str], int] = {}
+
+        for step in ordered_steps:
+            for output in step.outputs:
+                key = (step.id, output.name)
+
+                if key in slot_by_reference:
+                    raise ValueError(
+                        "Workflow step output names must be unique within each producer step."
+                    )
+
+                slot_by_reference[key] = len(slot_by_reference)
+
+        def visible_slot(
+            step: WorkflowCandidateStep,
+            producer_step_id: UUID,
+            name: str,
+        ) -> int | None:
+            producer_layer = layer_by_id.get(producer_step_id)
+
+            if producer_layer is None or producer_layer >= layer_by_id[step.id]:
+                return None
+
+            return slot_by_reference.get((producer_step_id, name))
+
+        plan_steps: list[WorkflowPlanStep] = []
+        ancestor_masks: list[int] = []
+
+        for position, step in enumerate(ordered_steps):
+            dependency_mask = 0
+
+            for dependency_id in step.depends_on:
+                dependency_mask |= 1 << position_by_id[dependency_id]
+
+            #
+            # A step also waits for every earlier-layer producer it
+            # reads, so it observes exactly the values layer mode
+            # would have shown it.
+            #
+            wait_mask = dependency_mask
+
+            for producer_step_id in (
+                *(binding.source.producer_step_id for binding in step.inputs),
+                *(condition.source.producer_step_id for condition in step.conditions),
+            ):
+                producer_layer = layer_by_id.get(producer_step_id)
+
+                if producer_layer is not None and producer_layer < layer_by_id[step.id]:
+                    wait_mask |= 1 << position_by_id[producer_step_id]
+
+            input_mask = 0
+            condition_mask = 0
+
+            for binding in step.inputs:
+                producer_position = position_by_id.get(binding.source.producer_step_id)
+
+                if producer_position is not None:
+                    input_mask |= 1 << producer_position
+
+            for condition in step.conditions:
+                producer_position = position_by_id.get(condition.source.producer_step_id)
+
+                if producer_position is not None:
+                    condition_mask |= 1 << producer_position
+
+            ancestor_mask = wait_mask
+
+            for upstream in _mask_positions(wait_mask):
+                ancestor_mask |= ancestor_masks[upstream]
+
+            ancestor_masks.append(ancestor_mask)
+
+            plan_steps.append(
+                WorkflowPlanStep(
+                    step=step,
+                    position=position,
+                    layer_index=layer_by_id[step.id],
+                    dependency_mask=dependency_mask,
+                    wait_mask=wait_mask,
+                    speculation_mask=wait_mask & condition_mask & ~input_mask,
+                    ancestor_mask=ancestor_mask,
+                    input_slots=tuple(
+                        (
+                            binding,
+                            visible_slot(
+                                step,
+                                binding.source.producer_step_id,
+                                binding.source.name,
+                            ),
+                        )
+                        for binding in step.inputs
+                    ),
+                    condition_slots=tuple(
+                        (
+                            condition,
+                            visible_slot(
+                                step,
+                                condition.source.producer_step_id,
+                                condition.source.name,
+                            ),
+                        )
+                        for condition in step.conditions
+                    ),
+                    output_slots=tuple(
+                        (output, slot_by_reference[(step.id, output.name)])
+                        for output in step.outputs
+                    ),
+                )
+            )
+
+        layers: list[tuple[int, ...]] = []
+        start = 0
+
+        for layer in declared_layers:
+            layers.append(tuple(range(start, start + len(layer))))
+            start += len(layer)
+
+        return cls(
+            candidate=candidate,
+            steps=tuple(plan_steps),
+            layers=tuple(layers),
+            slot_count=len(slot_by_reference),
+            slot_producers=tuple(
+                position_by_id[producer_step_id] for producer_step_id, _ in slot_by_reference
+            ),
+            structure=_structure(candidate),
+        )
+
+    def bind(
+        self,
+        candidate: WorkflowCandidate,
+    ) -> "WorkflowExecutionPlan":
+        """Reuse this plan for a structurally identical workflow candidate.
+
+        Candidates are structurally identical when they declare the same
+        steps, in the same order, with the same dependencies, inputs,
+        outputs, and conditions. Strategies and policies may differ.
+        """
+
+        if candidate is self.candidate:
+            return self
+
+        if _structure(candidate) != self.structure:
+            raise ValueError("Workflow candidate does not match the compiled execution plan.")
+
+        steps_by_id = {step.id: step for step in candidate.steps}
+
+        return replace(
+            self,
+            candidate=candidate,
+            steps=tuple(
+                replace(
+                    plan_step,
+                    step=steps_by_id[plan_step.step.id],
+                )
+                for plan_step in self.steps
+            ),
+        )
+
+    def required_mask(
+        self,
+        targets: Iterable[WorkflowValueReference],
+    ) -> int:
+        """Return the steps needed to produce the target values.
+
+        The bitset holds each target's producer and every step it
+        transitively waits for.
+        """
+
+        steps = {plan_step.step.id: plan_step for plan_step in self.steps}
+        mask = 0
+
+        for target in targets:
+            plan_step = steps.get(target.producer_step_id)
+
+            if plan_step is None or all(
+                output.name != target.name for output, _ in plan_step.output_slots
+            ):
+                raise ValueError(
+                    "Workflow run targets must reference values produced by workflow steps."
+                )
+
+            mask |= 1 << plan_step.position | plan_step.ancestor_mask
+
+        return mask
+
+    def critical_paths(
+        self,
+        durations: Sequence[float],
+    ) -> tuple[float, ...]:
+        """Return each step's expected remaining critical path.
+
+        `durations` holds an expected duration per plan position. A step's
+        critical path is its own duration plus the longest path among the
+        steps that wait for it.
+        """
+
+        if len(durations) != len(self.steps):
+            raise ValueError("Workflow step durations must be given for every plan step.")
+
+        #
+        # Steps only wait for earlier positions, so every step that waits
+        # for a position is resolved before it in reverse order.
+        #
+        tails = [0.0] * len(self.steps)
+        paths = [0.0] * len(self.steps)
+
+        for plan_step in reversed(self.steps):
+            path = durations[plan_step.position] + tails[plan_step.position]
+            paths[plan_step.position] = path
+
+            for upstream in _mask_positions(plan_step.wait_mask):
+                tails[upstream] = max(tails[upstream], path)
+
+        return tuple(paths)
+
+    def matches(
+        self,
+        candidate: WorkflowCandidate,
+    ) -> bool:
+        """Return whether this plan can be bound to a workflow candidate."""
+
+        return candidate is self.candidate or _structure(candidate) == self.structure
@@ -0,0 +1,88 @@
+"""Resource classes that bound how many workflow steps run at once."""
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from azathoth.prompting import ModelBinding
+from azathoth.strategies import Strategy
+from azathoth.tools import ToolStrategy
+from azathoth.workflows.candidate import WorkflowCandidateStep
+from azathoth.workflows.map import WorkflowMapStrategy
+
+
+class WorkflowResourceLimits(BaseModel):
+    """Limit the steps of each resource class that execute at once.
+
+    Resource classes are `/`-separated names. A limit applies to its own
+    class and to every class it prefixes, so `openrouter` bounds every
+    OpenRouter model together while `openrouter/openai/gpt-4o-mini`
+    bounds that model alone.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    max_concurrency: dict[str, int] = Field(default_factory=dict)
+
+    @model_validator(mode="after")
+    def validate_limits(self) -> "WorkflowResourceLimits":
+        """Ensure every limit names a class and admits at least one step."""
+
+        if any(not resource_class for resource_class in self.max_concurrency):
+            raise ValueError("Workflow resource classes cannot be empty.")
+
+        if any(limit < 1 for limit in self.max_concurrency.values()):
+            raise ValueError("Workflow resource limits must be at least 1.")
+
+        return self
+
+    def limited_classes(
+        self,
+        resource_class: str | None,
+    ) -> tuple[str, ...]:
+        """Return the limited classes a step of a resource class counts against.
+
+        Classes are returned in name order, which every step acquires
+        them in, so steps holding several limits cannot deadlock.
+        """
+
+        if resource_class is None:
+            return ()
+
+        return tuple(
+            sorted(
+                limited
+                for limited in self.max_concurrency
+                if resource_class == limited or resource_class.startswith(f"{limited}/")
+            )
+        )
+
+
+def workflow_strategy_resource_class(strategy: Strategy) -> str | None:
+    """Infer the resource class a strategy's executions consume.
+
+    Model-bound strategies consume their model, identified as
+    `provider/model`. Tool strategies consume their runtime, as
+    `tool/runtime`. Map strategies consume what their element strategy
+    consumes. Other strategies have no resource class.
+    """
+
+    model_binding = getattr(strategy, "model_binding", None)
+
+    if isinstance(model_binding, ModelBinding):
+        return model_binding.identifier
+
+    if isinstance(strategy, WorkflowMapStrategy):
+        return workflow_strategy_resource_class(strategy.strategy)
+
+    if isinstance(strategy, ToolStrategy):
+        return f"tool/{strategy.implementation.runtime}"
+
+    return None
+
+
+def workflow_step_resource_class(step: WorkflowCandidateStep) -> str | None:
+    """Return the resource class a step declares, or the one its strategy implies."""
+
+    if step.resource_class is not None:
+        return step.resource_class
+
+    return workflow_strategy_resource_class(step.strategy)
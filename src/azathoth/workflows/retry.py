@@ -1,7 +1,47 @@
 """Workflow retry policy models."""
 
+from collections.abc import Callable
+from enum import StrEnum
+from random import Random
+from typing import TypeAlias
+
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from azathoth.prompting import ModelBindingMismatchError, PromptBindingError
+from azathoth.providers import UnsupportedModelRequestError
+from azathoth.strategies import StrategyError
+from azathoth.tools import (
+    ToolEntrypointError,
+    ToolInputError,
+    UnsupportedToolRuntimeError,
+)
+
+WorkflowRetryClassifier: TypeAlias = Callable[[Exception], bool]
+
+_NON_RETRYABLE_ERRORS: tuple[type[Exception], ...] = (
+    ModelBindingMismatchError,
+    PromptBindingError,
+    StrategyError,
+    ToolEntrypointError,
+    ToolInputError,
+    UnsupportedModelRequestError,
+    UnsupportedToolRuntimeError,
+)
+
+
+def is_retryable_workflow_error(error: Exception) -> bool:
+    """Return whether retrying a failed step could plausibly succeed."""
+
+    return not isinstance(error, _NON_RETRYABLE_ERRORS)
+
+
+class WorkflowRetryJitter(StrEnum):
+    """Randomization applied to workflow retry delays."""
+
+    NONE = "none"
+    FULL = "full"
+    DECORRELATED = "decorrelated"
+
 
 class WorkflowRetryPolicy(BaseModel):
     """Configure retry behavior for a workflow step."""
@@ -15,6 +55,7 @@ class WorkflowRetryPolicy(BaseModel):
         default=None,
         ge=0.0,
     )
+    jitter: WorkflowRetryJitter = WorkflowRetryJitter.NONE
 
     @model_validator(mode="after")
     def validate_maximum_delay(self) -> "WorkflowRetryPolicy":
@@ -46,3 +87,51 @@ class WorkflowRetryPolicy(BaseModel):
             )
 
         return delay
+
+    def jittered_delay_for_attempt(
+        self,
+        attempt: int,
+        *,
+        previous_delay: float | None = None,
+        random: Random | None = None,
+    ) -> float:
+        """Return the delay before a retry attempt after applying jitter."""
+
+        delay = self.delay_for_attempt(attempt)
+
+        if attempt <= 1 or self.jitter is WorkflowRetryJitter.NONE:
+            return delay
+
+        source = random if random is not None else Random()
+
+        if self.jitter is WorkflowRetryJitter.FULL:
+            return source.uniform(0.0, delay)
+
+        #
+        # Decorrelated jitter grows from the previous delay rather than
+        # from the attempt number.
+        #
+        base = self.initial_delay_seconds
+        previous = previous_delay if previous_delay is not None else base
+
+        delay = source.uniform(
+            base,
+            max(base, previous * 3.0),
+        )
+
+        if self.maximum_delay_seconds is not None:
+            delay = min(
+                delay,
+                self.maximum_delay_seconds,
+            )
+
+        return delay
+
+
+class WorkflowRetryBudget(BaseModel):
+    """Limit the retries one workflow run may spend."""
+
+    model_config = ConfigDict(frozen=True)
+
+    max_retries: int | None = Field(default=None, ge=0)
+    max_retries_per_provider: int | None = Field(default=None, ge=0)
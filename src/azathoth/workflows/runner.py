@@ -1,37 +1,442 @@
 """Workflow execution orchestration."""
 
-from dataclasses import dataclass
+import asyncio
+import heapq
+from collections import Counter
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+)
+from contextlib import (
+    AbstractAsyncContextManager,
+    AsyncExitStack,
+    asynccontextmanager,
+    nullcontext,
+)
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
-from uuid import UUID
+from itertools import count
+from random import Random
+from statistics import median
+from time import monotonic
+from typing import TypeAlias
+from uuid import UUID, uuid4
+
+from pydantic import JsonValue
 
 from azathoth.context import Context, ContextEvent
 from azathoth.execution import ExecutionResult, StrategyExecutor
-from azathoth.strategies import Strategy
+from azathoth.models import construct_trusted
+from azathoth.prompting import ModelBinding
+from azathoth.providers import ModelCatalog, provider_deadline
+from azathoth.strategies import (
+    Strategy,
+    StrategyMetadata,
+    StrategyOutcome,
+    StreamingStrategy,
+)
 from azathoth.workflows.attempt import (
+    WorkflowHedgeRole,
     WorkflowStepAttempt,
     WorkflowStepFailure,
+    WorkflowStepFailureKind,
 )
+from azathoth.workflows.budget import (
+    WorkflowCostBudget,
+    WorkflowCostBudgetExceededError,
+    WorkflowCostLedger,
+    project_workflow_strategy_cost,
+)
+from azathoth.workflows.cache import WorkflowCachedStepResult, workflow_step_cache_key
 from azathoth.workflows.candidate import (
     WorkflowCandidate,
     WorkflowCandidateStep,
 )
+from azathoth.workflows.checkpoint import WorkflowRunCheckpoint
+from azathoth.workflows.checkpoint_repository import WorkflowRunCheckpointRepository
+from azathoth.workflows.events import (
+    WorkflowAttemptCompleted,
+    WorkflowRunCompleted,
+    WorkflowRunEvent,
+    WorkflowStepCommitted,
+    WorkflowStepStarted,
+)
 from azathoth.workflows.execution import (
     WorkflowRun,
     WorkflowStepRun,
+    WorkflowStepSkipReason,
     WorkflowStepStatus,
 )
 from azathoth.workflows.failure import WorkflowFailurePolicy
-from azathoth.workflows.retry import WorkflowRetryPolicy
-from azathoth.workflows.value import WorkflowValue
+from azathoth.workflows.latency import WorkflowLatencyProfile
+from azathoth.workflows.map import WorkflowMapStrategy, WorkflowStreamedMap
+from azathoth.workflows.plan import WorkflowExecutionPlan, WorkflowPlanStep
+from azathoth.workflows.resources import (
+    WorkflowResourceLimits,
+    workflow_step_resource_class,
+)
+from azathoth.workflows.retry import (
+    WorkflowRetryBudget,
+    WorkflowRetryClassifier,
+    WorkflowRetryPolicy,
+    is_retryable_workflow_error,
+)
+from azathoth.workflows.scheduling import (
+    WorkflowSchedulingMode,
+    WorkflowStepPrioritization,
+)
+from azathoth.workflows.speculation import WorkflowSpeculationPolicy
+from azathoth.workflows.step_cache import WorkflowStepCache
+from azathoth.workflows.tasks import await_tasks, cancel_tasks, gather_tasks
+from azathoth.workflows.timeout import (
+    WorkflowDeadlineExceededError,
+    WorkflowStepTimeoutError,
+)
+from azathoth.workflows.value import WorkflowValue, WorkflowValueReference
+
+Sleep: TypeAlias = Callable[[float], Awaitable[None]]
+
+_StepFlights: TypeAlias = dict[str, asyncio.Future[WorkflowCachedStepResult | None]]
+
+_StepPriorities: TypeAlias = dict[UUID, tuple[float, int]]
+
+_ResourceSlots: TypeAlias = dict[str, asyncio.Semaphore]
+
+_Admission: TypeAlias = Callable[[], AbstractAsyncContextManager[object]]
+
+
+def _strategy_model(strategy: Strategy) -> str | None:
+    """Return the model a strategy is bound to, when it declares one."""
+
+    model_binding = getattr(strategy, "model_binding", None)
+
+    if not isinstance(model_binding, ModelBinding):
+        return None
+
+    return model_binding.identifier
+
+
+def _strategy_provider(strategy: Strategy) -> str | None:
+    """Return the provider a strategy is bound to, when it declares one."""
+
+    model = _strategy_model(strategy)
+
+    if model is None:
+        return None
+
+    return model.split("/", 1)[0]
+
+
+class _StreamingProducer:
+    """Run a streaming strategy, starting each element in the map steps it feeds."""
+
+    def __init__(
+        self,
+        strategy: StreamingStrategy,
+        consumers: tuple[WorkflowStreamedMap, ...],
+    ) -> None:
+        self._strategy = strategy
+        self._consumers = consumers
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return the metadata of the streaming strategy."""
+
+        return self._strategy.metadata
+
+    @property
+    def model_binding(self) -> ModelBinding | None:
+        """Return the model the streaming strategy is bound to."""
+
+        model_binding = getattr(self._strategy, "model_binding", None)
+
+        return model_binding if isinstance(model_binding, ModelBinding) else None
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Run the strategy, passing its elements on as they are emitted."""
+
+        index = 0
+
+        def emit(element: JsonValue) -> None:
+            nonlocal index
+
+            for consumer in self._consumers:
+                consumer.start(index, element, context)
+
+            index += 1
+
+        return await self._strategy.run_streaming(context, emit)
+
+
+class _AdmittedMapStep:
+    """Run a strategy of a map step, admitting each element call separately.
+
+    Map steps hold no slots themselves. Each element call takes the step's
+    resource and run-wide slots, so every element in flight counts against
+    those limits. Strategies other than maps, such as a plain hedge, hold
+    the slots for the whole call.
+    """
+
+    def __init__(
+        self,
+        strategy: Strategy,
+        admission: _Admission,
+    ) -> None:
+        self._strategy = strategy
+        self._admission = admission
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return the metadata of the admitted strategy."""
+
+        return self._strategy.metadata
+
+    @property
+    def model_binding(self) -> ModelBinding | None:
+        """Return the model the admitted strategy is bound to."""
+
+        model_binding = getattr(self._strategy, "model_binding", None)
+
+        return model_binding if isinstance(model_binding, ModelBinding) else None
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Run the strategy within the step's slots."""
+
+        if isinstance(self._strategy, WorkflowMapStrategy):
+            return await self._strategy.run(context, admission=self._admission)
+
+        async with self._admission():
+            return await self._strategy.run(context)
+
+
+def _map_streams(
+    plan: WorkflowExecutionPlan,
+    required_mask: int,
+    admission: Callable[[WorkflowCandidateStep], _Admission],
+) -> dict[UUID, WorkflowStreamedMap]:
+    """Return a streamed map for every required step that can consume a stream.
+
+    A streaming map step consumes a stream when its only input is the whole
+    output of a step whose strategy streams. Its element calls enter the
+    admission returned for the step.
+    """
+
+    steps = {plan_step.step.id: plan_step.step for plan_step in plan.steps}
+    streams: dict[UUID, WorkflowStreamedMap] = {}
+
+    for plan_step in plan.steps:
+        step = plan_step.step
+        strategy = step.strategy
+
+        if (
+            not required_mask & (1 << plan_step.position)
+            or not isinstance(strategy, WorkflowMapStrategy)
+            or not strategy.streaming
+            or len(step.inputs) != 1
+            or step.inputs[0].name != strategy.input_name
+        ):
+            continue
+
+        source = step.inputs[0].source
+        producer = steps[source.producer_step_id]
+
+        if isinstance(producer.strategy, StreamingStrategy) and any(
+            binding.name == source.name and not binding.path for binding in producer.outputs
+        ):
+            streams[step.id] = WorkflowStreamedMap(
+                strategy,
+                source=source,
+                admission=admission(step),
+            )
+
+    return streams
+
+
+@dataclass
+class _RetryBudgetState:
+    """Retries spent so far by one workflow run."""
+
+    budget: WorkflowRetryBudget | None
+    retries: int = 0
+    retries_by_provider: Counter[str] = field(default_factory=Counter)
+
+    def consume(
+        self,
+        provider: str | None,
+    ) -> bool:
+        """Reserve one retry, returning whether the budget allowed it."""
+
+        if self.budget is None:
+            return True
+
+        if self.budget.max_retries is not None and self.retries >= self.budget.max_retries:
+            return False
+
+        if (
+            provider is not None
+            and self.budget.max_retries_per_provider is not None
+            and self.retries_by_provider[provider] >= self.budget.max_retries_per_provider
+        ):
+            return False
+
+        self.retries += 1
+
+        if provider is not None:
+            self.retries_by_provider[provider] += 1
+
+        return True
+
+
+def _attempts_cost_usd(
+    attempts: tuple[WorkflowStepAttempt, ...],
+    *,
+    projected_usd: float,
+) -> float:
+    """Return what attempts spent, charging the projection for unreported costs.
+
+    Failed and cancelled attempts may have been billed without reporting
+    it, so they count as projected rather than free.
+    """
+
+    spent_usd = 0.0
+
+    for attempt in attempts:
+        metrics = attempt.execution.metrics if attempt.execution is not None else None
+
+        if metrics is not None and metrics.estimated_cost_usd is not None:
+            spent_usd += metrics.estimated_cost_usd
+        else:
+            spent_usd += projected_usd
+
+    return spent_usd
+
+
+class _PriorityLimiter:
+    """Admit a limited number of steps at once, highest priority first.
+
+    Steps that ask for a slot together are admitted together, once the
+    event loop gets to the dispatch they scheduled. When `deferred`, a
+    released slot waits for the scheduler to call `dispatch_soon`, so steps
+    made ready by the release compete for it.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        *,
+        deferred: bool,
+    ) -> None:
+        self._available = capacity
+        self._deferred = deferred
+        self._waiters: list[tuple[tuple[float, int], int, asyncio.Future[None]]] = []
+        self._order = count()
+        self._dispatching = False
+
+    def dispatch_soon(self) -> None:
+        """Admit waiting steps into free slots on the next loop iteration."""
+
+        if not self._dispatching:
+            self._dispatching = True
+            asyncio.get_running_loop().call_soon(self._dispatch)
+
+    def _dispatch(self) -> None:
+        """Admit the highest-priority waiting steps into free slots."""
+
+        self._dispatching = False
+
+        while self._available and self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+
+            if not waiter.done():
+                waiter.set_result(None)
+                self._available -= 1
+
+    def _release(self) -> None:
+        """Return one slot."""
+
+        self._available += 1
+
+        if not self._deferred:
+            self.dispatch_soon()
+
+    @asynccontextmanager
+    async def admit(self, priority: tuple[float, int]) -> AsyncIterator[None]:
+        """Hold one slot while a step of the given priority executes."""
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), waiter))
+        self.dispatch_soon()
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            #
+            # A slot granted just before cancellation goes back.
+            #
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+
+            raise
+
+        try:
+            yield
+        finally:
+            self._release()
+
+
+class WorkflowConcurrencyPool:
+    """Concurrency slots shared by the workflow runs given the same pool.
+
+    Runs sharing a pool share their runner's `max_concurrency` and
+    resource class limits, so steps in flight across all of them stay
+    within those limits. Create pools with `WorkflowRunner.concurrency_pool`.
+    """
+
+    def __init__(
+        self,
+        *,
+        limiter: asyncio.Semaphore | _PriorityLimiter | None,
+        resources: _ResourceSlots,
+    ) -> None:
+        self._limiter = limiter
+        self._resources = resources
+
+    @property
+    def bounded(self) -> bool:
+        """Return whether the pool limits the steps in flight across its runs."""
+
+        return self._limiter is not None
+
+
+@dataclass(frozen=True)
+class _RunState:
+    """Mutable coordination state shared by the steps of one workflow run."""
+
+    limiter: asyncio.Semaphore | _PriorityLimiter | None
+    retry_budget: _RetryBudgetState
+    priorities: _StepPriorities = field(default_factory=dict)
+    deadline: float | None = None
+    emit: Callable[[WorkflowRunEvent], None] | None = None
+    flights: _StepFlights | None = None
+    streams: dict[UUID, WorkflowStreamedMap] = field(default_factory=dict)
+    producers: dict[UUID, tuple[WorkflowStreamedMap, ...]] = field(default_factory=dict)
+    resources: _ResourceSlots = field(default_factory=dict)
+    cost_ledger: WorkflowCostLedger | None = None
 
 
 @dataclass(frozen=True)
-class _LayerStepResult:
-    """Temporary result produced while processing one workflow layer."""
+class _StepResult:
+    """Temporary result produced while executing one workflow step."""
 
     step: WorkflowCandidateStep
-    step_context: Context | None
+    step_context: Context
     execution: ExecutionResult | None
+    attempts: tuple[WorkflowStepAttempt, ...]
+    error: Exception | None
+    status: WorkflowStepStatus
+    skip_reason: WorkflowStepSkipReason | None = None
 
 
 class WorkflowRunner:
@@ -41,52 +446,63 @@ class WorkflowRunner:
         self,
         *,
         executor: StrategyExecutor | None = None,
+        scheduling: WorkflowSchedulingMode = WorkflowSchedulingMode.SEQUENTIAL,
+        max_concurrency: int | None = None,
+        retry_classifier: WorkflowRetryClassifier = is_retryable_workflow_error,
+        retry_budget: WorkflowRetryBudget | None = None,
+        sleep: Sleep = asyncio.sleep,
+        random: Random | None = None,
+        run_timeout_seconds: float | None = None,
+        speculation: WorkflowSpeculationPolicy | None = None,
+        latency_profile: WorkflowLatencyProfile | None = None,
+        checkpoints: WorkflowRunCheckpointRepository | None = None,
+        cache: WorkflowStepCache | None = None,
+        prioritization: WorkflowStepPrioritization = WorkflowStepPrioritization.DECLARED_ORDER,
+        resource_limits: WorkflowResourceLimits | None = None,
+        cost_budget: WorkflowCostBudget | None = None,
+        model_catalog: ModelCatalog | None = None,
     ) -> None:
-        self._executor = executor if executor is not None else StrategyExecutor()
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("Workflow runner max_concurrency must be at least 1.")
 
-    @staticmethod
-    def _find_workflow_value(
-        *,
-        completed_steps: list[WorkflowStepRun],
-        producer_step_id: UUID,
-        name: str,
-    ) -> WorkflowValue | None:
-        """Return one previously committed workflow value."""
-
-        matches = tuple(
-            value
-            for step_run in completed_steps
-            if step_run.step_id == producer_step_id
-            for value in step_run.values
-            if value.name == name
-        )
+        if run_timeout_seconds is not None and run_timeout_seconds <= 0.0:
+            raise ValueError("Workflow runner run_timeout_seconds must be positive.")
 
-        if len(matches) > 1:
-            raise RuntimeError(
-                "Validated workflow value reference resolved more "
-                "than one committed workflow value."
-            )
+        if speculation is not None and scheduling is not WorkflowSchedulingMode.DEPENDENCY_DRIVEN:
+            raise ValueError("Workflow speculation requires dependency-driven scheduling.")
 
-        if not matches:
-            return None
+        if prioritization is WorkflowStepPrioritization.CRITICAL_PATH and max_concurrency is None:
+            raise ValueError("Workflow critical-path prioritization requires max_concurrency.")
 
-        return matches[0]
+        self._executor = executor if executor is not None else StrategyExecutor()
+        self._scheduling = scheduling
+        self._max_concurrency = max_concurrency
+        self._retry_classifier = retry_classifier
+        self._retry_budget = retry_budget
+        self._sleep = sleep
+        self._random = random if random is not None else Random()
+        self._run_timeout_seconds = run_timeout_seconds
+        self._speculation = speculation
+        self._latency_profile = latency_profile
+        self._checkpoints = checkpoints
+        self._cache = cache
+        self._prioritization = prioritization
+        self._resource_limits = resource_limits
+        self._cost_budget = cost_budget
+        self._model_catalog = model_catalog
+        self._plan: WorkflowExecutionPlan | None = None
+        self._priorities: tuple[WorkflowExecutionPlan, dict[UUID, tuple[float, int]]] | None = None
 
-    @classmethod
+    @staticmethod
     def _conditions_are_satisfied(
-        cls,
         *,
-        step: WorkflowCandidateStep,
-        completed_steps: list[WorkflowStepRun],
+        plan_step: WorkflowPlanStep,
+        values: list[WorkflowValue | None],
     ) -> bool:
         """Return whether all conditions for a workflow step are satisfied."""
 
-        for condition in step.conditions:
-            value = cls._find_workflow_value(
-                completed_steps=completed_steps,
-                producer_step_id=condition.source.producer_step_id,
-                name=condition.source.name,
-            )
+        for condition, slot in plan_step.condition_slots:
+            value = values[slot] if slot is not None else None
 
             if value is None:
                 return False
@@ -96,24 +512,24 @@ class WorkflowRunner:
 
         return True
 
-    @classmethod
+    @staticmethod
     def _build_step_context(
-        cls,
         *,
         layer_context: Context,
-        step: WorkflowCandidateStep,
-        completed_steps: list[WorkflowStepRun],
+        plan_step: WorkflowPlanStep,
+        values: list[WorkflowValue | None],
+        stream: WorkflowStreamedMap | None = None,
     ) -> Context:
-        """Add resolved workflow inputs to a step-local context."""
+        """Add resolved workflow inputs to a step-local context.
+
+        The streamed input of a streaming map step is bound with the event
+        id its stream reserved, which its started elements already name.
+        """
 
         step_context = layer_context
 
-        for binding in step.inputs:
-            value = cls._find_workflow_value(
-                completed_steps=completed_steps,
-                producer_step_id=binding.source.producer_step_id,
-                name=binding.source.name,
-            )
+        for binding, slot in plan_step.input_slots:
+            value = values[slot] if slot is not None else None
 
             if value is None:
                 raise RuntimeError(
@@ -121,7 +537,13 @@ class WorkflowRunner:
                 )
 
             step_context = step_context.append(
-                ContextEvent(
+                construct_trusted(
+                    ContextEvent,
+                    id=(
+                        stream.source_event_id
+                        if stream is not None and binding.name == stream.input_name
+                        else uuid4()
+                    ),
                     event_type="workflow.input.bound",
                     payload={
                         "name": binding.name,
@@ -135,310 +557,2008 @@ class WorkflowRunner:
 
         return step_context
 
-    async def _execute_with_retry(
+    async def _execute_attempt(
         self,
         *,
         strategy: Strategy,
         context: Context,
-        retry_policy: WorkflowRetryPolicy,
-    ) -> tuple[
-        ExecutionResult | None,
-        tuple[WorkflowStepAttempt, ...],
-        Exception | None,
-    ]:
-        """Execute a strategy according to its retry policy."""
+        timeout_seconds: float | None,
+        deadline: float | None,
+    ) -> ExecutionResult:
+        """Execute one strategy attempt within its step timeout and run deadline."""
+
+        if deadline is not None and monotonic() >= deadline:
+            raise WorkflowDeadlineExceededError(
+                "Workflow run deadline was exceeded before the step attempt started."
+            )
 
-        attempts: list[WorkflowStepAttempt] = []
+        attempt_deadline = deadline
 
-        for attempt_number in range(
-            1,
-            retry_policy.max_attempts + 1,
-        ):
-            started_at = datetime.now(
-                tz=UTC,
+        if timeout_seconds is not None:
+            step_deadline = monotonic() + timeout_seconds
+
+            if attempt_deadline is None or step_deadline < attempt_deadline:
+                attempt_deadline = step_deadline
+
+        if attempt_deadline is None:
+            return await self._executor.execute(
+                strategy,
+                context,
             )
 
+        #
+        # Provider requests read the same deadline so they give up
+        # before the attempt itself is cancelled.
+        #
+        with provider_deadline(attempt_deadline):
             try:
-                execution = await self._executor.execute(
-                    strategy,
-                    context,
-                )
+                async with asyncio.timeout(attempt_deadline - monotonic()) as scope:
+                    return await self._executor.execute(
+                        strategy,
+                        context,
+                    )
+            except TimeoutError as error:
+                if not scope.expired():
+                    raise
 
-                completed_at = datetime.now(
-                    tz=UTC,
-                )
+                if deadline is not None and attempt_deadline >= deadline:
+                    raise WorkflowDeadlineExceededError(
+                        "Workflow run deadline was exceeded during the step attempt."
+                    ) from error
 
-                attempts.append(
-                    WorkflowStepAttempt(
-                        attempt_number=attempt_number,
-                        started_at=started_at,
-                        completed_at=completed_at,
-                        execution=execution,
-                    )
-                )
+                raise WorkflowStepTimeoutError(
+                    f"Workflow step attempt exceeded its {timeout_seconds} second timeout."
+                ) from error
 
-                return (
-                    execution,
-                    tuple(attempts),
-                    None,
-                )
+    def _hedge_delay(
+        self,
+        step: WorkflowCandidateStep,
+    ) -> float | None:
+        """Return how long a step attempt may run before it is hedged."""
 
-            except Exception as error:
-                completed_at = datetime.now(
-                    tz=UTC,
-                )
+        policy = step.hedge_policy
 
-                attempts.append(
-                    WorkflowStepAttempt(
-                        attempt_number=attempt_number,
-                        started_at=started_at,
-                        completed_at=completed_at,
-                        failure=WorkflowStepFailure(
-                            exception_type=type(error).__name__,
-                            message=str(error),
-                        ),
-                    )
-                )
+        if policy is None:
+            return None
 
-                if attempt_number == retry_policy.max_attempts:
-                    return (
-                        None,
-                        tuple(attempts),
-                        error,
-                    )
+        if policy.latency_percentile is not None and self._latency_profile is not None:
+            delay = self._latency_profile.percentile(
+                step.id,
+                policy.latency_percentile,
+                minimum_observations=policy.minimum_observations,
+            )
 
-                retry_policy.delay_for_attempt(
-                    attempt_number + 1,
-                )
+            if delay is not None:
+                return delay
 
-        raise AssertionError("Workflow retry execution completed without producing an outcome.")
+        return policy.delay_seconds
 
-    @staticmethod
-    def _merge_execution_context(
+    async def _record_attempt(
+        self,
         *,
-        current_context: Context,
-        execution_context: Context,
-        execution: ExecutionResult,
-    ) -> Context:
-        """Append only events produced during strategy execution."""
-
-        if execution.initial_context != execution_context:
-            raise RuntimeError(
-                "Workflow step execution did not preserve the expected step-start context."
-            )
+        attempt_number: int,
+        strategy: Strategy,
+        context: Context,
+        timeout_seconds: float | None,
+        deadline: float | None,
+    ) -> tuple[WorkflowStepAttempt, ExecutionResult | Exception]:
+        """Execute and record one strategy attempt."""
 
-        initial_event_count = len(execution_context.events)
+        started_at = datetime.now(
+            tz=UTC,
+        )
 
-        produced_events = execution.final_context.events[initial_event_count:]
+        try:
+            execution = await self._execute_attempt(
+                strategy=strategy,
+                context=context,
+                timeout_seconds=timeout_seconds,
+                deadline=deadline,
+            )
+        except Exception as error:
+            completed_at = datetime.now(
+                tz=UTC,
+            )
 
-        merged = current_context
+            return (
+                WorkflowStepAttempt(
+                    attempt_number=attempt_number,
+                    started_at=started_at,
+                    completed_at=completed_at,
+                    failure=WorkflowStepFailure(
+                        exception_type=type(error).__name__,
+                        message=str(error),
+                        kind=(
+                            WorkflowStepFailureKind.TIMEOUT
+                            if isinstance(
+                                error,
+                                WorkflowStepTimeoutError | WorkflowDeadlineExceededError,
+                            )
+                            else WorkflowStepFailureKind.ERROR
+                        ),
+                    ),
+                ),
+                error,
+            )
 
-        for event in produced_events:
-            merged = merged.append(event)
+        completed_at = datetime.now(
+            tz=UTC,
+        )
 
-        return merged
+        return (
+            WorkflowStepAttempt(
+                attempt_number=attempt_number,
+                started_at=started_at,
+                completed_at=completed_at,
+                execution=execution,
+            ),
+            execution,
+        )
 
-    async def run(
+    async def _record_hedged_attempt(
         self,
-        workflow: WorkflowCandidate,
+        *,
+        attempt_number: int,
+        strategy: Strategy,
+        hedge_strategy: Strategy,
+        hedge_delay: float,
         context: Context,
-    ) -> WorkflowRun:
-        """Execute a workflow candidate by dependency layer."""
+        timeout_seconds: float | None,
+        deadline: float | None,
+    ) -> tuple[tuple[WorkflowStepAttempt, ...], ExecutionResult | Exception]:
+        """Execute one attempt, duplicating it once it outlives the hedge delay.
+
+        The first successful attempt wins and the other is cancelled.
+        Both are recorded, with the winner last.
+        """
+
+        roles: dict[
+            asyncio.Task[tuple[WorkflowStepAttempt, ExecutionResult | Exception]],
+            tuple[WorkflowHedgeRole, datetime],
+        ] = {}
+
+        def launch(
+            role: WorkflowHedgeRole,
+            attempt_strategy: Strategy,
+        ) -> asyncio.Task[tuple[WorkflowStepAttempt, ExecutionResult | Exception]]:
+            task = asyncio.create_task(
+                self._record_attempt(
+                    attempt_number=attempt_number,
+                    strategy=attempt_strategy,
+                    context=context,
+                    timeout_seconds=timeout_seconds,
+                    deadline=deadline,
+                )
+            )
 
-        started_at = datetime.now(
-            tz=UTC,
-        )
+            roles[task] = (role, datetime.now(tz=UTC))
 
-        current_context = context
-        completed_steps: list[WorkflowStepRun] = []
+            return task
 
-        blocked_step_ids: set[UUID] = set()
+        primary = launch(WorkflowHedgeRole.PRIMARY, strategy)
 
-        for layer_index, layer in enumerate(workflow.execution_layers()):
-            layer_context = current_context
+        try:
+            done, _ = await asyncio.wait(
+                (primary,),
+                timeout=hedge_delay,
+            )
 
-            layer_results: list[
-                tuple[
-                    WorkflowCandidateStep,
-                    Context | None,
-                    ExecutionResult | None,
-                    tuple[WorkflowStepAttempt, ...],
-                    Exception | None,
-                    WorkflowStepStatus,
-                ]
-            ] = []
-
-            for step in layer:
-                #
-                # A dependency skipped because of SKIP_DEPENDENTS
-                # blocks this step transitively.
-                #
-                if any(dependency_id in blocked_step_ids for dependency_id in step.depends_on):
-                    blocked_step_ids.add(step.id)
-
-                    layer_results.append(
-                        (
-                            step,
-                            None,
-                            None,
-                            (),
-                            None,
-                            WorkflowStepStatus.SKIPPED,
-                        )
-                    )
+            if done:
+                attempt, outcome = primary.result()
 
-                    continue
+                return ((attempt,), outcome)
+
+            launch(WorkflowHedgeRole.HEDGE, hedge_strategy)
+
+            attempts: list[WorkflowStepAttempt] = []
+            outcome = RuntimeError("Hedged workflow step attempt produced no outcome.")
+            pending = set(roles)
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                winner: WorkflowStepAttempt | None = None
 
                 #
-                # Normal conditional eligibility.
+                # Prefer the primary when both attempts finish together.
                 #
-                if not self._conditions_are_satisfied(
-                    step=step,
-                    completed_steps=completed_steps,
+                for task in sorted(
+                    done,
+                    key=lambda finished: roles[finished][0] is WorkflowHedgeRole.HEDGE,
                 ):
-                    layer_results.append(
-                        (
-                            step,
-                            None,
-                            None,
-                            (),
-                            None,
-                            WorkflowStepStatus.SKIPPED,
-                        )
-                    )
-
-                    continue
+                    attempt, task_outcome = task.result()
+                    attempt = attempt.model_copy(update={"hedge_role": roles[task][0]})
 
-                step_context = self._build_step_context(
-                    layer_context=layer_context,
-                    step=step,
-                    completed_steps=completed_steps,
-                )
+                    if winner is None and isinstance(task_outcome, ExecutionResult):
+                        winner = attempt
+                        outcome = task_outcome
+                        continue
 
-                execution, attempts, error = await self._execute_with_retry(
-                    strategy=step.strategy,
-                    context=step_context,
-                    retry_policy=step.retry_policy,
-                )
+                    attempts.append(attempt)
 
-                if error is not None:
-                    if step.failure_policy is WorkflowFailurePolicy.FAIL_WORKFLOW:
-                        raise error
+                    if winner is None:
+                        outcome = task_outcome
 
-                    if step.failure_policy is WorkflowFailurePolicy.SKIP_DEPENDENTS:
-                        blocked_step_ids.add(step.id)
+                if winner is None:
+                    continue
 
-                    layer_results.append(
-                        (
-                            step,
-                            step_context,
-                            None,
-                            attempts,
-                            error,
-                            WorkflowStepStatus.FAILED,
+                cancelled_at = datetime.now(tz=UTC)
+
+                for task in pending:
+                    role, started_at = roles[task]
+
+                    attempts.append(
+                        WorkflowStepAttempt(
+                            attempt_number=attempt_number,
+                            started_at=started_at,
+                            completed_at=cancelled_at,
+                            failure=WorkflowStepFailure(
+                                exception_type="CancelledError",
+                                message=(
+                                    "Workflow step attempt was cancelled after a "
+                                    "hedged attempt succeeded."
+                                ),
+                                kind=WorkflowStepFailureKind.CANCELLED,
+                            ),
+                            hedge_role=role,
                         )
                     )
 
-                    continue
+                return ((*attempts, winner), outcome)
 
-                if execution is None:
-                    raise RuntimeError(
-                        "Successful workflow step execution did not produce an execution result."
-                    )
+            return (tuple(attempts), outcome)
+        finally:
+            await cancel_tasks(roles)
 
-                layer_results.append(
-                    (
-                        step,
-                        step_context,
-                        execution,
-                        attempts,
-                        None,
-                        WorkflowStepStatus.EXECUTED,
+    async def _execute_with_retry(
+        self,
+        *,
+        strategy: Strategy,
+        context: Context,
+        retry_policy: WorkflowRetryPolicy,
+        retry_budget: _RetryBudgetState | None = None,
+        cost_ledger: WorkflowCostLedger | None = None,
+        projected_cost_usd: float = 0.0,
+        timeout_seconds: float | None = None,
+        deadline: float | None = None,
+        hedge_delay: float | None = None,
+        hedge_strategy: Strategy | None = None,
+        on_attempt: Callable[[WorkflowStepAttempt], None] | None = None,
+    ) -> tuple[
+        ExecutionResult | None,
+        tuple[WorkflowStepAttempt, ...],
+        Exception | None,
+    ]:
+        """Execute a strategy according to its retry and hedge policies.
+
+        With a cost ledger, the caller has reserved the first attempt's
+        projected cost. Each retry reserves its own before it starts.
+        """
+
+        attempts: list[WorkflowStepAttempt] = []
+        delay: float | None = None
+
+        for attempt_number in range(
+            1,
+            retry_policy.max_attempts + 1,
+        ):
+            outcome: ExecutionResult | Exception
+            round_attempts: tuple[WorkflowStepAttempt, ...]
+            spent_usd = projected_cost_usd
+
+            try:
+                if hedge_delay is None:
+                    attempt, outcome = await self._record_attempt(
+                        attempt_number=attempt_number,
+                        strategy=strategy,
+                        context=context,
+                        timeout_seconds=timeout_seconds,
+                        deadline=deadline,
                     )
+
+                    round_attempts = (attempt,)
+                else:
+                    round_attempts, outcome = await self._record_hedged_attempt(
+                        attempt_number=attempt_number,
+                        strategy=strategy,
+                        hedge_strategy=(hedge_strategy if hedge_strategy is not None else strategy),
+                        hedge_delay=hedge_delay,
+                        context=context,
+                        timeout_seconds=timeout_seconds,
+                        deadline=deadline,
+                    )
+
+                spent_usd = _attempts_cost_usd(
+                    round_attempts,
+                    projected_usd=projected_cost_usd,
+                )
+            finally:
+                #
+                # A cancelled round is charged its projection.
+                #
+                if cost_ledger is not None:
+                    cost_ledger.settle(projected_cost_usd, spent_usd)
+
+            attempts.extend(round_attempts)
+
+            if on_attempt is not None:
+                for attempt in round_attempts:
+                    on_attempt(attempt)
+
+            if isinstance(outcome, ExecutionResult):
+                return (
+                    outcome,
+                    tuple(attempts),
+                    None,
                 )
 
+            error = outcome
+
             #
-            # Commit the layer in declared workflow order.
+            # Stop early for errors a retry cannot fix and once the run
+            # deadline has passed.
             #
-            for (
-                step,
-                result_context,
-                execution,
-                attempts,
-                error,
-                status,
-            ) in layer_results:
-                if status is WorkflowStepStatus.SKIPPED:
-                    completed_steps.append(
-                        WorkflowStepRun(
-                            step_id=step.id,
-                            layer_index=layer_index,
-                            status=WorkflowStepStatus.SKIPPED,
-                            execution=None,
-                            attempts=(),
-                            values=(),
+            if (
+                attempt_number == retry_policy.max_attempts
+                or isinstance(error, WorkflowDeadlineExceededError)
+                or not self._retry_classifier(error)
+            ):
+                return (
+                    None,
+                    tuple(attempts),
+                    error,
+                )
+
+            delay = retry_policy.jittered_delay_for_attempt(
+                attempt_number + 1,
+                previous_delay=delay,
+                random=self._random,
+            )
+
+            #
+            # A retry that could only start after the run deadline is not
+            # worth waiting for, and one the cost budget cannot afford is
+            # not started. The shared retry budget is consumed last, so
+            # only retries that will run spend it.
+            #
+            if (deadline is not None and monotonic() + delay >= deadline) or (
+                cost_ledger is not None and not cost_ledger.reserve(projected_cost_usd)
+            ):
+                return (
+                    None,
+                    tuple(attempts),
+                    error,
+                )
+
+            if retry_budget is not None and not retry_budget.consume(_strategy_provider(strategy)):
+                if cost_ledger is not None:
+                    cost_ledger.settle(projected_cost_usd, 0.0)
+
+                return (
+                    None,
+                    tuple(attempts),
+                    error,
+                )
+
+            if delay > 0.0:
+                await self._sleep(delay)
+
+        raise AssertionError("Workflow retry execution completed without producing an outcome.")
+
+    @staticmethod
+    def _merge_execution_context(
+        *,
+        current_context: Context,
+        execution_context: Context,
+        execution: ExecutionResult,
+    ) -> Context:
+        """Append only events produced during strategy execution."""
+
+        #
+        # Executions normally start from the step context itself, so the
+        # identity check avoids comparing histories at all.
+        #
+        if (
+            execution.initial_context is not execution_context
+            and execution.initial_context != execution_context
+        ):
+            raise RuntimeError(
+                "Workflow step execution did not preserve the expected step-start context."
+            )
+
+        merged = current_context
+
+        for event in execution.produced_events:
+            merged = merged.append(event)
+
+        return merged
+
+    async def _execute_step(
+        self,
+        *,
+        step: WorkflowCandidateStep,
+        step_context: Context,
+        state: _RunState,
+        speculative: bool = False,
+    ) -> _StepResult:
+        """Execute one eligible workflow step, reusing a cached or shared result."""
+
+        cache_key = (
+            workflow_step_cache_key(
+                step.strategy.metadata,
+                step_context,
+                model=_strategy_model(step.strategy),
+            )
+            if step.cacheable and (self._cache is not None or state.flights is not None)
+            else None
+        )
+        flight: asyncio.Future[WorkflowCachedStepResult | None] | None = None
+
+        if cache_key is not None:
+            cached = self._cache.get(cache_key) if self._cache is not None else None
+
+            if cached is None and state.flights is not None:
+                cached, flight = await self._join_flight(
+                    flights=state.flights,
+                    key=cache_key,
+                )
+
+            if cached is not None:
+                return self._replay_step(
+                    step=step,
+                    step_context=step_context,
+                    cached=cached,
+                    emit=state.emit,
+                    speculative=speculative,
+                )
+
+        shared: WorkflowCachedStepResult | None = None
+
+        try:
+            result = await self._execute_strategy_step(
+                step=step,
+                step_context=step_context,
+                state=state,
+                speculative=speculative,
+            )
+
+            #
+            # A winning hedge ran another strategy or model, which the cache
+            # key does not describe.
+            #
+            if (
+                cache_key is not None
+                and result.execution is not None
+                and result.attempts[-1].hedge_role is not WorkflowHedgeRole.HEDGE
+            ):
+                shared = WorkflowCachedStepResult.from_execution(
+                    cache_key,
+                    result.execution,
+                    cached_at=datetime.now(tz=UTC),
+                )
+
+                if self._cache is not None:
+                    self._cache.put(shared)
+
+            return result
+        finally:
+            #
+            # Waiters execute the step themselves when this execution
+            # failed, was cancelled, or cannot be shared.
+            #
+            if flight is not None and not flight.done():
+                flight.set_result(shared)
+
+    @staticmethod
+    async def _join_flight(
+        *,
+        flights: _StepFlights,
+        key: str,
+    ) -> tuple[
+        WorkflowCachedStepResult | None,
+        asyncio.Future[WorkflowCachedStepResult | None] | None,
+    ]:
+        """Wait for a shared step already executing, or claim its execution.
+
+        Returns the shared result when another run produced one, otherwise
+        the future this run must resolve once its own execution finishes.
+        """
+
+        flight = flights.get(key)
+
+        if flight is not None:
+            return await asyncio.shield(flight), None
+
+        flight = asyncio.get_running_loop().create_future()
+        flights[key] = flight
+
+        return None, flight
+
+    async def _execute_strategy_step(
+        self,
+        *,
+        step: WorkflowCandidateStep,
+        step_context: Context,
+        state: _RunState,
+        speculative: bool,
+    ) -> _StepResult:
+        """Execute one workflow step by calling its strategy."""
+
+        hedge_delay = self._hedge_delay(step)
+        strategy = state.streams.get(step.id, step.strategy)
+        hedge_strategy = step.hedge_strategy
+        consumers = state.producers.get(step.id)
+
+        if consumers is not None:
+            if isinstance(strategy, StreamingStrategy):
+                strategy = _StreamingProducer(strategy, consumers)
+
+            if isinstance(hedge_strategy, StreamingStrategy):
+                hedge_strategy = _StreamingProducer(hedge_strategy, consumers)
+
+        emit = state.emit
+        admission: AbstractAsyncContextManager[object]
+
+        if isinstance(step.strategy, WorkflowMapStrategy):
+            #
+            # Map steps are admitted per element call, so a map with many
+            # elements counts each one against the step's limits.
+            #
+            element_admission = self._admission(step, state, elements=True)
+            admission = nullcontext()
+
+            if not isinstance(strategy, WorkflowStreamedMap):
+                strategy = _AdmittedMapStep(strategy, element_admission)
+
+            if hedge_strategy is not None:
+                hedge_strategy = _AdmittedMapStep(hedge_strategy, element_admission)
+        else:
+            admission = self._admission(step, state, elements=False)()
+
+        async with admission:
+            #
+            # Spend is projected once the step is admitted, so steps
+            # waiting for a slot hold no part of the budget.
+            #
+            projected_cost_usd = self._projected_cost_usd(step, step_context, state)
+
+            if state.cost_ledger is not None and not state.cost_ledger.reserve(projected_cost_usd):
+                #
+                # Only steps the workflow can do without are skipped. A
+                # required step fails, so the run stops with the reason
+                # rather than quietly blocking everything after it.
+                #
+                if step.failure_policy is WorkflowFailurePolicy.FAIL_WORKFLOW:
+                    return self._budget_failure(
+                        step=step,
+                        step_context=step_context,
+                        projected_cost_usd=projected_cost_usd,
+                        ledger=state.cost_ledger,
+                    )
+
+                return _StepResult(
+                    step=step,
+                    step_context=step_context,
+                    execution=None,
+                    attempts=(),
+                    error=None,
+                    status=WorkflowStepStatus.SKIPPED,
+                    skip_reason=WorkflowStepSkipReason.BUDGET_EXHAUSTED,
+                )
+
+            if emit is not None:
+                emit(
+                    WorkflowStepStarted(
+                        step_id=step.id,
+                        started_at=datetime.now(tz=UTC),
+                        speculative=speculative,
+                    )
+                )
+
+            execution, attempts, error = await self._execute_with_retry(
+                strategy=strategy,
+                context=step_context,
+                retry_policy=step.retry_policy,
+                retry_budget=state.retry_budget,
+                cost_ledger=state.cost_ledger,
+                projected_cost_usd=projected_cost_usd,
+                timeout_seconds=step.timeout_seconds,
+                deadline=state.deadline,
+                hedge_delay=hedge_delay,
+                hedge_strategy=hedge_strategy,
+                on_attempt=(
+                    (
+                        lambda attempt: emit(
+                            WorkflowAttemptCompleted(
+                                step_id=step.id,
+                                attempt=attempt,
+                            )
                         )
                     )
+                    if emit is not None
+                    else None
+                ),
+            )
+
+        if error is not None:
+            return _StepResult(
+                step=step,
+                step_context=step_context,
+                execution=None,
+                attempts=attempts,
+                error=error,
+                status=WorkflowStepStatus.FAILED,
+            )
+
+        if execution is None:
+            raise RuntimeError(
+                "Successful workflow step execution did not produce an execution result."
+            )
+
+        return _StepResult(
+            step=step,
+            step_context=step_context,
+            execution=execution,
+            attempts=attempts,
+            error=None,
+            status=WorkflowStepStatus.EXECUTED,
+        )
+
+    @staticmethod
+    def _budget_failure(
+        *,
+        step: WorkflowCandidateStep,
+        step_context: Context,
+        projected_cost_usd: float,
+        ledger: WorkflowCostLedger,
+    ) -> _StepResult:
+        """Fail a required step the cost budget cannot afford, without starting it."""
+
+        remaining_usd = max(
+            ledger.budget.max_cost_usd - ledger.spent_usd - ledger.reserved_usd,
+            0.0,
+        )
+        error = WorkflowCostBudgetExceededError(
+            f"Workflow step {step.id} projects ${projected_cost_usd:.4f}, more than the "
+            f"${remaining_usd:.4f} left in its cost budget."
+        )
+        refused_at = datetime.now(tz=UTC)
+
+        return _StepResult(
+            step=step,
+            step_context=step_context,
+            execution=None,
+            attempts=(
+                WorkflowStepAttempt(
+                    attempt_number=1,
+                    started_at=refused_at,
+                    completed_at=refused_at,
+                    failure=WorkflowStepFailure(
+                        exception_type=type(error).__name__,
+                        message=str(error),
+                    ),
+                ),
+            ),
+            error=error,
+            status=WorkflowStepStatus.FAILED,
+        )
+
+    @staticmethod
+    def _replay_step(
+        *,
+        step: WorkflowCandidateStep,
+        step_context: Context,
+        cached: WorkflowCachedStepResult,
+        emit: Callable[[WorkflowRunEvent], None] | None,
+        speculative: bool,
+    ) -> _StepResult:
+        """Complete a workflow step from a cached result without executing it."""
+
+        started_at = datetime.now(tz=UTC)
+
+        attempt = WorkflowStepAttempt(
+            attempt_number=1,
+            started_at=started_at,
+            completed_at=started_at,
+            execution=cached.replay(step_context, occurred_at=started_at),
+            cached=True,
+        )
+
+        if emit is not None:
+            emit(
+                WorkflowStepStarted(
+                    step_id=step.id,
+                    started_at=started_at,
+                    speculative=speculative,
+                )
+            )
+            emit(
+                WorkflowAttemptCompleted(
+                    step_id=step.id,
+                    attempt=attempt,
+                )
+            )
+
+        return _StepResult(
+            step=step,
+            step_context=step_context,
+            execution=attempt.execution,
+            attempts=(attempt,),
+            error=None,
+            status=WorkflowStepStatus.EXECUTED,
+        )
+
+    @staticmethod
+    def _record_step(
+        *,
+        plan_step: WorkflowPlanStep,
+        result: _StepResult | None,
+        values: list[WorkflowValue | None],
+        skip_reason: WorkflowStepSkipReason | None = None,
+        discarded_attempts: tuple[WorkflowStepAttempt, ...] = (),
+    ) -> WorkflowStepRun:
+        """Return durable evidence for one processed workflow step.
+
+        Values produced by the step are stored in their plan slots.
+        """
+
+        step = plan_step.step
+
+        if result is None or result.status is WorkflowStepStatus.SKIPPED:
+            return WorkflowStepRun(
+                step_id=step.id,
+                layer_index=plan_step.layer_index,
+                status=WorkflowStepStatus.SKIPPED,
+                execution=None,
+                attempts=(),
+                values=(),
+                skip_reason=skip_reason if result is None else result.skip_reason,
+                discarded_attempts=discarded_attempts,
+            )
+
+        if result.status is WorkflowStepStatus.FAILED:
+            if result.error is None:
+                raise RuntimeError("Failed workflow step is missing its failure.")
+
+            return WorkflowStepRun(
+                step_id=step.id,
+                layer_index=plan_step.layer_index,
+                status=WorkflowStepStatus.FAILED,
+                execution=None,
+                attempts=result.attempts,
+                values=(),
+            )
+
+        execution = result.execution
+
+        if execution is None:
+            raise RuntimeError("Executed workflow step is missing its execution result.")
+
+        step_values: list[WorkflowValue] = []
+
+        for binding, slot in plan_step.output_slots:
+            value = construct_trusted(
+                WorkflowValue,
+                name=binding.name,
+                value=binding.resolve(execution.output),
+                producer_step_id=step.id,
+            )
+
+            values[slot] = value
+            step_values.append(value)
+
+        return WorkflowStepRun(
+            step_id=step.id,
+            layer_index=plan_step.layer_index,
+            status=WorkflowStepStatus.EXECUTED,
+            execution=execution,
+            attempts=result.attempts,
+            values=tuple(step_values),
+        )
 
+    @staticmethod
+    def _restore_step(
+        *,
+        plan_step: WorkflowPlanStep,
+        step_run: WorkflowStepRun,
+        values: list[WorkflowValue | None],
+    ) -> _StepResult | None:
+        """Restore the values of a checkpointed step into their plan slots.
+
+        Returns the step result needed to merge its context, if it executed.
+        """
+
+        recorded = {value.name: value for value in step_run.values}
+
+        for binding, slot in plan_step.output_slots:
+            value = recorded.get(binding.name)
+
+            if value is not None:
+                values[slot] = value
+
+        if step_run.execution is None:
+            return None
+
+        return _StepResult(
+            step=plan_step.step,
+            step_context=step_run.execution.initial_context,
+            execution=step_run.execution,
+            attempts=step_run.attempts,
+            error=None,
+            status=step_run.status,
+        )
+
+    async def _execute_layer(
+        self,
+        *,
+        eligible: list[tuple[WorkflowCandidateStep, Context]],
+        state: _RunState,
+    ) -> dict[UUID, _StepResult]:
+        """Execute the eligible steps of one dependency layer."""
+
+        results: dict[UUID, _StepResult] = {}
+
+        if self._scheduling is WorkflowSchedulingMode.SEQUENTIAL:
+            for step, step_context in eligible:
+                result = await self._execute_step(
+                    step=step,
+                    step_context=step_context,
+                    state=state,
+                )
+
+                results[step.id] = result
+
+                if (
+                    result.error is not None
+                    and step.failure_policy is WorkflowFailurePolicy.FAIL_WORKFLOW
+                ):
+                    raise result.error
+
+            return results
+
+        #
+        # Every eligible step of the layer already has its immutable
+        # layer-start context, so the steps can run together.
+        #
+        tasks = [
+            asyncio.create_task(
+                self._execute_step(
+                    step=step,
+                    step_context=step_context,
+                    state=state,
+                )
+            )
+            for step, step_context in eligible
+        ]
+
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+
+                if (
+                    result.error is not None
+                    and result.step.failure_policy is WorkflowFailurePolicy.FAIL_WORKFLOW
+                ):
+                    raise result.error
+
+                results[result.step.id] = result
+        finally:
+            await cancel_tasks(tasks)
+
+        return results
+
+    @staticmethod
+    def _blocks_dependents(
+        plan_step: WorkflowPlanStep,
+        step_run: WorkflowStepRun,
+    ) -> bool:
+        """Return whether a recorded step causes its dependents to be skipped."""
+
+        if step_run.skip_reason in (
+            WorkflowStepSkipReason.BLOCKED,
+            WorkflowStepSkipReason.BUDGET_EXHAUSTED,
+        ):
+            return True
+
+        return (
+            step_run.status is WorkflowStepStatus.FAILED
+            and plan_step.step.failure_policy is WorkflowFailurePolicy.SKIP_DEPENDENTS
+        )
+
+    async def _run_by_layer(
+        self,
+        *,
+        plan: WorkflowExecutionPlan,
+        context: Context,
+        state: _RunState,
+        committed: dict[UUID, WorkflowStepRun],
+        required_mask: int,
+    ) -> tuple[list[WorkflowStepRun], Context]:
+        """Execute and commit workflow steps one dependency layer at a time.
+
+        Steps already committed by a checkpoint are restored, not executed.
+        Steps outside `required_mask` are skipped.
+        """
+
+        current_context = context
+        completed_steps: list[WorkflowStepRun] = []
+        values: list[WorkflowValue | None] = [None] * plan.slot_count
+
+        blocked_mask = 0
+        skip_reasons: dict[int, WorkflowStepSkipReason] = {}
+
+        for layer in plan.layers:
+            layer_context = current_context
+
+            eligible: list[tuple[WorkflowCandidateStep, Context]] = []
+
+            for position in layer:
+                plan_step = plan.steps[position]
+
+                if plan_step.step.id in committed:
                     continue
 
-                if status is WorkflowStepStatus.FAILED:
-                    if error is None:
-                        raise RuntimeError("Failed workflow step is missing its failure.")
-
-                    completed_steps.append(
-                        WorkflowStepRun(
-                            step_id=step.id,
-                            layer_index=layer_index,
-                            status=WorkflowStepStatus.FAILED,
-                            execution=None,
-                            attempts=attempts,
-                            values=(),
-                        )
+                if not required_mask & (1 << position):
+                    skip_reasons[position] = WorkflowStepSkipReason.NOT_REQUIRED
+                    continue
+
+                #
+                # A dependency skipped because of SKIP_DEPENDENTS
+                # blocks this step transitively.
+                #
+                if plan_step.dependency_mask & blocked_mask:
+                    blocked_mask |= 1 << position
+                    skip_reasons[position] = WorkflowStepSkipReason.BLOCKED
+                    continue
+
+                #
+                # Normal conditional eligibility.
+                #
+                if not self._conditions_are_satisfied(
+                    plan_step=plan_step,
+                    values=values,
+                ):
+                    skip_reasons[position] = WorkflowStepSkipReason.CONDITION
+                    continue
+
+                eligible.append(
+                    (
+                        plan_step.step,
+                        self._build_step_context(
+                            layer_context=layer_context,
+                            plan_step=plan_step,
+                            values=values,
+                            stream=state.streams.get(plan_step.step.id),
+                        ),
                     )
+                )
+
+            layer_results = await self._execute_layer(
+                eligible=eligible,
+                state=state,
+            )
+
+            #
+            # Commit the layer in declared workflow order.
+            #
+            for position in layer:
+                plan_step = plan.steps[position]
+                step = plan_step.step
+                restored = committed.get(step.id)
+
+                if restored is not None:
+                    step_run = restored
+                    result = self._restore_step(
+                        plan_step=plan_step,
+                        step_run=step_run,
+                        values=values,
+                    )
+                else:
+                    result = layer_results.get(step.id)
+
+                    step_run = self._record_step(
+                        plan_step=plan_step,
+                        result=result,
+                        values=values,
+                        skip_reason=skip_reasons.get(position),
+                    )
+
+                    if state.emit is not None:
+                        state.emit(WorkflowStepCommitted(step=step_run))
+
+                if self._blocks_dependents(plan_step, step_run):
+                    blocked_mask |= 1 << position
+
+                if result is not None and result.execution is not None:
+                    current_context = self._merge_execution_context(
+                        current_context=current_context,
+                        execution_context=result.step_context,
+                        execution=result.execution,
+                    )
+
+                completed_steps.append(step_run)
+
+        return completed_steps, current_context
+
+    async def _run_by_dependency(
+        self,
+        *,
+        plan: WorkflowExecutionPlan,
+        context: Context,
+        state: _RunState,
+        committed: dict[UUID, WorkflowStepRun],
+        required_mask: int,
+    ) -> tuple[list[WorkflowStepRun], Context]:
+        """Execute each workflow step as soon as its own dependencies commit.
+
+        Steps already committed by a checkpoint are restored, not executed.
+        Steps outside `required_mask` are skipped.
+        """
+
+        step_runs: list[WorkflowStepRun | None] = [None] * len(plan.steps)
+        results: list[_StepResult | None] = [None] * len(plan.steps)
+        values: list[WorkflowValue | None] = [None] * plan.slot_count
+
+        finished_mask = 0
+        blocked_mask = 0
+
+        #
+        # Conditional steps the speculation policy trusts may start before
+        # the producers of their conditions finish.
+        #
+        speculation = self._speculation
+        speculative_mask = 0
+
+        if speculation is not None:
+            for plan_step in plan.steps:
+                if plan_step.speculation_mask and speculation.should_speculate(plan_step.step.id):
+                    speculative_mask |= 1 << plan_step.position
+
+        pending: dict[asyncio.Task[_StepResult], WorkflowPlanStep] = {}
+        waiting = list(plan.steps)
+
+        #
+        # Speculative steps whose conditions have not resolved yet, and
+        # the results they finished with in the meantime.
+        #
+        unresolved: dict[int, asyncio.Task[_StepResult]] = {}
+        held: dict[int, _StepResult] = {}
+        speculated_mask = 0
+        cancelled: list[asyncio.Task[_StepResult]] = []
+
+        failures: list[_StepResult] = []
+
+        def record(
+            plan_step: WorkflowPlanStep,
+            result: _StepResult | None,
+            *,
+            skip_reason: WorkflowStepSkipReason | None = None,
+            discarded_attempts: tuple[WorkflowStepAttempt, ...] = (),
+        ) -> None:
+            step_run = self._record_step(
+                plan_step=plan_step,
+                result=result,
+                values=values,
+                skip_reason=skip_reason,
+                discarded_attempts=discarded_attempts,
+            )
 
+            #
+            # A step that fails the workflow is never committed.
+            #
+            if (
+                result is not None
+                and result.error is not None
+                and plan_step.step.failure_policy is WorkflowFailurePolicy.FAIL_WORKFLOW
+            ):
+                failures.append(result)
+                return
+
+            if state.emit is not None:
+                state.emit(WorkflowStepCommitted(step=step_run))
+
+            commit(plan_step, step_run, result)
+
+        def commit(
+            plan_step: WorkflowPlanStep,
+            step_run: WorkflowStepRun,
+            result: _StepResult | None,
+        ) -> None:
+            nonlocal finished_mask, blocked_mask
+
+            if self._blocks_dependents(plan_step, step_run):
+                blocked_mask |= 1 << plan_step.position
+
+            results[plan_step.position] = result
+            step_runs[plan_step.position] = step_run
+            finished_mask |= 1 << plan_step.position
+
+        def skip_reason_for(
+            plan_step: WorkflowPlanStep,
+        ) -> WorkflowStepSkipReason | None:
+            if plan_step.dependency_mask & blocked_mask:
+                return WorkflowStepSkipReason.BLOCKED
+
+            if not self._conditions_are_satisfied(
+                plan_step=plan_step,
+                values=values,
+            ):
+                return WorkflowStepSkipReason.CONDITION
+
+            return None
+
+        def launch(
+            plan_step: WorkflowPlanStep,
+            *,
+            speculative: bool = False,
+        ) -> asyncio.Task[_StepResult]:
+            base_context = context
+
+            for ancestor_position in plan_step.ancestor_positions:
+                ancestor_result = results[ancestor_position]
+
+                if ancestor_result is None or ancestor_result.execution is None:
                     continue
 
-                if execution is None:
-                    raise RuntimeError("Executed workflow step is missing its execution result.")
+                base_context = self._merge_execution_context(
+                    current_context=base_context,
+                    execution_context=ancestor_result.step_context,
+                    execution=ancestor_result.execution,
+                )
+
+            step_context = self._build_step_context(
+                layer_context=base_context,
+                plan_step=plan_step,
+                values=values,
+                stream=state.streams.get(plan_step.step.id),
+            )
+
+            task = asyncio.create_task(
+                self._execute_step(
+                    step=plan_step.step,
+                    step_context=step_context,
+                    state=state,
+                    speculative=speculative,
+                )
+            )
+            pending[task] = plan_step
+
+            return task
+
+        def may_speculate(
+            plan_step: WorkflowPlanStep,
+        ) -> bool:
+            if not speculative_mask & (1 << plan_step.position):
+                return False
+
+            if plan_step.wait_mask & ~finished_mask & ~plan_step.speculation_mask:
+                return False
+
+            if plan_step.dependency_mask & blocked_mask:
+                return False
+
+            #
+            # Conditions whose producers already finished must hold.
+            #
+            for condition, slot in plan_step.condition_slots:
+                if slot is None:
+                    return False
+
+                if not finished_mask & (1 << plan.slot_producers[slot]):
+                    continue
+
+                value = values[slot]
+
+                if value is None or not condition.matches(value.value):
+                    return False
+
+            return True
+
+        def resolve(
+            plan_step: WorkflowPlanStep,
+        ) -> None:
+            task = unresolved.pop(plan_step.position)
+            skip_reason = skip_reason_for(plan_step)
+            result = held.pop(plan_step.position, None)
+
+            if skip_reason is None:
+                if result is not None:
+                    record(plan_step, result)
+
+                return
 
-                if result_context is None:
-                    raise RuntimeError("Executed workflow step is missing its execution context.")
+            #
+            # The speculation missed. Finished work is discarded and
+            # recorded separately; unfinished work is cancelled.
+            #
+            if result is None:
+                pending.pop(task, None)
+                task.cancel()
+                cancelled.append(task)
+
+            record(
+                plan_step,
+                None,
+                skip_reason=skip_reason,
+                discarded_attempts=result.attempts if result is not None else (),
+            )
+
+        for plan_step in plan.steps:
+            restored = committed.get(plan_step.step.id)
+
+            if restored is not None:
+                waiting.remove(plan_step)
+                commit(
+                    plan_step,
+                    restored,
+                    self._restore_step(
+                        plan_step=plan_step,
+                        step_run=restored,
+                        values=values,
+                    ),
+                )
+
+        #
+        # Steps no target needs are skipped before anything executes.
+        # Their dependents are unrequired too, so nothing waits on them.
+        #
+        for plan_step in tuple(waiting):
+            if not required_mask & (1 << plan_step.position):
+                waiting.remove(plan_step)
+                record(
+                    plan_step,
+                    None,
+                    skip_reason=WorkflowStepSkipReason.NOT_REQUIRED,
+                )
+
+        try:
+            while waiting or pending or unresolved:
+                progressed = True
+
+                while progressed and not failures:
+                    progressed = False
+
+                    for position in tuple(unresolved):
+                        plan_step = plan.steps[position]
+
+                        if plan_step.wait_mask & ~finished_mask:
+                            continue
+
+                        resolve(plan_step)
+                        progressed = True
+
+                    for plan_step in tuple(waiting):
+                        if plan_step.wait_mask & ~finished_mask:
+                            if may_speculate(plan_step):
+                                waiting.remove(plan_step)
+                                unresolved[plan_step.position] = launch(
+                                    plan_step,
+                                    speculative=True,
+                                )
+                                speculated_mask |= 1 << plan_step.position
+                                progressed = True
+
+                            continue
+
+                        waiting.remove(plan_step)
+                        progressed = True
+
+                        skip_reason = skip_reason_for(plan_step)
+
+                        if skip_reason is not None:
+                            record(
+                                plan_step,
+                                None,
+                                skip_reason=skip_reason,
+                            )
+                            continue
+
+                        launch(plan_step)
+
+                if failures or not pending:
+                    break
+
+                #
+                # Slots released by finished steps go to the best step
+                # ready now, including the steps those releases made ready.
+                #
+                if isinstance(state.limiter, _PriorityLimiter):
+                    state.limiter.dispatch_soon()
+
+                done, _ = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                for task in sorted(
+                    done,
+                    key=lambda finished: pending[finished].position,
+                ):
+                    plan_step = pending.pop(task)
+                    result = task.result()
+
+                    if speculated_mask & (1 << plan_step.position):
+                        result = replace(
+                            result,
+                            attempts=tuple(
+                                attempt.model_copy(
+                                    update={
+                                        "speculative": True,
+                                    },
+                                )
+                                for attempt in result.attempts
+                            ),
+                        )
+
+                    if plan_step.position in unresolved:
+                        held[plan_step.position] = result
+                        continue
+
+                    record(plan_step, result)
 
+                #
+                # Once the run has failed, in-flight steps are cancelled
+                # rather than left to finish.
+                #
+                if failures:
+                    break
+        finally:
+            await cancel_tasks([*pending, *cancelled])
+
+        if failures and failures[0].error is not None:
+            raise failures[0].error
+
+        current_context = context
+        completed_steps: list[WorkflowStepRun] = []
+
+        #
+        # Commit every step in layer order regardless of completion order.
+        #
+        for step_result, step_run in zip(results, step_runs, strict=True):
+            if step_result is not None and step_result.execution is not None:
                 current_context = self._merge_execution_context(
                     current_context=current_context,
-                    execution_context=result_context,
-                    execution=execution,
+                    execution_context=step_result.step_context,
+                    execution=step_result.execution,
                 )
 
-                values = tuple(
-                    WorkflowValue(
-                        name=binding.name,
-                        value=binding.resolve(execution.output),
-                        producer_step_id=step.id,
-                    )
-                    for binding in step.outputs
+            if step_run is None:
+                raise RuntimeError("Dependency-driven workflow run left a step unprocessed.")
+
+            completed_steps.append(step_run)
+
+        return completed_steps, current_context
+
+    def compile(
+        self,
+        workflow: WorkflowCandidate,
+    ) -> WorkflowExecutionPlan:
+        """Return an execution plan for a workflow candidate.
+
+        The most recently compiled plan is reused when the candidate is
+        structurally identical, so repeated runs skip structural work.
+        """
+
+        plan = self._plan
+
+        if plan is not None and plan.matches(workflow):
+            plan = plan.bind(workflow)
+        else:
+            plan = WorkflowExecutionPlan.compile(workflow)
+
+        self._plan = plan
+
+        return plan
+
+    def _limited_classes(
+        self,
+        step: WorkflowCandidateStep,
+    ) -> tuple[str, ...]:
+        """Return the limited resource classes a step holds while it executes."""
+
+        if self._resource_limits is None:
+            return ()
+
+        return self._resource_limits.limited_classes(workflow_step_resource_class(step))
+
+    def _admission(
+        self,
+        step: WorkflowCandidateStep,
+        state: _RunState,
+        *,
+        elements: bool,
+    ) -> _Admission:
+        """Return what a call of a step's strategy holds while it executes.
+
+        Resource slots come before the run-wide slot, so calls waiting for
+        a saturated resource leave the run-wide slots to steps that need
+        other resources. Slots released by `elements` of a map step are
+        dispatched at once, since no step completes to dispatch them.
+        """
+
+        resource_classes = self._limited_classes(step)
+        limiter = state.limiter
+
+        @asynccontextmanager
+        async def admit() -> AsyncIterator[None]:
+            async with AsyncExitStack() as admission:
+                for resource_class in resource_classes:
+                    await admission.enter_async_context(state.resources[resource_class])
+
+                if isinstance(limiter, _PriorityLimiter):
+                    if elements:
+                        admission.callback(limiter.dispatch_soon)
+
+                    await admission.enter_async_context(limiter.admit(state.priorities[step.id]))
+                elif limiter is not None:
+                    await admission.enter_async_context(limiter)
+
+                yield
+
+        return admit
+
+    def concurrency_pool(self) -> WorkflowConcurrencyPool:
+        """Return fresh concurrency slots for runs that should share them.
+
+        `run_batch` and `run_population` share one pool across their runs.
+        Passing one pool to several `run` calls does the same for runs
+        started separately.
+        """
+
+        limiter: asyncio.Semaphore | _PriorityLimiter | None = None
+
+        if self._max_concurrency is not None:
+            if self._prioritization is WorkflowStepPrioritization.CRITICAL_PATH:
+                limiter = _PriorityLimiter(
+                    self._max_concurrency,
+                    deferred=self._scheduling is WorkflowSchedulingMode.DEPENDENCY_DRIVEN,
                 )
+            else:
+                limiter = asyncio.Semaphore(self._max_concurrency)
+
+        return WorkflowConcurrencyPool(
+            limiter=limiter,
+            resources=(
+                {
+                    resource_class: asyncio.Semaphore(limit)
+                    for resource_class, limit in self._resource_limits.max_concurrency.items()
+                }
+                if self._resource_limits is not None
+                else {}
+            ),
+        )
 
-                completed_steps.append(
-                    WorkflowStepRun(
-                        step_id=step.id,
-                        layer_index=layer_index,
-                        status=WorkflowStepStatus.EXECUTED,
-                        execution=execution,
-                        attempts=attempts,
-                        values=values,
+    def _cost_ledger(self) -> WorkflowCostLedger | None:
+        """Return a fresh ledger for the runner's cost budget, if it has one."""
+
+        if self._cost_budget is None:
+            return None
+
+        return WorkflowCostLedger(self._cost_budget)
+
+    def _projected_cost_usd(
+        self,
+        step: WorkflowCandidateStep,
+        step_context: Context,
+        state: _RunState,
+    ) -> float:
+        """Project what one attempt of a step costs under the run's cost budget.
+
+        Without a model catalog nothing is priced, so only reported spend
+        counts against the budget.
+        """
+
+        if state.cost_ledger is None or self._model_catalog is None:
+            return 0.0
+
+        return project_workflow_strategy_cost(
+            step.strategy,
+            step_context,
+            budget=state.cost_ledger.budget,
+            catalog=self._model_catalog,
+        )
+
+    def _step_priorities(
+        self,
+        plan: WorkflowExecutionPlan,
+    ) -> _StepPriorities:
+        """Return admission priorities that favor the longest expected paths.
+
+        Priorities sort by expected remaining critical path, longest first,
+        then by declared order. Durations are median latencies from the
+        latency profile. Steps it never observed count as the median of
+        those it did, and without any observations every path is zero,
+        leaving declared order.
+        """
+
+        if self._priorities is not None and self._priorities[0] is plan:
+            return self._priorities[1]
+
+        expected = (
+            self._latency_profile.expected_durations(
+                tuple(
+                    (plan_step.step.id, plan_step.step.strategy.metadata.id)
+                    for plan_step in plan.steps
+                )
+            )
+            if self._latency_profile is not None
+            else (None,) * len(plan.steps)
+        )
+        observed = [duration for duration in expected if duration is not None]
+        fallback = median(observed) if observed else 0.0
+        paths = plan.critical_paths(
+            tuple(fallback if duration is None else duration for duration in expected)
+        )
+        declared = plan.candidate.graph.positions
+        priorities = {
+            plan_step.step.id: (-paths[plan_step.position], declared[plan_step.step.id])
+            for plan_step in plan.steps
+        }
+        self._priorities = (plan, priorities)
+
+        return priorities
+
+    async def run(
+        self,
+        workflow: WorkflowCandidate | WorkflowExecutionPlan,
+        context: Context,
+        *,
+        targets: tuple[WorkflowValueReference, ...] | None = None,
+        cost_ledger: WorkflowCostLedger | None = None,
+        pool: WorkflowConcurrencyPool | None = None,
+    ) -> WorkflowRun:
+        """Execute a workflow candidate or compiled plan in dependency order.
+
+        When `targets` is given, only the steps needed to produce those
+        values execute. Every other step is skipped as not required.
+
+        The run spends against `cost_ledger` when one is given, so several
+        runs can share one budget, and otherwise against a ledger of its
+        own for the runner's cost budget. Likewise, runs given the same
+        `pool` share their concurrency limits.
+        """
+
+        return await self._run(
+            workflow,
+            context,
+            targets=targets,
+            cost_ledger=cost_ledger,
+            pool=pool,
+        )
+
+    async def run_population(
+        self,
+        workflows: tuple[WorkflowCandidate | WorkflowExecutionPlan, ...],
+        context: Context,
+        *,
+        targets: tuple[tuple[WorkflowValueReference, ...], ...] | None = None,
+        cost_ledger: WorkflowCostLedger | None = None,
+        pool: WorkflowConcurrencyPool | None = None,
+    ) -> tuple[WorkflowRun, ...]:
+        """Execute workflow candidates concurrently, sharing identical steps.
+
+        A cacheable step whose strategy and step context match a step of
+        another candidate executes once. The other candidates record a
+        cached attempt replaying its result. Each candidate receives its
+        own run, in input order.
+
+        `targets`, when given, holds the required values of each
+        candidate, in the same order. Concurrency limits and the cost
+        budget bound the population as a whole, as do `pool` and
+        `cost_ledger` when given.
+        """
+
+        if targets is not None and len(targets) != len(workflows):
+            raise ValueError("Workflow population targets must be given for every candidate.")
+
+        flights: _StepFlights = {}
+        shared_pool = pool if pool is not None else self.concurrency_pool()
+        ledger = cost_ledger if cost_ledger is not None else self._cost_ledger()
+
+        return await gather_tasks(
+            self._run(
+                workflow,
+                context,
+                flights=flights,
+                targets=targets[index] if targets is not None else None,
+                pool=shared_pool,
+                cost_ledger=ledger,
+            )
+            for index, workflow in enumerate(workflows)
+        )
+
+    async def run_batch(
+        self,
+        workflow: WorkflowCandidate | WorkflowExecutionPlan,
+        contexts: tuple[Context, ...],
+        *,
+        targets: tuple[WorkflowValueReference, ...] | None = None,
+        cost_ledger: WorkflowCostLedger | None = None,
+        pool: WorkflowConcurrencyPool | None = None,
+    ) -> tuple[WorkflowRun, ...]:
+        """Execute one workflow against many contexts.
+
+        The workflow is compiled once. Each context receives the run a
+        separate call to `run` would produce, in input order. When the pool
+        has a `max_concurrency` limit, the steps of every run are in flight
+        together within it. Otherwise the runs execute one at a time, so an
+        unbounded runner never starts every context at once. Concurrency
+        limits and the cost budget bound the batch as a whole, as do `pool`
+        and `cost_ledger` when given.
+        """
+
+        plan = workflow if isinstance(workflow, WorkflowExecutionPlan) else self.compile(workflow)
+        shared_pool = pool if pool is not None else self.concurrency_pool()
+        ledger = cost_ledger if cost_ledger is not None else self._cost_ledger()
+
+        return await await_tasks(
+            (
+                self._run(
+                    plan,
+                    context,
+                    targets=targets,
+                    pool=shared_pool,
+                    cost_ledger=ledger,
+                )
+                for context in contexts
+            ),
+            concurrent=shared_pool.bounded,
+        )
+
+    async def stream(
+        self,
+        workflow: WorkflowCandidate | WorkflowExecutionPlan,
+        context: Context,
+    ) -> AsyncGenerator[WorkflowRunEvent, None]:
+        """Execute a workflow, yielding progress events as they happen.
+
+        The final event is a `WorkflowRunCompleted` carrying the finished
+        run. Closing the iterator early cancels the remaining execution.
+        """
+
+        events: asyncio.Queue[WorkflowRunEvent] = asyncio.Queue()
+
+        execution = asyncio.create_task(
+            self._run(
+                workflow,
+                context,
+                emit=events.put_nowait,
+            )
+        )
+
+        try:
+            while True:
+                if events.empty() and execution.done():
+                    #
+                    # A failed run raises here; a finished run always
+                    # queues its completion event first.
+                    #
+                    execution.result()
+
+                    raise RuntimeError("Workflow run finished without a completion event.")
+
+                next_event = asyncio.ensure_future(events.get())
+
+                await asyncio.wait(
+                    (next_event, execution),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                if not next_event.done():
+                    next_event.cancel()
+                    continue
+
+                event = next_event.result()
+
+                yield event
+
+                if isinstance(event, WorkflowRunCompleted):
+                    return
+        finally:
+            await cancel_tasks((execution,))
+
+    async def resume(
+        self,
+        run_id: UUID,
+        workflow: WorkflowCandidate | WorkflowExecutionPlan,
+    ) -> WorkflowRun:
+        """Continue a checkpointed workflow run after its committed steps.
+
+        The resumed run keeps the identifier, initial context, and start
+        time of the original run.
+        """
+
+        if self._checkpoints is None:
+            raise ValueError("Resuming a workflow run requires a checkpoint repository.")
+
+        checkpoint = self._checkpoints.get(run_id)
+
+        if checkpoint is None:
+            raise ValueError(f"Workflow run {run_id} has no checkpoint.")
+
+        return await self._run(
+            workflow,
+            checkpoint.initial_context,
+            checkpoint=checkpoint,
+        )
+
+    async def rerun(
+        self,
+        parent: WorkflowRun,
+        workflow: WorkflowCandidate | WorkflowExecutionPlan,
+    ) -> WorkflowRun:
+        """Execute a modified workflow, reusing the steps its changes cannot affect.
+
+        A parent step is changed when it failed, is missing, moved to another
+        layer, was won by a hedge, was not required by the parent's targets,
+        was skipped by the parent's cost budget, or executed a different
+        strategy, version, or model. Changed steps and
+        every step that can observe them are executed against the parent's
+        initial context. Other steps are copied from the parent run.
+        """
+
+        plan = workflow if isinstance(workflow, WorkflowExecutionPlan) else self.compile(workflow)
+
+        if parent.workflow != plan.candidate.metadata:
+            raise ValueError("Incremental workflow runs require a parent run of the same workflow.")
+
+        return await self._run(
+            plan,
+            parent.initial_context,
+            reused=self._reusable_steps(
+                parent=parent,
+                plan=plan,
+            ),
+        )
+
+    def _reusable_steps(
+        self,
+        *,
+        parent: WorkflowRun,
+        plan: WorkflowExecutionPlan,
+    ) -> dict[UUID, WorkflowStepRun]:
+        """Return the parent steps a rerun of the plan would reproduce exactly."""
+
+        parent_steps = {step.step_id: step for step in parent.steps}
+        changed_mask = 0
+
+        for plan_step in plan.steps:
+            step_run = parent_steps.get(plan_step.step.id)
+
+            if step_run is None or step_run.layer_index != plan_step.layer_index:
+                changed_mask |= 1 << plan_step.position
+                continue
+
+            #
+            # A condition or blocked skip depends only on upstream values,
+            # which are unchanged unless the step observes a changed step.
+            # A step the parent's targets did not need must run, since
+            # reruns are not targeted, and a step the parent's budget
+            # could not afford may fit in this run's.
+            #
+            if step_run.status is WorkflowStepStatus.SKIPPED:
+                if step_run.skip_reason in (
+                    WorkflowStepSkipReason.NOT_REQUIRED,
+                    WorkflowStepSkipReason.BUDGET_EXHAUSTED,
+                ):
+                    changed_mask |= 1 << plan_step.position
+
+                continue
+
+            metadata = plan_step.step.strategy.metadata
+            model = _strategy_model(plan_step.step.strategy)
+            execution = step_run.execution
+
+            if (
+                execution is None
+                or execution.strategy_id != metadata.id
+                or execution.strategy_version != metadata.version
+                or step_run.attempts[-1].hedge_role is WorkflowHedgeRole.HEDGE
+            ):
+                changed_mask |= 1 << plan_step.position
+                continue
+
+            #
+            # Model substitutions keep the strategy identity. Bound
+            # strategies verify the reported model, so the metrics of the
+            # parent execution name the model it ran.
+            #
+            metrics = execution.metrics
+
+            if model is not None and (
+                metrics is None or f"{metrics.provider}/{metrics.model}" != model
+            ):
+                changed_mask |= 1 << plan_step.position
+
+        #
+        # Dependency-driven steps see only their ancestors. Layer steps
+        # see every step of every earlier layer.
+        #
+        first_changed_layer = min(
+            (
+                plan_step.layer_index
+                for plan_step in plan.steps
+                if changed_mask & (1 << plan_step.position)
+            ),
+            default=len(plan.layers),
+        )
+
+        reused: dict[UUID, WorkflowStepRun] = {}
+
+        for plan_step in plan.steps:
+            if changed_mask & (1 << plan_step.position):
+                continue
+
+            if self._scheduling is WorkflowSchedulingMode.DEPENDENCY_DRIVEN:
+                if any(
+                    changed_mask & (1 << ancestor_position)
+                    for ancestor_position in plan_step.ancestor_positions
+                ):
+                    continue
+            elif plan_step.layer_index > first_changed_layer:
+                continue
+
+            reused[plan_step.step.id] = parent_steps[plan_step.step.id]
+
+        return reused
+
+    async def _run(
+        self,
+        workflow: WorkflowCandidate | WorkflowExecutionPlan,
+        context: Context,
+        *,
+        emit: Callable[[WorkflowRunEvent], None] | None = None,
+        checkpoint: WorkflowRunCheckpoint | None = None,
+        reused: dict[UUID, WorkflowStepRun] | None = None,
+        flights: _StepFlights | None = None,
+        targets: tuple[WorkflowValueReference, ...] | None = None,
+        pool: WorkflowConcurrencyPool | None = None,
+        cost_ledger: WorkflowCostLedger | None = None,
+    ) -> WorkflowRun:
+        """Execute a workflow, reporting progress to an optional event sink.
+
+        Steps from a checkpoint or reused from a parent run are restored
+        rather than executed. With `targets`, only the steps needed to
+        produce them execute. Runs given the same `pool` share their
+        concurrency limits, and runs given the same `cost_ledger` share their
+        cost budget. Without a ledger, the run has one of its own for the
+        runner's cost budget.
+        """
+
+        plan = workflow if isinstance(workflow, WorkflowExecutionPlan) else self.compile(workflow)
+        required_mask = (
+            plan.required_mask(targets) if targets is not None else (1 << len(plan.steps)) - 1
+        )
+
+        if checkpoint is None:
+            run_id = uuid4()
+            started_at = datetime.now(
+                tz=UTC,
+            )
+            committed: dict[UUID, WorkflowStepRun] = dict(reused) if reused is not None else {}
+        else:
+            if checkpoint.workflow != plan.candidate.metadata:
+                raise ValueError("Workflow run checkpoint belongs to a different workflow.")
+
+            run_id = checkpoint.run_id
+            started_at = checkpoint.started_at
+            committed = {step.step_id: step for step in checkpoint.steps}
+
+            if not committed.keys() <= {plan_step.step.id for plan_step in plan.steps}:
+                raise ValueError("Workflow run checkpoint contains steps outside the workflow.")
+
+        checkpoints = self._checkpoints
+        sink = emit
+
+        if checkpoints is not None:
+            if checkpoint is None:
+                checkpoints.start(
+                    WorkflowRunCheckpoint(
+                        run_id=run_id,
+                        workflow=plan.candidate.metadata,
+                        initial_context=context,
+                        started_at=started_at,
+                        steps=tuple(committed.values()),
                     )
                 )
+
+            def checkpoint_commits(event: WorkflowRunEvent) -> None:
+                if isinstance(event, WorkflowStepCommitted):
+                    checkpoints.commit_step(run_id, event.step)
+
+                if emit is not None:
+                    emit(event)
+
+            sink = checkpoint_commits
+
+        if pool is None:
+            pool = self.concurrency_pool()
+
+        state = _RunState(
+            limiter=pool._limiter,
+            priorities=(
+                self._step_priorities(plan) if isinstance(pool._limiter, _PriorityLimiter) else {}
+            ),
+            retry_budget=_RetryBudgetState(
+                budget=self._retry_budget,
+            ),
+            deadline=(
+                monotonic() + self._run_timeout_seconds
+                if self._run_timeout_seconds is not None
+                else None
+            ),
+            emit=sink,
+            flights=flights,
+            resources=pool._resources,
+            cost_ledger=cost_ledger if cost_ledger is not None else self._cost_ledger(),
+        )
+        streams = state.streams
+        streams.update(
+            _map_streams(
+                plan,
+                required_mask,
+                lambda step: self._admission(step, state, elements=True),
+            )
+        )
+
+        for plan_step in plan.steps:
+            stream = streams.get(plan_step.step.id)
+
+            if stream is not None:
+                producer_id = plan_step.step.inputs[0].source.producer_step_id
+                state.producers[producer_id] = (*state.producers.get(producer_id, ()), stream)
+
+        try:
+            if self._scheduling is WorkflowSchedulingMode.DEPENDENCY_DRIVEN:
+                completed_steps, final_context = await self._run_by_dependency(
+                    plan=plan,
+                    context=context,
+                    state=state,
+                    committed=committed,
+                    required_mask=required_mask,
+                )
+            else:
+                completed_steps, final_context = await self._run_by_layer(
+                    plan=plan,
+                    context=context,
+                    state=state,
+                    committed=committed,
+                    required_mask=required_mask,
+                )
+        finally:
+            #
+            # Slots this run released may be waiting for its scheduler to
+            # dispatch them to the other runs sharing the pool.
+            #
+            if isinstance(state.limiter, _PriorityLimiter):
+                state.limiter.dispatch_soon()
+
+            await asyncio.gather(*(stream.close() for stream in streams.values()))
+
         completed_at = datetime.now(
             tz=UTC,
         )
 
-        return WorkflowRun(
-            workflow=workflow.metadata,
+        run = WorkflowRun(
+            id=run_id,
+            workflow=plan.candidate.metadata,
             steps=tuple(completed_steps),
             initial_context=context,
-            final_context=current_context,
+            final_context=final_context,
             started_at=started_at,
             completed_at=completed_at,
         )
+
+        #
+        # A completed run no longer needs its checkpoint.
+        #
+        if checkpoints is not None:
+            checkpoints.discard(run_id)
+
+        if emit is not None:
+            emit(WorkflowRunCompleted(run=run))
+
+        return run
@@ -0,0 +1,18 @@
+"""Workflow step scheduling modes and admission priorities."""
+
+from enum import StrEnum
+
+
+class WorkflowSchedulingMode(StrEnum):
+    """How a workflow runner decides when eligible steps start."""
+
+    SEQUENTIAL = "sequential"
+    CONCURRENT = "concurrent"
+    DEPENDENCY_DRIVEN = "dependency_driven"
+
+
+class WorkflowStepPrioritization(StrEnum):
+    """The order in which ready steps are admitted under a concurrency limit."""
+
+    DECLARED_ORDER = "declared_order"
+    CRITICAL_PATH = "critical_path"
@@ -0,0 +1,121 @@
+"""Speculative execution of conditional workflow steps."""
+
+from collections import Counter
+from collections.abc import Iterable
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from azathoth.workflows.execution import (
+    WorkflowRun,
+    WorkflowStepSkipReason,
+    WorkflowStepStatus,
+)
+
+
+class WorkflowConditionHitRate(BaseModel):
+    """How often a workflow step passed its conditions in recorded runs."""
+
+    model_config = ConfigDict(frozen=True)
+
+    step_id: UUID
+    observations: int = Field(ge=0)
+    hits: int = Field(ge=0)
+
+    @model_validator(mode="after")
+    def validate_hits(self) -> "WorkflowConditionHitRate":
+        """Ensure hits do not exceed observations."""
+
+        if self.hits > self.observations:
+            raise ValueError("Workflow condition hits cannot exceed observations.")
+
+        return self
+
+    @property
+    def rate(self) -> float:
+        """Return the fraction of observations in which the step ran."""
+
+        if self.observations == 0:
+            return 0.0
+
+        return self.hits / self.observations
+
+
+class WorkflowSpeculationPolicy(BaseModel):
+    """Decide which conditional steps may start before their conditions resolve."""
+
+    model_config = ConfigDict(frozen=True)
+
+    hit_rates: tuple[WorkflowConditionHitRate, ...] = ()
+    minimum_hit_rate: float = Field(default=0.9, gt=0.0, le=1.0)
+    minimum_observations: int = Field(default=10, ge=1)
+
+    @classmethod
+    def from_runs(
+        cls,
+        runs: Iterable[WorkflowRun],
+        *,
+        minimum_hit_rate: float = 0.9,
+        minimum_observations: int = 10,
+    ) -> "WorkflowSpeculationPolicy":
+        """Derive condition hit rates from recorded workflow runs.
+
+        A step is observed whenever its conditions were evaluated. Steps
+        skipped because a dependency was blocked, or because the run did
+        not require them, are not observations.
+        Skips recorded before skip reasons existed count as misses.
+        """
+
+        observations: Counter[UUID] = Counter()
+        hits: Counter[UUID] = Counter()
+
+        for run in runs:
+            for step in run.steps:
+                if step.status is WorkflowStepStatus.SKIPPED:
+                    if step.skip_reason not in (
+                        None,
+                        WorkflowStepSkipReason.CONDITION,
+                    ):
+                        continue
+                else:
+                    hits[step.step_id] += 1
+
+                observations[step.step_id] += 1
+
+        return cls(
+            hit_rates=tuple(
+                WorkflowConditionHitRate(
+                    step_id=step_id,
+                    observations=count,
+                    hits=hits[step_id],
+                )
+                for step_id, count in observations.items()
+            ),
+            minimum_hit_rate=minimum_hit_rate,
+            minimum_observations=minimum_observations,
+        )
+
+    def hit_rate(
+        self,
+        step_id: UUID,
+    ) -> WorkflowConditionHitRate | None:
+        """Return the recorded hit rate for one workflow step."""
+
+        return next(
+            (hit_rate for hit_rate in self.hit_rates if hit_rate.step_id == step_id),
+            None,
+        )
+
+    def should_speculate(
+        self,
+        step_id: UUID,
+    ) -> bool:
+        """Return whether a conditional step is likely enough to start early."""
+
+        hit_rate = self.hit_rate(step_id)
+
+        return (
+            hit_rate is not None
+            and hit_rate.observations >= self.minimum_observations
+            and hit_rate.rate >= self.minimum_hit_rate
+        )
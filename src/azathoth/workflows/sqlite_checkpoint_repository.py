@@ -0,0 +1,335 @@
+"""SQLite persistence for workflow run checkpoints."""
+
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+from uuid import UUID
+
+from azathoth.context import Context
+from azathoth.execution import shared_context_events
+from azathoth.workflows.checkpoint import WorkflowRunCheckpoint
+from azathoth.workflows.execution import WorkflowStepRun
+
+
+class SQLiteWorkflowRunCheckpointRepository:
+    """Persist workflow run checkpoints in a SQLite database.
+
+    Each committed step is written as its own row, so checkpointing a step
+    never rewrites the progress already stored for the run.
+
+    Step rows record their executions' produced events, and write the
+    leading events of each execution context as a count of events shared
+    with the checkpoint context: the initial context followed by the
+    events of every earlier row. Rows therefore do not repeat the run's
+    history.
+    """
+
+    def __init__(
+        self,
+        database: str | Path,
+    ) -> None:
+        self._database = str(database)
+        self._contexts: dict[UUID, Context] = {}
+        self._initialize()
+
+    def start(
+        self,
+        checkpoint: WorkflowRunCheckpoint,
+    ) -> None:
+        """Persist a new checkpoint without replacing existing progress."""
+
+        connection = sqlite3.connect(self._database)
+
+        try:
+            try:
+                connection.execute(
+                    """
+                    INSERT INTO workflow_run_checkpoints (
+                        run_id,
+                        workflow_id,
+                        payload
+                    )
+                    VALUES (?, ?, ?)
+                    """,
+                    (
+                        str(checkpoint.run_id),
+                        str(checkpoint.workflow.id),
+                        checkpoint.model_copy(
+                            update={
+                                "steps": (),
+                            },
+                        ).model_dump_json(),
+                    ),
+                )
+
+                context = checkpoint.initial_context
+                rows: list[tuple[str, str, str]] = []
+
+                for step in checkpoint.steps:
+                    rows.append(
+                        (
+                            str(checkpoint.run_id),
+                            str(step.step_id),
+                            self._dump_step(step, context),
+                        )
+                    )
+                    context = self._extended(context, (step,))
+
+                connection.executemany(
+                    """
+                    INSERT INTO workflow_run_checkpoint_steps (
+                        run_id,
+                        step_id,
+                        payload
+                    )
+                    VALUES (?, ?, ?)
+                    """,
+                    rows,
+                )
+                connection.commit()
+            except sqlite3.IntegrityError as exc:
+                raise ValueError(
+                    f"Workflow run checkpoint {checkpoint.run_id} already exists."
+                ) from exc
+        finally:
+            connection.close()
+
+        self._contexts[checkpoint.run_id] = context
+
+    def commit_step(
+        self,
+        run_id: UUID,
+        step: WorkflowStepRun,
+    ) -> None:
+        """Append one committed step to a workflow run checkpoint."""
+
+        connection = sqlite3.connect(self._database)
+
+        try:
+            row = connection.execute(
+                """
+                SELECT payload
+                FROM workflow_run_checkpoints
+                WHERE run_id = ?
+                """,
+                (str(run_id),),
+            ).fetchone()
+
+            if row is None:
+                raise ValueError(f"Workflow run {run_id} has no checkpoint.")
+
+            context = self._contexts.get(run_id)
+
+            if context is None:
+                checkpoint = self._load(connection, row[0])
+                context = self._extended(checkpoint.initial_context, checkpoint.steps)
+
+            try:
+                connection.execute(
+                    """
+                    INSERT INTO workflow_run_checkpoint_steps (
+                        run_id,
+                        step_id,
+                        payload
+                    )
+                    VALUES (?, ?, ?)
+                    """,
+                    (
+                        str(run_id),
+                        str(step.step_id),
+                        self._dump_step(step, context),
+                    ),
+                )
+                connection.commit()
+            except sqlite3.IntegrityError as exc:
+                raise ValueError(
+                    f"Workflow step {step.step_id} is already committed to run {run_id}."
+                ) from exc
+        finally:
+            connection.close()
+
+        self._contexts[run_id] = self._extended(context, (step,))
+
+    def get(
+        self,
+        run_id: UUID,
+    ) -> WorkflowRunCheckpoint | None:
+        """Return a workflow run checkpoint by run identifier."""
+
+        connection = sqlite3.connect(self._database)
+
+        try:
+            row = connection.execute(
+                """
+                SELECT payload
+                FROM workflow_run_checkpoints
+                WHERE run_id = ?
+                """,
+                (str(run_id),),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            return self._load(
+                connection,
+                row[0],
+            )
+        finally:
+            connection.close()
+
+    def checkpoints(
+        self,
+    ) -> tuple[WorkflowRunCheckpoint, ...]:
+        """Return all persisted checkpoints in the order runs started."""
+
+        connection = sqlite3.connect(self._database)
+
+        try:
+            rows = connection.execute(
+                """
+                SELECT payload
+                FROM workflow_run_checkpoints
+                ORDER BY sequence
+                """
+            ).fetchall()
+
+            return tuple(
+                self._load(
+                    connection,
+                    row[0],
+                )
+                for row in rows
+            )
+        finally:
+            connection.close()
+
+    def discard(
+        self,
+        run_id: UUID,
+    ) -> None:
+        """Remove the checkpoint of a workflow run, if one exists."""
+
+        connection = sqlite3.connect(self._database)
+
+        try:
+            connection.execute(
+                """
+                DELETE FROM workflow_run_checkpoint_steps
+                WHERE run_id = ?
+                """,
+                (str(run_id),),
+            )
+            connection.execute(
+                """
+                DELETE FROM workflow_run_checkpoints
+                WHERE run_id = ?
+                """,
+                (str(run_id),),
+            )
+            connection.commit()
+        finally:
+            connection.close()
+
+        self._contexts.pop(run_id, None)
+
+    @staticmethod
+    def _extended(
+        context: Context,
+        steps: Iterable[WorkflowStepRun],
+    ) -> Context:
+        """Return a checkpoint context followed by the events steps produced."""
+
+        for step in steps:
+            if step.execution is not None:
+                for event in step.execution.produced_events:
+                    context = context.append(event)
+
+        return context
+
+    @staticmethod
+    def _dump_step(
+        step: WorkflowStepRun,
+        context: Context,
+    ) -> str:
+        """Serialize a step row relative to the checkpoint context before it."""
+
+        with shared_context_events(context):
+            return step.model_dump_json()
+
+    @classmethod
+    def _load(
+        cls,
+        connection: sqlite3.Connection,
+        payload: object,
+    ) -> WorkflowRunCheckpoint:
+        """Reconstruct one checkpoint and its committed steps."""
+
+        if not isinstance(payload, str):
+            raise TypeError("Persisted workflow run checkpoint payload was not text.")
+
+        checkpoint = WorkflowRunCheckpoint.model_validate_json(payload)
+
+        rows = connection.execute(
+            """
+            SELECT payload
+            FROM workflow_run_checkpoint_steps
+            WHERE run_id = ?
+            ORDER BY sequence
+            """,
+            (str(checkpoint.run_id),),
+        ).fetchall()
+
+        steps: list[WorkflowStepRun] = []
+        context = checkpoint.initial_context
+
+        for row in rows:
+            if not isinstance(row[0], str):
+                raise TypeError("Persisted workflow step checkpoint payload was not text.")
+
+            with shared_context_events(context):
+                step = WorkflowStepRun.model_validate_json(row[0])
+
+            steps.append(step)
+            context = cls._extended(context, (step,))
+
+        return WorkflowRunCheckpoint(
+            run_id=checkpoint.run_id,
+            workflow=checkpoint.workflow,
+            initial_context=checkpoint.initial_context,
+            started_at=checkpoint.started_at,
+            steps=tuple(steps),
+        )
+
+    def _initialize(self) -> None:
+        """Create repository tables when they do not already exist."""
+
+        connection = sqlite3.connect(self._database)
+
+        try:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS workflow_run_checkpoints (
+                    sequence INTEGER PRIMARY KEY AUTOINCREMENT,
+                    run_id TEXT NOT NULL UNIQUE,
+                    workflow_id TEXT NOT NULL,
+                    payload TEXT NOT NULL
+                )
+                """
+            )
+
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS workflow_run_checkpoint_steps (
+                    sequence INTEGER PRIMARY KEY AUTOINCREMENT,
+                    run_id TEXT NOT NULL,
+                    step_id TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    UNIQUE (run_id, step_id)
+                )
+                """
+            )
+
+            connection.commit()
+        finally:
+            connection.close()
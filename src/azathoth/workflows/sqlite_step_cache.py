@@ -0,0 +1,199 @@
+"""SQLite least-recently-used cache of workflow step results."""
+
+import sqlite3
+from datetime import UTC, timedelta
+from pathlib import Path
+
+from azathoth.workflows.cache import Clock, WorkflowCachedStepResult, utc_now
+
+
+class SQLiteWorkflowStepCache:
+    """Persist workflow step results in a SQLite database.
+
+    Reads record a use sequence, so once `max_entries` is reached the
+    least recently used entries are evicted. Entries older than
+    `ttl_seconds` are never returned and are removed on write.
+    """
+
+    def __init__(
+        self,
+        database: str | Path,
+        *,
+        max_entries: int | None = None,
+        ttl_seconds: float | None = None,
+        clock: Clock = utc_now,
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("Workflow step cache max_entries must be at least 1.")
+
+        if ttl_seconds is not None and ttl_seconds <= 0.0:
+            raise ValueError("Workflow step cache ttl_seconds must be positive.")
+
+        self._database = str(database)
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._initialize()
+
+    def get(
+        self,
+        key: str,
+    ) -> WorkflowCachedStepResult | None:
+        """Return an unexpired cached result and mark it recently used."""
+
+        connection = sqlite3.connect(self._database)
+
+        try:
+            row = connection.execute(
+                """
+                SELECT payload
+                FROM workflow_step_cache
+                WHERE key = ?
+                """,
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            if not isinstance(row[0], str):
+                raise TypeError("Persisted workflow step cache payload was not text.")
+
+            result = WorkflowCachedStepResult.model_validate_json(row[0])
+
+            if result.expired(self._clock(), self._ttl_seconds):
+                connection.execute(
+                    """
+                    DELETE FROM workflow_step_cache
+                    WHERE key = ?
+                    """,
+                    (key,),
+                )
+                connection.commit()
+
+                return None
+
+            self._touch(
+                connection,
+                key,
+            )
+            connection.commit()
+
+            return result
+        finally:
+            connection.close()
+
+    def put(
+        self,
+        result: WorkflowCachedStepResult,
+    ) -> None:
+        """Store a result, evicting expired and least recently used entries."""
+
+        connection = sqlite3.connect(self._database)
+
+        try:
+            connection.execute(
+                """
+                INSERT INTO workflow_step_cache (
+                    key,
+                    strategy_id,
+                    cached_at,
+                    last_used,
+                    payload
+                )
+                VALUES (?, ?, ?, 0, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    strategy_id = excluded.strategy_id,
+                    cached_at = excluded.cached_at,
+                    payload = excluded.payload
+                """,
+                (
+                    result.key,
+                    str(result.strategy_id),
+                    result.cached_at.astimezone(UTC).isoformat(),
+                    result.model_dump_json(),
+                ),
+            )
+            self._touch(
+                connection,
+                result.key,
+            )
+
+            if self._ttl_seconds is not None:
+                connection.execute(
+                    """
+                    DELETE FROM workflow_step_cache
+                    WHERE cached_at <= ?
+                    """,
+                    (
+                        (self._clock() - timedelta(seconds=self._ttl_seconds))
+                        .astimezone(UTC)
+                        .isoformat(),
+                    ),
+                )
+
+            if self._max_entries is not None:
+                connection.execute(
+                    """
+                    DELETE FROM workflow_step_cache
+                    WHERE key NOT IN (
+                        SELECT key
+                        FROM workflow_step_cache
+                        ORDER BY last_used DESC
+                        LIMIT ?
+                    )
+                    """,
+                    (self._max_entries,),
+                )
+
+            connection.commit()
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _touch(
+        connection: sqlite3.Connection,
+        key: str,
+    ) -> None:
+        """Mark one entry as the most recently used."""
+
+        connection.execute(
+            """
+            UPDATE workflow_step_cache
+            SET last_used = (
+                SELECT COALESCE(MAX(last_used), 0) + 1
+                FROM workflow_step_cache
+            )
+            WHERE key = ?
+            """,
+            (key,),
+        )
+
+    def _initialize(self) -> None:
+        """Create cache tables when they do not already exist."""
+
+        connection = sqlite3.connect(self._database)
+
+        try:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS workflow_step_cache (
+                    key TEXT PRIMARY KEY,
+                    strategy_id TEXT NOT NULL,
+                    cached_at TEXT NOT NULL,
+                    last_used INTEGER NOT NULL,
+                    payload TEXT NOT NULL
+                )
+                """
+            )
+
+            connection.execute(
+                """
+                CREATE INDEX IF NOT EXISTS workflow_step_cache_last_used
+                ON workflow_step_cache (last_used)
+                """
+            )
+
+            connection.commit()
+        finally:
+            connection.close()
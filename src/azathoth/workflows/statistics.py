@@ -13,12 +13,19 @@ class WorkflowRunStatistics(BaseModel):
     executed_steps: int = Field(ge=0)
     failed_steps: int = Field(ge=0)
     skipped_steps: int = Field(ge=0)
+    budget_exhausted_steps: int = Field(default=0, ge=0)
 
     total_attempts: int = Field(ge=0)
     successful_attempts: int = Field(ge=0)
     failed_attempts: int = Field(ge=0)
+    cancelled_attempts: int = Field(default=0, ge=0)
 
     retry_count: int = Field(ge=0)
+    hedged_attempts: int = Field(default=0, ge=0)
+    cached_attempts: int = Field(default=0, ge=0)
+
+    discarded_attempts: int = Field(default=0, ge=0)
+    discarded_cost_usd: float = Field(default=0.0, ge=0.0)
 
     duration_seconds: float = Field(ge=0.0)
 
@@ -31,15 +38,36 @@ class WorkflowRunStatistics(BaseModel):
 
         return self
 
+    @model_validator(mode="after")
+    def validate_budget_exhausted_steps(self) -> "WorkflowRunStatistics":
+        """Ensure budget-exhausted steps are counted as skipped steps."""
+
+        if self.budget_exhausted_steps > self.skipped_steps:
+            raise ValueError("Workflow budget-exhausted steps cannot exceed skipped steps.")
+
+        return self
+
     @model_validator(mode="after")
     def validate_attempt_counts(self) -> "WorkflowRunStatistics":
         """Ensure attempt counts reconcile with the attempt total."""
 
-        if self.successful_attempts + self.failed_attempts != self.total_attempts:
+        if (
+            self.successful_attempts + self.failed_attempts + self.cancelled_attempts
+            != self.total_attempts
+        ):
             raise ValueError("Workflow attempt statistics must sum to total_attempts.")
 
         return self
 
+    @model_validator(mode="after")
+    def validate_cached_attempts(self) -> "WorkflowRunStatistics":
+        """Ensure cached attempts are counted as successful attempts."""
+
+        if self.cached_attempts > self.successful_attempts:
+            raise ValueError("Workflow cached attempts cannot exceed successful attempts.")
+
+        return self
+
     @model_validator(mode="after")
     def validate_retry_count(self) -> "WorkflowRunStatistics":
         """Ensure retry count does not exceed recorded attempts."""
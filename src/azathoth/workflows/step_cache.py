@@ -0,0 +1,25 @@
+"""Storage contracts for cached workflow step results."""
+
+from typing import Protocol
+
+from azathoth.workflows.cache import WorkflowCachedStepResult
+
+
+class WorkflowStepCache(Protocol):
+    """Store successful workflow step results by content address."""
+
+    def get(
+        self,
+        key: str,
+    ) -> WorkflowCachedStepResult | None:
+        """Return an unexpired cached result, if one exists."""
+
+        ...
+
+    def put(
+        self,
+        result: WorkflowCachedStepResult,
+    ) -> None:
+        """Store a result, replacing any entry with the same key."""
+
+        ...
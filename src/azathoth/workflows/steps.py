@@ -8,6 +8,7 @@ from azathoth.prompting import PromptStrategySpec
 from azathoth.tools import ToolRequirement
 from azathoth.workflows.condition import WorkflowCondition
 from azathoth.workflows.failure import WorkflowFailurePolicy
+from azathoth.workflows.hedging import WorkflowHedgePolicy
 from azathoth.workflows.retry import WorkflowRetryPolicy
 from azathoth.workflows.value import (
     WorkflowInputBinding,
@@ -23,13 +24,27 @@ class ToolStepSpecification(BaseModel):
     requirement: ToolRequirement
 
 
+class MapStepSpecification(BaseModel):
+    """Describe a workflow step applied to every element of a list input."""
+
+    model_config = ConfigDict(frozen=True)
+
+    specification: PromptStrategySpec | ToolStepSpecification
+    input_name: str = Field(min_length=1)
+    max_concurrency: int | None = Field(
+        default=None,
+        ge=1,
+    )
+    streaming: bool = False
+
+
 class WorkflowStepSpecification(BaseModel):
     """Describe one independently configured step of a workflow."""
 
     model_config = ConfigDict(frozen=True)
 
     id: UUID = Field(default_factory=uuid4)
-    specification: PromptStrategySpec | ToolStepSpecification
+    specification: PromptStrategySpec | ToolStepSpecification | MapStepSpecification
     depends_on: tuple[UUID, ...] = ()
     inputs: tuple[WorkflowInputBinding, ...] = ()
     outputs: tuple[WorkflowValueBinding, ...] = ()
@@ -38,3 +53,13 @@ class WorkflowStepSpecification(BaseModel):
         default_factory=WorkflowRetryPolicy,
     )
     failure_policy: WorkflowFailurePolicy = WorkflowFailurePolicy.FAIL_WORKFLOW
+    timeout_seconds: float | None = Field(
+        default=None,
+        gt=0.0,
+    )
+    hedge_policy: WorkflowHedgePolicy | None = None
+    cacheable: bool = True
+    resource_class: str | None = Field(
+        default=None,
+        min_length=1,
+    )
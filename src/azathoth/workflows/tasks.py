@@ -0,0 +1,49 @@
+"""Task helpers shared by the workflow runner and benchmarks."""
+
+import asyncio
+from collections.abc import Coroutine, Iterable
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+
+async def cancel_tasks(
+    tasks: Iterable[asyncio.Task[Any]],
+) -> None:
+    """Cancel unfinished tasks and wait for them to unwind."""
+
+    unfinished = [task for task in tasks if not task.done()]
+
+    for task in unfinished:
+        task.cancel()
+
+    await asyncio.gather(
+        *unfinished,
+        return_exceptions=True,
+    )
+
+
+async def gather_tasks(
+    executions: Iterable[Coroutine[Any, Any, _T]],
+) -> tuple[_T, ...]:
+    """Await executions concurrently, cancelling the rest if one raises."""
+
+    tasks = tuple(asyncio.create_task(execution) for execution in executions)
+
+    try:
+        return tuple(await asyncio.gather(*tasks))
+    finally:
+        await cancel_tasks(tasks)
+
+
+async def await_tasks(
+    executions: Iterable[Coroutine[Any, Any, _T]],
+    *,
+    concurrent: bool,
+) -> tuple[_T, ...]:
+    """Await executions concurrently, or one at a time in order."""
+
+    if concurrent:
+        return await gather_tasks(executions)
+
+    return tuple([await execution for execution in executions])
@@ -0,0 +1,50 @@
+"""Layered caches of workflow step results."""
+
+from azathoth.workflows.cache import WorkflowCachedStepResult
+from azathoth.workflows.step_cache import WorkflowStepCache
+
+
+class TieredWorkflowStepCache:
+    """Read through faster caches before slower ones.
+
+    A hit in a slower tier is copied into every faster tier with its
+    original cache time, so time-to-live is measured from when the step
+    actually executed. Writes go to every tier.
+    """
+
+    def __init__(
+        self,
+        *tiers: WorkflowStepCache,
+    ) -> None:
+        if not tiers:
+            raise ValueError("Tiered workflow step caches require at least one tier.")
+
+        self._tiers = tiers
+
+    def get(
+        self,
+        key: str,
+    ) -> WorkflowCachedStepResult | None:
+        """Return the result from the fastest tier that holds it."""
+
+        for index, tier in enumerate(self._tiers):
+            result = tier.get(key)
+
+            if result is None:
+                continue
+
+            for faster in self._tiers[:index]:
+                faster.put(result)
+
+            return result
+
+        return None
+
+    def put(
+        self,
+        result: WorkflowCachedStepResult,
+    ) -> None:
+        """Store a result in every tier."""
+
+        for tier in self._tiers:
+            tier.put(result)
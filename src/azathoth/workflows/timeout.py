@@ -0,0 +1,9 @@
+"""Timeout errors raised while executing workflow steps."""
+
+
+class WorkflowStepTimeoutError(TimeoutError):
+    """Raised when one workflow step attempt exceeds its step timeout."""
+
+
+class WorkflowDeadlineExceededError(TimeoutError):
+    """Raised when a workflow run exceeds its run deadline."""
@@ -0,0 +1,176 @@
+"""Tests for context compaction policies."""
+
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import ValidationError
+
+from azathoth.context import Context, ContextCompactionPolicy, ContextEvent
+
+
+def create_event(
+    event_type: str,
+    *,
+    producer: str = "test-suite",
+    provenance: str | None = None,
+    minute: int = 0,
+) -> ContextEvent:
+    """Create an event of one type."""
+
+    return ContextEvent(
+        event_type=event_type,
+        payload={"minute": minute},
+        producer=producer,
+        provenance=provenance,
+        occurred_at=datetime(2026, 10, 18, 9, minute, tzinfo=UTC),
+    )
+
+
+def create_context(*events: ContextEvent) -> Context:
+    """Create a context by appending events one at a time."""
+
+    context = Context()
+
+    for event in events:
+        context = context.append(event)
+
+    return context
+
+
+def test_compaction_keeps_the_latest_events_of_each_type() -> None:
+    first_search = create_event("search.completed", minute=1)
+    request = create_event("request.received", minute=2)
+    second_search = create_event("search.completed", minute=3)
+    third_search = create_event("search.completed", minute=4)
+
+    compacted = create_context(first_search, request, second_search, third_search).compact(
+        ContextCompactionPolicy(keep_latest_per_type=2)
+    )
+
+    checkpoint, *retained = compacted.events
+
+    assert retained == [request, second_search, third_search]
+    assert checkpoint.event_type == "context.compacted"
+    assert checkpoint.producer == "context-compaction"
+    assert checkpoint.payload == {
+        "event_ids": [str(first_search.id)],
+        "event_counts": {"search.completed": 1},
+    }
+    assert checkpoint.occurred_at == first_search.occurred_at
+
+
+def test_compaction_drops_consumed_events_from_named_producers() -> None:
+    consumed = create_event("search.completed", producer="search", minute=1)
+    pending = create_event("search.completed", producer="search", minute=2)
+    answer = create_event(
+        "answer.drafted",
+        producer="writer",
+        provenance=str(consumed.id),
+        minute=3,
+    )
+
+    compacted = create_context(consumed, pending, answer).compact(
+        ContextCompactionPolicy(drop_consumed_producers=("search",))
+    )
+
+    assert compacted.events[1:] == (pending, answer)
+    assert compacted.events[0].payload["event_ids"] == [str(consumed.id)]
+
+
+def test_compaction_keeps_consumed_events_from_other_producers() -> None:
+    request = create_event("request.received", producer="user", minute=1)
+    answer = create_event(
+        "answer.drafted",
+        producer="writer",
+        provenance=str(request.id),
+        minute=2,
+    )
+    context = create_context(request, answer)
+
+    assert context.compact(ContextCompactionPolicy(drop_consumed_producers=("search",))) is context
+
+
+def test_consumed_events_do_not_count_toward_the_latest_events() -> None:
+    pending = create_event("search.completed", producer="search", minute=1)
+    consumed = create_event("search.completed", producer="search", minute=2)
+    answer = create_event(
+        "answer.drafted",
+        producer="writer",
+        provenance=str(consumed.id),
+        minute=3,
+    )
+
+    compacted = create_context(pending, consumed, answer).compact(
+        ContextCompactionPolicy(
+            keep_latest_per_type=1,
+            drop_consumed_producers=("search",),
+        )
+    )
+
+    assert compacted.events[1:] == (pending, answer)
+
+
+def test_compacting_again_folds_the_earlier_checkpoint() -> None:
+    events = [create_event("search.completed", minute=minute) for minute in range(5)]
+    policy = ContextCompactionPolicy(keep_latest_per_type=2)
+
+    once = create_context(*events[:3]).compact(policy)
+    twice = create_context(*once.events, *events[3:]).compact(policy)
+
+    checkpoint, *retained = twice.events
+
+    assert retained == events[3:]
+    assert checkpoint.payload == {
+        "event_ids": [str(event.id) for event in events[:3]],
+        "event_counts": {"search.completed": 3},
+    }
+    assert len(twice.by_type("context.compacted")) == 1
+
+
+def test_compaction_returns_the_context_when_nothing_is_removed() -> None:
+    context = create_context(
+        create_event("request.received"),
+        create_event("search.completed"),
+    )
+
+    assert context.compact(ContextCompactionPolicy(keep_latest_per_type=1)) is context
+
+
+def test_compacted_contexts_answer_queries() -> None:
+    events = [create_event(f"step.{minute % 2}.completed", minute=minute) for minute in range(6)]
+    context = create_context(*events)
+    context.latest("step.0.completed")
+
+    compacted = context.compact(ContextCompactionPolicy(keep_latest_per_type=1))
+
+    assert compacted.by_type("step.0.completed") == (events[4],)
+    assert compacted.latest("step.1.completed") == events[5]
+    assert compacted.append(events[0]).by_type("step.0.completed") == (events[4], events[0])
+
+
+def test_compacted_contexts_round_trip() -> None:
+    compacted = create_context(
+        create_event("search.completed", minute=1),
+        create_event("search.completed", minute=2),
+    ).compact(ContextCompactionPolicy(keep_latest_per_type=1))
+
+    assert Context.model_validate_json(compacted.model_dump_json()) == compacted
+
+
+def test_compaction_policies_require_a_rule() -> None:
+    with pytest.raises(
+        ValidationError,
+        match="require keep_latest_per_type or drop_consumed_producers",
+    ):
+        ContextCompactionPolicy()
+
+
+def test_compaction_policies_reject_invalid_rules() -> None:
+    with pytest.raises(ValidationError):
+        ContextCompactionPolicy(keep_latest_per_type=0)
+
+    with pytest.raises(
+        ValidationError,
+        match="Context compaction producers cannot be empty",
+    ):
+        ContextCompactionPolicy(drop_consumed_producers=("",))
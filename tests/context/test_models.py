@@ -5,7 +5,7 @@ from datetime import UTC, datetime
 import pytest
 from pydantic import ValidationError
 
-from azathoth.context import Context, ContextEvent
+from azathoth.context import Context, ContextEvent, ContextEventSequence
 
 
 def test_append_returns_new_context() -> None:
@@ -81,3 +81,136 @@ def test_context_event_rejects_invalid_confidence() -> None:
             producer="classifier",
             confidence=1.25,
         )
+
+
+def create_events(count: int) -> tuple[ContextEvent, ...]:
+    """Create events with distinct payloads."""
+
+    return tuple(
+        ContextEvent(
+            event_type="step.completed",
+            payload={"index": index},
+            producer="test-suite",
+        )
+        for index in range(count)
+    )
+
+
+def test_appended_contexts_share_earlier_events() -> None:
+    events = create_events(1_100)
+    base = Context(events=events[:-1])
+
+    branch = base.append(events[-1])
+    other = base.append(create_events(1)[0])
+
+    assert isinstance(branch.events, ContextEventSequence)
+    assert branch.events == events
+    assert events == branch.events
+    assert other.events[:-1] == base.events
+    assert branch != other
+    assert len(base.events) == len(events) - 1
+
+
+def test_event_sequences_index_slice_and_reverse_like_tuples() -> None:
+    events = create_events(1_100)
+    context = Context()
+
+    for event in events:
+        context = context.append(event)
+
+    assert context.events[0] is events[0]
+    assert context.events[-1] is events[-1]
+    assert context.events[1_000] is events[1_000]
+    assert context.events[30:1_050] == events[30:1_050]
+    assert context.events[::7] == events[::7]
+    assert tuple(reversed(context.events)) == events[::-1]
+    assert context.events == ContextEventSequence(events)
+
+    with pytest.raises(IndexError):
+        context.events[len(events)]
+
+
+def test_contexts_serialize_their_events_as_lists() -> None:
+    context = Context(events=create_events(40))
+
+    restored = Context.model_validate_json(context.model_dump_json())
+
+    assert restored == context
+    assert isinstance(context.model_dump()["events"], tuple)
+
+
+def create_timed_events(*minutes: int) -> tuple[ContextEvent, ...]:
+    """Create events alternating producers, occurring at the given minutes."""
+
+    return tuple(
+        ContextEvent(
+            event_type=f"step.{index % 2}.completed",
+            payload={"index": index},
+            producer=f"producer-{index % 3}",
+            occurred_at=datetime(2026, 1, 1, 12, minute, tzinfo=UTC),
+        )
+        for index, minute in enumerate(minutes)
+    )
+
+
+def test_queries_cover_events_appended_after_earlier_queries() -> None:
+    events = create_events(70) + create_timed_events(*range(40))
+    context = Context()
+
+    for index, event in enumerate(events):
+        context = context.append(event)
+
+        if index % 25 == 0:
+            context.latest("step.1.completed")
+
+    assert context.by_type("step.completed") == events[:70]
+    assert context.by_type("step.1.completed") == events[71::2]
+    assert context.by_producer("producer-2") == tuple(
+        event for event in events if event.producer == "producer-2"
+    )
+    assert context.by_producer("missing") == ()
+    assert context.latest("step.0.completed") is events[-2]
+
+
+def test_branches_extend_their_shared_indexes_independently() -> None:
+    first, second, third = create_timed_events(1, 2, 3)
+    base = Context().append(first)
+    base.latest("step.0.completed")
+
+    left = base.append(second)
+    right = base.append(third)
+
+    assert left.latest("step.1.completed") is second
+    assert right.latest("step.1.completed") is None
+    assert right.latest("step.0.completed") is third
+    assert base.by_type("step.0.completed") == (first,)
+
+
+def test_contexts_queried_only_through_branches_answer_queries() -> None:
+    first, second, third = create_timed_events(1, 2, 3)
+    base = Context().append(first).append(second)
+
+    assert base.append(third).latest("step.0.completed") is third
+
+    merged = base.append(create_events(1)[0])
+
+    assert merged.latest("step.0.completed") is first
+    assert merged.by_type("step.1.completed") == (second,)
+
+
+def test_between_returns_events_in_occurrence_order() -> None:
+    events = create_timed_events(5, 10, 10, 20)
+    context = Context(events=events)
+    start = datetime(2026, 1, 1, 12, 10, tzinfo=UTC)
+    end = datetime(2026, 1, 1, 12, 20, tzinfo=UTC)
+
+    assert context.between(start, end) == events[1:3]
+
+    late = create_timed_events(7)[0]
+    appended = context.append(late)
+
+    assert appended.between(datetime(2026, 1, 1, 12, 0, tzinfo=UTC), start) == (
+        events[0],
+        late,
+    )
+    assert context.between(end, start) == ()
@@ -0,0 +1,86 @@
+"""Tests for recorded strategy execution results."""
+
+from datetime import UTC, datetime
+from uuid import UUID
+
+import pytest
+from pydantic import ValidationError
+
+from azathoth.context import Context, ContextEvent
+from azathoth.execution import ExecutionResult, shared_context_events
+
+STRATEGY_ID = UUID("5a0e4f55-7c36-4a43-a0f5-2f1c9a6d1b38")
+RECORDED_AT = datetime(2026, 7, 28, 14, 0, tzinfo=UTC)
+
+
+def create_event(event_type: str) -> ContextEvent:
+    """Create an event of one type."""
+
+    return ContextEvent(
+        event_type=event_type,
+        payload={},
+        producer="test-suite",
+    )
+
+
+def create_result(
+    context: Context,
+    *produced_events: ContextEvent,
+) -> ExecutionResult:
+    """Create an execution result that produced the supplied events."""
+
+    return ExecutionResult(
+        strategy_id=STRATEGY_ID,
+        strategy_name="Recording strategy",
+        strategy_version="1.0.0",
+        output=None,
+        initial_context=context,
+        produced_events=produced_events,
+        started_at=RECORDED_AT,
+        completed_at=RECORDED_AT,
+    )
+
+
+def test_final_contexts_are_rebuilt_from_produced_events() -> None:
+    context = Context().append(create_event("request.received"))
+    produced = create_event("strategy.execution.completed")
+
+    result = create_result(context, produced)
+
+    assert result.initial_context is context
+    assert result.final_context == context.append(produced)
+    assert create_result(context).final_context == context
+
+
+def test_recorded_final_contexts_become_produced_events() -> None:
+    context = Context().append(create_event("request.received"))
+    produced = create_event("strategy.execution.completed")
+    payload = create_result(context).model_dump(mode="json", exclude={"produced_events"})
+
+    result = ExecutionResult.model_validate(
+        {**payload, "final_context": context.append(produced).model_dump(mode="json")},
+    )
+
+    assert result.produced_events == (produced,)
+
+    with pytest.raises(ValidationError, match="must extend their initial context"):
+        ExecutionResult.model_validate(
+            {**payload, "final_context": Context().append(produced).model_dump(mode="json")},
+        )
+
+
+def test_results_serialize_events_they_share_as_a_count() -> None:
+    shared = Context().append(create_event("request.received"))
+    step_context = shared.append(create_event("workflow.input.bound"))
+    result = create_result(step_context, create_event("strategy.execution.completed"))
+
+    with shared_context_events(shared):
+        payload = result.model_dump_json()
+        restored = ExecutionResult.model_validate_json(payload)
+
+    assert restored == result
+    assert payload.count("request.received") == 0
+    assert payload.count("workflow.input.bound") == 1
+
+    with pytest.raises(ValidationError, match="share events"):
+        ExecutionResult.model_validate_json(payload)
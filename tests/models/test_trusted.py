@@ -0,0 +1,96 @@
+"""Tests for trusted construction of framework-built models."""
+
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
+
+from azathoth.models import (
+    construct_trusted,
+    strict_validation,
+    strict_validation_enabled,
+)
+
+
+class Reading(BaseModel):
+    """A model with field constraints, defaults, and a cross-field check."""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: UUID = Field(default_factory=uuid4)
+    name: str = Field(min_length=1)
+    values: tuple[int, ...] = ()
+    minimum: int = 0
+
+    @model_validator(mode="after")
+    def validate_minimum(self) -> "Reading":
+        """Require every value to reach the minimum."""
+
+        if any(value < self.minimum for value in self.values):
+            raise ValueError("Reading values cannot fall below the minimum.")
+
+        return self
+
+
+class AliasedReading(BaseModel):
+    """A model whose field is populated through an alias."""
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str = Field(alias="label", min_length=1)
+
+
+def test_trusted_construction_matches_validated_construction() -> None:
+    reading_id = uuid4()
+
+    trusted = construct_trusted(Reading, id=reading_id, name="load", values=(1, 2))
+
+    assert trusted == Reading(id=reading_id, name="load", values=(1, 2))
+    assert trusted.model_fields_set == {"id", "name", "values"}
+
+
+def test_trusted_construction_fills_defaults() -> None:
+    first = construct_trusted(Reading, name="load")
+    second = construct_trusted(Reading, name="load")
+
+    assert first.values == ()
+    assert first.minimum == 0
+    assert first.id != second.id
+    assert tuple(first.model_dump()) == ("id", "name", "values", "minimum")
+
+
+def test_trusted_construction_skips_field_validation() -> None:
+    with strict_validation(False):
+        reading = construct_trusted(Reading, name="")
+
+    assert reading.name == ""
+
+
+def test_trusted_construction_keeps_model_invariants() -> None:
+    with pytest.raises(
+        ValueError,
+        match="Reading values cannot fall below the minimum",
+    ):
+        construct_trusted(Reading, name="load", values=(1,), minimum=2)
+
+
+def test_trusted_construction_validates_models_it_cannot_build() -> None:
+    reading = construct_trusted(AliasedReading, label="load")
+
+    assert reading.name == "load"
+
+    with pytest.raises(ValidationError):
+        construct_trusted(AliasedReading, label="")
+
+
+def test_strict_validation_validates_trusted_construction() -> None:
+    with strict_validation():
+        assert strict_validation_enabled()
+
+        with pytest.raises(ValidationError):
+            construct_trusted(Reading, name="")
+
+        with strict_validation(False):
+            assert not strict_validation_enabled()
+
+        assert strict_validation_enabled()
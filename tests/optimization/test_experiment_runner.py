@@ -128,7 +128,6 @@ class RecordingOptimizationRunner:
             strategy_version=strategy.metadata.version,
             output=example.expected_outcome.value,
             initial_context=example.context,
-            final_context=example.context,
             started_at=now,
             completed_at=now,
         )
@@ -41,7 +41,6 @@ def create_run(
             strategy_version=strategy.version,
             output=None,
             initial_context=Context(),
-            final_context=Context(),
             started_at=now,
             completed_at=now,
         ),
@@ -31,23 +31,21 @@ def create_execution_result() -> ExecutionResult:
         )
     )
 
-    final_context = initial_context.append(
-        ContextEvent(
-            event_type="strategy.execution.completed",
-            payload={
-                "strategy_name": "Extract customer intent",
-            },
-            producer="strategy-executor",
-        )
-    )
-
     return ExecutionResult(
         strategy_id=UUID("3d8522f1-4ea1-4e58-8f85-f8bd507f76fc"),
         strategy_name="Extract customer intent",
         strategy_version="1.0.0",
         output="duplicate_charge",
         initial_context=initial_context,
-        final_context=final_context,
+        produced_events=(
+            ContextEvent(
+                event_type="strategy.execution.completed",
+                payload={
+                    "strategy_name": "Extract customer intent",
+                },
+                producer="strategy-executor",
+            ),
+        ),
         started_at=datetime(
             2026,
             7,
@@ -135,7 +135,6 @@ def create_execution_result(
         strategy_version="1.0.0",
         output="duplicate_charge",
         initial_context=example.context,
-        final_context=example.context,
         started_at=datetime(
             2026,
             7,
@@ -61,7 +61,6 @@ def create_run(
         strategy_version=strategy_version,
         output="duplicate_charge",
         initial_context=Context(),
-        final_context=Context(),
         started_at=now,
         completed_at=now,
     )
@@ -0,0 +1,32 @@
+"""Tests for provider request deadlines."""
+
+from time import monotonic
+
+from azathoth.providers import provider_deadline, remaining_provider_time
+
+
+def test_remaining_provider_time_is_unbounded_by_default() -> None:
+    assert remaining_provider_time() is None
+
+
+def test_provider_deadline_reports_remaining_time() -> None:
+    with provider_deadline(monotonic() + 10.0):
+        remaining = remaining_provider_time()
+
+    assert remaining is not None
+    assert 0.0 < remaining <= 10.0
+    assert remaining_provider_time() is None
+
+
+def test_nested_provider_deadlines_only_tighten() -> None:
+    with provider_deadline(monotonic() + 1.0):
+        with provider_deadline(monotonic() + 60.0):
+            loosened = remaining_provider_time()
+
+        with provider_deadline(None):
+            cleared = remaining_provider_time()
+
+    assert loosened is not None
+    assert loosened <= 1.0
+    assert cleared is not None
+    assert cleared <= 1.0
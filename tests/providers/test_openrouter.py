@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+from time import monotonic
 from typing import Any
 
 import httpx
@@ -13,6 +14,7 @@ from azathoth.providers import (
     OpenRouterConfiguration,
     OpenRouterLanguageModel,
     Prompt,
+    provider_deadline,
 )
 
 
@@ -249,3 +251,59 @@ def test_openrouter_language_model_preserves_resolved_model() -> None:
 
     assert response.model == "~deepseek/deepseek-v4-flash-latest"
     assert response.resolved_model == "deepseek/deepseek-v4-flash-0731"
+
+
+def test_openrouter_language_model_clamps_timeout_to_deadline() -> None:
+    recorded_timeout: dict[str, float] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        recorded_timeout.update(request.extensions["timeout"])
+
+        return httpx.Response(
+            200,
+            json=create_response(),
+            request=request,
+        )
+
+    model = OpenRouterLanguageModel(
+        create_configuration(),
+        "openai/gpt-test",
+        transport=httpx.MockTransport(handler),
+    )
+
+    with provider_deadline(monotonic() + 2.0):
+        asyncio.run(
+            model.complete(
+                Prompt(
+                    text="Classify this text as positive or negative.",
+                )
+            )
+        )
+
+    assert 0.0 < recorded_timeout["read"] <= 2.0
+
+
+def test_openrouter_language_model_rejects_expired_deadlines() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("Expired deadlines must not send requests.")
+
+    model = OpenRouterLanguageModel(
+        create_configuration(),
+        "openai/gpt-test",
+        transport=httpx.MockTransport(handler),
+    )
+
+    with (
+        provider_deadline(monotonic() - 1.0),
+        pytest.raises(
+            ModelExecutionError,
+            match="exceeded its deadline",
+        ),
+    ):
+        asyncio.run(
+            model.complete(
+                Prompt(
+                    text="Classify this text as positive or negative.",
+                )
+            )
+        )
@@ -46,7 +46,6 @@ def create_execution_result() -> ExecutionResult:
         strategy_version="1.0.0",
         output="success",
         initial_context=context,
-        final_context=context,
         started_at=STARTED_AT,
         completed_at=COMPLETED_AT,
     )
@@ -84,7 +84,6 @@ class FlakyExecutor(StrategyExecutor):
             strategy_version=strategy.metadata.version,
             output="success",
             initial_context=context,
-            final_context=context,
             started_at=timestamp,
             completed_at=timestamp,
         )
@@ -0,0 +1,249 @@
+"""Tests for executing one workflow against many contexts."""
+
+import asyncio
+from uuid import UUID
+
+import pytest
+
+from azathoth.context import Context, ContextEvent
+from azathoth.strategies import StrategyMetadata, StrategyOutcome
+from azathoth.workflows import (
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowInputBinding,
+    WorkflowMetadata,
+    WorkflowRun,
+    WorkflowRunner,
+    WorkflowSchedulingMode,
+    WorkflowValueBinding,
+    WorkflowValueReference,
+)
+
+WORKFLOW_ID = UUID("a1c2e3a4-b5c6-4d7e-8f9a-0b1c2d3e4f5a")
+
+READ_ID = UUID("b2d3f4b5-c6d7-4e8f-9a0b-1c2d3e4f5a6b")
+SHOUT_ID = UUID("c3e4a5c6-d7e8-4f9a-8b1c-2d3e4f5a6b7c")
+
+READ_STRATEGY_ID = UUID("d4f5b6d7-e8f9-4a0b-9c2d-3e4f5a6b7c8d")
+SHOUT_STRATEGY_ID = UUID("e5a6c7e8-f9a0-4b1c-8d3e-4f5a6b7c8d9e")
+
+
+class TrackingStrategy:
+    """Transform the latest request or bound input and track concurrency."""
+
+    def __init__(
+        self,
+        *,
+        strategy_id: UUID,
+        name: str,
+        event_type: str,
+        field: str,
+    ) -> None:
+        self._metadata = StrategyMetadata(
+            id=strategy_id,
+            name=name,
+            description=f"Execute the {name} step.",
+        )
+        self._event_type = event_type
+        self._field = field
+        self.running = 0
+        self.peak = 0
+        self.completed = 0
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Return the configured field, upper-cased for shouting steps."""
+
+        event = context.latest(self._event_type)
+
+        assert event is not None
+
+        value = event.payload[self._field]
+
+        assert isinstance(value, str)
+
+        if value == "fail":
+            raise RuntimeError("Request failed.")
+
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+
+        await asyncio.sleep(0.05 if value == "slow" else 0.01)
+
+        self.running -= 1
+        self.completed += 1
+
+        output = value.upper() if self.metadata.name == "Shout" else value
+
+        return StrategyOutcome(
+            output=output,
+            events=(
+                ContextEvent(
+                    event_type="test.step.completed",
+                    payload={"step": self.metadata.name, "output": output},
+                    producer="test",
+                ),
+            ),
+        )
+
+
+def create_candidate() -> tuple[WorkflowCandidate, TrackingStrategy, TrackingStrategy]:
+    """Create a read step feeding a shout step."""
+
+    read = TrackingStrategy(
+        strategy_id=READ_STRATEGY_ID,
+        name="Read",
+        event_type="test.request",
+        field="text",
+    )
+    shout = TrackingStrategy(
+        strategy_id=SHOUT_STRATEGY_ID,
+        name="Shout",
+        event_type="workflow.input.bound",
+        field="value",
+    )
+
+    candidate = WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Shout requests",
+            description="Read a request and shout it back.",
+        ),
+        steps=(
+            WorkflowCandidateStep(
+                id=READ_ID,
+                strategy=read,
+                outputs=(WorkflowValueBinding(name="text"),),
+            ),
+            WorkflowCandidateStep(
+                id=SHOUT_ID,
+                strategy=shout,
+                depends_on=(READ_ID,),
+                inputs=(
+                    WorkflowInputBinding(
+                        name="text",
+                        source=WorkflowValueReference(
+                            producer_step_id=READ_ID,
+                            name="text",
+                        ),
+                    ),
+                ),
+                outputs=(WorkflowValueBinding(name="shout"),),
+            ),
+        ),
+    )
+
+    return candidate, read, shout
+
+
+def request(text: str) -> Context:
+    """Return an initial context carrying one request."""
+
+    return Context(
+        events=(
+            ContextEvent(
+                event_type="test.request",
+                payload={"text": text},
+                producer="test",
+            ),
+        ),
+    )
+
+
+def observed(run: WorkflowRun) -> tuple[object, ...]:
+    """Return what a run produced, without identifiers or timestamps."""
+
+    return (
+        run.values,
+        tuple(step.status for step in run.steps),
+        tuple(event.payload for event in run.final_context.events),
+    )
+
+
+@pytest.mark.parametrize(
+    "scheduling",
+    tuple(WorkflowSchedulingMode),
+)
+def test_batch_runs_match_single_runs(
+    scheduling: WorkflowSchedulingMode,
+) -> None:
+    runner = WorkflowRunner(scheduling=scheduling)
+    contexts = (request("hello"), request("slow"), request("goodbye"))
+
+    batch = asyncio.run(runner.run_batch(create_candidate()[0], contexts))
+    single = tuple(asyncio.run(runner.run(create_candidate()[0], context)) for context in contexts)
+
+    assert tuple(observed(run) for run in batch) == tuple(observed(run) for run in single)
+    assert tuple(run.initial_context for run in batch) == contexts
+    assert len({run.id for run in batch}) == len(contexts)
+
+
+def test_batch_steps_are_in_flight_together() -> None:
+    candidate, read, shout = create_candidate()
+
+    runs = asyncio.run(
+        WorkflowRunner(max_concurrency=3).run_batch(
+            candidate,
+            tuple(request(text) for text in ("a", "b", "c")),
+        )
+    )
+
+    assert tuple(run.values_named("shout")[0].value for run in runs) == ("A", "B", "C")
+    assert (read.peak, shout.peak) == (3, 3)
+
+
+def test_unbounded_batches_run_one_context_at_a_time() -> None:
+    candidate, read, shout = create_candidate()
+
+    runs = asyncio.run(
+        WorkflowRunner().run_batch(
+            candidate,
+            tuple(request(text) for text in ("a", "b", "c")),
+        )
+    )
+
+    assert tuple(run.values_named("shout")[0].value for run in runs) == ("A", "B", "C")
+    assert (read.peak, shout.peak) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    "scheduling",
+    tuple(WorkflowSchedulingMode),
+)
+def test_batch_runs_share_the_runner_concurrency_limit(
+    scheduling: WorkflowSchedulingMode,
+) -> None:
+    candidate, read, shout = create_candidate()
+
+    runs = asyncio.run(
+        WorkflowRunner(scheduling=scheduling, max_concurrency=2).run_batch(
+            candidate,
+            tuple(request(text) for text in ("a", "b", "c", "d", "e")),
+        )
+    )
+
+    assert tuple(run.values_named("shout")[0].value for run in runs) == ("A", "B", "C", "D", "E")
+    assert max(read.peak, shout.peak) == 2
+
+
+def test_failed_batch_runs_cancel_the_others() -> None:
+    candidate, read, _ = create_candidate()
+
+    with pytest.raises(RuntimeError, match="Request failed"):
+        asyncio.run(
+            WorkflowRunner(max_concurrency=2).run_batch(
+                candidate,
+                (request("slow"), request("fail")),
+            )
+        )
+
+    assert read.completed == 0
+
+
+def test_empty_batches_produce_no_runs() -> None:
+    assert asyncio.run(WorkflowRunner().run_batch(create_candidate()[0], ())) == ()
@@ -3,6 +3,9 @@
 import asyncio
 from uuid import UUID
 
+import pytest
+
+from azathoth.context import Context
 from azathoth.evaluation import (
     BenchmarkCase,
     BenchmarkDataset,
@@ -18,11 +21,13 @@ from azathoth.providers import (
     ModelRequirements,
     Prompt,
 )
-from azathoth.strategies import StrategyMetadata
+from azathoth.strategies import StrategyMetadata, StrategyOutcome
 from azathoth.workflows import (
     WorkflowBenchmarkRunner,
     WorkflowCandidate,
+    WorkflowCandidateStep,
     WorkflowMetadata,
+    WorkflowRunner,
     WorkflowSpecification,
     WorkflowStepSpecification,
     WorkflowValueBinding,
@@ -207,6 +212,65 @@ def create_failing_candidate(
     )
 
 
+class InFlightStrategy:
+    """Return a fixed label and track calls in flight across candidates."""
+
+    running = 0
+    peak = 0
+
+    def __init__(self, label: str) -> None:
+        self._label = label
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return StrategyMetadata(
+            id=STRATEGY_ID,
+            name="Classify sentiment",
+            description="Return a sentiment label.",
+        )
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Return the label after a short delay."""
+
+        del context
+
+        InFlightStrategy.running += 1
+        InFlightStrategy.peak = max(InFlightStrategy.peak, InFlightStrategy.running)
+
+        await asyncio.sleep(0.01)
+
+        InFlightStrategy.running -= 1
+
+        return StrategyOutcome(output=self._label)
+
+
+def create_in_flight_candidate(
+    case: BenchmarkCase,
+) -> WorkflowCandidate:
+    """Create a single-step candidate whose calls are tracked."""
+
+    expected = case.expected.value
+
+    assert isinstance(expected, str)
+
+    return WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Sentiment classification",
+            description="Classify benchmark sentiment.",
+        ),
+        steps=(
+            WorkflowCandidateStep(
+                id=STEP_ID,
+                strategy=InFlightStrategy(expected),
+                outputs=(WorkflowValueBinding(name="classification"),),
+            ),
+        ),
+    )
+
+
 def test_workflow_benchmark_executes_all_cases() -> None:
     result = asyncio.run(
         WorkflowBenchmarkRunner().run(
@@ -285,6 +349,43 @@ def test_workflow_benchmark_aggregates_usage() -> None:
     assert result.total_latency_ms == 0
 
 
+@pytest.mark.parametrize(
+    ("max_concurrency", "peak"),
+    ((2, 2), (None, 1)),
+)
+def test_workflow_benchmark_bounds_concurrency_across_cases(
+    max_concurrency: int | None,
+    peak: int,
+) -> None:
+    dataset = BenchmarkDataset(
+        name="many-cases",
+        description="More cases than the runner runs at once.",
+        cases=tuple(
+            BenchmarkCase(
+                input=f"Case {index}",
+                expected=ExpectedOutcome(
+                    description="Positive sentiment",
+                    value="positive",
+                    comparison=OutcomeComparison.EXACT,
+                ),
+            )
+            for index in range(6)
+        ),
+    )
+    InFlightStrategy.peak = 0
+
+    result = asyncio.run(
+        WorkflowBenchmarkRunner(WorkflowRunner(max_concurrency=max_concurrency)).run(
+            dataset,
+            create_in_flight_candidate,
+            output_name="classification",
+        )
+    )
+
+    assert result.cases_passed == 6
+    assert InFlightStrategy.peak == peak
+
+
 def test_workflow_benchmark_handles_empty_dataset() -> None:
     dataset = BenchmarkDataset(
         name="empty",
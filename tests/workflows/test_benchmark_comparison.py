@@ -226,6 +226,27 @@ def test_benchmark_comparator_records_candidate_accuracy() -> None:
     assert negative_only.accuracy == 0.5
 
 
+def test_benchmark_comparators_sharing_steps_execute_identical_steps_once() -> None:
+    comparison = asyncio.run(
+        WorkflowBenchmarkComparator(share_steps=True).compare(
+            create_dataset(),
+            {
+                "first": create_perfect_candidate,
+                "second": create_perfect_candidate,
+            },
+            output_name="classification",
+        )
+    )
+
+    cached = tuple(
+        tuple(case.run.steps[0].attempts[0].cached for case in candidate.result.cases)
+        for candidate in comparison.candidates
+    )
+
+    assert cached == ((False, False), (True, True))
+    assert all(candidate.result.accuracy == 1.0 for candidate in comparison.candidates)
+
+
 def test_benchmark_comparator_records_usage_independently() -> None:
     comparison = asyncio.run(
         WorkflowBenchmarkComparator().compare(
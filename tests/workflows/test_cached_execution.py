@@ -0,0 +1,319 @@
+"""Tests for memoized workflow step execution."""
+
+import asyncio
+from pathlib import Path
+from uuid import UUID
+
+from azathoth.context import Context, ContextEvent
+from azathoth.prompting import ModelBinding
+from azathoth.strategies import (
+    StrategyExecutionMetrics,
+    StrategyMetadata,
+    StrategyOutcome,
+)
+from azathoth.workflows import (
+    InMemoryWorkflowStepCache,
+    SQLiteWorkflowStepCache,
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowHedgePolicy,
+    WorkflowInputBinding,
+    WorkflowLatencyProfile,
+    WorkflowMetadata,
+    WorkflowRun,
+    WorkflowRunner,
+    WorkflowStepCache,
+    WorkflowValueBinding,
+    WorkflowValueReference,
+)
+
+WORKFLOW_ID = UUID("c9d0e1f2-a3b4-4c5d-8e6f-7a8b9c0d1e2f")
+
+SOURCE_ID = UUID("d0e1f2a3-b4c5-4d6e-9f7a-8b9c0d1e2f3a")
+SUMMARY_ID = UUID("e1f2a3b4-c5d6-4e7f-8a8b-9c0d1e2f3a4b")
+
+SOURCE_STRATEGY_ID = UUID("f2a3b4c5-d6e7-4f8a-9b9c-0d1e2f3a4b5c")
+SUMMARY_STRATEGY_ID = UUID("a3b4c5d6-e7f8-4a9b-8c0d-1e2f3a4b5c6d")
+
+
+class CountingStrategy:
+    """Return a configured output and count calls."""
+
+    def __init__(
+        self,
+        *,
+        strategy_id: UUID,
+        name: str,
+        output: str,
+        version: str = "1.0.0",
+        model: str | None = None,
+        delay_seconds: float = 0.0,
+    ) -> None:
+        self._metadata = StrategyMetadata(
+            id=strategy_id,
+            name=name,
+            description=f"Execute the {name} step.",
+            version=version,
+        )
+        self._model_binding = ModelBinding(identifier=model) if model is not None else None
+        self._output = output
+        self._delay_seconds = delay_seconds
+        self.calls = 0
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    @property
+    def model_binding(self) -> ModelBinding | None:
+        """Return the model the strategy is bound to."""
+
+        return self._model_binding
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Return the configured output with one produced event."""
+
+        self.calls += 1
+
+        await asyncio.sleep(self._delay_seconds)
+
+        return StrategyOutcome(
+            output=self._output,
+            events=(
+                ContextEvent(
+                    event_type="test.step.completed",
+                    payload={"step": self.metadata.name},
+                    producer="test",
+                ),
+            ),
+            metrics=StrategyExecutionMetrics(
+                estimated_cost_usd=0.5,
+            ),
+        )
+
+
+def create_candidate(
+    *,
+    source: str = "document",
+    source_version: str = "1.0.0",
+    summary_model: str = "test/large",
+    cacheable: bool = True,
+    hedged: bool = False,
+) -> tuple[WorkflowCandidate, CountingStrategy, CountingStrategy]:
+    """Create a source step feeding a summary step."""
+
+    source_strategy = CountingStrategy(
+        strategy_id=SOURCE_STRATEGY_ID,
+        name="Source",
+        output=source,
+        version=source_version,
+    )
+    summary_strategy = CountingStrategy(
+        strategy_id=SUMMARY_STRATEGY_ID,
+        name="Summary",
+        output="summary",
+        model=summary_model,
+        delay_seconds=5.0 if hedged else 0.0,
+    )
+
+    candidate = WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Summarize",
+            description="Summarize one source document.",
+        ),
+        steps=(
+            WorkflowCandidateStep(
+                id=SOURCE_ID,
+                strategy=source_strategy,
+                outputs=(WorkflowValueBinding(name="document"),),
+            ),
+            WorkflowCandidateStep(
+                id=SUMMARY_ID,
+                strategy=summary_strategy,
+                depends_on=(SOURCE_ID,),
+                inputs=(
+                    WorkflowInputBinding(
+                        name="document",
+                        source=WorkflowValueReference(
+                            producer_step_id=SOURCE_ID,
+                            name="document",
+                        ),
+                    ),
+                ),
+                outputs=(WorkflowValueBinding(name="summary"),),
+                cacheable=cacheable,
+                hedge_policy=(WorkflowHedgePolicy(delay_seconds=0.01) if hedged else None),
+                hedge_strategy=(
+                    CountingStrategy(
+                        strategy_id=SUMMARY_STRATEGY_ID,
+                        name="Summary",
+                        output="fast summary",
+                        model="test/small",
+                    )
+                    if hedged
+                    else None
+                ),
+            ),
+        ),
+    )
+
+    return candidate, source_strategy, summary_strategy
+
+
+def run_candidate(
+    candidate: WorkflowCandidate,
+    cache: WorkflowStepCache,
+) -> WorkflowRun:
+    """Execute a candidate with a step cache."""
+
+    return asyncio.run(
+        WorkflowRunner(cache=cache).run(
+            candidate,
+            Context(),
+        )
+    )
+
+
+def test_repeated_runs_are_served_from_the_cache() -> None:
+    cache = InMemoryWorkflowStepCache()
+
+    first = run_candidate(create_candidate()[0], cache)
+
+    candidate, source, summary = create_candidate()
+    second = run_candidate(candidate, cache)
+
+    assert (source.calls, summary.calls) == (0, 0)
+    assert second.values == first.values
+    assert all(attempt.cached for step in second.steps for attempt in step.attempts)
+    assert not any(attempt.cached for step in first.steps for attempt in step.attempts)
+
+
+def test_cached_runs_replay_the_same_context() -> None:
+    cache = InMemoryWorkflowStepCache()
+
+    first = run_candidate(create_candidate()[0], cache)
+    second = run_candidate(create_candidate()[0], cache)
+
+    assert [
+        (event.event_type, event.producer, event.payload) for event in second.final_context.events
+    ] == [(event.event_type, event.producer, event.payload) for event in first.final_context.events]
+    assert [event.provenance for event in second.final_context.events] == [
+        str(event.id) for event in first.final_context.events
+    ]
+    assert second.steps[1].execution is not None
+    assert second.steps[1].execution.initial_context.events[-1].payload == {
+        "name": "document",
+        "value": "document",
+        "producer_step_id": str(SOURCE_ID),
+        "source_name": "document",
+    }
+
+
+def test_steps_replayed_within_a_run_produce_new_events() -> None:
+    strategy = CountingStrategy(
+        strategy_id=SOURCE_STRATEGY_ID,
+        name="Source",
+        output="document",
+    )
+    candidate = WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Repeat",
+            description="Run one strategy twice in one layer.",
+        ),
+        steps=(
+            WorkflowCandidateStep(id=SOURCE_ID, strategy=strategy),
+            WorkflowCandidateStep(id=SUMMARY_ID, strategy=strategy),
+        ),
+    )
+
+    run = run_candidate(candidate, InMemoryWorkflowStepCache())
+    events = run.final_context.events
+
+    assert strategy.calls == 1
+    assert len(events) == 6
+    assert len({event.id for event in events}) == 6
+    assert [event.provenance for event in events[3:]] == [str(event.id) for event in events[:3]]
+
+
+def test_cached_attempts_keep_their_original_metrics() -> None:
+    cache = InMemoryWorkflowStepCache()
+
+    run_candidate(create_candidate()[0], cache)
+    run = run_candidate(create_candidate()[0], cache)
+
+    assert run.statistics.cached_attempts == 2
+    assert run.statistics.successful_attempts == 2
+    assert all(
+        step.execution is not None
+        and step.execution.metrics == StrategyExecutionMetrics(estimated_cost_usd=0.5)
+        for step in run.steps
+    )
+    assert WorkflowLatencyProfile.from_runs((run,)).latencies == ()
+
+
+def test_changed_inputs_miss_the_cache() -> None:
+    cache = InMemoryWorkflowStepCache()
+
+    run_candidate(create_candidate()[0], cache)
+
+    candidate, source, summary = create_candidate(
+        source="another document",
+        source_version="2.0.0",
+    )
+    run = run_candidate(candidate, cache)
+
+    assert (source.calls, summary.calls) == (1, 1)
+    assert not run.steps[1].attempts[0].cached
+
+
+def test_substituted_models_miss_the_cache() -> None:
+    cache = InMemoryWorkflowStepCache()
+
+    run_candidate(create_candidate()[0], cache)
+
+    candidate, source, summary = create_candidate(summary_model="test/small")
+    run_candidate(candidate, cache)
+
+    assert (source.calls, summary.calls) == (0, 1)
+
+
+def test_steps_can_opt_out_of_caching() -> None:
+    cache = InMemoryWorkflowStepCache()
+
+    run_candidate(create_candidate(cacheable=False)[0], cache)
+
+    candidate, source, summary = create_candidate(cacheable=False)
+    run_candidate(candidate, cache)
+
+    assert (source.calls, summary.calls) == (0, 1)
+
+
+def test_hedge_results_are_not_cached_for_the_primary_strategy() -> None:
+    cache = InMemoryWorkflowStepCache()
+
+    run = run_candidate(create_candidate(hedged=True)[0], cache)
+
+    assert run.values_named("summary")[0].value == "fast summary"
+
+    candidate, _, summary = create_candidate()
+    run_candidate(candidate, cache)
+
+    assert summary.calls == 1
+
+
+def test_sqlite_caches_are_shared_between_processes(
+    tmp_path: Path,
+) -> None:
+    run_candidate(
+        create_candidate()[0],
+        SQLiteWorkflowStepCache(tmp_path / "cache.db"),
+    )
+
+    candidate, source, summary = create_candidate()
+    run_candidate(candidate, SQLiteWorkflowStepCache(tmp_path / "cache.db"))
+
+    assert (source.calls, summary.calls) == (0, 0)
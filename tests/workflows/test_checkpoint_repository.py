@@ -0,0 +1,281 @@
+"""Tests for workflow run checkpoint persistence."""
+
+import sqlite3
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+from azathoth.context import Context, ContextEvent
+from azathoth.execution import ExecutionResult
+from azathoth.workflows import (
+    InMemoryWorkflowRunCheckpointRepository,
+    SQLiteWorkflowRunCheckpointRepository,
+    WorkflowMetadata,
+    WorkflowRunCheckpoint,
+    WorkflowRunCheckpointRepository,
+    WorkflowStepAttempt,
+    WorkflowStepRun,
+    WorkflowStepSkipReason,
+    WorkflowStepStatus,
+    require_workflow_run_checkpoint_repository,
+)
+
+RUN_ID = UUID("a1a1a1a1-1111-4111-8111-111111111111")
+SECOND_RUN_ID = UUID("b2b2b2b2-2222-4222-8222-222222222222")
+
+WORKFLOW_ID = UUID("c3c3c3c3-3333-4333-8333-333333333333")
+
+FIRST_STEP_ID = UUID("d4d4d4d4-4444-4444-8444-444444444444")
+SECOND_STEP_ID = UUID("e5e5e5e5-5555-4555-8555-555555555555")
+
+EVENT_ID = UUID("f6f6f6f6-6666-4666-8666-666666666666")
+
+STARTED_AT = datetime(2026, 8, 18, 12, 0, tzinfo=UTC)
+
+RepositoryFactory = Callable[[Path], WorkflowRunCheckpointRepository]
+
+
+@pytest.fixture(
+    params=(
+        lambda path: InMemoryWorkflowRunCheckpointRepository(),
+        lambda path: SQLiteWorkflowRunCheckpointRepository(path / "checkpoints.db"),
+    ),
+    ids=("memory", "sqlite"),
+)
+def repository(
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+) -> WorkflowRunCheckpointRepository:
+    """Return each checkpoint repository implementation."""
+
+    factory: RepositoryFactory = request.param
+
+    return require_workflow_run_checkpoint_repository(factory(tmp_path))
+
+
+def create_checkpoint(
+    run_id: UUID = RUN_ID,
+) -> WorkflowRunCheckpoint:
+    """Create an empty checkpoint for a deterministic workflow run."""
+
+    return WorkflowRunCheckpoint(
+        run_id=run_id,
+        workflow=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Checkpointed workflow",
+            description="Persist progress between steps.",
+        ),
+        initial_context=Context(
+            events=(
+                ContextEvent(
+                    id=EVENT_ID,
+                    event_type="request.received",
+                    payload={"text": "resume me"},
+                    producer="test",
+                    occurred_at=STARTED_AT,
+                ),
+            ),
+        ),
+        started_at=STARTED_AT,
+    )
+
+
+def create_step(step_id: UUID) -> WorkflowStepRun:
+    """Create a committed step that was skipped by its conditions."""
+
+    return WorkflowStepRun(
+        step_id=step_id,
+        layer_index=0,
+        status=WorkflowStepStatus.SKIPPED,
+        skip_reason=WorkflowStepSkipReason.CONDITION,
+    )
+
+
+def create_executed_step(
+    step_id: UUID,
+    context: Context,
+) -> WorkflowStepRun:
+    """Create a committed step that produced one large event from a context."""
+
+    execution = ExecutionResult(
+        strategy_id=step_id,
+        strategy_name="Write notes",
+        strategy_version="1.0.0",
+        output="notes",
+        initial_context=context,
+        produced_events=(
+            ContextEvent(
+                event_type="notes.written",
+                payload={"notes": f"{step_id} " * 100},
+                producer="test",
+                occurred_at=STARTED_AT,
+            ),
+        ),
+        started_at=STARTED_AT,
+        completed_at=STARTED_AT,
+    )
+
+    return WorkflowStepRun(
+        step_id=step_id,
+        layer_index=0,
+        status=WorkflowStepStatus.EXECUTED,
+        execution=execution,
+        attempts=(
+            WorkflowStepAttempt(
+                attempt_number=1,
+                started_at=STARTED_AT,
+                completed_at=STARTED_AT,
+                execution=execution,
+            ),
+        ),
+    )
+
+
+def test_checkpoint_repository_appends_committed_steps(
+    repository: WorkflowRunCheckpointRepository,
+) -> None:
+    repository.start(create_checkpoint())
+    repository.commit_step(RUN_ID, create_step(FIRST_STEP_ID))
+    repository.commit_step(RUN_ID, create_step(SECOND_STEP_ID))
+
+    checkpoint = repository.get(RUN_ID)
+
+    assert checkpoint is not None
+    assert checkpoint == create_checkpoint().model_copy(
+        update={
+            "steps": (
+                create_step(FIRST_STEP_ID),
+                create_step(SECOND_STEP_ID),
+            ),
+        },
+    )
+    assert checkpoint.step(SECOND_STEP_ID) == create_step(SECOND_STEP_ID)
+
+
+def test_checkpoint_repository_returns_none_for_unknown_runs(
+    repository: WorkflowRunCheckpointRepository,
+) -> None:
+    assert repository.get(RUN_ID) is None
+
+
+def test_checkpoint_repository_rejects_duplicate_runs(
+    repository: WorkflowRunCheckpointRepository,
+) -> None:
+    repository.start(create_checkpoint())
+
+    with pytest.raises(
+        ValueError,
+        match="already exists",
+    ):
+        repository.start(create_checkpoint())
+
+
+def test_checkpoint_repository_requires_a_started_run(
+    repository: WorkflowRunCheckpointRepository,
+) -> None:
+    with pytest.raises(
+        ValueError,
+        match="has no checkpoint",
+    ):
+        repository.commit_step(RUN_ID, create_step(FIRST_STEP_ID))
+
+
+def test_checkpoint_repository_discards_checkpoints(
+    repository: WorkflowRunCheckpointRepository,
+) -> None:
+    repository.start(create_checkpoint())
+    repository.start(create_checkpoint(SECOND_RUN_ID))
+    repository.commit_step(RUN_ID, create_step(FIRST_STEP_ID))
+
+    repository.discard(RUN_ID)
+    repository.discard(RUN_ID)
+
+    assert repository.get(RUN_ID) is None
+    assert tuple(checkpoint.run_id for checkpoint in repository.checkpoints()) == (SECOND_RUN_ID,)
+
+
+def test_checkpoints_reject_steps_committed_twice() -> None:
+    with pytest.raises(
+        ValueError,
+        match="cannot commit a step more than once",
+    ):
+        WorkflowRunCheckpoint.model_validate(
+            {
+                **create_checkpoint().model_dump(),
+                "steps": (
+                    create_step(FIRST_STEP_ID),
+                    create_step(FIRST_STEP_ID),
+                ),
+            }
+        )
+
+
+def test_sqlite_checkpoint_repository_survives_reconstruction(
+    tmp_path: Path,
+) -> None:
+    database = tmp_path / "checkpoints.db"
+
+    SQLiteWorkflowRunCheckpointRepository(database).start(create_checkpoint())
+    SQLiteWorkflowRunCheckpointRepository(database).commit_step(
+        RUN_ID,
+        create_step(FIRST_STEP_ID),
+    )
+
+    checkpoint = SQLiteWorkflowRunCheckpointRepository(database).get(RUN_ID)
+
+    assert checkpoint is not None
+    assert checkpoint.steps == (create_step(FIRST_STEP_ID),)
+
+
+def test_sqlite_checkpoint_repository_rejects_duplicate_steps(
+    tmp_path: Path,
+) -> None:
+    repository = SQLiteWorkflowRunCheckpointRepository(tmp_path / "checkpoints.db")
+
+    repository.start(create_checkpoint())
+    repository.commit_step(RUN_ID, create_step(FIRST_STEP_ID))
+
+    with pytest.raises(
+        ValueError,
+        match="already committed",
+    ):
+        repository.commit_step(RUN_ID, create_step(FIRST_STEP_ID))
+
+
+def test_sqlite_checkpoint_steps_store_only_their_produced_events(
+    tmp_path: Path,
+) -> None:
+    database = tmp_path / "checkpoints.db"
+    checkpoint = create_checkpoint()
+    first = create_executed_step(FIRST_STEP_ID, checkpoint.initial_context)
+
+    assert first.execution is not None
+
+    second = create_executed_step(SECOND_STEP_ID, first.execution.final_context)
+
+    SQLiteWorkflowRunCheckpointRepository(database).start(checkpoint)
+    SQLiteWorkflowRunCheckpointRepository(database).commit_step(RUN_ID, first)
+    SQLiteWorkflowRunCheckpointRepository(database).commit_step(RUN_ID, second)
+
+    connection = sqlite3.connect(database)
+
+    try:
+        rows = connection.execute(
+            """
+            SELECT payload
+            FROM workflow_run_checkpoint_steps
+            ORDER BY sequence
+            """
+        ).fetchall()
+    finally:
+        connection.close()
+
+    restored = SQLiteWorkflowRunCheckpointRepository(database).get(RUN_ID)
+
+    assert restored is not None
+    assert restored.steps == (first, second)
+    assert all("resume me" not in row[0] for row in rows)
+    assert str(FIRST_STEP_ID) not in rows[1][0]
@@ -0,0 +1,296 @@
+"""Tests for concurrent execution of workflow dependency layers."""
+
+import asyncio
+from uuid import UUID
+
+import pytest
+
+from azathoth.context import Context
+from azathoth.strategies import StrategyMetadata, StrategyOutcome
+from azathoth.workflows import (
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowFailurePolicy,
+    WorkflowMetadata,
+    WorkflowRunner,
+    WorkflowSchedulingMode,
+    WorkflowStepStatus,
+    WorkflowValueBinding,
+)
+
+WORKFLOW_ID = UUID("5a0f2a8e-3f55-4d0b-9a39-2f0c8f0d9d61")
+
+SLOW_STEP_ID = UUID("0f6d3b1c-1b6e-4c55-bb0a-8f6a2d1c4e10")
+MEDIUM_STEP_ID = UUID("8b1e7e0a-54a4-4a8f-9f5d-0f3f2b6a7c21")
+FAST_STEP_ID = UUID("d3c2b1a0-9e8f-4d7c-8b6a-5f4e3d2c1b32")
+SUMMARY_STEP_ID = UUID("6e5d4c3b-2a19-4807-b6f5-e4d3c2b1a043")
+
+
+class ConcurrencyProbe:
+    """Record how many strategies are running at the same time."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.maximum_in_flight = 0
+        self.completed: list[str] = []
+
+
+class SleepingStrategy:
+    """Wait before returning so sibling steps can overlap."""
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        delay_seconds: float,
+        probe: ConcurrencyProbe,
+        fail: bool = False,
+    ) -> None:
+        self._metadata = StrategyMetadata(
+            name=name,
+            description=f"Execute the {name} step.",
+        )
+        self._delay_seconds = delay_seconds
+        self._probe = probe
+        self._fail = fail
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Sleep, record completion, and return the strategy name."""
+
+        self._probe.in_flight += 1
+        self._probe.maximum_in_flight = max(
+            self._probe.maximum_in_flight,
+            self._probe.in_flight,
+        )
+
+        try:
+            await asyncio.sleep(self._delay_seconds)
+        finally:
+            self._probe.in_flight -= 1
+
+        self._probe.completed.append(self.metadata.name)
+
+        if self._fail:
+            raise RuntimeError(f"{self.metadata.name} failed")
+
+        return StrategyOutcome(
+            output={"name": self.metadata.name},
+        )
+
+
+def create_fan_out_candidate(
+    probe: ConcurrencyProbe,
+    *,
+    failing_step: str | None = None,
+    failure_policy: WorkflowFailurePolicy = WorkflowFailurePolicy.FAIL_WORKFLOW,
+) -> WorkflowCandidate:
+    """Create three independent root steps followed by a summary step."""
+
+    def strategy(name: str, delay_seconds: float) -> SleepingStrategy:
+        return SleepingStrategy(
+            name=name,
+            delay_seconds=delay_seconds,
+            probe=probe,
+            fail=name == failing_step,
+        )
+
+    return WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Fan-out workflow",
+            description="Classify a request along three independent branches.",
+        ),
+        steps=(
+            WorkflowCandidateStep(
+                id=SLOW_STEP_ID,
+                strategy=strategy("Slow", 0.05),
+                outputs=(WorkflowValueBinding(name="slow", path=("name",)),),
+                failure_policy=failure_policy,
+            ),
+            WorkflowCandidateStep(
+                id=MEDIUM_STEP_ID,
+                strategy=strategy("Medium", 0.03),
+                outputs=(WorkflowValueBinding(name="medium", path=("name",)),),
+                failure_policy=failure_policy,
+            ),
+            WorkflowCandidateStep(
+                id=FAST_STEP_ID,
+                strategy=strategy("Fast", 0.01),
+                outputs=(WorkflowValueBinding(name="fast", path=("name",)),),
+                failure_policy=failure_policy,
+            ),
+            WorkflowCandidateStep(
+                id=SUMMARY_STEP_ID,
+                strategy=strategy("Summary", 0.0),
+                depends_on=(
+                    SLOW_STEP_ID,
+                    MEDIUM_STEP_ID,
+                    FAST_STEP_ID,
+                ),
+            ),
+        ),
+    )
+
+
+def test_runner_rejects_non_positive_max_concurrency() -> None:
+    with pytest.raises(
+        ValueError,
+        match="max_concurrency must be at least 1",
+    ):
+        WorkflowRunner(
+            max_concurrency=0,
+        )
+
+
+def test_sequential_runner_executes_one_layer_step_at_a_time() -> None:
+    probe = ConcurrencyProbe()
+
+    asyncio.run(
+        WorkflowRunner().run(
+            create_fan_out_candidate(probe),
+            Context(),
+        )
+    )
+
+    assert probe.maximum_in_flight == 1
+    assert probe.completed == ["Slow", "Medium", "Fast", "Summary"]
+
+
+def test_concurrent_runner_launches_layer_steps_together() -> None:
+    probe = ConcurrencyProbe()
+
+    asyncio.run(
+        WorkflowRunner(
+            scheduling=WorkflowSchedulingMode.CONCURRENT,
+        ).run(
+            create_fan_out_candidate(probe),
+            Context(),
+        )
+    )
+
+    assert probe.maximum_in_flight == 3
+    assert probe.completed == ["Fast", "Medium", "Slow", "Summary"]
+
+
+def test_concurrent_runner_respects_max_concurrency() -> None:
+    probe = ConcurrencyProbe()
+
+    asyncio.run(
+        WorkflowRunner(
+            scheduling=WorkflowSchedulingMode.CONCURRENT,
+            max_concurrency=2,
+        ).run(
+            create_fan_out_candidate(probe),
+            Context(),
+        )
+    )
+
+    assert probe.maximum_in_flight == 2
+
+
+def test_concurrent_runner_commits_layer_in_declared_order() -> None:
+    probe = ConcurrencyProbe()
+
+    run = asyncio.run(
+        WorkflowRunner(
+            scheduling=WorkflowSchedulingMode.CONCURRENT,
+        ).run(
+            create_fan_out_candidate(probe),
+            Context(),
+        )
+    )
+
+    assert tuple(step.step_id for step in run.steps) == (
+        SLOW_STEP_ID,
+        MEDIUM_STEP_ID,
+        FAST_STEP_ID,
+        SUMMARY_STEP_ID,
+    )
+    assert tuple(step.layer_index for step in run.steps) == (0, 0, 0, 1)
+    assert tuple(value.value for value in run.values) == ("Slow", "Medium", "Fast")
+
+    completed_strategies = tuple(
+        event.payload["strategy_name"]
+        for event in run.final_context.events
+        if event.event_type == "strategy.execution.completed"
+    )
+
+    assert completed_strategies == (
+        "Slow",
+        "Medium",
+        "Fast",
+        "Summary",
+    )
+
+
+def test_concurrent_runner_matches_sequential_evidence() -> None:
+    sequential = asyncio.run(
+        WorkflowRunner().run(
+            create_fan_out_candidate(ConcurrencyProbe()),
+            Context(),
+        )
+    )
+    concurrent = asyncio.run(
+        WorkflowRunner(
+            scheduling=WorkflowSchedulingMode.CONCURRENT,
+        ).run(
+            create_fan_out_candidate(ConcurrencyProbe()),
+            Context(),
+        )
+    )
+
+    assert tuple((step.step_id, step.status, step.values) for step in sequential.steps) == tuple(
+        (step.step_id, step.status, step.values) for step in concurrent.steps
+    )
+
+
+def test_concurrent_runner_raises_fail_workflow_errors() -> None:
+    probe = ConcurrencyProbe()
+
+    with pytest.raises(
+        RuntimeError,
+        match="Medium failed",
+    ):
+        asyncio.run(
+            WorkflowRunner(
+                scheduling=WorkflowSchedulingMode.CONCURRENT,
+            ).run(
+                create_fan_out_candidate(
+                    probe,
+                    failing_step="Medium",
+                ),
+                Context(),
+            )
+        )
+
+    assert "Summary" not in probe.completed
+
+
+def test_concurrent_runner_records_continued_failures() -> None:
+    probe = ConcurrencyProbe()
+
+    run = asyncio.run(
+        WorkflowRunner(
+            scheduling=WorkflowSchedulingMode.CONCURRENT,
+        ).run(
+            create_fan_out_candidate(
+                probe,
+                failing_step="Fast",
+                failure_policy=WorkflowFailurePolicy.CONTINUE,
+            ),
+            Context(),
+        )
+    )
+
+    assert tuple(step.status for step in run.steps) == (
+        WorkflowStepStatus.EXECUTED,
+        WorkflowStepStatus.EXECUTED,
+        WorkflowStepStatus.FAILED,
+        WorkflowStepStatus.EXECUTED,
+    )
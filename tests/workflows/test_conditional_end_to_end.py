@@ -103,7 +103,6 @@ class ConditionalWorkflowExecutor(StrategyExecutor):
             strategy_version=strategy.metadata.version,
             output=output,
             initial_context=context,
-            final_context=context,
             started_at=datetime(
                 2026,
                 8,
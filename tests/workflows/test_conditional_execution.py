@@ -122,7 +122,6 @@ class ConditionalExecutor(StrategyExecutor):
             strategy_version=strategy.metadata.version,
             output=output,
             initial_context=context,
-            final_context=context,
             started_at=started_at,
             completed_at=completed_at,
         )
@@ -380,7 +379,6 @@ class NumericConditionalExecutor(StrategyExecutor):
             strategy_version=strategy.metadata.version,
             output=output,
             initial_context=context,
-            final_context=context,
             started_at=datetime(
                 2026,
                 8,
@@ -0,0 +1,489 @@
+"""Tests for capping what workflow runs spend on model calls."""
+
+import asyncio
+from uuid import UUID, uuid5
+
+import pytest
+
+from azathoth.context import Context, ContextEvent
+from azathoth.evaluation import (
+    BenchmarkCase,
+    BenchmarkDataset,
+    EvaluationStatus,
+    ExpectedOutcome,
+    OutcomeComparison,
+)
+from azathoth.prompting import (
+    ContextPromptStrategy,
+    ModelBinding,
+    PromptBinding,
+    PromptStrategy,
+    PromptTemplate,
+)
+from azathoth.providers import (
+    DeterministicLanguageModel,
+    ModelCatalog,
+    ModelMetadata,
+    ModelPricing,
+    Prompt,
+)
+from azathoth.strategies import (
+    StrategyExecutionMetrics,
+    StrategyMetadata,
+    StrategyOutcome,
+)
+from azathoth.workflows import (
+    WorkflowBenchmarkRunner,
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowCostBudget,
+    WorkflowCostBudgetExceededError,
+    WorkflowCostLedger,
+    WorkflowFailurePolicy,
+    WorkflowMapStrategy,
+    WorkflowMetadata,
+    WorkflowRetryBudget,
+    WorkflowRetryPolicy,
+    WorkflowRunner,
+    WorkflowSchedulingMode,
+    WorkflowStepSkipReason,
+    WorkflowStepStatus,
+    WorkflowValueBinding,
+    project_workflow_strategy_cost,
+)
+
+WORKFLOW_ID = UUID("b1c2d3e4-f5a6-4b7c-8d9e-0f1a2b3c4d5e")
+DATASET_ID = UUID("c2d3e4f5-a6b7-4c8d-9e0f-1a2b3c4d5e6f")
+
+MODEL = "test/priced-model"
+
+#
+# Every call projects one dollar of output and no input.
+#
+CATALOG = ModelCatalog(
+    models=(
+        ModelMetadata(
+            provider="test",
+            model="priced-model",
+            display_name="Priced Model",
+            context_window_tokens=8_192,
+            maximum_output_tokens=1_000,
+            pricing=ModelPricing(
+                input_usd_per_million_tokens=1_000.0,
+                output_usd_per_million_tokens=1_000.0,
+            ),
+        ),
+    ),
+)
+
+BUDGET = WorkflowCostBudget(max_cost_usd=2.5, expected_output_tokens=1_000)
+
+
+class CostingStrategy:
+    """Report a fixed cost for every call to a priced model."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        cost_usd: float = 1.0,
+        failures: int = 0,
+        model: str = MODEL,
+    ) -> None:
+        self._metadata = StrategyMetadata(
+            id=uuid5(WORKFLOW_ID, name),
+            name=name,
+            description=f"Execute the {name} step.",
+        )
+        self._cost_usd = cost_usd
+        self._failures = failures
+        self._model = model
+        self.calls = 0
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    @property
+    def model_binding(self) -> ModelBinding:
+        """Return the configured model."""
+
+        return ModelBinding(identifier=self._model)
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Fail the configured number of times, then report the call's cost."""
+
+        self.calls += 1
+
+        if self.calls <= self._failures:
+            raise RuntimeError("Provider unavailable.")
+
+        return StrategyOutcome(
+            output=self.metadata.name,
+            events=(
+                ContextEvent(
+                    event_type="test.step.completed",
+                    payload={"step": self.metadata.name},
+                    producer="test",
+                ),
+            ),
+            metrics=StrategyExecutionMetrics(estimated_cost_usd=self._cost_usd),
+        )
+
+
+def create_candidate(
+    *strategies: CostingStrategy,
+    chained: bool = False,
+    retry_policy: WorkflowRetryPolicy | None = None,
+    failure_policy: WorkflowFailurePolicy = WorkflowFailurePolicy.CONTINUE,
+) -> WorkflowCandidate:
+    """Create one step per strategy, optionally each depending on the last."""
+
+    steps: list[WorkflowCandidateStep] = []
+
+    for strategy in strategies:
+        steps.append(
+            WorkflowCandidateStep(
+                id=strategy.metadata.id,
+                strategy=strategy,
+                depends_on=(steps[-1].id,) if chained and steps else (),
+                outputs=(WorkflowValueBinding(name="value"),),
+                retry_policy=(retry_policy if retry_policy is not None else WorkflowRetryPolicy()),
+                failure_policy=failure_policy,
+            )
+        )
+
+    return WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Priced model calls",
+            description="Call a priced model.",
+        ),
+        steps=tuple(steps),
+    )
+
+
+def create_runner(
+    budget: WorkflowCostBudget | None = BUDGET,
+    *,
+    scheduling: WorkflowSchedulingMode = WorkflowSchedulingMode.SEQUENTIAL,
+) -> WorkflowRunner:
+    """Create a runner pricing steps from the test catalog."""
+
+    return WorkflowRunner(
+        scheduling=scheduling,
+        cost_budget=budget,
+        model_catalog=CATALOG,
+    )
+
+
+def test_projections_price_the_prompt_and_expected_output() -> None:
+    budget = WorkflowCostBudget(max_cost_usd=1.0, expected_output_tokens=2_000)
+    strategy = PromptStrategy(
+        metadata=StrategyMetadata(name="Classify", description="Classify text."),
+        prompt=Prompt(text="x" * 400),
+        language_model=DeterministicLanguageModel(),
+        model_binding=ModelBinding(identifier=MODEL),
+    )
+
+    #
+    # 100 prompt tokens and the model's 1,000 output tokens.
+    #
+    assert project_workflow_strategy_cost(
+        strategy,
+        Context(),
+        budget=budget,
+        catalog=CATALOG,
+    ) == pytest.approx(1.1)
+    assert (
+        project_workflow_strategy_cost(
+            strategy,
+            Context(),
+            budget=budget,
+            catalog=ModelCatalog(),
+        )
+        == 0.0
+    )
+
+
+def test_projections_render_context_prompts_and_count_map_elements() -> None:
+    strategy = ContextPromptStrategy(
+        metadata=StrategyMetadata(name="Summarize", description="Summarize text."),
+        template=PromptTemplate(
+            text="{text}",
+            bindings=(
+                PromptBinding(variable_name="text", event_type="document", field_name="text"),
+            ),
+        ),
+        language_model=DeterministicLanguageModel(),
+        model_binding=ModelBinding(identifier=MODEL),
+    )
+    context = Context().append(
+        ContextEvent(
+            event_type="document",
+            payload={"text": "x" * 4_000},
+            producer="test",
+        )
+    )
+
+    assert project_workflow_strategy_cost(
+        strategy,
+        context,
+        budget=BUDGET,
+        catalog=CATALOG,
+    ) == pytest.approx(2.0)
+
+    elements = context.append(
+        ContextEvent(
+            event_type="workflow.input.bound",
+            payload={"name": "chunks", "value": ["a", "b", "c"]},
+            producer="workflow-runner",
+        )
+    )
+
+    assert project_workflow_strategy_cost(
+        WorkflowMapStrategy(strategy, input_name="chunks"),
+        elements,
+        budget=BUDGET,
+        catalog=CATALOG,
+    ) == pytest.approx(6.0)
+
+
+def test_steps_the_budget_cannot_afford_are_skipped() -> None:
+    first, second, third = (CostingStrategy(name) for name in ("First", "Second", "Third"))
+
+    run = asyncio.run(
+        create_runner(WorkflowCostBudget(max_cost_usd=1.5, expected_output_tokens=1_000)).run(
+            create_candidate(first, second, third, chained=True),
+            Context(),
+        )
+    )
+
+    assert [step.status for step in run.steps] == [
+        WorkflowStepStatus.EXECUTED,
+        WorkflowStepStatus.SKIPPED,
+        WorkflowStepStatus.SKIPPED,
+    ]
+    assert [step.skip_reason for step in run.steps] == [
+        None,
+        WorkflowStepSkipReason.BUDGET_EXHAUSTED,
+        WorkflowStepSkipReason.BLOCKED,
+    ]
+    assert run.statistics.budget_exhausted_steps == 1
+    assert second.calls == 0
+
+
+def test_optional_steps_the_budget_cannot_afford_are_skipped() -> None:
+    first, second = (CostingStrategy(name) for name in ("First", "Second"))
+
+    run = asyncio.run(
+        create_runner(WorkflowCostBudget(max_cost_usd=1.5, expected_output_tokens=1_000)).run(
+            create_candidate(
+                first,
+                second,
+                chained=True,
+                failure_policy=WorkflowFailurePolicy.SKIP_DEPENDENTS,
+            ),
+            Context(),
+        )
+    )
+
+    assert run.steps[1].status is WorkflowStepStatus.SKIPPED
+    assert run.steps[1].skip_reason is WorkflowStepSkipReason.BUDGET_EXHAUSTED
+    assert second.calls == 0
+
+
+@pytest.mark.parametrize(
+    "scheduling",
+    tuple(WorkflowSchedulingMode),
+)
+def test_required_steps_the_budget_cannot_afford_fail_the_run(
+    scheduling: WorkflowSchedulingMode,
+) -> None:
+    first, second = (CostingStrategy(name) for name in ("First", "Second"))
+
+    with pytest.raises(
+        WorkflowCostBudgetExceededError,
+        match=r"projects \$1\.0000, more than the \$0\.5000 left in its cost budget",
+    ):
+        asyncio.run(
+            create_runner(
+                WorkflowCostBudget(max_cost_usd=1.5, expected_output_tokens=1_000),
+                scheduling=scheduling,
+            ).run(
+                create_candidate(
+                    first,
+                    second,
+                    chained=True,
+                    failure_policy=WorkflowFailurePolicy.FAIL_WORKFLOW,
+                ),
+                Context(),
+            )
+        )
+
+    assert second.calls == 0
+
+
+def test_reruns_execute_steps_the_parent_budget_skipped() -> None:
+    first, second = (CostingStrategy(name) for name in ("First", "Second"))
+    candidate = create_candidate(first, second, chained=True)
+
+    parent = asyncio.run(
+        create_runner(WorkflowCostBudget(max_cost_usd=1.5, expected_output_tokens=1_000)).run(
+            candidate,
+            Context(),
+        )
+    )
+    rerun = asyncio.run(create_runner().rerun(parent, candidate))
+
+    assert parent.steps[1].skip_reason is WorkflowStepSkipReason.BUDGET_EXHAUSTED
+    assert rerun.steps[1].status is WorkflowStepStatus.EXECUTED
+    assert second.calls == 1
+
+
+def test_retries_stop_once_the_budget_cannot_afford_them() -> None:
+    strategy = CostingStrategy("Flaky", failures=5)
+
+    run = asyncio.run(
+        create_runner().run(
+            create_candidate(strategy, retry_policy=WorkflowRetryPolicy(max_attempts=5)),
+            Context(),
+        )
+    )
+
+    #
+    # Failed attempts report no cost, so each is charged its projection.
+    #
+    assert run.steps[0].status is WorkflowStepStatus.FAILED
+    assert len(run.steps[0].attempts) == 2
+
+
+def test_retries_the_budget_refuses_leave_the_retry_budget_unspent() -> None:
+    priced = CostingStrategy("Priced", failures=5)
+    unpriced = CostingStrategy("Unpriced", failures=1, model="test/unpriced-model")
+
+    run = asyncio.run(
+        WorkflowRunner(
+            scheduling=WorkflowSchedulingMode.SEQUENTIAL,
+            cost_budget=WorkflowCostBudget(max_cost_usd=1.5, expected_output_tokens=1_000),
+            model_catalog=CATALOG,
+            retry_budget=WorkflowRetryBudget(max_retries=1),
+        ).run(
+            create_candidate(
+                priced,
+                unpriced,
+                retry_policy=WorkflowRetryPolicy(max_attempts=2),
+            ),
+            Context(),
+        )
+    )
+
+    assert [len(step.attempts) for step in run.steps] == [1, 2]
+    assert run.steps[1].status is WorkflowStepStatus.EXECUTED
+
+
+def test_reported_spend_counts_against_the_budget() -> None:
+    ledger = WorkflowCostLedger(BUDGET)
+    expensive = CostingStrategy("Expensive", cost_usd=3.0)
+    cheap = CostingStrategy("Cheap", cost_usd=0.0)
+
+    run = asyncio.run(
+        WorkflowRunner(model_catalog=CATALOG).run(
+            create_candidate(expensive, cheap),
+            Context(),
+            cost_ledger=ledger,
+        )
+    )
+
+    assert ledger.spent_usd == pytest.approx(3.0)
+    assert ledger.reserved_usd == 0.0
+    assert ledger.exhausted
+    assert run.steps[1].skip_reason is WorkflowStepSkipReason.BUDGET_EXHAUSTED
+
+
+def test_steps_projecting_no_cost_run_once_the_budget_is_spent() -> None:
+    ledger = WorkflowCostLedger(BUDGET)
+    expensive = CostingStrategy("Expensive", cost_usd=3.0)
+    unpriced = CostingStrategy("Unpriced", cost_usd=0.0)
+
+    #
+    # Without a catalog, neither step projects any cost.
+    #
+    run = asyncio.run(
+        WorkflowRunner().run(
+            create_candidate(expensive, unpriced),
+            Context(),
+            cost_ledger=ledger,
+        )
+    )
+
+    assert ledger.exhausted
+    assert run.steps[1].status is WorkflowStepStatus.EXECUTED
+    assert ledger.reserve(0.0)
+    assert not ledger.reserve(0.01)
+
+
+@pytest.mark.parametrize(
+    "scheduling",
+    (WorkflowSchedulingMode.CONCURRENT, WorkflowSchedulingMode.DEPENDENCY_DRIVEN),
+)
+def test_batches_share_one_budget(
+    scheduling: WorkflowSchedulingMode,
+) -> None:
+    runs = asyncio.run(
+        create_runner(scheduling=scheduling).run_batch(
+            create_candidate(CostingStrategy("Call")),
+            (Context(), Context(), Context()),
+        )
+    )
+
+    assert sorted(run.steps[0].status for run in runs) == [
+        WorkflowStepStatus.EXECUTED,
+        WorkflowStepStatus.EXECUTED,
+        WorkflowStepStatus.SKIPPED,
+    ]
+
+
+def test_benchmark_cases_beyond_the_budget_fail() -> None:
+    dataset = BenchmarkDataset(
+        id=DATASET_ID,
+        name="priced-calls",
+        description="Cases that each call a priced model.",
+        cases=tuple(
+            BenchmarkCase(
+                id=uuid5(DATASET_ID, name),
+                input=name,
+                expected=ExpectedOutcome(
+                    description="The step name",
+                    value=name,
+                    comparison=OutcomeComparison.EXACT,
+                ),
+            )
+            for name in ("First", "Second", "Third")
+        ),
+    )
+
+    result = asyncio.run(
+        WorkflowBenchmarkRunner(
+            WorkflowRunner(model_catalog=CATALOG),
+            cost_budget=BUDGET,
+        ).run(
+            dataset,
+            lambda case: create_candidate(CostingStrategy(str(case.input))),
+            output_name="value",
+        )
+    )
+
+    assert [case.evaluation.status for case in result.cases] == [
+        EvaluationStatus.PASSED,
+        EvaluationStatus.PASSED,
+        EvaluationStatus.FAILED,
+    ]
+    assert "budget was exhausted" in result.cases[2].evaluation.reason
+
+
+def test_cost_budgets_must_allow_spend() -> None:
+    with pytest.raises(ValueError, match="greater than 0"):
+        WorkflowCostBudget(max_cost_usd=0.0)
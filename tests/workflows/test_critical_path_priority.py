@@ -0,0 +1,242 @@
+"""Tests for admitting ready workflow steps by expected critical path."""
+
+import asyncio
+from uuid import UUID, uuid5
+
+import pytest
+
+from azathoth.context import Context, ContextEvent
+from azathoth.strategies import StrategyMetadata, StrategyOutcome
+from azathoth.workflows import (
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowExecutionPlan,
+    WorkflowLatencyProfile,
+    WorkflowMetadata,
+    WorkflowRunner,
+    WorkflowSchedulingMode,
+    WorkflowStepLatency,
+    WorkflowStepPrioritization,
+    WorkflowStrategyLatency,
+    WorkflowValueBinding,
+)
+
+WORKFLOW_ID = UUID("f6a7b8c9-d0e1-4f2a-8b3c-4d5e6f7a8b9c")
+
+FIRST_ID = UUID("a7b8c9d0-e1f2-4a3b-9c4d-5e6f7a8b9c0d")
+SECOND_ID = UUID("b8c9d0e1-f2a3-4b4c-8d5e-6f7a8b9c0d1e")
+HEAD_ID = UUID("c9d0e1f2-a3b4-4c5d-9e6f-7a8b9c0d1e2f")
+MIDDLE_ID = UUID("d0e1f2a3-b4c5-4d6e-8f7a-8b9c0d1e2f3a")
+TAIL_ID = UUID("e1f2a3b4-c5d6-4e7f-9a8b-9c0d1e2f3a4b")
+
+CHAIN = (HEAD_ID, MIDDLE_ID, TAIL_ID)
+
+
+class LoggingStrategy:
+    """Log when the step starts, then return its name."""
+
+    def __init__(
+        self,
+        name: str,
+        log: list[str],
+    ) -> None:
+        self._metadata = StrategyMetadata(
+            id=uuid5(WORKFLOW_ID, name),
+            name=name,
+            description=f"Execute the {name} step.",
+        )
+        self._log = log
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Log the start, wait briefly, and return the step name."""
+
+        self._log.append(self.metadata.name)
+
+        await asyncio.sleep(0.005)
+
+        return StrategyOutcome(
+            output=self.metadata.name,
+            events=(
+                ContextEvent(
+                    event_type="test.step.completed",
+                    payload={"step": self.metadata.name},
+                    producer="test",
+                ),
+            ),
+        )
+
+
+def create_candidate(log: list[str]) -> WorkflowCandidate:
+    """Create two short independent steps declared before a three-step chain."""
+
+    def step(
+        step_id: UUID,
+        name: str,
+        upstream_id: UUID | None = None,
+    ) -> WorkflowCandidateStep:
+        return WorkflowCandidateStep(
+            id=step_id,
+            strategy=LoggingStrategy(name, log),
+            depends_on=(upstream_id,) if upstream_id is not None else (),
+            outputs=(WorkflowValueBinding(name=name.lower()),),
+        )
+
+    return WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Short steps and a long chain",
+            description="Run two short steps beside a slow chain.",
+        ),
+        steps=(
+            step(FIRST_ID, "First"),
+            step(SECOND_ID, "Second"),
+            step(HEAD_ID, "Head"),
+            step(MIDDLE_ID, "Middle", HEAD_ID),
+            step(TAIL_ID, "Tail", MIDDLE_ID),
+        ),
+    )
+
+
+def step_profile(durations: dict[UUID, float]) -> WorkflowLatencyProfile:
+    """Return a latency profile recording one duration per step."""
+
+    return WorkflowLatencyProfile(
+        latencies=tuple(
+            WorkflowStepLatency(step_id=step_id, durations_seconds=(duration,))
+            for step_id, duration in durations.items()
+        ),
+    )
+
+
+HISTORY = step_profile(
+    {
+        FIRST_ID: 0.1,
+        SECOND_ID: 0.1,
+        **dict.fromkeys(CHAIN, 1.0),
+    }
+)
+
+
+def started(
+    *,
+    scheduling: WorkflowSchedulingMode = WorkflowSchedulingMode.DEPENDENCY_DRIVEN,
+    prioritization: WorkflowStepPrioritization = WorkflowStepPrioritization.CRITICAL_PATH,
+    latency_profile: WorkflowLatencyProfile | None = HISTORY,
+) -> list[str]:
+    """Run the workflow one step at a time and return the start order."""
+
+    log: list[str] = []
+
+    asyncio.run(
+        WorkflowRunner(
+            scheduling=scheduling,
+            max_concurrency=1,
+            prioritization=prioritization,
+            latency_profile=latency_profile,
+        ).run(create_candidate(log), Context())
+    )
+
+    return log
+
+
+def test_critical_paths_add_the_longest_waiting_chain() -> None:
+    plan = WorkflowExecutionPlan.compile(create_candidate([]))
+
+    assert plan.critical_paths((0.1, 0.1, 1.0, 2.0, 3.0)) == (0.1, 0.1, 6.0, 5.0, 3.0)
+
+    with pytest.raises(ValueError, match="must be given for every plan step"):
+        plan.critical_paths((1.0,))
+
+
+def test_the_longest_chain_is_admitted_first() -> None:
+    assert started() == ["Head", "Middle", "Tail", "First", "Second"]
+
+
+def test_layer_scheduling_admits_each_layer_by_critical_path() -> None:
+    assert started(scheduling=WorkflowSchedulingMode.CONCURRENT) == [
+        "Head",
+        "First",
+        "Second",
+        "Middle",
+        "Tail",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("prioritization", "latency_profile"),
+    (
+        (WorkflowStepPrioritization.DECLARED_ORDER, HISTORY),
+        (WorkflowStepPrioritization.CRITICAL_PATH, None),
+        (WorkflowStepPrioritization.CRITICAL_PATH, WorkflowLatencyProfile()),
+    ),
+)
+def test_steps_without_priorities_start_in_declared_order(
+    prioritization: WorkflowStepPrioritization,
+    latency_profile: WorkflowLatencyProfile | None,
+) -> None:
+    assert started(
+        prioritization=prioritization,
+        latency_profile=latency_profile,
+    ) == ["First", "Second", "Head", "Middle", "Tail"]
+
+
+def test_unobserved_steps_count_as_the_median_observed_step() -> None:
+    #
+    # Every step counts as one second, so the tail ties the short steps
+    # and falls back to declared order.
+    #
+    assert started(latency_profile=step_profile({HEAD_ID: 1.0})) == [
+        "Head",
+        "Middle",
+        "First",
+        "Second",
+        "Tail",
+    ]
+
+
+def test_strategy_latencies_stand_in_for_unobserved_steps() -> None:
+    profile = WorkflowLatencyProfile(
+        latencies=step_profile(
+            {
+                SECOND_ID: 0.1,
+                **dict.fromkeys(CHAIN, 1.0),
+            }
+        ).latencies,
+        strategy_latencies=(
+            WorkflowStrategyLatency(
+                strategy_id=uuid5(WORKFLOW_ID, "First"),
+                durations_seconds=(5.0,),
+            ),
+        ),
+    )
+
+    assert profile.expected_durations(
+        (
+            (FIRST_ID, uuid5(WORKFLOW_ID, "First")),
+            (HEAD_ID, uuid5(WORKFLOW_ID, "First")),
+            (uuid5(WORKFLOW_ID, "Unknown"), uuid5(WORKFLOW_ID, "Unknown")),
+        )
+    ) == (5.0, 1.0, None)
+    assert started(latency_profile=profile)[0] == "First"
+
+
+def test_recorded_runs_profile_strategy_latencies() -> None:
+    run = asyncio.run(WorkflowRunner().run(create_candidate([]), Context()))
+
+    profile = WorkflowLatencyProfile.from_runs((run,))
+
+    assert {latency.strategy_id for latency in profile.strategy_latencies} == {
+        step.execution.strategy_id for step in run.steps if step.execution is not None
+    }
+    assert profile.strategy_latency(uuid5(WORKFLOW_ID, "Head")) is not None
+
+
+def test_critical_path_prioritization_requires_a_concurrency_limit() -> None:
+    with pytest.raises(ValueError, match="requires max_concurrency"):
+        WorkflowRunner(prioritization=WorkflowStepPrioritization.CRITICAL_PATH)
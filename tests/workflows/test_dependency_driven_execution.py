@@ -0,0 +1,349 @@
+"""Tests for dependency-driven workflow step scheduling."""
+
+import asyncio
+from uuid import UUID
+
+import pytest
+from pydantic import JsonValue
+
+from azathoth.context import Context
+from azathoth.strategies import StrategyMetadata, StrategyOutcome
+from azathoth.workflows import (
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowCondition,
+    WorkflowFailurePolicy,
+    WorkflowInputBinding,
+    WorkflowMetadata,
+    WorkflowRun,
+    WorkflowRunner,
+    WorkflowSchedulingMode,
+    WorkflowStepStatus,
+    WorkflowValueBinding,
+    WorkflowValueReference,
+)
+
+WORKFLOW_ID = UUID("b7f0c3e2-5d41-4a6e-9c8b-1f2e3d4c5b60")
+
+SLOW_ROOT_ID = UUID("1a2b3c4d-5e6f-4071-8293-a4b5c6d7e8f1")
+FAST_ROOT_ID = UUID("2b3c4d5e-6f70-4182-93a4-b5c6d7e8f902")
+FAST_CHILD_ID = UUID("3c4d5e6f-7081-4293-a4b5-c6d7e8f9a013")
+JOIN_ID = UUID("4d5e6f70-8192-43a4-b5c6-d7e8f9a0b124")
+
+
+class Timeline:
+    """Record strategy start and completion order."""
+
+    def __init__(self) -> None:
+        self.entries: list[str] = []
+        self.in_flight = 0
+        self.maximum_in_flight = 0
+
+
+class TimedStrategy:
+    """Sleep for a configured delay and return a structured output."""
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        delay_seconds: float,
+        timeline: Timeline,
+        output: JsonValue = None,
+        fail: bool = False,
+    ) -> None:
+        self._metadata = StrategyMetadata(
+            name=name,
+            description=f"Execute the {name} step.",
+        )
+        self._delay_seconds = delay_seconds
+        self._timeline = timeline
+        self._output: JsonValue = output if output is not None else {"name": name}
+        self._fail = fail
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Record timing and return the configured output."""
+
+        self._timeline.entries.append(f"start:{self.metadata.name}")
+        self._timeline.in_flight += 1
+        self._timeline.maximum_in_flight = max(
+            self._timeline.maximum_in_flight,
+            self._timeline.in_flight,
+        )
+
+        try:
+            await asyncio.sleep(self._delay_seconds)
+        finally:
+            self._timeline.in_flight -= 1
+
+        self._timeline.entries.append(f"end:{self.metadata.name}")
+
+        if self._fail:
+            raise RuntimeError(f"{self.metadata.name} failed")
+
+        return StrategyOutcome(
+            output=self._output,
+        )
+
+
+def create_uneven_candidate(
+    timeline: Timeline,
+    *,
+    failing_step: str | None = None,
+    failure_policy: WorkflowFailurePolicy = WorkflowFailurePolicy.FAIL_WORKFLOW,
+) -> WorkflowCandidate:
+    """Create a DAG whose fast branch should not wait for the slow root."""
+
+    def strategy(name: str, delay_seconds: float) -> TimedStrategy:
+        return TimedStrategy(
+            name=name,
+            delay_seconds=delay_seconds,
+            timeline=timeline,
+            fail=name == failing_step,
+        )
+
+    return WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Uneven workflow",
+            description="Join a slow branch with a fast two-step branch.",
+        ),
+        steps=(
+            WorkflowCandidateStep(
+                id=SLOW_ROOT_ID,
+                strategy=strategy("Slow root", 0.08),
+                outputs=(WorkflowValueBinding(name="slow", path=("name",)),),
+            ),
+            WorkflowCandidateStep(
+                id=FAST_ROOT_ID,
+                strategy=strategy("Fast root", 0.01),
+                outputs=(WorkflowValueBinding(name="fast", path=("name",)),),
+                failure_policy=failure_policy,
+            ),
+            WorkflowCandidateStep(
+                id=FAST_CHILD_ID,
+                strategy=strategy("Fast child", 0.01),
+                depends_on=(FAST_ROOT_ID,),
+                inputs=(
+                    WorkflowInputBinding(
+                        name="fast",
+                        source=WorkflowValueReference(
+                            producer_step_id=FAST_ROOT_ID,
+                            name="fast",
+                        ),
+                    ),
+                ),
+                outputs=(WorkflowValueBinding(name="child", path=("name",)),),
+            ),
+            WorkflowCandidateStep(
+                id=JOIN_ID,
+                strategy=strategy("Join", 0.0),
+                depends_on=(
+                    SLOW_ROOT_ID,
+                    FAST_CHILD_ID,
+                ),
+            ),
+        ),
+    )
+
+
+def run_candidate(
+    candidate: WorkflowCandidate,
+    scheduling: WorkflowSchedulingMode,
+    *,
+    max_concurrency: int | None = None,
+) -> WorkflowRun:
+    """Execute a candidate with one scheduling mode."""
+
+    return asyncio.run(
+        WorkflowRunner(
+            scheduling=scheduling,
+            max_concurrency=max_concurrency,
+        ).run(
+            candidate,
+            Context(),
+        )
+    )
+
+
+def test_dependency_driven_runner_starts_steps_when_dependencies_commit() -> None:
+    timeline = Timeline()
+
+    run_candidate(
+        create_uneven_candidate(timeline),
+        WorkflowSchedulingMode.DEPENDENCY_DRIVEN,
+    )
+
+    assert timeline.entries.index("start:Fast child") < timeline.entries.index("end:Slow root")
+    assert timeline.entries[-2:] == ["start:Join", "end:Join"]
+
+
+def test_concurrent_layers_wait_for_the_slowest_previous_layer_step() -> None:
+    timeline = Timeline()
+
+    run_candidate(
+        create_uneven_candidate(timeline),
+        WorkflowSchedulingMode.CONCURRENT,
+    )
+
+    assert timeline.entries.index("start:Fast child") > timeline.entries.index("end:Slow root")
+
+
+def test_dependency_driven_runner_records_layer_evidence() -> None:
+    layered = run_candidate(
+        create_uneven_candidate(Timeline()),
+        WorkflowSchedulingMode.SEQUENTIAL,
+    )
+    dependency_driven = run_candidate(
+        create_uneven_candidate(Timeline()),
+        WorkflowSchedulingMode.DEPENDENCY_DRIVEN,
+    )
+
+    assert tuple(step.step_id for step in dependency_driven.steps) == (
+        SLOW_ROOT_ID,
+        FAST_ROOT_ID,
+        FAST_CHILD_ID,
+        JOIN_ID,
+    )
+    assert tuple(step.layer_index for step in dependency_driven.steps) == tuple(
+        step.layer_index for step in layered.steps
+    )
+    assert dependency_driven.values == layered.values
+    assert tuple(event.event_type for event in dependency_driven.final_context.events) == tuple(
+        event.event_type for event in layered.final_context.events
+    )
+
+
+def test_dependency_driven_step_context_contains_only_ancestor_events() -> None:
+    run = run_candidate(
+        create_uneven_candidate(Timeline()),
+        WorkflowSchedulingMode.DEPENDENCY_DRIVEN,
+    )
+
+    child = next(step for step in run.steps if step.step_id == FAST_CHILD_ID)
+
+    assert child.execution is not None
+
+    started_strategies = tuple(
+        event.payload["strategy_name"]
+        for event in child.execution.initial_context.by_type("strategy.execution.started")
+    )
+
+    assert started_strategies == ("Fast root",)
+
+
+def test_dependency_driven_runner_respects_max_concurrency() -> None:
+    timeline = Timeline()
+
+    run_candidate(
+        create_uneven_candidate(timeline),
+        WorkflowSchedulingMode.DEPENDENCY_DRIVEN,
+        max_concurrency=1,
+    )
+
+    assert timeline.maximum_in_flight == 1
+
+
+def test_dependency_driven_runner_blocks_skip_dependents_failures() -> None:
+    run = run_candidate(
+        create_uneven_candidate(
+            Timeline(),
+            failing_step="Fast root",
+            failure_policy=WorkflowFailurePolicy.SKIP_DEPENDENTS,
+        ),
+        WorkflowSchedulingMode.DEPENDENCY_DRIVEN,
+    )
+
+    assert tuple(step.status for step in run.steps) == (
+        WorkflowStepStatus.EXECUTED,
+        WorkflowStepStatus.FAILED,
+        WorkflowStepStatus.SKIPPED,
+        WorkflowStepStatus.SKIPPED,
+    )
+
+
+def test_dependency_driven_runner_raises_fail_workflow_errors() -> None:
+    timeline = Timeline()
+
+    with pytest.raises(
+        RuntimeError,
+        match="Fast root failed",
+    ):
+        run_candidate(
+            create_uneven_candidate(
+                timeline,
+                failing_step="Fast root",
+            ),
+            WorkflowSchedulingMode.DEPENDENCY_DRIVEN,
+        )
+
+    assert "start:Fast child" not in timeline.entries
+    assert "start:Join" not in timeline.entries
+
+
+def test_dependency_driven_runner_evaluates_conditions_like_layer_mode() -> None:
+    timeline = Timeline()
+
+    router_id = UUID("5e6f7081-92a3-44b5-86d7-e8f9a0b1c235")
+    math_id = UUID("6f708192-a3b4-45c6-97e8-f9a0b1c2d346")
+    writing_id = UUID("708192a3-b4c5-46d7-a8f9-a0b1c2d3e457")
+
+    def routed(step_id: UUID, name: str, route: str) -> WorkflowCandidateStep:
+        return WorkflowCandidateStep(
+            id=step_id,
+            strategy=TimedStrategy(
+                name=name,
+                delay_seconds=0.0,
+                timeline=timeline,
+            ),
+            depends_on=(router_id,),
+            conditions=(
+                WorkflowCondition(
+                    source=WorkflowValueReference(
+                        producer_step_id=router_id,
+                        name="route",
+                    ),
+                    expected=route,
+                ),
+            ),
+        )
+
+    candidate = WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Routing workflow",
+            description="Route a request to one specialist.",
+        ),
+        steps=(
+            WorkflowCandidateStep(
+                id=router_id,
+                strategy=TimedStrategy(
+                    name="Router",
+                    delay_seconds=0.0,
+                    timeline=timeline,
+                    output={"route": "math"},
+                ),
+                outputs=(WorkflowValueBinding(name="route", path=("route",)),),
+            ),
+            routed(math_id, "Math", "math"),
+            routed(writing_id, "Writing", "writing"),
+        ),
+    )
+
+    run = run_candidate(
+        candidate,
+        WorkflowSchedulingMode.DEPENDENCY_DRIVEN,
+    )
+
+    assert tuple(step.status for step in run.steps) == (
+        WorkflowStepStatus.EXECUTED,
+        WorkflowStepStatus.EXECUTED,
+        WorkflowStepStatus.SKIPPED,
+    )
+    assert "start:Writing" not in timeline.entries
@@ -1,12 +1,13 @@
 """Tests for recorded workflow execution results."""
 
+import json
 from datetime import UTC, datetime
 from uuid import UUID
 
 import pytest
 from pydantic import ValidationError
 
-from azathoth.context import Context
+from azathoth.context import Context, ContextEvent
 from azathoth.execution import ExecutionResult
 from azathoth.workflows import (
     WorkflowMetadata,
@@ -57,7 +58,6 @@ def create_execution_result(
         strategy_version="1.0.0",
         output=None,
         initial_context=context,
-        final_context=context,
         started_at=started_at,
         completed_at=completed_at,
     )
@@ -395,3 +395,49 @@ def test_workflow_step_run_persists_successful_attempt() -> None:
     assert attempt.succeeded
     assert attempt.execution == first.execution
     assert attempt.failure is None
+
+
+def test_workflow_runs_serialize_each_shared_event_once() -> None:
+    request = ContextEvent(
+        event_type="request.received",
+        payload={"text": "Why was I charged twice?"},
+        producer="test-suite",
+    )
+    classified = ContextEvent(
+        event_type="request.classified",
+        payload={"category": "billing"},
+        producer="classifier",
+    )
+    context = Context().append(request)
+    execution = create_execution_result(
+        strategy_id=STRATEGY_ONE_ID,
+        strategy_name="Classifier",
+        context=context,
+    ).model_copy(update={"produced_events": (classified,)})
+    run = create_workflow_run().model_copy(
+        update={
+            "steps": (
+                WorkflowStepRun(
+                    step_id=STEP_ONE_ID,
+                    layer_index=0,
+                    status=WorkflowStepStatus.EXECUTED,
+                    execution=execution,
+                    attempts=(create_step_attempt(execution=execution),),
+                ),
+            ),
+            "initial_context": context,
+            "final_context": execution.final_context,
+        }
+    )
+
+    payload = run.model_dump_json()
+    restored = WorkflowRun.model_validate_json(payload)
+
+    assert payload.count(str(request.id)) == 2
+    assert restored == run
+    assert require_execution(restored.steps[0]).final_context == run.final_context
+
+    with pytest.raises(ValidationError, match="share events"):
+        WorkflowStepRun.model_validate_json(
+            json.dumps(json.loads(payload)["steps"][0]),
+        )
@@ -0,0 +1,267 @@
+"""Tests for compiled workflow execution plans."""
+
+import asyncio
+from uuid import UUID
+
+import pytest
+from pydantic import JsonValue
+
+from azathoth.context import Context
+from azathoth.strategies import StrategyMetadata, StrategyOutcome
+from azathoth.workflows import (
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowCondition,
+    WorkflowExecutionPlan,
+    WorkflowInputBinding,
+    WorkflowMetadata,
+    WorkflowRunner,
+    WorkflowSchedulingMode,
+    WorkflowStepStatus,
+    WorkflowValueBinding,
+    WorkflowValueReference,
+)
+
+WORKFLOW_ID = UUID("9c1d2e3f-4a5b-4c6d-8e7f-0a1b2c3d4e51")
+
+ROUTER_ID = UUID("1d2e3f4a-5b6c-4d7e-8f90-a1b2c3d4e562")
+ANSWER_ID = UUID("2e3f4a5b-6c7d-4e8f-9012-b2c3d4e5f673")
+REVIEW_ID = UUID("3f4a5b6c-7d8e-4f90-a123-c3d4e5f6a784")
+SUMMARY_ID = UUID("4a5b6c7d-8e9f-4012-b234-d4e5f6a7b895")
+
+
+class StaticStrategy:
+    """Return one configured output."""
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        output: JsonValue,
+    ) -> None:
+        self._metadata = StrategyMetadata(
+            name=name,
+            description=f"Execute the {name} step.",
+        )
+        self._output = output
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Return the configured output."""
+
+        return StrategyOutcome(
+            output=self._output,
+        )
+
+
+def create_candidate(route: str = "answer") -> WorkflowCandidate:
+    """Create a routed workflow declared out of dependency order."""
+
+    def reference(producer_step_id: UUID, name: str) -> WorkflowValueReference:
+        return WorkflowValueReference(
+            producer_step_id=producer_step_id,
+            name=name,
+        )
+
+    return WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Planned workflow",
+            description="Route, answer, review, and summarize.",
+        ),
+        steps=(
+            WorkflowCandidateStep(
+                id=SUMMARY_ID,
+                strategy=StaticStrategy(name="Summary", output="summary"),
+                depends_on=(ANSWER_ID, REVIEW_ID),
+                inputs=(
+                    WorkflowInputBinding(
+                        name="answer",
+                        source=reference(ANSWER_ID, "answer"),
+                    ),
+                ),
+                outputs=(WorkflowValueBinding(name="summary"),),
+            ),
+            WorkflowCandidateStep(
+                id=ROUTER_ID,
+                strategy=StaticStrategy(name="Router", output={"route": route}),
+                outputs=(WorkflowValueBinding(name="route", path=("route",)),),
+            ),
+            WorkflowCandidateStep(
+                id=ANSWER_ID,
+                strategy=StaticStrategy(name="Answer", output="42"),
+                depends_on=(ROUTER_ID,),
+                conditions=(
+                    WorkflowCondition(
+                        source=reference(ROUTER_ID, "route"),
+                        expected="answer",
+                    ),
+                ),
+                outputs=(WorkflowValueBinding(name="answer"),),
+            ),
+            WorkflowCandidateStep(
+                id=REVIEW_ID,
+                strategy=StaticStrategy(name="Review", output="approved"),
+                depends_on=(ROUTER_ID,),
+                conditions=(
+                    WorkflowCondition(
+                        source=reference(ANSWER_ID, "answer"),
+                        expected="42",
+                    ),
+                ),
+            ),
+        ),
+    )
+
+
+def test_plan_orders_steps_by_layer_then_declared_order() -> None:
+    candidate = create_candidate()
+
+    plan = WorkflowExecutionPlan.compile(candidate)
+
+    assert tuple(
+        tuple(plan.steps[position].step.id for position in layer) for layer in plan.layers
+    ) == tuple(tuple(step.id for step in layer) for layer in candidate.execution_layers())
+    assert tuple(step.layer_index for step in plan.steps) == (0, 1, 1, 2)
+    assert tuple(step.position for step in plan.steps) == (0, 1, 2, 3)
+
+
+def test_plan_records_dependency_bitsets() -> None:
+    plan = WorkflowExecutionPlan.compile(create_candidate())
+
+    router, answer, review, summary = plan.steps
+
+    assert router.dependency_mask == 0
+    assert answer.dependency_mask == 0b0001
+    assert review.dependency_mask == 0b0001
+    assert summary.dependency_mask == 0b0110
+    assert summary.ancestor_positions == (0, 1, 2)
+
+
+def test_plan_binds_values_to_slots() -> None:
+    plan = WorkflowExecutionPlan.compile(create_candidate())
+
+    router, answer, review, summary = plan.steps
+
+    assert plan.slot_count == 3
+    assert answer.condition_slots[0][1] == router.output_slots[0][1]
+    assert summary.input_slots[0][1] == answer.output_slots[0][1]
+
+
+def test_plan_leaves_same_layer_references_unbound() -> None:
+    plan = WorkflowExecutionPlan.compile(create_candidate())
+
+    review = plan.steps[2]
+
+    assert review.condition_slots[0][1] is None
+
+
+def test_plan_rejects_duplicate_output_names() -> None:
+    candidate = WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Duplicate outputs",
+            description="Export one name twice.",
+        ),
+        steps=(
+            WorkflowCandidateStep(
+                id=ROUTER_ID,
+                strategy=StaticStrategy(name="Router", output="route"),
+                outputs=(
+                    WorkflowValueBinding(name="route"),
+                    WorkflowValueBinding(name="route"),
+                ),
+            ),
+        ),
+    )
+
+    with pytest.raises(
+        ValueError,
+        match="output names must be unique",
+    ):
+        WorkflowExecutionPlan.compile(candidate)
+
+
+def test_plan_binds_structurally_identical_candidates() -> None:
+    plan = WorkflowExecutionPlan.compile(create_candidate())
+    other = create_candidate(route="review")
+
+    bound = plan.bind(other)
+
+    assert bound.candidate is other
+    assert bound.layers is plan.layers
+    assert tuple(step.step for step in bound.steps) == tuple(
+        next(candidate_step for candidate_step in other.steps if candidate_step.id == step.step.id)
+        for step in plan.steps
+    )
+
+
+def test_plan_rejects_structurally_different_candidates() -> None:
+    plan = WorkflowExecutionPlan.compile(create_candidate())
+    other = WorkflowCandidate(
+        metadata=create_candidate().metadata,
+        steps=(
+            WorkflowCandidateStep(
+                id=ROUTER_ID,
+                strategy=StaticStrategy(name="Router", output="route"),
+            ),
+        ),
+    )
+
+    assert not plan.matches(other)
+
+    with pytest.raises(
+        ValueError,
+        match="does not match the compiled execution plan",
+    ):
+        plan.bind(other)
+
+
+def test_runner_reuses_compiled_plans() -> None:
+    runner = WorkflowRunner()
+    candidate = create_candidate()
+
+    plan = runner.compile(candidate)
+
+    assert runner.compile(candidate) is plan
+    assert runner.compile(create_candidate(route="review")).layers is plan.layers
+
+
+@pytest.mark.parametrize(
+    "scheduling",
+    tuple(WorkflowSchedulingMode),
+)
+def test_runner_executes_plans_like_candidates(
+    scheduling: WorkflowSchedulingMode,
+) -> None:
+    candidate = create_candidate()
+
+    from_candidate = asyncio.run(
+        WorkflowRunner(scheduling=scheduling).run(
+            candidate,
+            Context(),
+        )
+    )
+    from_plan = asyncio.run(
+        WorkflowRunner(scheduling=scheduling).run(
+            WorkflowExecutionPlan.compile(candidate),
+            Context(),
+        )
+    )
+
+    assert from_plan.workflow == from_candidate.workflow
+    assert tuple(step.status for step in from_plan.steps) == (
+        tuple(step.status for step in from_candidate.steps)
+    )
+    assert from_plan.values == from_candidate.values
+    assert tuple(step.status for step in from_plan.steps) == (
+        WorkflowStepStatus.EXECUTED,
+        WorkflowStepStatus.EXECUTED,
+        WorkflowStepStatus.SKIPPED,
+        WorkflowStepStatus.EXECUTED,
+    )
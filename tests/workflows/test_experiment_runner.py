@@ -458,6 +458,120 @@ def test_experiment_runner_preserves_input_order_for_exact_ties() -> None:
     assert result.ranking.entries[1].scorecard == result.scorecards[1]
 
 
+@pytest.mark.parametrize(
+    ("share_steps", "calls"),
+    ((True, 1), (False, 2)),
+)
+def test_experiment_runner_executes_shared_steps_once_when_sharing(
+    share_steps: bool,
+    calls: int,
+) -> None:
+    """Identical steps of different candidates should execute once only when shared."""
+
+    shared = tuple(
+        StaticStrategy(
+            strategy_id=STRATEGY_ID_A,
+            output="success",
+            estimated_cost_usd=0.05,
+        )
+        for _ in range(2)
+    )
+
+    workflows = tuple(
+        create_workflow(
+            workflow_id=workflow_id,
+            step_id=STEP_ID_A,
+            strategy=strategy,
+            name=name,
+        )
+        for workflow_id, strategy, name in zip(
+            (WORKFLOW_ID_A, WORKFLOW_ID_B),
+            shared,
+            ("first", "second"),
+            strict=True,
+        )
+    )
+
+    result = asyncio.run(
+        WorkflowExperimentRunner(
+            scorer=create_scorer(),
+            share_steps=share_steps,
+        ).run(
+            workflows=workflows,
+            context=Context(),
+            evaluator=RecordingEvaluator(),
+            expected_outcome=create_expected_outcome(),
+        )
+    )
+
+    assert sum(strategy.calls for strategy in shared) == calls
+    assert result.scorecards[0].overall_score == pytest.approx(
+        result.scorecards[1].overall_score,
+        abs=0.01,
+    )
+
+
+def test_incremental_experiments_reuse_unchanged_steps() -> None:
+    """Later candidates of one workflow should rerun only their changes."""
+
+    def create_variant(
+        final_strategy_id: UUID,
+        output: str,
+    ) -> tuple[WorkflowCandidate, StaticStrategy, StaticStrategy]:
+        shared = StaticStrategy(
+            strategy_id=STRATEGY_ID_A,
+            output="draft",
+            estimated_cost_usd=0.05,
+        )
+        final = StaticStrategy(
+            strategy_id=final_strategy_id,
+            output=output,
+            estimated_cost_usd=0.05,
+        )
+
+        return (
+            WorkflowCandidate(
+                metadata=WorkflowMetadata(
+                    id=WORKFLOW_ID_A,
+                    name="variants",
+                    description="Workflow used for experiment runner tests.",
+                ),
+                steps=(
+                    WorkflowCandidateStep(
+                        id=STEP_ID_A,
+                        strategy=shared,
+                    ),
+                    WorkflowCandidateStep(
+                        id=STEP_ID_B,
+                        strategy=final,
+                        depends_on=(STEP_ID_A,),
+                    ),
+                ),
+            ),
+            shared,
+            final,
+        )
+
+    first, first_shared, first_final = create_variant(STRATEGY_ID_B, "failure")
+    second, second_shared, second_final = create_variant(STRATEGY_ID_C, "success")
+
+    result = asyncio.run(
+        WorkflowExperimentRunner(
+            scorer=create_scorer(),
+            incremental=True,
+        ).run(
+            workflows=(first, second),
+            context=Context(),
+            evaluator=RecordingEvaluator(),
+            expected_outcome=create_expected_outcome(),
+        )
+    )
+
+    assert (first_shared.calls, first_final.calls) == (1, 1)
+    assert (second_shared.calls, second_final.calls) == (0, 1)
+    assert result.winner == result.scorecards[1]
+
+
 def test_experiment_runner_rejects_empty_workflow_collection() -> None:
     """Experiments require at least one candidate workflow."""
 
@@ -108,7 +108,6 @@ class SelectiveFailureExecutor(StrategyExecutor):
                 "result": strategy.metadata.name,
             },
             initial_context=context,
-            final_context=context,
             started_at=timestamp,
             completed_at=timestamp,
         )
@@ -102,7 +102,6 @@ class SelectiveFailureExecutor(StrategyExecutor):
             strategy_version=strategy.metadata.version,
             output=strategy.metadata.name,
             initial_context=context,
-            final_context=context,
             started_at=now,
             completed_at=now,
         )
@@ -21,6 +21,7 @@ from azathoth.workflows import (
     WorkflowCandidate,
     WorkflowCondition,
     WorkflowGenerationError,
+    WorkflowHedgePolicy,
     WorkflowInputBinding,
     WorkflowMetadata,
     WorkflowSpecification,
@@ -599,3 +600,76 @@ def test_generation_preserves_workflow_conditions() -> None:
     )
 
     assert candidate.steps[1].conditions == specification.steps[1].conditions
+
+
+def test_generation_preserves_step_timeouts() -> None:
+    specification = WorkflowSpecification(
+        metadata=create_workflow_specification().metadata,
+        steps=(
+            create_classification_step().model_copy(
+                update={
+                    "timeout_seconds": 5.0,
+                },
+            ),
+            create_reasoning_step(),
+        ),
+    )
+
+    candidate = generate_workflow_candidate(
+        specification=specification,
+        catalog=create_catalog(),
+        registry=create_registry(),
+    )
+
+    assert tuple(step.timeout_seconds for step in candidate.steps) == (5.0, None)
+
+
+def create_hedged_specification(
+    alternate_model: str,
+) -> WorkflowSpecification:
+    """Create a workflow whose classification step hedges on another model."""
+
+    return WorkflowSpecification(
+        metadata=create_workflow_specification().metadata,
+        steps=(
+            create_classification_step().model_copy(
+                update={
+                    "hedge_policy": WorkflowHedgePolicy(
+                        delay_seconds=1.0,
+                        alternate_model=alternate_model,
+                    ),
+                },
+            ),
+            create_reasoning_step(),
+        ),
+    )
+
+
+def test_generation_binds_alternate_hedge_models() -> None:
+    candidate = generate_workflow_candidate(
+        specification=create_hedged_specification("provider-b/reasoner"),
+        catalog=create_catalog(),
+        registry=create_registry(),
+    )
+
+    classification = candidate.steps[0]
+
+    assert isinstance(classification.strategy, PromptStrategy)
+    assert isinstance(classification.hedge_strategy, PromptStrategy)
+    assert classification.strategy.model_binding is not None
+    assert classification.strategy.model_binding.identifier == "provider-a/classifier"
+    assert classification.hedge_strategy.model_binding is not None
+    assert classification.hedge_strategy.model_binding.identifier == "provider-b/reasoner"
+    assert candidate.steps[1].hedge_strategy is None
+
+
+def test_generation_fails_when_alternate_hedge_model_is_not_eligible() -> None:
+    with pytest.raises(
+        WorkflowGenerationError,
+        match="Alternate hedge model 'provider-c/basic'",
+    ):
+        generate_workflow_candidate(
+            specification=create_hedged_specification("provider-c/basic"),
+            catalog=create_catalog(),
+            registry=create_registry(),
+        )
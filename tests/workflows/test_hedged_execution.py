@@ -0,0 +1,370 @@
+"""Tests for hedged execution of slow workflow steps."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from time import perf_counter
+from uuid import UUID
+
+import pytest
+from pydantic import ValidationError
+
+from azathoth.context import Context
+from azathoth.strategies import StrategyMetadata, StrategyOutcome
+from azathoth.workflows import (
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowFailurePolicy,
+    WorkflowHedgePolicy,
+    WorkflowHedgeRole,
+    WorkflowLatencyProfile,
+    WorkflowMetadata,
+    WorkflowRetryPolicy,
+    WorkflowRun,
+    WorkflowRunner,
+    WorkflowStepAttempt,
+    WorkflowStepFailureKind,
+    WorkflowStepLatency,
+    WorkflowStepRun,
+    WorkflowStepStatus,
+    WorkflowValueBinding,
+)
+
+WORKFLOW_ID = UUID("5a6b7c8d-9e0f-4a1b-8c2d-3e4f5a6b7c8d")
+
+STEP_ID = UUID("6b7c8d9e-0f1a-4b2c-9d3e-4f5a6b7c8d9e")
+
+
+class DelayedStrategy:
+    """Sleep for one configured delay per call and return its name."""
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        delays: tuple[float, ...],
+        fail: bool = False,
+    ) -> None:
+        self._metadata = StrategyMetadata(
+            name=name,
+            description=f"Execute the {name} step.",
+        )
+        self._delays = delays
+        self._fail = fail
+        self.calls = 0
+        self.cancelled = False
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Sleep for the delay configured for this call."""
+
+        delay = self._delays[min(self.calls, len(self._delays) - 1)]
+        self.calls += 1
+
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+        if self._fail:
+            raise RuntimeError(f"{self.metadata.name} failed")
+
+        return StrategyOutcome(output=self.metadata.name)
+
+
+def run_step(
+    step: WorkflowCandidateStep,
+    runner: WorkflowRunner | None = None,
+) -> WorkflowRun:
+    """Execute a one-step workflow against an empty context."""
+
+    return asyncio.run(
+        (runner if runner is not None else WorkflowRunner()).run(
+            WorkflowCandidate(
+                metadata=WorkflowMetadata(
+                    id=WORKFLOW_ID,
+                    name="Hedged workflow",
+                    description="Hedge one slow step.",
+                ),
+                steps=(step,),
+            ),
+            Context(),
+        )
+    )
+
+
+def roles(step: WorkflowStepRun) -> tuple[WorkflowHedgeRole | None, ...]:
+    """Return the hedge roles of recorded attempts."""
+
+    return tuple(attempt.hedge_role for attempt in step.attempts)
+
+
+def test_slow_attempts_are_hedged_on_the_alternate_strategy() -> None:
+    primary = DelayedStrategy(name="Primary", delays=(5.0,))
+    alternate = DelayedStrategy(name="Alternate", delays=(0.01,))
+
+    started = perf_counter()
+
+    run = run_step(
+        WorkflowCandidateStep(
+            id=STEP_ID,
+            strategy=primary,
+            outputs=(WorkflowValueBinding(name="answer"),),
+            hedge_policy=WorkflowHedgePolicy(delay_seconds=0.02),
+            hedge_strategy=alternate,
+        )
+    )
+
+    step = run.steps[0]
+
+    assert perf_counter() - started < 1.0
+    assert primary.cancelled
+    assert step.status is WorkflowStepStatus.EXECUTED
+    assert run.values_named("answer")[0].value == "Alternate"
+    assert roles(step) == (WorkflowHedgeRole.PRIMARY, WorkflowHedgeRole.HEDGE)
+    assert step.attempts[0].failure is not None
+    assert step.attempts[0].failure.kind is WorkflowStepFailureKind.CANCELLED
+    assert tuple(attempt.attempt_number for attempt in step.attempts) == (1, 1)
+
+
+def test_fast_attempts_are_not_hedged() -> None:
+    primary = DelayedStrategy(name="Primary", delays=(0.0,))
+    alternate = DelayedStrategy(name="Alternate", delays=(0.0,))
+
+    run = run_step(
+        WorkflowCandidateStep(
+            id=STEP_ID,
+            strategy=primary,
+            hedge_policy=WorkflowHedgePolicy(delay_seconds=1.0),
+            hedge_strategy=alternate,
+        )
+    )
+
+    assert alternate.calls == 0
+    assert roles(run.steps[0]) == (None,)
+
+
+def test_hedges_duplicate_the_primary_strategy_by_default() -> None:
+    strategy = DelayedStrategy(name="Flaky latency", delays=(5.0, 0.01))
+
+    run = run_step(
+        WorkflowCandidateStep(
+            id=STEP_ID,
+            strategy=strategy,
+            hedge_policy=WorkflowHedgePolicy(delay_seconds=0.02),
+        )
+    )
+
+    assert strategy.calls == 2
+    assert strategy.cancelled
+    assert run.steps[0].status is WorkflowStepStatus.EXECUTED
+
+
+def test_hedges_are_not_counted_as_retries_or_failures() -> None:
+    run = run_step(
+        WorkflowCandidateStep(
+            id=STEP_ID,
+            strategy=DelayedStrategy(name="Primary", delays=(5.0,)),
+            hedge_policy=WorkflowHedgePolicy(delay_seconds=0.02),
+            hedge_strategy=DelayedStrategy(name="Alternate", delays=(0.01,)),
+        )
+    )
+
+    statistics = run.statistics
+
+    assert statistics.total_attempts == 2
+    assert statistics.successful_attempts == 1
+    assert statistics.failed_attempts == 0
+    assert statistics.cancelled_attempts == 1
+    assert statistics.hedged_attempts == 1
+    assert statistics.retry_count == 0
+    assert run.reliability.first_attempt_success_rate == 1.0
+    assert run.reliability.retry_rate == 0.0
+
+
+def test_primary_failures_after_hedging_wait_for_the_hedge() -> None:
+    run = run_step(
+        WorkflowCandidateStep(
+            id=STEP_ID,
+            strategy=DelayedStrategy(name="Primary", delays=(0.05,), fail=True),
+            hedge_policy=WorkflowHedgePolicy(delay_seconds=0.01),
+            hedge_strategy=DelayedStrategy(name="Alternate", delays=(0.1,)),
+        )
+    )
+
+    step = run.steps[0]
+
+    assert step.status is WorkflowStepStatus.EXECUTED
+    assert roles(step) == (WorkflowHedgeRole.PRIMARY, WorkflowHedgeRole.HEDGE)
+    assert step.attempts[0].failure is not None
+    assert step.attempts[0].failure.kind is WorkflowStepFailureKind.ERROR
+    assert run.statistics.failed_attempts == 1
+
+
+def test_failed_hedged_attempts_are_retried_together() -> None:
+    run = run_step(
+        WorkflowCandidateStep(
+            id=STEP_ID,
+            strategy=DelayedStrategy(name="Primary", delays=(0.03,), fail=True),
+            retry_policy=WorkflowRetryPolicy(max_attempts=2),
+            failure_policy=WorkflowFailurePolicy.CONTINUE,
+            hedge_policy=WorkflowHedgePolicy(delay_seconds=0.01),
+            hedge_strategy=DelayedStrategy(name="Alternate", delays=(0.03,), fail=True),
+        )
+    )
+
+    step = run.steps[0]
+
+    assert step.status is WorkflowStepStatus.FAILED
+    assert tuple(attempt.attempt_number for attempt in step.attempts) == (1, 1, 2, 2)
+    assert run.statistics.retry_count == 1
+    assert run.statistics.hedged_attempts == 2
+
+
+def test_hedge_delay_follows_the_recorded_latency_percentile() -> None:
+    alternate = DelayedStrategy(name="Alternate", delays=(0.01,))
+
+    run = run_step(
+        WorkflowCandidateStep(
+            id=STEP_ID,
+            strategy=DelayedStrategy(name="Primary", delays=(5.0,)),
+            hedge_policy=WorkflowHedgePolicy(
+                latency_percentile=95.0,
+                minimum_observations=3,
+            ),
+            hedge_strategy=alternate,
+        ),
+        WorkflowRunner(
+            latency_profile=WorkflowLatencyProfile(
+                latencies=(
+                    WorkflowStepLatency(
+                        step_id=STEP_ID,
+                        durations_seconds=(0.01, 0.01, 0.02),
+                    ),
+                ),
+            ),
+        ),
+    )
+
+    assert alternate.calls == 1
+    assert roles(run.steps[0]) == (WorkflowHedgeRole.PRIMARY, WorkflowHedgeRole.HEDGE)
+
+
+def test_percentile_hedges_wait_for_enough_observations() -> None:
+    alternate = DelayedStrategy(name="Alternate", delays=(0.0,))
+
+    run_step(
+        WorkflowCandidateStep(
+            id=STEP_ID,
+            strategy=DelayedStrategy(name="Primary", delays=(0.05,)),
+            hedge_policy=WorkflowHedgePolicy(
+                latency_percentile=95.0,
+                minimum_observations=10,
+            ),
+            hedge_strategy=alternate,
+        ),
+        WorkflowRunner(
+            latency_profile=WorkflowLatencyProfile(
+                latencies=(
+                    WorkflowStepLatency(
+                        step_id=STEP_ID,
+                        durations_seconds=(0.01,),
+                    ),
+                ),
+            ),
+        ),
+    )
+
+    assert alternate.calls == 0
+
+
+def test_latency_profiles_record_primary_attempt_durations() -> None:
+    started_at = datetime(2026, 1, 1, tzinfo=UTC)
+
+    def attempt(
+        seconds: float,
+        role: WorkflowHedgeRole | None,
+    ) -> WorkflowStepAttempt:
+        return WorkflowStepAttempt.model_validate(
+            {
+                "attempt_number": 1,
+                "started_at": started_at,
+                "completed_at": started_at + timedelta(seconds=seconds),
+                "failure": {
+                    "exception_type": "CancelledError",
+                    "message": "cancelled",
+                    "kind": WorkflowStepFailureKind.CANCELLED,
+                },
+                "hedge_role": role,
+            }
+        )
+
+    run = run_step(
+        WorkflowCandidateStep(
+            id=STEP_ID,
+            strategy=DelayedStrategy(name="Primary", delays=(0.0,)),
+        )
+    )
+    hedged = run.model_copy(
+        update={
+            "steps": (
+                run.steps[0].model_copy(
+                    update={
+                        "attempts": (
+                            attempt(9.0, WorkflowHedgeRole.PRIMARY),
+                            run.steps[0]
+                            .attempts[0]
+                            .model_copy(
+                                update={"hedge_role": WorkflowHedgeRole.HEDGE},
+                            ),
+                        ),
+                    },
+                ),
+            ),
+        },
+    )
+
+    profile = WorkflowLatencyProfile.from_runs((run, run, hedged))
+    latency = profile.latency(STEP_ID)
+
+    assert latency is not None
+    assert latency.observations == 2
+    assert profile.percentile(STEP_ID, 50.0) == latency.durations_seconds[0]
+    assert profile.percentile(STEP_ID, 50.0, minimum_observations=3) is None
+
+
+def test_step_latency_percentiles_use_the_nearest_rank() -> None:
+    latency = WorkflowStepLatency(
+        step_id=STEP_ID,
+        durations_seconds=(1.0, 2.0, 3.0, 4.0),
+    )
+
+    assert latency.percentile(25.0) == 1.0
+    assert latency.percentile(50.0) == 2.0
+    assert latency.percentile(99.0) == 4.0
+    assert latency.percentile(100.0) == 4.0
+
+
+def test_hedge_policies_require_a_threshold() -> None:
+    with pytest.raises(
+        ValidationError,
+        match="require a delay_seconds or latency_percentile",
+    ):
+        WorkflowHedgePolicy()
+
+
+def test_hedge_strategies_require_a_hedge_policy() -> None:
+    with pytest.raises(
+        ValueError,
+        match="hedge strategies require a hedge policy",
+    ):
+        WorkflowCandidateStep(
+            id=STEP_ID,
+            strategy=DelayedStrategy(name="Primary", delays=(0.0,)),
+            hedge_strategy=DelayedStrategy(name="Alternate", delays=(0.0,)),
+        )
@@ -0,0 +1,344 @@
+"""Tests for incremental re-execution of modified workflow candidates."""
+
+import asyncio
+from dataclasses import replace
+from uuid import UUID, uuid5
+
+import pytest
+
+from azathoth.context import Context, ContextEvent
+from azathoth.prompting import ModelBinding
+from azathoth.strategies import (
+    StrategyExecutionMetrics,
+    StrategyMetadata,
+    StrategyOutcome,
+)
+from azathoth.workflows import (
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowFailurePolicy,
+    WorkflowInputBinding,
+    WorkflowMetadata,
+    WorkflowRun,
+    WorkflowRunner,
+    WorkflowSchedulingMode,
+    WorkflowStepStatus,
+    WorkflowValueBinding,
+    WorkflowValueReference,
+)
+
+WORKFLOW_ID = UUID("b4c5d6e7-f8a9-4b0c-8d1e-2f3a4b5c6d7e")
+
+SOURCE_ID = UUID("c5d6e7f8-a9b0-4c1d-9e2f-3a4b5c6d7e8f")
+LEFT_ID = UUID("d6e7f8a9-b0c1-4d2e-8f3a-4b5c6d7e8f9a")
+RIGHT_ID = UUID("e7f8a9b0-c1d2-4e3f-9a4b-5c6d7e8f9a0b")
+LEFT_REVIEW_ID = UUID("f8a9b0c1-d2e3-4f4a-8b5c-6d7e8f9a0b1c")
+RIGHT_REVIEW_ID = UUID("a9b0c1d2-e3f4-4a5b-9c6d-7e8f9a0b1c2d")
+
+STEP_IDS = (SOURCE_ID, LEFT_ID, RIGHT_ID, LEFT_REVIEW_ID, RIGHT_REVIEW_ID)
+
+SUBSTITUTE_ID = UUID("b0c1d2e3-f4a5-4b6c-8d7e-8f9a0b1c2d3e")
+
+
+class CountingStrategy:
+    """Return its name with a suffix and count calls.
+
+    Strategies with the same name share an identity unless one is given.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        strategy_id: UUID | None = None,
+        suffix: str = "",
+        model: str | None = None,
+        fail: bool = False,
+    ) -> None:
+        self._metadata = StrategyMetadata(
+            id=strategy_id if strategy_id is not None else uuid5(WORKFLOW_ID, name),
+            name=name,
+            description=f"Execute the {name} step.",
+        )
+        self._model_binding = ModelBinding(identifier=model) if model is not None else None
+        self._suffix = suffix
+        self._fail = fail
+        self.calls = 0
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    @property
+    def model_binding(self) -> ModelBinding | None:
+        """Return the model the strategy is bound to."""
+
+        return self._model_binding
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Return the strategy name, or fail when configured to."""
+
+        self.calls += 1
+
+        if self._fail:
+            raise RuntimeError(f"{self.metadata.name} failed")
+
+        provider, model = (
+            self._model_binding.identifier.split("/", 1)
+            if self._model_binding is not None
+            else (None, None)
+        )
+
+        return StrategyOutcome(
+            output=f"{self.metadata.name}{self._suffix}",
+            events=(
+                ContextEvent(
+                    event_type="test.step.completed",
+                    payload={"step": self.metadata.name},
+                    producer="test",
+                ),
+            ),
+            metrics=StrategyExecutionMetrics(
+                provider=provider,
+                model=model,
+            ),
+        )
+
+
+def create_candidate(
+    *,
+    right_model: str = "test/large",
+    fail_right: bool = False,
+) -> WorkflowCandidate:
+    """Create a source feeding two branches, each with a review step."""
+
+    def step(
+        step_id: UUID,
+        name: str,
+        upstream_id: UUID | None = None,
+        *,
+        model: str | None = None,
+        fail: bool = False,
+    ) -> WorkflowCandidateStep:
+        return WorkflowCandidateStep(
+            id=step_id,
+            strategy=CountingStrategy(name=name, model=model, fail=fail),
+            depends_on=(upstream_id,) if upstream_id is not None else (),
+            inputs=(
+                (
+                    WorkflowInputBinding(
+                        name="upstream",
+                        source=WorkflowValueReference(
+                            producer_step_id=upstream_id,
+                            name="value",
+                        ),
+                    ),
+                )
+                if upstream_id is not None
+                else ()
+            ),
+            outputs=(WorkflowValueBinding(name="value"),),
+            failure_policy=WorkflowFailurePolicy.SKIP_DEPENDENTS,
+        )
+
+    return WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Branching review",
+            description="Draft two branches and review each.",
+        ),
+        steps=(
+            step(SOURCE_ID, "Source"),
+            step(LEFT_ID, "Left", SOURCE_ID),
+            step(RIGHT_ID, "Right", SOURCE_ID, model=right_model, fail=fail_right),
+            step(LEFT_REVIEW_ID, "Left review", LEFT_ID),
+            step(RIGHT_REVIEW_ID, "Right review", RIGHT_ID),
+        ),
+    )
+
+
+def substitute(
+    candidate: WorkflowCandidate,
+    step_id: UUID,
+) -> tuple[WorkflowCandidate, CountingStrategy]:
+    """Rebind one step to a different strategy, as a model substitution would."""
+
+    strategy = CountingStrategy(
+        name="Right",
+        strategy_id=SUBSTITUTE_ID,
+        suffix=" (substituted)",
+    )
+
+    return (
+        WorkflowCandidate(
+            metadata=candidate.metadata,
+            steps=tuple(
+                replace(step, strategy=strategy) if step.id == step_id else step
+                for step in candidate.steps
+            ),
+        ),
+        strategy,
+    )
+
+
+def calls(candidate: WorkflowCandidate) -> dict[UUID, int]:
+    """Return how often each step strategy was called."""
+
+    counts: dict[UUID, int] = {}
+
+    for step in candidate.steps:
+        assert isinstance(step.strategy, CountingStrategy)
+        counts[step.id] = step.strategy.calls
+
+    return counts
+
+
+def run_parent(
+    runner: WorkflowRunner,
+    candidate: WorkflowCandidate,
+) -> WorkflowRun:
+    """Execute the parent candidate in full."""
+
+    return asyncio.run(runner.run(candidate, Context()))
+
+
+def test_dependency_driven_reruns_execute_only_the_changed_branch() -> None:
+    runner = WorkflowRunner(scheduling=WorkflowSchedulingMode.DEPENDENCY_DRIVEN)
+    parent_candidate = create_candidate()
+    parent = run_parent(runner, parent_candidate)
+
+    candidate, _ = substitute(create_candidate(), RIGHT_ID)
+
+    run = asyncio.run(runner.rerun(parent, candidate))
+
+    assert calls(candidate) == {
+        SOURCE_ID: 0,
+        LEFT_ID: 0,
+        RIGHT_ID: 1,
+        LEFT_REVIEW_ID: 0,
+        RIGHT_REVIEW_ID: 1,
+    }
+    assert run.id != parent.id
+    assert tuple(step.step_id for step in run.steps) == STEP_IDS
+    assert (run.steps[0], run.steps[1], run.steps[3]) == (
+        parent.steps[0],
+        parent.steps[1],
+        parent.steps[3],
+    )
+    assert run.values_named("value")[2].value == "Right (substituted)"
+
+
+@pytest.mark.parametrize(
+    "scheduling",
+    (WorkflowSchedulingMode.SEQUENTIAL, WorkflowSchedulingMode.CONCURRENT),
+)
+def test_layer_reruns_execute_every_later_layer(
+    scheduling: WorkflowSchedulingMode,
+) -> None:
+    runner = WorkflowRunner(scheduling=scheduling)
+    parent = run_parent(runner, create_candidate())
+
+    candidate, _ = substitute(create_candidate(), RIGHT_ID)
+
+    asyncio.run(runner.rerun(parent, candidate))
+
+    assert calls(candidate) == {
+        SOURCE_ID: 0,
+        LEFT_ID: 0,
+        RIGHT_ID: 1,
+        LEFT_REVIEW_ID: 1,
+        RIGHT_REVIEW_ID: 1,
+    }
+
+
+@pytest.mark.parametrize(
+    "scheduling",
+    tuple(WorkflowSchedulingMode),
+)
+def test_reruns_match_full_runs_of_the_modified_candidate(
+    scheduling: WorkflowSchedulingMode,
+) -> None:
+    runner = WorkflowRunner(scheduling=scheduling)
+    parent = run_parent(runner, create_candidate())
+
+    rerun = asyncio.run(runner.rerun(parent, substitute(create_candidate(), RIGHT_ID)[0]))
+    full = run_parent(runner, substitute(create_candidate(), RIGHT_ID)[0])
+
+    assert rerun.values == full.values
+    assert tuple(
+        event.payload
+        for event in rerun.final_context.events
+        if event.event_type == "test.step.completed"
+    ) == tuple(
+        event.payload
+        for event in full.final_context.events
+        if event.event_type == "test.step.completed"
+    )
+
+
+def test_model_substitutions_are_changes() -> None:
+    runner = WorkflowRunner(scheduling=WorkflowSchedulingMode.DEPENDENCY_DRIVEN)
+    parent = run_parent(runner, create_candidate())
+
+    candidate = create_candidate(right_model="test/small")
+    asyncio.run(runner.rerun(parent, candidate))
+
+    assert calls(candidate) == {
+        SOURCE_ID: 0,
+        LEFT_ID: 0,
+        RIGHT_ID: 1,
+        LEFT_REVIEW_ID: 0,
+        RIGHT_REVIEW_ID: 1,
+    }
+
+
+def test_unchanged_candidates_reuse_every_step() -> None:
+    runner = WorkflowRunner()
+    parent = run_parent(runner, create_candidate())
+
+    candidate = create_candidate()
+    run = asyncio.run(runner.rerun(parent, candidate))
+
+    assert set(calls(candidate).values()) == {0}
+    assert run.steps == parent.steps
+    assert run.final_context == parent.final_context
+
+
+def test_reruns_execute_steps_that_failed_in_the_parent() -> None:
+    runner = WorkflowRunner(scheduling=WorkflowSchedulingMode.DEPENDENCY_DRIVEN)
+    parent = run_parent(runner, create_candidate(fail_right=True))
+
+    assert parent.steps[2].status is WorkflowStepStatus.FAILED
+
+    candidate = create_candidate()
+    run = asyncio.run(runner.rerun(parent, candidate))
+
+    assert parent.steps[4].status is WorkflowStepStatus.SKIPPED
+    assert calls(candidate) == {
+        SOURCE_ID: 0,
+        LEFT_ID: 0,
+        RIGHT_ID: 1,
+        LEFT_REVIEW_ID: 0,
+        RIGHT_REVIEW_ID: 1,
+    }
+    assert run.steps[2].status is WorkflowStepStatus.EXECUTED
+    assert run.steps[4].status is WorkflowStepStatus.EXECUTED
+
+
+def test_reruns_require_a_parent_of_the_same_workflow() -> None:
+    runner = WorkflowRunner()
+    parent = run_parent(runner, create_candidate())
+
+    candidate = create_candidate()
+    other = WorkflowCandidate(
+        metadata=candidate.metadata.model_copy(update={"name": "Other workflow"}),
+        steps=candidate.steps,
+    )
+
+    with pytest.raises(
+        ValueError,
+        match="require a parent run of the same workflow",
+    ):
+        asyncio.run(runner.rerun(parent, other))
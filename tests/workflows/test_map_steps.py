@@ -0,0 +1,368 @@
+"""Tests for workflow steps mapped over list-valued inputs."""
+
+import asyncio
+from time import monotonic
+from uuid import UUID
+
+import pytest
+from pydantic import JsonValue
+
+from azathoth.context import Context, ContextEvent
+from azathoth.providers import LanguageModelRegistry, ModelCatalog
+from azathoth.strategies import (
+    StrategyExecutionMetrics,
+    StrategyMetadata,
+    StrategyOutcome,
+)
+from azathoth.tools import (
+    ToolCatalog,
+    ToolDefinition,
+    ToolImplementation,
+    ToolImplementationCatalog,
+    ToolImplementationResolver,
+    ToolInputSchema,
+    ToolOutputSchema,
+    ToolRequirement,
+    ToolResolver,
+    ToolStrategy,
+)
+from azathoth.workflows import (
+    MapStepSpecification,
+    ToolStepSpecification,
+    WorkflowInputBinding,
+    WorkflowMapInputError,
+    WorkflowMapStrategy,
+    WorkflowMetadata,
+    WorkflowRunner,
+    WorkflowSpecification,
+    WorkflowStepSpecification,
+    WorkflowValueBinding,
+    WorkflowValueReference,
+    generate_workflow_candidate,
+)
+
+WORKFLOW_ID = UUID("a5b6c7d8-e9f0-4a1b-8c2d-3e4f5a6b7c8d")
+
+SPLIT_STEP_ID = UUID("b6c7d8e9-f0a1-4b2c-9d3e-4f5a6b7c8d9e")
+COUNT_STEP_ID = UUID("c7d8e9f0-a1b2-4c3d-8e4f-5a6b7c8d9e0f")
+
+SPLIT_TOOL_ID = UUID("d8e9f0a1-b2c3-4d4e-9f5a-6b7c8d9e0f1a")
+COUNT_TOOL_ID = UUID("e9f0a1b2-c3d4-4e5f-8a6b-7c8d9e0f1a2b")
+
+ELEMENT_STRATEGY_ID = UUID("f0a1b2c3-d4e5-4f6a-9b7c-8d9e0f1a2b3c")
+
+
+class ElementStrategy:
+    """Echo the bound element, finishing earlier elements last."""
+
+    def __init__(
+        self,
+        *,
+        cost_usd: float | None = 0.25,
+        latency_ms: int | None = None,
+    ) -> None:
+        self._metadata = StrategyMetadata(
+            id=ELEMENT_STRATEGY_ID,
+            name="Echo element",
+            description="Echo one mapped element.",
+        )
+        self._cost_usd = cost_usd
+        self._latency_ms = latency_ms
+        self.contexts: list[Context] = []
+        self.running = 0
+        self.peak = 0
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Return the latest bound input value."""
+
+        self.contexts.append(context)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+
+        event = context.latest("workflow.input.bound")
+
+        assert event is not None
+
+        index = event.payload["index"]
+
+        assert isinstance(index, int)
+
+        await asyncio.sleep(0.01 * (3 - index))
+
+        self.running -= 1
+
+        return StrategyOutcome(
+            output=event.payload["value"],
+            events=(
+                ContextEvent(
+                    event_type="test.element.completed",
+                    payload={"index": index},
+                    producer="test",
+                ),
+            ),
+            metrics=StrategyExecutionMetrics(
+                prompt_tokens=2,
+                completion_tokens=1,
+                total_tokens=3,
+                estimated_cost_usd=self._cost_usd,
+                latency_ms=self._latency_ms,
+            ),
+        )
+
+
+def bound(name: str, value: JsonValue) -> ContextEvent:
+    """Return a workflow input bound by the runner."""
+
+    return ContextEvent(
+        event_type="workflow.input.bound",
+        payload={"name": name, "value": value},
+        producer="workflow-runner",
+    )
+
+
+def test_map_outputs_follow_element_order() -> None:
+    strategy = ElementStrategy()
+
+    outcome = asyncio.run(
+        WorkflowMapStrategy(strategy, input_name="chunks").run(
+            Context(events=(bound("chunks", ["a", "b", "c"]),)),
+        )
+    )
+
+    assert outcome.output == ["a", "b", "c"]
+    assert tuple(event.payload["index"] for event in outcome.events) == (0, 1, 2)
+    assert strategy.peak == 3
+
+
+def test_map_elements_receive_their_own_bound_events() -> None:
+    strategy = ElementStrategy()
+    source = bound("chunks", ["a", "b", "c"])
+
+    asyncio.run(
+        WorkflowMapStrategy(strategy, input_name="chunks").run(
+            Context(events=(source,)),
+        )
+    )
+
+    events = [context.latest("workflow.input.bound") for context in strategy.contexts]
+
+    assert all(event is not None for event in events)
+    assert len({event.id for event in events if event is not None} | {source.id}) == 4
+    assert {
+        (event.payload["value"], event.payload["source_event_id"])
+        for event in events
+        if event is not None
+    } == {(element, str(source.id)) for element in ("a", "b", "c")}
+
+
+def test_map_concurrency_is_limited() -> None:
+    strategy = ElementStrategy()
+
+    outcome = asyncio.run(
+        WorkflowMapStrategy(strategy, input_name="chunks", max_concurrency=1).run(
+            Context(events=(bound("chunks", ["a", "b", "c"]),)),
+        )
+    )
+
+    assert outcome.output == ["a", "b", "c"]
+    assert strategy.peak == 1
+
+
+def test_map_elements_rebind_only_the_mapped_input() -> None:
+    strategy = ElementStrategy()
+
+    asyncio.run(
+        WorkflowMapStrategy(strategy, input_name="chunks").run(
+            Context(events=(bound("chunks", ["a"]), bound("title", "Report"))),
+        )
+    )
+
+    assert tuple(
+        (event.payload["name"], event.payload["value"]) for event in strategy.contexts[0].events
+    ) == (("title", "Report"), ("chunks", "a"))
+
+
+def test_map_metrics_sum_element_metrics() -> None:
+    outcome = asyncio.run(
+        WorkflowMapStrategy(ElementStrategy(), input_name="chunks").run(
+            Context(events=(bound("chunks", ["a", "b"]),)),
+        )
+    )
+
+    assert outcome.metrics == StrategyExecutionMetrics(
+        prompt_tokens=4,
+        completion_tokens=2,
+        total_tokens=6,
+        estimated_cost_usd=0.5,
+    )
+
+    partial = asyncio.run(
+        WorkflowMapStrategy(ElementStrategy(cost_usd=None), input_name="chunks").run(
+            Context(events=(bound("chunks", ["a"]),)),
+        )
+    )
+
+    assert partial.metrics is not None
+    assert partial.metrics.estimated_cost_usd is None
+
+
+def test_map_latency_is_the_wall_clock_time_of_its_elements() -> None:
+    started_at = monotonic()
+    outcome = asyncio.run(
+        WorkflowMapStrategy(ElementStrategy(latency_ms=1000), input_name="chunks").run(
+            Context(events=(bound("chunks", ["a", "b", "c"]),)),
+        )
+    )
+    elapsed_ms = (monotonic() - started_at) * 1000
+
+    assert outcome.metrics is not None
+    assert outcome.metrics.latency_ms is not None
+    assert 20 <= outcome.metrics.latency_ms <= elapsed_ms
+
+
+def test_map_inputs_must_be_bound_lists() -> None:
+    strategy = WorkflowMapStrategy(ElementStrategy(), input_name="chunks")
+
+    with pytest.raises(WorkflowMapInputError, match="was not bound"):
+        asyncio.run(strategy.run(Context()))
+
+    with pytest.raises(WorkflowMapInputError, match="must be bound to a list"):
+        asyncio.run(strategy.run(Context(events=(bound("chunks", "a b c"),))))
+
+
+def test_map_strategies_have_their_own_identity() -> None:
+    strategy = WorkflowMapStrategy(ElementStrategy(), input_name="chunks")
+
+    assert strategy.metadata.id != ELEMENT_STRATEGY_ID
+    assert strategy.metadata.id == (
+        WorkflowMapStrategy(ElementStrategy(), input_name="chunks").metadata.id
+    )
+
+
+def create_tool(
+    tool_id: UUID,
+    name: str,
+    source: str,
+) -> tuple[ToolDefinition, ToolImplementation]:
+    """Create one deterministic Python tool."""
+
+    return (
+        ToolDefinition(
+            id=tool_id,
+            name=name,
+            description=f"Deterministic {name} tool.",
+            input_schema=ToolInputSchema(json_schema={"type": "object"}),
+            output_schema=ToolOutputSchema(json_schema={"type": "object"}),
+        ),
+        ToolImplementation(
+            tool_id=tool_id,
+            tool_version="1.0.0",
+            version="1.0.0",
+            runtime="python",
+            source=source,
+        ),
+    )
+
+
+def create_specification(
+    *,
+    bind_chunks: bool = True,
+) -> WorkflowSpecification:
+    """Split a document into chunks and count the words of each chunk."""
+
+    return WorkflowSpecification(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Chunk word counts",
+            description="Count the words of every document chunk.",
+        ),
+        steps=(
+            WorkflowStepSpecification(
+                id=SPLIT_STEP_ID,
+                specification=ToolStepSpecification(
+                    requirement=ToolRequirement(name="split"),
+                ),
+                outputs=(WorkflowValueBinding(name="chunks", path=("chunks",)),),
+            ),
+            WorkflowStepSpecification(
+                id=COUNT_STEP_ID,
+                specification=MapStepSpecification(
+                    specification=ToolStepSpecification(
+                        requirement=ToolRequirement(name="count"),
+                    ),
+                    input_name="chunk",
+                    max_concurrency=2,
+                ),
+                depends_on=(SPLIT_STEP_ID,),
+                inputs=(
+                    (
+                        WorkflowInputBinding(
+                            name="chunk",
+                            source=WorkflowValueReference(
+                                producer_step_id=SPLIT_STEP_ID,
+                                name="chunks",
+                            ),
+                        ),
+                    )
+                    if bind_chunks
+                    else ()
+                ),
+                outputs=(WorkflowValueBinding(name="counts"),),
+            ),
+        ),
+    )
+
+
+def test_generated_map_steps_run_their_tool_per_element() -> None:
+    split = create_tool(
+        SPLIT_TOOL_ID,
+        "split",
+        "def run():\n    return {'chunks': ['one two', 'three', 'four five six']}\n",
+    )
+    count = create_tool(
+        COUNT_TOOL_ID,
+        "count",
+        "def run(chunk):\n    return {'words': len(chunk.split())}\n",
+    )
+
+    candidate = generate_workflow_candidate(
+        specification=create_specification(),
+        catalog=ModelCatalog(),
+        registry=LanguageModelRegistry(models={}),
+        tool_resolver=ToolResolver(ToolCatalog(definitions=(split[0], count[0]))),
+        tool_implementation_resolver=ToolImplementationResolver(
+            ToolImplementationCatalog(implementations=(split[1], count[1])),
+        ),
+    )
+
+    strategy = candidate.steps[1].strategy
+
+    assert isinstance(strategy, WorkflowMapStrategy)
+    assert isinstance(strategy.strategy, ToolStrategy)
+
+    run = asyncio.run(WorkflowRunner().run(candidate, Context()))
+
+    assert run.values_named("counts")[0].value == [
+        {"words": 2},
+        {"words": 1},
+        {"words": 3},
+    ]
+
+
+def test_map_steps_must_bind_their_mapped_input() -> None:
+    with pytest.raises(ValueError, match="must bind their mapped input"):
+        create_specification(bind_chunks=False)
+
+
+def test_map_step_specifications_round_trip_through_json() -> None:
+    specification = create_specification()
+
+    assert WorkflowSpecification.model_validate_json(specification.model_dump_json()) == (
+        specification
+    )
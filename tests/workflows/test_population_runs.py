@@ -0,0 +1,197 @@
+"""Tests for executing workflow candidate populations with shared steps."""
+
+import asyncio
+from uuid import UUID, uuid5
+
+import pytest
+
+from azathoth.context import Context, ContextEvent
+from azathoth.strategies import StrategyMetadata, StrategyOutcome
+from azathoth.workflows import (
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowFailurePolicy,
+    WorkflowInputBinding,
+    WorkflowMetadata,
+    WorkflowRunner,
+    WorkflowSchedulingMode,
+    WorkflowStepStatus,
+    WorkflowValueBinding,
+    WorkflowValueReference,
+)
+
+WORKFLOW_ID = UUID("c1d2e3f4-a5b6-4c7d-8e9f-0a1b2c3d4e5f")
+
+DRAFT_ID = UUID("d2e3f4a5-b6c7-4d8e-9f0a-1b2c3d4e5f6a")
+REVIEW_ID = UUID("e3f4a5b6-c7d8-4e9f-8a1b-2c3d4e5f6a7b")
+
+DRAFT_STRATEGY_ID = UUID("f4a5b6c7-d8e9-4f0a-9b2c-3d4e5f6a7b8c")
+
+
+class CountingStrategy:
+    """Return a configured output after a short delay and count calls."""
+
+    def __init__(
+        self,
+        *,
+        strategy_id: UUID,
+        name: str,
+        output: str,
+        fail: bool = False,
+    ) -> None:
+        self._metadata = StrategyMetadata(
+            id=strategy_id,
+            name=name,
+            description=f"Execute the {name} step.",
+        )
+        self._output = output
+        self._fail = fail
+        self.calls = 0
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Return the configured output, or fail when configured to."""
+
+        self.calls += 1
+
+        await asyncio.sleep(0.01)
+
+        if self._fail:
+            raise RuntimeError(f"{self.metadata.name} failed")
+
+        return StrategyOutcome(
+            output=self._output,
+            events=(
+                ContextEvent(
+                    event_type="test.step.completed",
+                    payload={"output": self._output},
+                    producer="test",
+                ),
+            ),
+        )
+
+
+def create_candidate(
+    review: str,
+    *,
+    draft_cacheable: bool = True,
+    draft_fails: bool = False,
+) -> tuple[WorkflowCandidate, CountingStrategy, CountingStrategy]:
+    """Create a shared draft step feeding a candidate-specific review step."""
+
+    draft = CountingStrategy(
+        strategy_id=DRAFT_STRATEGY_ID,
+        name="Draft",
+        output="draft",
+        fail=draft_fails,
+    )
+    reviewer = CountingStrategy(
+        strategy_id=uuid5(WORKFLOW_ID, review),
+        name=f"Review {review}",
+        output=review,
+    )
+
+    candidate = WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Draft and review",
+            description="Draft once and review the draft.",
+        ),
+        steps=(
+            WorkflowCandidateStep(
+                id=DRAFT_ID,
+                strategy=draft,
+                outputs=(WorkflowValueBinding(name="draft"),),
+                cacheable=draft_cacheable,
+                failure_policy=WorkflowFailurePolicy.SKIP_DEPENDENTS,
+            ),
+            WorkflowCandidateStep(
+                id=REVIEW_ID,
+                strategy=reviewer,
+                depends_on=(DRAFT_ID,),
+                inputs=(
+                    WorkflowInputBinding(
+                        name="draft",
+                        source=WorkflowValueReference(
+                            producer_step_id=DRAFT_ID,
+                            name="draft",
+                        ),
+                    ),
+                ),
+                outputs=(WorkflowValueBinding(name="review"),),
+            ),
+        ),
+    )
+
+    return candidate, draft, reviewer
+
+
+@pytest.mark.parametrize(
+    "scheduling",
+    tuple(WorkflowSchedulingMode),
+)
+def test_shared_steps_execute_once_per_population(
+    scheduling: WorkflowSchedulingMode,
+) -> None:
+    first, first_draft, first_reviewer = create_candidate("terse")
+    second, second_draft, second_reviewer = create_candidate("detailed")
+
+    runs = asyncio.run(
+        WorkflowRunner(scheduling=scheduling).run_population(
+            (first, second),
+            Context(),
+        )
+    )
+
+    assert first_draft.calls + second_draft.calls == 1
+    assert (first_reviewer.calls, second_reviewer.calls) == (1, 1)
+    assert sorted(run.steps[0].attempts[0].cached for run in runs) == [False, True]
+    assert tuple(run.values_named("review")[0].value for run in runs) == (
+        "terse",
+        "detailed",
+    )
+
+
+def test_population_runs_match_individual_runs() -> None:
+    runner = WorkflowRunner()
+
+    population = asyncio.run(
+        runner.run_population(
+            (create_candidate("terse")[0], create_candidate("detailed")[0]),
+            Context(),
+        )
+    )
+    individual = tuple(
+        asyncio.run(runner.run(create_candidate(review)[0], Context()))
+        for review in ("terse", "detailed")
+    )
+
+    assert len({run.id for run in population}) == 2
+    assert tuple(run.values for run in population) == tuple(run.values for run in individual)
+    assert tuple(
+        tuple(event.payload for event in run.final_context.events) for run in population
+    ) == tuple(tuple(event.payload for event in run.final_context.events) for run in individual)
+
+
+def test_uncacheable_steps_execute_for_every_candidate() -> None:
+    first, first_draft, _ = create_candidate("terse", draft_cacheable=False)
+    second, second_draft, _ = create_candidate("detailed", draft_cacheable=False)
+
+    asyncio.run(WorkflowRunner().run_population((first, second), Context()))
+
+    assert (first_draft.calls, second_draft.calls) == (1, 1)
+
+
+def test_failed_shared_steps_execute_for_every_candidate() -> None:
+    first, first_draft, _ = create_candidate("terse", draft_fails=True)
+    second, second_draft, _ = create_candidate("detailed", draft_fails=True)
+
+    runs = asyncio.run(WorkflowRunner().run_population((first, second), Context()))
+
+    assert (first_draft.calls, second_draft.calls) == (1, 1)
+    assert all(run.steps[0].status is WorkflowStepStatus.FAILED for run in runs)
@@ -59,7 +59,6 @@ def create_execution(
         strategy_version="1.0.0",
         output=name,
         initial_context=context,
-        final_context=context,
         started_at=STARTED_AT,
         completed_at=COMPLETED_AT,
     )
@@ -107,7 +107,6 @@ class ReliabilityExecutor(StrategyExecutor):
             strategy_version=strategy.metadata.version,
             output=strategy.metadata.name,
             initial_context=context,
-            final_context=context,
             started_at=timestamp,
             completed_at=timestamp,
         )
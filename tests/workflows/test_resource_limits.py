@@ -0,0 +1,390 @@
+"""Tests for per-resource-class limits on workflow step execution."""
+
+import asyncio
+from collections import Counter
+from uuid import UUID, uuid5
+
+import pytest
+
+from azathoth.context import Context, ContextEvent
+from azathoth.prompting import ModelBinding
+from azathoth.strategies import StrategyMetadata, StrategyOutcome
+from azathoth.tools import PythonToolExecutor, ToolImplementation, ToolStrategy
+from azathoth.workflows import (
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowInputBinding,
+    WorkflowMapStrategy,
+    WorkflowMetadata,
+    WorkflowResourceLimits,
+    WorkflowRunner,
+    WorkflowSchedulingMode,
+    WorkflowStepPrioritization,
+    WorkflowValueBinding,
+    WorkflowValueReference,
+    workflow_step_resource_class,
+    workflow_strategy_resource_class,
+)
+
+WORKFLOW_ID = UUID("a8b9c0d1-e2f3-4a4b-8c5d-6e7f8a9b0c1d")
+TOOL_ID = UUID("b9c0d1e2-f3a4-4b5c-9d6e-7f8a9b0c1d2e")
+IMPLEMENTATION_ID = UUID("c0d1e2f3-a4b5-4c6d-8e7f-8a9b0c1d2e3f")
+
+MODEL = "openrouter/openai/gpt-4o-mini"
+
+
+class TrackedStrategy:
+    """Record when each step starts and how many steps of a class overlap."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        log: list[str],
+        running: Counter[str],
+        peaks: Counter[str],
+        model: str | None = None,
+    ) -> None:
+        self._metadata = StrategyMetadata(
+            id=uuid5(WORKFLOW_ID, name),
+            name=name,
+            description=f"Execute the {name} step.",
+        )
+        self._log = log
+        self._running = running
+        self._peaks = peaks
+        self._model_binding = ModelBinding(identifier=model) if model is not None else None
+        self._resource = model if model is not None else "tool"
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    @property
+    def model_binding(self) -> ModelBinding | None:
+        """Return the bound model, when there is one."""
+
+        return self._model_binding
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Log the start and track overlapping steps of the same resource."""
+
+        self._log.append(self.metadata.name)
+        self._running[self._resource] += 1
+        self._peaks[self._resource] = max(
+            self._peaks[self._resource],
+            self._running[self._resource],
+        )
+
+        await asyncio.sleep(0.01)
+
+        self._running[self._resource] -= 1
+
+        return StrategyOutcome(
+            output=self.metadata.name,
+            events=(
+                ContextEvent(
+                    event_type="test.step.completed",
+                    payload={"step": self.metadata.name},
+                    producer="test",
+                ),
+            ),
+        )
+
+
+def create_tool_strategy() -> ToolStrategy:
+    """Create a Python tool strategy."""
+
+    return ToolStrategy(
+        metadata=StrategyMetadata(
+            id=TOOL_ID,
+            name="identity",
+            description="Return nothing.",
+        ),
+        implementation=ToolImplementation(
+            id=IMPLEMENTATION_ID,
+            tool_id=TOOL_ID,
+            tool_version="1.0.0",
+            version="1.0.0",
+            runtime="python",
+            source="def run():\n    return {}\n",
+        ),
+        executor=PythonToolExecutor(),
+    )
+
+
+def create_candidate(
+    *,
+    tools: int,
+    models: int,
+    log: list[str],
+    running: Counter[str],
+    peaks: Counter[str],
+) -> WorkflowCandidate:
+    """Create independent tool steps declared before independent model steps."""
+
+    def step(name: str, model: str | None) -> WorkflowCandidateStep:
+        return WorkflowCandidateStep(
+            id=uuid5(WORKFLOW_ID, name),
+            strategy=TrackedStrategy(
+                name,
+                log=log,
+                running=running,
+                peaks=peaks,
+                model=model,
+            ),
+            outputs=(WorkflowValueBinding(name="value"),),
+            resource_class="tool/python" if model is None else None,
+        )
+
+    return WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Tools and model calls",
+            description="Run local tools beside provider calls.",
+        ),
+        steps=(
+            *(step(f"Tool {index}", None) for index in range(tools)),
+            *(step(f"Model {index}", MODEL) for index in range(models)),
+        ),
+    )
+
+
+class ChunksStrategy:
+    """Return a fixed list of chunks."""
+
+    def __init__(self, chunks: int) -> None:
+        self._chunks = chunks
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return StrategyMetadata(
+            id=uuid5(WORKFLOW_ID, "Chunks"),
+            name="Chunks",
+            description="Split the input into chunks.",
+        )
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Return one chunk per index."""
+
+        del context
+
+        return StrategyOutcome(output=[f"Chunk {index}" for index in range(self._chunks)])
+
+
+def create_map_candidate(
+    *,
+    chunks: int,
+    running: Counter[str],
+    peaks: Counter[str],
+) -> WorkflowCandidate:
+    """Create a model map over chunks beside an independent model step."""
+
+    chunks_id = uuid5(WORKFLOW_ID, "Chunks")
+
+    def tracked(name: str) -> TrackedStrategy:
+        return TrackedStrategy(name, log=[], running=running, peaks=peaks, model=MODEL)
+
+    return WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Mapped model calls",
+            description="Call a model once per chunk.",
+        ),
+        steps=(
+            WorkflowCandidateStep(
+                id=chunks_id,
+                strategy=ChunksStrategy(chunks),
+                outputs=(WorkflowValueBinding(name="chunks"),),
+            ),
+            WorkflowCandidateStep(
+                id=uuid5(WORKFLOW_ID, "Summaries"),
+                strategy=WorkflowMapStrategy(tracked("Summarize"), input_name="chunks"),
+                depends_on=(chunks_id,),
+                inputs=(
+                    WorkflowInputBinding(
+                        name="chunks",
+                        source=WorkflowValueReference(
+                            producer_step_id=chunks_id,
+                            name="chunks",
+                        ),
+                    ),
+                ),
+                outputs=(WorkflowValueBinding(name="summaries"),),
+            ),
+            WorkflowCandidateStep(
+                id=uuid5(WORKFLOW_ID, "Title"),
+                strategy=tracked("Title"),
+                depends_on=(chunks_id,),
+                outputs=(WorkflowValueBinding(name="title"),),
+            ),
+        ),
+    )
+
+
+def test_strategies_imply_their_resource_class() -> None:
+    model_strategy = TrackedStrategy(
+        "Model",
+        log=[],
+        running=Counter(),
+        peaks=Counter(),
+        model=MODEL,
+    )
+
+    assert workflow_strategy_resource_class(model_strategy) == MODEL
+    assert workflow_strategy_resource_class(create_tool_strategy()) == "tool/python"
+    assert (
+        workflow_strategy_resource_class(
+            WorkflowMapStrategy(create_tool_strategy(), input_name="chunks"),
+        )
+        == "tool/python"
+    )
+    assert (
+        workflow_strategy_resource_class(
+            TrackedStrategy("Plain", log=[], running=Counter(), peaks=Counter()),
+        )
+        is None
+    )
+
+
+def test_declared_resource_classes_take_precedence() -> None:
+    step = WorkflowCandidateStep(
+        id=TOOL_ID,
+        strategy=create_tool_strategy(),
+        resource_class="gpu",
+    )
+
+    assert workflow_step_resource_class(step) == "gpu"
+
+    with pytest.raises(ValueError, match="resource classes cannot be empty"):
+        WorkflowCandidateStep(
+            id=TOOL_ID,
+            strategy=create_tool_strategy(),
+            resource_class="",
+        )
+
+
+def test_limits_apply_to_their_class_and_every_class_it_prefixes() -> None:
+    limits = WorkflowResourceLimits(
+        max_concurrency={MODEL: 1, "openrouter": 4, "open": 2, "tool": 8},
+    )
+
+    assert limits.limited_classes(MODEL) == ("openrouter", MODEL)
+    assert limits.limited_classes("openrouter/anthropic/claude-haiku") == ("openrouter",)
+    assert limits.limited_classes("tool/python") == ("tool",)
+    assert limits.limited_classes(None) == ()
+
+
+def test_resource_limits_must_admit_steps() -> None:
+    with pytest.raises(ValueError, match="must be at least 1"):
+        WorkflowResourceLimits(max_concurrency={"tool": 0})
+
+    with pytest.raises(ValueError, match="cannot be empty"):
+        WorkflowResourceLimits(max_concurrency={"": 1})
+
+
+@pytest.mark.parametrize(
+    "scheduling",
+    (WorkflowSchedulingMode.CONCURRENT, WorkflowSchedulingMode.DEPENDENCY_DRIVEN),
+)
+def test_saturated_resources_do_not_starve_other_steps(
+    scheduling: WorkflowSchedulingMode,
+) -> None:
+    log: list[str] = []
+    peaks: Counter[str] = Counter()
+
+    run = asyncio.run(
+        WorkflowRunner(
+            scheduling=scheduling,
+            max_concurrency=2,
+            resource_limits=WorkflowResourceLimits(max_concurrency={"tool": 1}),
+        ).run(
+            create_candidate(
+                tools=4,
+                models=1,
+                log=log,
+                running=Counter(),
+                peaks=peaks,
+            ),
+            Context(),
+        )
+    )
+
+    assert peaks["tool"] == 1
+    assert log[:2] == ["Tool 0", "Model 0"]
+    assert len(run.values) == 5
+
+
+def test_model_limits_bound_a_whole_batch() -> None:
+    peaks: Counter[str] = Counter()
+
+    runs = asyncio.run(
+        WorkflowRunner(
+            scheduling=WorkflowSchedulingMode.CONCURRENT,
+            resource_limits=WorkflowResourceLimits(max_concurrency={MODEL: 2}),
+        ).run_batch(
+            create_candidate(
+                tools=0,
+                models=2,
+                log=[],
+                running=Counter(),
+                peaks=peaks,
+            ),
+            (Context(), Context(), Context()),
+        )
+    )
+
+    assert peaks[MODEL] == 2
+    assert len(runs) == 3
+
+
+@pytest.mark.parametrize(
+    ("runner", "peak"),
+    (
+        (
+            WorkflowRunner(
+                scheduling=WorkflowSchedulingMode.CONCURRENT,
+                resource_limits=WorkflowResourceLimits(max_concurrency={MODEL: 2}),
+            ),
+            2,
+        ),
+        (
+            WorkflowRunner(
+                scheduling=WorkflowSchedulingMode.DEPENDENCY_DRIVEN,
+                max_concurrency=4,
+                resource_limits=WorkflowResourceLimits(max_concurrency={"openrouter": 2}),
+            ),
+            2,
+        ),
+        (
+            WorkflowRunner(
+                scheduling=WorkflowSchedulingMode.DEPENDENCY_DRIVEN,
+                max_concurrency=1,
+                prioritization=WorkflowStepPrioritization.CRITICAL_PATH,
+                resource_limits=WorkflowResourceLimits(max_concurrency={MODEL: 2}),
+            ),
+            1,
+        ),
+    ),
+    ids=("concurrent", "dependency-driven", "critical-path"),
+)
+def test_map_elements_count_against_their_class_limit(
+    runner: WorkflowRunner,
+    peak: int,
+) -> None:
+    peaks: Counter[str] = Counter()
+
+    run = asyncio.run(
+        runner.run(
+            create_map_candidate(chunks=5, running=Counter(), peaks=peaks),
+            Context(),
+        )
+    )
+
+    assert peaks[MODEL] == peak
+    assert run.values_named("summaries")[0].value == ["Summarize"] * 5
+    assert run.values_named("title")[0].value == "Title"
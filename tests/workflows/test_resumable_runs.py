@@ -0,0 +1,307 @@
+"""Tests for checkpointed, resumable workflow runs."""
+
+import asyncio
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+from pydantic import JsonValue
+
+from azathoth.context import Context, ContextEvent
+from azathoth.strategies import StrategyMetadata, StrategyOutcome
+from azathoth.workflows import (
+    InMemoryWorkflowRunCheckpointRepository,
+    SQLiteWorkflowRunCheckpointRepository,
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowInputBinding,
+    WorkflowMetadata,
+    WorkflowRun,
+    WorkflowRunCheckpointRepository,
+    WorkflowRunner,
+    WorkflowSchedulingMode,
+    WorkflowStepStatus,
+    WorkflowValueBinding,
+    WorkflowValueReference,
+)
+
+WORKFLOW_ID = UUID("0f1a2b3c-4d5e-4f60-8172-839405a6b7c8")
+
+DRAFT_ID = UUID("1a2b3c4d-5e6f-4071-8283-9405a6b7c8d9")
+REVIEW_ID = UUID("2b3c4d5e-6f70-4182-9394-05a6b7c8d9ea")
+PUBLISH_ID = UUID("3c4d5e6f-7081-4293-a405-a6b7c8d9eafb")
+
+
+class CountingStrategy:
+    """Return one output, optionally failing, and count calls."""
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        fail: bool = False,
+    ) -> None:
+        self._metadata = StrategyMetadata(
+            name=name,
+            description=f"Execute the {name} step.",
+        )
+        self._fail = fail
+        self.calls = 0
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Return the strategy name, or fail when configured to."""
+
+        self.calls += 1
+
+        if self._fail:
+            raise RuntimeError(f"{self.metadata.name} crashed")
+
+        return StrategyOutcome(
+            output=self.metadata.name,
+            events=(
+                ContextEvent(
+                    event_type="test.step.completed",
+                    payload={"step": self.metadata.name},
+                    producer="test",
+                ),
+            ),
+        )
+
+
+def create_candidate(
+    *,
+    publish_fails: bool = False,
+) -> tuple[WorkflowCandidate, tuple[CountingStrategy, ...]]:
+    """Create a draft, review, publish pipeline."""
+
+    strategies = (
+        CountingStrategy(name="Draft"),
+        CountingStrategy(name="Review"),
+        CountingStrategy(name="Publish", fail=publish_fails),
+    )
+
+    def reference(producer_step_id: UUID, name: str) -> WorkflowValueReference:
+        return WorkflowValueReference(
+            producer_step_id=producer_step_id,
+            name=name,
+        )
+
+    candidate = WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Publishing pipeline",
+            description="Draft, review, and publish.",
+        ),
+        steps=(
+            WorkflowCandidateStep(
+                id=DRAFT_ID,
+                strategy=strategies[0],
+                outputs=(WorkflowValueBinding(name="draft"),),
+            ),
+            WorkflowCandidateStep(
+                id=REVIEW_ID,
+                strategy=strategies[1],
+                depends_on=(DRAFT_ID,),
+                inputs=(
+                    WorkflowInputBinding(
+                        name="draft",
+                        source=reference(DRAFT_ID, "draft"),
+                    ),
+                ),
+                outputs=(WorkflowValueBinding(name="review"),),
+            ),
+            WorkflowCandidateStep(
+                id=PUBLISH_ID,
+                strategy=strategies[2],
+                depends_on=(REVIEW_ID,),
+                inputs=(
+                    WorkflowInputBinding(
+                        name="draft",
+                        source=reference(DRAFT_ID, "draft"),
+                    ),
+                ),
+                outputs=(WorkflowValueBinding(name="published"),),
+            ),
+        ),
+    )
+
+    return candidate, strategies
+
+
+def crash(
+    runner: WorkflowRunner,
+) -> None:
+    """Run the pipeline until its final step crashes."""
+
+    candidate, _ = create_candidate(publish_fails=True)
+
+    with pytest.raises(
+        RuntimeError,
+        match="Publish crashed",
+    ):
+        asyncio.run(runner.run(candidate, Context()))
+
+
+def steps_seen_by_publish(run: WorkflowRun) -> tuple[JsonValue, ...]:
+    """Return the step events in the context handed to the final step."""
+
+    execution = run.steps[2].execution
+
+    assert execution is not None
+
+    return tuple(
+        event.payload
+        for event in execution.initial_context.events
+        if event.event_type == "test.step.completed"
+    )
+
+
+@pytest.mark.parametrize(
+    "scheduling",
+    tuple(WorkflowSchedulingMode),
+)
+def test_resumed_runs_skip_committed_steps(
+    scheduling: WorkflowSchedulingMode,
+) -> None:
+    checkpoints = InMemoryWorkflowRunCheckpointRepository()
+
+    crash(WorkflowRunner(scheduling=scheduling, checkpoints=checkpoints))
+
+    (checkpoint,) = checkpoints.checkpoints()
+
+    assert tuple(step.step_id for step in checkpoint.steps) == (DRAFT_ID, REVIEW_ID)
+
+    candidate, strategies = create_candidate()
+
+    run = asyncio.run(
+        WorkflowRunner(scheduling=scheduling, checkpoints=checkpoints).resume(
+            checkpoint.run_id,
+            candidate,
+        )
+    )
+
+    assert tuple(strategy.calls for strategy in strategies) == (0, 0, 1)
+    assert run.id == checkpoint.run_id
+    assert run.started_at == checkpoint.started_at
+    assert run.steps[:2] == checkpoint.steps
+    assert tuple(step.status for step in run.steps) == (WorkflowStepStatus.EXECUTED,) * 3
+    assert run.values_named("published")[0].value == "Publish"
+    assert checkpoints.checkpoints() == ()
+
+
+def test_resumed_runs_match_uninterrupted_runs() -> None:
+    checkpoints = InMemoryWorkflowRunCheckpointRepository()
+
+    crash(WorkflowRunner(checkpoints=checkpoints))
+
+    resumed = asyncio.run(
+        WorkflowRunner(checkpoints=checkpoints).resume(
+            checkpoints.checkpoints()[0].run_id,
+            create_candidate()[0],
+        )
+    )
+    uninterrupted = asyncio.run(
+        WorkflowRunner().run(
+            create_candidate()[0],
+            Context(),
+        )
+    )
+
+    assert resumed.values == uninterrupted.values
+    assert tuple(event.event_type for event in resumed.final_context.events) == tuple(
+        event.event_type for event in uninterrupted.final_context.events
+    )
+    assert steps_seen_by_publish(resumed) == steps_seen_by_publish(uninterrupted)
+    assert steps_seen_by_publish(resumed) == ({"step": "Draft"}, {"step": "Review"})
+
+
+def test_sqlite_checkpoints_resume_across_runner_instances(
+    tmp_path: Path,
+) -> None:
+    database = tmp_path / "checkpoints.db"
+
+    crash(WorkflowRunner(checkpoints=SQLiteWorkflowRunCheckpointRepository(database)))
+
+    checkpoints: WorkflowRunCheckpointRepository = SQLiteWorkflowRunCheckpointRepository(database)
+    (checkpoint,) = checkpoints.checkpoints()
+
+    candidate, strategies = create_candidate()
+
+    run = asyncio.run(
+        WorkflowRunner(checkpoints=checkpoints).resume(
+            checkpoint.run_id,
+            candidate,
+        )
+    )
+
+    assert tuple(strategy.calls for strategy in strategies) == (0, 0, 1)
+    assert run.steps[:2] == checkpoint.steps
+    assert checkpoints.get(checkpoint.run_id) is None
+
+
+def test_completed_runs_discard_their_checkpoints() -> None:
+    checkpoints = InMemoryWorkflowRunCheckpointRepository()
+
+    asyncio.run(
+        WorkflowRunner(checkpoints=checkpoints).run(
+            create_candidate()[0],
+            Context(),
+        )
+    )
+
+    assert checkpoints.checkpoints() == ()
+
+
+def test_resume_rejects_unknown_runs() -> None:
+    with pytest.raises(
+        ValueError,
+        match="has no checkpoint",
+    ):
+        asyncio.run(
+            WorkflowRunner(checkpoints=InMemoryWorkflowRunCheckpointRepository()).resume(
+                WORKFLOW_ID,
+                create_candidate()[0],
+            )
+        )
+
+
+def test_resume_requires_a_checkpoint_repository() -> None:
+    with pytest.raises(
+        ValueError,
+        match="requires a checkpoint repository",
+    ):
+        asyncio.run(
+            WorkflowRunner().resume(
+                WORKFLOW_ID,
+                create_candidate()[0],
+            )
+        )
+
+
+def test_resume_rejects_a_different_workflow() -> None:
+    checkpoints = InMemoryWorkflowRunCheckpointRepository()
+
+    crash(WorkflowRunner(checkpoints=checkpoints))
+
+    candidate, _ = create_candidate()
+    other = WorkflowCandidate(
+        metadata=candidate.metadata.model_copy(update={"name": "Other pipeline"}),
+        steps=candidate.steps,
+    )
+
+    with pytest.raises(
+        ValueError,
+        match="belongs to a different workflow",
+    ):
+        asyncio.run(
+            WorkflowRunner(checkpoints=checkpoints).resume(
+                checkpoints.checkpoints()[0].run_id,
+                other,
+            )
+        )
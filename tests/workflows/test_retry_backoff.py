@@ -0,0 +1,332 @@
+"""Tests for retry backoff, jitter, classification, and retry budgets."""
+
+import asyncio
+from random import Random
+from uuid import UUID
+
+from azathoth.context import Context
+from azathoth.prompting import ModelBinding, ModelBindingMismatchError
+from azathoth.strategies import StrategyMetadata, StrategyOutcome
+from azathoth.tools import ToolInputError
+from azathoth.workflows import (
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowFailurePolicy,
+    WorkflowMetadata,
+    WorkflowRetryBudget,
+    WorkflowRetryJitter,
+    WorkflowRetryPolicy,
+    WorkflowRun,
+    WorkflowRunner,
+    WorkflowStepStatus,
+    is_retryable_workflow_error,
+)
+
+WORKFLOW_ID = UUID("a3e9c1f0-7b2d-4e5f-8a6c-9d0e1f2a3b41")
+
+FIRST_STEP_ID = UUID("b4f0d2e1-8c3e-4f60-9b7d-0e1f2a3b4c52")
+SECOND_STEP_ID = UUID("c5a1e3f2-9d4f-4071-8c8e-1f2a3b4c5d63")
+
+
+class FailingStrategy:
+    """Fail a configured number of times before succeeding."""
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        error: Exception,
+        failures_before_success: int,
+        model_binding: ModelBinding | None = None,
+    ) -> None:
+        self._metadata = StrategyMetadata(
+            name=name,
+            description=f"Execute the {name} step.",
+        )
+        self._error = error
+        self._remaining_failures = failures_before_success
+        self._model_binding = model_binding
+        self.calls = 0
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    @property
+    def model_binding(self) -> ModelBinding | None:
+        """Return the model bound to this strategy."""
+
+        return self._model_binding
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Fail until the configured number of failures is exhausted."""
+
+        self.calls += 1
+
+        if self._remaining_failures > 0:
+            self._remaining_failures -= 1
+            raise self._error
+
+        return StrategyOutcome(output="success")
+
+
+class RecordingSleep:
+    """Record requested retry delays without waiting."""
+
+    def __init__(self) -> None:
+        self.delays: list[float] = []
+
+    async def __call__(self, delay: float) -> None:
+        self.delays.append(delay)
+
+
+def create_candidate(
+    *strategies: FailingStrategy,
+    retry_policy: WorkflowRetryPolicy,
+) -> WorkflowCandidate:
+    """Create independent continue-on-failure steps for each strategy."""
+
+    return WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Retry backoff workflow",
+            description="Exercise retry backoff behavior.",
+        ),
+        steps=tuple(
+            WorkflowCandidateStep(
+                id=step_id,
+                strategy=strategy,
+                retry_policy=retry_policy,
+                failure_policy=WorkflowFailurePolicy.CONTINUE,
+            )
+            for step_id, strategy in zip(
+                (FIRST_STEP_ID, SECOND_STEP_ID),
+                strategies,
+                strict=False,
+            )
+        ),
+    )
+
+
+def run_candidate(
+    candidate: WorkflowCandidate,
+    runner: WorkflowRunner,
+) -> WorkflowRun:
+    """Execute a candidate against an empty context."""
+
+    return asyncio.run(
+        runner.run(
+            candidate,
+            Context(),
+        )
+    )
+
+
+def test_retry_policy_defaults_to_no_jitter() -> None:
+    policy = WorkflowRetryPolicy(
+        max_attempts=3,
+        initial_delay_seconds=1.0,
+        backoff_multiplier=2.0,
+    )
+
+    assert policy.jitter is WorkflowRetryJitter.NONE
+    assert policy.jittered_delay_for_attempt(3) == policy.delay_for_attempt(3) == 2.0
+
+
+def test_full_jitter_stays_within_the_exponential_delay() -> None:
+    policy = WorkflowRetryPolicy(
+        max_attempts=5,
+        initial_delay_seconds=1.0,
+        backoff_multiplier=2.0,
+        jitter=WorkflowRetryJitter.FULL,
+    )
+    random = Random(7)
+
+    delays = [policy.jittered_delay_for_attempt(4, random=random) for _ in range(50)]
+
+    assert all(0.0 <= delay <= 4.0 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_decorrelated_jitter_stays_between_initial_and_maximum_delay() -> None:
+    policy = WorkflowRetryPolicy(
+        max_attempts=10,
+        initial_delay_seconds=0.5,
+        maximum_delay_seconds=3.0,
+        jitter=WorkflowRetryJitter.DECORRELATED,
+    )
+    random = Random(11)
+
+    delay: float | None = None
+
+    for attempt in range(2, 10):
+        delay = policy.jittered_delay_for_attempt(
+            attempt,
+            previous_delay=delay,
+            random=random,
+        )
+
+        assert 0.5 <= delay <= 3.0
+
+
+def test_retry_policy_with_jitter_round_trips_through_json() -> None:
+    policy = WorkflowRetryPolicy(
+        max_attempts=3,
+        jitter=WorkflowRetryJitter.DECORRELATED,
+    )
+
+    assert WorkflowRetryPolicy.model_validate_json(policy.model_dump_json()) == policy
+
+
+def test_runner_waits_for_backoff_delays_between_attempts() -> None:
+    sleep = RecordingSleep()
+    strategy = FailingStrategy(
+        name="Flaky",
+        error=RuntimeError("temporary failure"),
+        failures_before_success=2,
+    )
+
+    run = run_candidate(
+        create_candidate(
+            strategy,
+            retry_policy=WorkflowRetryPolicy(
+                max_attempts=3,
+                initial_delay_seconds=1.0,
+                backoff_multiplier=2.0,
+            ),
+        ),
+        WorkflowRunner(sleep=sleep),
+    )
+
+    assert run.steps[0].status is WorkflowStepStatus.EXECUTED
+    assert sleep.delays == [1.0, 2.0]
+
+
+def test_runner_does_not_sleep_without_a_delay() -> None:
+    sleep = RecordingSleep()
+
+    run_candidate(
+        create_candidate(
+            FailingStrategy(
+                name="Flaky",
+                error=RuntimeError("temporary failure"),
+                failures_before_success=1,
+            ),
+            retry_policy=WorkflowRetryPolicy(max_attempts=2),
+        ),
+        WorkflowRunner(sleep=sleep),
+    )
+
+    assert sleep.delays == []
+
+
+def test_default_classifier_rejects_deterministic_errors() -> None:
+    assert is_retryable_workflow_error(RuntimeError("temporary failure"))
+    assert not is_retryable_workflow_error(ModelBindingMismatchError("wrong model"))
+    assert not is_retryable_workflow_error(ToolInputError("bad input"))
+
+
+def test_runner_does_not_retry_non_retryable_errors() -> None:
+    strategy = FailingStrategy(
+        name="Mismatched",
+        error=ModelBindingMismatchError("wrong model"),
+        failures_before_success=1,
+    )
+
+    run = run_candidate(
+        create_candidate(
+            strategy,
+            retry_policy=WorkflowRetryPolicy(max_attempts=3),
+        ),
+        WorkflowRunner(sleep=RecordingSleep()),
+    )
+
+    assert strategy.calls == 1
+    assert run.steps[0].status is WorkflowStepStatus.FAILED
+    assert run.steps[0].attempts[0].failure is not None
+    assert run.steps[0].attempts[0].failure.exception_type == "ModelBindingMismatchError"
+
+
+def test_runner_uses_a_custom_retry_classifier() -> None:
+    strategy = FailingStrategy(
+        name="Flaky",
+        error=RuntimeError("temporary failure"),
+        failures_before_success=1,
+    )
+
+    run_candidate(
+        create_candidate(
+            strategy,
+            retry_policy=WorkflowRetryPolicy(max_attempts=3),
+        ),
+        WorkflowRunner(
+            retry_classifier=lambda error: False,
+            sleep=RecordingSleep(),
+        ),
+    )
+
+    assert strategy.calls == 1
+
+
+def test_run_retry_budget_limits_retries_across_steps() -> None:
+    first = FailingStrategy(
+        name="First",
+        error=RuntimeError("rate limited"),
+        failures_before_success=5,
+    )
+    second = FailingStrategy(
+        name="Second",
+        error=RuntimeError("rate limited"),
+        failures_before_success=5,
+    )
+
+    run = run_candidate(
+        create_candidate(
+            first,
+            second,
+            retry_policy=WorkflowRetryPolicy(max_attempts=4),
+        ),
+        WorkflowRunner(
+            retry_budget=WorkflowRetryBudget(max_retries=2),
+            sleep=RecordingSleep(),
+        ),
+    )
+
+    assert first.calls == 3
+    assert second.calls == 1
+    assert run.retry_count == 2
+
+
+def test_provider_retry_budget_limits_only_that_provider() -> None:
+    openrouter = FailingStrategy(
+        name="OpenRouter step",
+        error=RuntimeError("rate limited"),
+        failures_before_success=5,
+        model_binding=ModelBinding(identifier="openrouter/openai/gpt-4o-mini"),
+    )
+    local = FailingStrategy(
+        name="Local step",
+        error=RuntimeError("temporary failure"),
+        failures_before_success=2,
+    )
+
+    run = run_candidate(
+        create_candidate(
+            openrouter,
+            local,
+            retry_policy=WorkflowRetryPolicy(max_attempts=4),
+        ),
+        WorkflowRunner(
+            retry_budget=WorkflowRetryBudget(max_retries_per_provider=1),
+            sleep=RecordingSleep(),
+        ),
+    )
+
+    assert openrouter.calls == 2
+    assert local.calls == 3
+    assert tuple(step.status for step in run.steps) == (
+        WorkflowStepStatus.FAILED,
+        WorkflowStepStatus.EXECUTED,
+    )
@@ -87,7 +87,6 @@ class FlakyExecutor(StrategyExecutor):
             strategy_version=strategy.metadata.version,
             output="success",
             initial_context=context,
-            final_context=context,
             started_at=now,
             completed_at=now,
         )
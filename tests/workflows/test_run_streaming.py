@@ -0,0 +1,246 @@
+"""Tests for streaming workflow run progress."""
+
+import asyncio
+from contextlib import aclosing
+from time import perf_counter
+from uuid import UUID
+
+import pytest
+
+from azathoth.context import Context
+from azathoth.strategies import StrategyMetadata, StrategyOutcome
+from azathoth.workflows import (
+    WorkflowAttemptCompleted,
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowMetadata,
+    WorkflowRetryPolicy,
+    WorkflowRunCompleted,
+    WorkflowRunEvent,
+    WorkflowRunner,
+    WorkflowSchedulingMode,
+    WorkflowStepCommitted,
+    WorkflowStepStarted,
+    WorkflowValueBinding,
+)
+
+WORKFLOW_ID = UUID("7c8d9e0f-1a2b-4c3d-8e4f-5a6b7c8d9e0f")
+
+FIRST_STEP_ID = UUID("8d9e0f1a-2b3c-4d4e-9f5a-6b7c8d9e0f1a")
+SECOND_STEP_ID = UUID("9e0f1a2b-3c4d-4e5f-8a6b-7c8d9e0f1a2b")
+
+
+class DelayedStrategy:
+    """Sleep for one configured delay per call and return its name."""
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        delays: tuple[float, ...] = (0.0,),
+        failures: int = 0,
+    ) -> None:
+        self._metadata = StrategyMetadata(
+            name=name,
+            description=f"Execute the {name} step.",
+        )
+        self._delays = delays
+        self._failures = failures
+        self.calls = 0
+        self.cancelled = False
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Sleep for the configured delay, failing the first calls."""
+
+        delay = self._delays[min(self.calls, len(self._delays) - 1)]
+        self.calls += 1
+
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+        if self.calls <= self._failures:
+            raise RuntimeError(f"{self.metadata.name} failed")
+
+        return StrategyOutcome(output=self.metadata.name)
+
+
+def create_candidate(
+    first: DelayedStrategy,
+    second: DelayedStrategy,
+    *,
+    dependent: bool = True,
+) -> WorkflowCandidate:
+    """Create a two-step workflow, optionally with a dependency."""
+
+    return WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Streamed workflow",
+            description="Stream the progress of two steps.",
+        ),
+        steps=(
+            WorkflowCandidateStep(
+                id=FIRST_STEP_ID,
+                strategy=first,
+                outputs=(WorkflowValueBinding(name="first"),),
+                retry_policy=WorkflowRetryPolicy(max_attempts=2),
+            ),
+            WorkflowCandidateStep(
+                id=SECOND_STEP_ID,
+                strategy=second,
+                depends_on=(FIRST_STEP_ID,) if dependent else (),
+                outputs=(WorkflowValueBinding(name="second"),),
+            ),
+        ),
+    )
+
+
+def collect(
+    runner: WorkflowRunner,
+    candidate: WorkflowCandidate,
+) -> list[WorkflowRunEvent]:
+    """Collect every streamed event of one run."""
+
+    async def consume() -> list[WorkflowRunEvent]:
+        return [event async for event in runner.stream(candidate, Context())]
+
+    return asyncio.run(consume())
+
+
+def describe(event: WorkflowRunEvent) -> tuple[str, UUID | None]:
+    """Return the event type and the step it concerns."""
+
+    if isinstance(event, WorkflowStepStarted | WorkflowAttemptCompleted):
+        return (event.event_type, event.step_id)
+
+    if isinstance(event, WorkflowStepCommitted):
+        return (event.event_type, event.step.step_id)
+
+    return (event.event_type, None)
+
+
+def test_stream_reports_steps_attempts_and_commits_in_order() -> None:
+    events = collect(
+        WorkflowRunner(),
+        create_candidate(
+            DelayedStrategy(name="First", failures=1),
+            DelayedStrategy(name="Second"),
+        ),
+    )
+
+    assert tuple(describe(event) for event in events) == (
+        ("workflow.step.started", FIRST_STEP_ID),
+        ("workflow.attempt.completed", FIRST_STEP_ID),
+        ("workflow.attempt.completed", FIRST_STEP_ID),
+        ("workflow.step.committed", FIRST_STEP_ID),
+        ("workflow.step.started", SECOND_STEP_ID),
+        ("workflow.attempt.completed", SECOND_STEP_ID),
+        ("workflow.step.committed", SECOND_STEP_ID),
+        ("workflow.run.completed", None),
+    )
+
+
+def test_stream_finishes_with_the_assembled_run() -> None:
+    events = collect(
+        WorkflowRunner(),
+        create_candidate(
+            DelayedStrategy(name="First"),
+            DelayedStrategy(name="Second"),
+        ),
+    )
+
+    completed = events[-1]
+    committed = tuple(event.step for event in events if isinstance(event, WorkflowStepCommitted))
+
+    assert isinstance(completed, WorkflowRunCompleted)
+    assert completed.run.steps == committed
+    assert tuple(value.value for value in completed.run.values) == ("First", "Second")
+
+
+def test_dependency_driven_streams_commit_fast_steps_first() -> None:
+    events = collect(
+        WorkflowRunner(scheduling=WorkflowSchedulingMode.DEPENDENCY_DRIVEN),
+        create_candidate(
+            DelayedStrategy(name="First", delays=(0.1,)),
+            DelayedStrategy(name="Second"),
+            dependent=False,
+        ),
+    )
+
+    commits = tuple(
+        event.step.step_id for event in events if isinstance(event, WorkflowStepCommitted)
+    )
+    completed = events[-1]
+
+    assert commits == (SECOND_STEP_ID, FIRST_STEP_ID)
+    assert isinstance(completed, WorkflowRunCompleted)
+    assert tuple(step.step_id for step in completed.run.steps) == (
+        FIRST_STEP_ID,
+        SECOND_STEP_ID,
+    )
+
+
+def test_closing_the_stream_early_cancels_remaining_steps() -> None:
+    slow = DelayedStrategy(name="Slow", delays=(5.0,))
+
+    async def first_commit() -> WorkflowStepCommitted:
+        runner = WorkflowRunner(scheduling=WorkflowSchedulingMode.DEPENDENCY_DRIVEN)
+
+        async with aclosing(
+            runner.stream(
+                create_candidate(
+                    slow,
+                    DelayedStrategy(name="Fast"),
+                    dependent=False,
+                ),
+                Context(),
+            )
+        ) as events:
+            async for event in events:
+                if isinstance(event, WorkflowStepCommitted):
+                    return event
+
+        raise AssertionError("The stream finished without committing a step.")
+
+    started = perf_counter()
+
+    committed = asyncio.run(first_commit())
+
+    assert perf_counter() - started < 1.0
+    assert committed.step.step_id == SECOND_STEP_ID
+    assert slow.cancelled
+
+
+def test_stream_raises_workflow_failures_after_reporting_progress() -> None:
+    events: list[WorkflowRunEvent] = []
+
+    async def consume() -> None:
+        async for event in WorkflowRunner().stream(
+            create_candidate(
+                DelayedStrategy(name="First", failures=2),
+                DelayedStrategy(name="Second"),
+            ),
+            Context(),
+        ):
+            events.append(event)
+
+    with pytest.raises(
+        RuntimeError,
+        match="First failed",
+    ):
+        asyncio.run(consume())
+
+    assert tuple(describe(event) for event in events) == (
+        ("workflow.step.started", FIRST_STEP_ID),
+        ("workflow.attempt.completed", FIRST_STEP_ID),
+        ("workflow.attempt.completed", FIRST_STEP_ID),
+    )
@@ -113,24 +113,22 @@ class RecordingExecutor(StrategyExecutor):
             tzinfo=UTC,
         )
 
-        final_context = context.append(
-            ContextEvent(
-                event_type="workflow.step.completed",
-                payload={
-                    "strategy_name": strategy.metadata.name,
-                    "call_index": call_index,
-                },
-                producer="recording-executor",
-            )
-        )
-
         return ExecutionResult(
             strategy_id=strategy.metadata.id,
             strategy_name=strategy.metadata.name,
             strategy_version=strategy.metadata.version,
             output=strategy.metadata.name,
             initial_context=context,
-            final_context=final_context,
+            produced_events=(
+                ContextEvent(
+                    event_type="workflow.step.completed",
+                    payload={
+                        "strategy_name": strategy.metadata.name,
+                        "call_index": call_index,
+                    },
+                    producer="recording-executor",
+                ),
+            ),
             started_at=started_at,
             completed_at=completed_at,
         )
@@ -197,7 +195,6 @@ class WorkflowInputRecordingExecutor(StrategyExecutor):
             strategy_version=strategy.metadata.version,
             output=output,
             initial_context=context,
-            final_context=context,
             started_at=started_at,
             completed_at=completed_at,
         )
@@ -247,7 +244,6 @@ class StructuredOutputExecutor(StrategyExecutor):
                 "confidence": 0.98,
             },
             initial_context=context,
-            final_context=context,
             started_at=started_at,
             completed_at=completed_at,
         )
@@ -95,7 +95,6 @@ def create_execution(
         output="result",
         metrics=metrics,
         initial_context=context,
-        final_context=context,
         started_at=STARTED_AT,
         completed_at=completed_at,
     )
@@ -0,0 +1,380 @@
+"""Tests for speculative execution of conditional workflow steps."""
+
+import asyncio
+from datetime import UTC, datetime
+from uuid import UUID
+
+import pytest
+from pydantic import JsonValue, ValidationError
+
+from azathoth.context import Context
+from azathoth.strategies import (
+    StrategyExecutionMetrics,
+    StrategyMetadata,
+    StrategyOutcome,
+)
+from azathoth.workflows import (
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowCondition,
+    WorkflowConditionHitRate,
+    WorkflowFailurePolicy,
+    WorkflowMetadata,
+    WorkflowRun,
+    WorkflowRunner,
+    WorkflowSchedulingMode,
+    WorkflowSpeculationPolicy,
+    WorkflowStepAttempt,
+    WorkflowStepFailure,
+    WorkflowStepRun,
+    WorkflowStepSkipReason,
+    WorkflowStepStatus,
+    WorkflowValueBinding,
+    WorkflowValueReference,
+)
+
+WORKFLOW_ID = UUID("0b1c2d3e-4f50-4617-8293-a4b5c6d7e8f9")
+
+ROUTER_ID = UUID("1c2d3e4f-5061-4728-93a4-b5c6d7e8f90a")
+MATH_ID = UUID("2d3e4f50-6172-4839-a4b5-c6d7e8f90a1b")
+WRITING_ID = UUID("3e4f5061-7283-494a-b5c6-d7e8f90a1b2c")
+
+SPECULATIVE_POLICY = WorkflowSpeculationPolicy(
+    hit_rates=(
+        WorkflowConditionHitRate(
+            step_id=MATH_ID,
+            observations=10,
+            hits=10,
+        ),
+        WorkflowConditionHitRate(
+            step_id=WRITING_ID,
+            observations=10,
+            hits=0,
+        ),
+    ),
+)
+
+
+class Timeline:
+    """Record strategy start and completion order."""
+
+    def __init__(self) -> None:
+        self.entries: list[str] = []
+
+
+class TimedStrategy:
+    """Sleep for a configured delay and return a configured output."""
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        delay_seconds: float,
+        timeline: Timeline,
+        output: JsonValue,
+        cost_usd: float = 0.0,
+        fail: bool = False,
+    ) -> None:
+        self._metadata = StrategyMetadata(
+            name=name,
+            description=f"Execute the {name} step.",
+        )
+        self._delay_seconds = delay_seconds
+        self._timeline = timeline
+        self._output: JsonValue = output
+        self._cost_usd = cost_usd
+        self._fail = fail
+        self.cancelled = False
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Record timing and return the configured output."""
+
+        self._timeline.entries.append(f"start:{self.metadata.name}")
+
+        try:
+            await asyncio.sleep(self._delay_seconds)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+        self._timeline.entries.append(f"end:{self.metadata.name}")
+
+        if self._fail:
+            raise RuntimeError(f"{self.metadata.name} failed")
+
+        return StrategyOutcome(
+            output=self._output,
+            metrics=StrategyExecutionMetrics(
+                estimated_cost_usd=self._cost_usd,
+            ),
+        )
+
+
+def create_routing_candidate(
+    timeline: Timeline,
+    *,
+    route: str,
+    math_delay_seconds: float = 0.01,
+) -> tuple[WorkflowCandidate, TimedStrategy]:
+    """Create a router with two conditional specialists."""
+
+    def specialist(
+        step_id: UUID,
+        name: str,
+        expected: str,
+        delay_seconds: float,
+    ) -> WorkflowCandidateStep:
+        return WorkflowCandidateStep(
+            id=step_id,
+            strategy=TimedStrategy(
+                name=name,
+                delay_seconds=delay_seconds,
+                timeline=timeline,
+                output=name,
+                cost_usd=0.25,
+            ),
+            depends_on=(ROUTER_ID,),
+            conditions=(
+                WorkflowCondition(
+                    source=WorkflowValueReference(
+                        producer_step_id=ROUTER_ID,
+                        name="route",
+                    ),
+                    expected=expected,
+                ),
+            ),
+            outputs=(WorkflowValueBinding(name="answer"),),
+        )
+
+    math = specialist(MATH_ID, "Math", "math", math_delay_seconds)
+
+    candidate = WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Routing workflow",
+            description="Route a request to one specialist.",
+        ),
+        steps=(
+            WorkflowCandidateStep(
+                id=ROUTER_ID,
+                strategy=TimedStrategy(
+                    name="Router",
+                    delay_seconds=0.05,
+                    timeline=timeline,
+                    output={"route": route},
+                ),
+                outputs=(WorkflowValueBinding(name="route", path=("route",)),),
+            ),
+            math,
+            specialist(WRITING_ID, "Writing", "writing", 0.01),
+        ),
+    )
+
+    assert isinstance(math.strategy, TimedStrategy)
+
+    return candidate, math.strategy
+
+
+def run_candidate(
+    candidate: WorkflowCandidate,
+    speculation: WorkflowSpeculationPolicy | None = SPECULATIVE_POLICY,
+) -> WorkflowRun:
+    """Execute a candidate with dependency-driven scheduling."""
+
+    return asyncio.run(
+        WorkflowRunner(
+            scheduling=WorkflowSchedulingMode.DEPENDENCY_DRIVEN,
+            speculation=speculation,
+        ).run(
+            candidate,
+            Context(),
+        )
+    )
+
+
+def test_speculation_starts_likely_branches_before_the_router_commits() -> None:
+    timeline = Timeline()
+    candidate, _ = create_routing_candidate(timeline, route="math")
+
+    run = run_candidate(candidate)
+
+    assert timeline.entries.index("start:Math") < timeline.entries.index("end:Router")
+    assert "start:Writing" not in timeline.entries
+    assert tuple(step.status for step in run.steps) == (
+        WorkflowStepStatus.EXECUTED,
+        WorkflowStepStatus.EXECUTED,
+        WorkflowStepStatus.SKIPPED,
+    )
+    assert all(attempt.speculative for attempt in run.steps[1].attempts)
+    assert run.statistics.discarded_attempts == 0
+
+
+def test_confirmed_speculation_records_the_same_values() -> None:
+    speculative_candidate, _ = create_routing_candidate(Timeline(), route="math")
+    plain_candidate, _ = create_routing_candidate(Timeline(), route="math")
+
+    speculative = run_candidate(speculative_candidate)
+    plain = run_candidate(plain_candidate, speculation=None)
+
+    assert speculative.values == plain.values
+    assert tuple(step.skip_reason for step in speculative.steps) == tuple(
+        step.skip_reason for step in plain.steps
+    )
+
+
+def test_missed_speculation_is_discarded_and_costed_separately() -> None:
+    candidate, _ = create_routing_candidate(Timeline(), route="writing")
+
+    run = run_candidate(candidate)
+
+    math = run.steps[1]
+
+    assert math.status is WorkflowStepStatus.SKIPPED
+    assert math.skip_reason is WorkflowStepSkipReason.CONDITION
+    assert math.values == ()
+    assert len(math.discarded_attempts) == 1
+    assert run.values_named("answer")[0].value == "Writing"
+    assert run.statistics.discarded_attempts == 1
+    assert run.statistics.discarded_cost_usd == 0.25
+
+
+def test_missed_speculation_cancels_unfinished_work() -> None:
+    candidate, math = create_routing_candidate(
+        Timeline(),
+        route="writing",
+        math_delay_seconds=5.0,
+    )
+
+    run = run_candidate(candidate)
+
+    assert math.cancelled
+    assert run.steps[1].status is WorkflowStepStatus.SKIPPED
+    assert run.steps[1].discarded_attempts == ()
+
+
+def test_speculation_requires_dependency_driven_scheduling() -> None:
+    with pytest.raises(
+        ValueError,
+        match="requires dependency-driven scheduling",
+    ):
+        WorkflowRunner(speculation=SPECULATIVE_POLICY)
+
+
+def test_speculation_policy_requires_enough_observations() -> None:
+    policy = WorkflowSpeculationPolicy(
+        hit_rates=(
+            WorkflowConditionHitRate(
+                step_id=MATH_ID,
+                observations=3,
+                hits=3,
+            ),
+        ),
+    )
+
+    assert not policy.should_speculate(MATH_ID)
+    assert not policy.should_speculate(WRITING_ID)
+    assert SPECULATIVE_POLICY.should_speculate(MATH_ID)
+    assert not SPECULATIVE_POLICY.should_speculate(WRITING_ID)
+
+
+def test_speculation_policy_derives_hit_rates_from_runs() -> None:
+    runs = tuple(
+        run_candidate(
+            create_routing_candidate(Timeline(), route=route)[0],
+            speculation=None,
+        )
+        for route in ("math", "math", "math", "writing")
+    )
+
+    policy = WorkflowSpeculationPolicy.from_runs(
+        runs,
+        minimum_hit_rate=0.7,
+        minimum_observations=4,
+    )
+
+    math = policy.hit_rate(MATH_ID)
+
+    assert math is not None
+    assert (math.observations, math.hits) == (4, 3)
+    assert policy.should_speculate(MATH_ID)
+    assert not policy.should_speculate(WRITING_ID)
+
+
+def test_layer_runs_record_skip_reasons() -> None:
+    timeline = Timeline()
+
+    candidate = WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Blocked workflow",
+            description="Skip a step behind a failed dependency.",
+        ),
+        steps=(
+            WorkflowCandidateStep(
+                id=ROUTER_ID,
+                strategy=TimedStrategy(
+                    name="Router",
+                    delay_seconds=0.0,
+                    timeline=timeline,
+                    output={},
+                    fail=True,
+                ),
+                outputs=(WorkflowValueBinding(name="route", path=("route",)),),
+                failure_policy=WorkflowFailurePolicy.SKIP_DEPENDENTS,
+            ),
+            WorkflowCandidateStep(
+                id=MATH_ID,
+                strategy=TimedStrategy(
+                    name="Math",
+                    delay_seconds=0.0,
+                    timeline=timeline,
+                    output="Math",
+                ),
+                depends_on=(ROUTER_ID,),
+            ),
+        ),
+    )
+
+    run = asyncio.run(
+        WorkflowRunner().run(
+            candidate,
+            Context(),
+        )
+    )
+
+    assert tuple(step.status for step in run.steps) == (
+        WorkflowStepStatus.FAILED,
+        WorkflowStepStatus.SKIPPED,
+    )
+    assert run.steps[1].skip_reason is WorkflowStepSkipReason.BLOCKED
+
+
+def test_only_skipped_steps_may_record_discarded_attempts() -> None:
+    attempt = WorkflowStepAttempt(
+        attempt_number=1,
+        started_at=datetime(2026, 1, 1, tzinfo=UTC),
+        completed_at=datetime(2026, 1, 1, tzinfo=UTC),
+        failure=WorkflowStepFailure(
+            exception_type="RuntimeError",
+            message="failed",
+        ),
+        speculative=True,
+    )
+
+    with pytest.raises(
+        ValidationError,
+        match="Only skipped workflow steps can record discarded attempts",
+    ):
+        WorkflowStepRun(
+            step_id=MATH_ID,
+            layer_index=1,
+            status=WorkflowStepStatus.FAILED,
+            attempts=(attempt,),
+            discarded_attempts=(attempt,),
+        )
@@ -89,6 +89,7 @@ def create_execution() -> ExecutionResult:
     """Create deterministic strategy execution evidence."""
 
     initial_context = create_initial_context()
+    final_context = create_final_context()
 
     return ExecutionResult(
         strategy_id=STRATEGY_ID,
@@ -98,7 +99,7 @@ def create_execution() -> ExecutionResult:
             "classification": "positive",
         },
         initial_context=initial_context,
-        final_context=create_final_context(),
+        produced_events=tuple(final_context.events[len(initial_context.events) :]),
         started_at=STARTED_AT,
         completed_at=COMPLETED_AT,
     )
@@ -0,0 +1,304 @@
+"""Tests for content-addressed workflow step result caches."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+from azathoth.context import Context, ContextEvent
+from azathoth.execution import ExecutionResult
+from azathoth.strategies import StrategyExecutionMetrics, StrategyMetadata
+from azathoth.workflows import (
+    InMemoryWorkflowStepCache,
+    SQLiteWorkflowStepCache,
+    TieredWorkflowStepCache,
+    WorkflowCachedStepResult,
+    WorkflowStepCache,
+    require_workflow_step_cache,
+    workflow_step_cache_key,
+)
+
+STRATEGY_ID = UUID("a7b8c9d0-e1f2-4a3b-8c4d-5e6f7a8b9c0d")
+
+EVENT_ID = UUID("b8c9d0e1-f2a3-4b4c-9d5e-6f7a8b9c0d1e")
+
+CACHED_AT = datetime(2026, 8, 18, 12, 0, tzinfo=UTC)
+
+METADATA = StrategyMetadata(
+    id=STRATEGY_ID,
+    name="Summarize",
+    description="Summarize the bound input.",
+)
+
+
+class Clock:
+    """Return a manually advanced time."""
+
+    def __init__(self) -> None:
+        self.now = CACHED_AT
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+CacheFactory = Callable[[Path, Clock, int | None, float | None], WorkflowStepCache]
+
+
+@pytest.fixture(
+    params=(
+        lambda path, clock, max_entries, ttl_seconds: InMemoryWorkflowStepCache(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            clock=clock,
+        ),
+        lambda path, clock, max_entries, ttl_seconds: SQLiteWorkflowStepCache(
+            path / "cache.db",
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            clock=clock,
+        ),
+    ),
+    ids=("memory", "sqlite"),
+)
+def create_cache(
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+) -> Callable[..., WorkflowStepCache]:
+    """Return a factory for each cache implementation."""
+
+    factory: CacheFactory = request.param
+
+    def create(
+        *,
+        clock: Clock | None = None,
+        max_entries: int | None = None,
+        ttl_seconds: float | None = None,
+    ) -> WorkflowStepCache:
+        return require_workflow_step_cache(
+            factory(
+                tmp_path,
+                clock if clock is not None else Clock(),
+                max_entries,
+                ttl_seconds,
+            )
+        )
+
+    return create
+
+
+def bound(value: str) -> Context:
+    """Return a step context with one bound workflow input."""
+
+    return Context(
+        events=(
+            ContextEvent(
+                event_type="workflow.input.bound",
+                payload={"name": "text", "value": value},
+                producer="workflow-runner",
+            ),
+        ),
+    )
+
+
+def create_result(key: str) -> WorkflowCachedStepResult:
+    """Create a cached result for one key."""
+
+    return WorkflowCachedStepResult(
+        key=key,
+        strategy_id=STRATEGY_ID,
+        strategy_name=METADATA.name,
+        strategy_version=METADATA.version,
+        output=f"summary of {key}",
+        events=(
+            ContextEvent(
+                id=EVENT_ID,
+                event_type="summary.created",
+                producer="test",
+                occurred_at=CACHED_AT,
+            ),
+        ),
+        started_at=CACHED_AT,
+        completed_at=CACHED_AT,
+        cached_at=CACHED_AT,
+    )
+
+
+def test_cache_keys_ignore_event_identity_and_time() -> None:
+    first = bound("hello")
+    second = bound("hello")
+
+    assert first.events[0].id != second.events[0].id
+    assert workflow_step_cache_key(METADATA, first) == workflow_step_cache_key(METADATA, second)
+
+
+def test_cache_keys_depend_on_inputs_and_strategy_version() -> None:
+    key = workflow_step_cache_key(METADATA, bound("hello"))
+
+    assert workflow_step_cache_key(METADATA, bound("goodbye")) != key
+    assert (
+        workflow_step_cache_key(
+            METADATA.model_copy(update={"version": "2.0.0"}),
+            bound("hello"),
+        )
+        != key
+    )
+
+
+def test_cache_keys_depend_on_the_bound_model() -> None:
+    key = workflow_step_cache_key(METADATA, bound("hello"), model="test/large")
+
+    assert workflow_step_cache_key(METADATA, bound("hello"), model="test/small") != key
+    assert workflow_step_cache_key(METADATA, bound("hello")) != key
+
+
+def test_cached_results_replay_produced_events_onto_a_new_context() -> None:
+    original = bound("hello")
+    execution = ExecutionResult(
+        strategy_id=STRATEGY_ID,
+        strategy_name=METADATA.name,
+        strategy_version=METADATA.version,
+        output="summary",
+        metrics=StrategyExecutionMetrics(estimated_cost_usd=0.25),
+        initial_context=original,
+        produced_events=create_result("a").events[:1],
+        started_at=CACHED_AT,
+        completed_at=CACHED_AT,
+    )
+
+    cached = WorkflowCachedStepResult.from_execution(
+        "a",
+        execution,
+        cached_at=CACHED_AT,
+    )
+    replayed_at = CACHED_AT + timedelta(hours=1)
+    replayed = cached.replay(bound("hello"), occurred_at=replayed_at)
+
+    assert cached.events == create_result("a").events
+    assert replayed.output == "summary"
+    assert replayed.metrics == StrategyExecutionMetrics(estimated_cost_usd=0.25)
+    assert [
+        (event.event_type, event.producer, event.payload, event.provenance)
+        for event in replayed.final_context.events[1:]
+    ] == [
+        (event.event_type, event.producer, event.payload, str(event.id)) for event in cached.events
+    ]
+    assert all(event.occurred_at == replayed_at for event in replayed.produced_events)
+
+
+def test_cached_results_replay_independent_outputs() -> None:
+    execution = ExecutionResult(
+        strategy_id=STRATEGY_ID,
+        strategy_name=METADATA.name,
+        strategy_version=METADATA.version,
+        output={"records": [{"id": 1}]},
+        initial_context=bound("hello"),
+        started_at=CACHED_AT,
+        completed_at=CACHED_AT,
+    )
+    cached = WorkflowCachedStepResult.from_execution(
+        "a",
+        execution,
+        cached_at=CACHED_AT,
+    )
+
+    first = cached.replay(bound("hello"))
+    second = cached.replay(bound("hello"))
+    assert isinstance(first.output, dict)
+    assert isinstance(first.output["records"], list)
+    first.output["records"].append({"id": 2})
+
+    assert second.output == {"records": [{"id": 1}]}
+    assert cached.output == {"records": [{"id": 1}]}
+
+
+def test_caches_return_stored_results(
+    create_cache: Callable[..., WorkflowStepCache],
+) -> None:
+    cache = create_cache()
+
+    cache.put(create_result("a"))
+
+    assert cache.get("a") == create_result("a")
+    assert cache.get("b") is None
+
+
+def test_caches_evict_least_recently_used_entries(
+    create_cache: Callable[..., WorkflowStepCache],
+) -> None:
+    cache = create_cache(max_entries=2)
+
+    cache.put(create_result("a"))
+    cache.put(create_result("b"))
+    cache.get("a")
+    cache.put(create_result("c"))
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_caches_expire_entries_after_their_ttl(
+    create_cache: Callable[..., WorkflowStepCache],
+) -> None:
+    clock = Clock()
+    cache = create_cache(clock=clock, ttl_seconds=60.0)
+
+    cache.put(create_result("a"))
+    clock.now = CACHED_AT + timedelta(seconds=59)
+
+    assert cache.get("a") is not None
+
+    clock.now = CACHED_AT + timedelta(seconds=60)
+
+    assert cache.get("a") is None
+
+
+def test_caches_reject_invalid_limits() -> None:
+    with pytest.raises(
+        ValueError,
+        match="max_entries must be at least 1",
+    ):
+        InMemoryWorkflowStepCache(max_entries=0)
+
+    with pytest.raises(
+        ValueError,
+        match="ttl_seconds must be positive",
+    ):
+        InMemoryWorkflowStepCache(ttl_seconds=0.0)
+
+
+def test_sqlite_caches_survive_reconstruction(
+    tmp_path: Path,
+) -> None:
+    SQLiteWorkflowStepCache(tmp_path / "cache.db").put(create_result("a"))
+
+    assert SQLiteWorkflowStepCache(tmp_path / "cache.db").get("a") == create_result("a")
+
+
+def test_tiered_caches_promote_slower_hits(
+    tmp_path: Path,
+) -> None:
+    memory = InMemoryWorkflowStepCache()
+    sqlite = SQLiteWorkflowStepCache(tmp_path / "cache.db")
+
+    sqlite.put(create_result("a"))
+
+    cache = TieredWorkflowStepCache(memory, sqlite)
+
+    assert cache.get("a") == create_result("a")
+    assert memory.get("a") == create_result("a")
+
+    cache.put(create_result("b"))
+
+    assert memory.get("b") is not None
+    assert sqlite.get("b") is not None
+
+
+def test_tiered_caches_require_a_tier() -> None:
+    with pytest.raises(
+        ValueError,
+        match="require at least one tier",
+    ):
+        TieredWorkflowStepCache()
@@ -0,0 +1,275 @@
+"""Tests for workflow step timeouts, run deadlines, and cancellation."""
+
+import asyncio
+from time import perf_counter
+from uuid import UUID
+
+import pytest
+
+from azathoth.context import Context
+from azathoth.providers import remaining_provider_time
+from azathoth.strategies import StrategyMetadata, StrategyOutcome
+from azathoth.workflows import (
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowFailurePolicy,
+    WorkflowMetadata,
+    WorkflowRetryPolicy,
+    WorkflowRun,
+    WorkflowRunner,
+    WorkflowSchedulingMode,
+    WorkflowStepFailureKind,
+    WorkflowStepStatus,
+    WorkflowValueBinding,
+)
+
+WORKFLOW_ID = UUID("e1f2a3b4-c5d6-4e7f-8091-a2b3c4d5e6f7")
+
+FIRST_STEP_ID = UUID("f2a3b4c5-d6e7-4f80-91a2-b3c4d5e6f708")
+SECOND_STEP_ID = UUID("a3b4c5d6-e7f8-4091-a2b3-c4d5e6f70819")
+
+
+class DelayedStrategy:
+    """Sleep for one configured delay per attempt."""
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        delays: tuple[float, ...],
+        fail: bool = False,
+    ) -> None:
+        self._metadata = StrategyMetadata(
+            name=name,
+            description=f"Execute the {name} step.",
+        )
+        self._delays = delays
+        self._fail = fail
+        self.calls = 0
+        self.cancelled = False
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Sleep for the delay configured for this attempt."""
+
+        delay = self._delays[min(self.calls, len(self._delays) - 1)]
+        self.calls += 1
+
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+        if self._fail:
+            raise RuntimeError(f"{self.metadata.name} failed")
+
+        return StrategyOutcome(output=self.metadata.name)
+
+
+class DeadlineProbeStrategy:
+    """Return the provider deadline visible to the strategy."""
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return StrategyMetadata(
+            name="Deadline probe",
+            description="Report the remaining provider time.",
+        )
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Return the remaining provider time."""
+
+        return StrategyOutcome(output=remaining_provider_time())
+
+
+def create_candidate(
+    *steps: WorkflowCandidateStep,
+) -> WorkflowCandidate:
+    """Create a workflow candidate from prepared steps."""
+
+    return WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Timeout workflow",
+            description="Exercise step timeouts and run deadlines.",
+        ),
+        steps=steps,
+    )
+
+
+def run_candidate(
+    candidate: WorkflowCandidate,
+    runner: WorkflowRunner | None = None,
+) -> WorkflowRun:
+    """Execute a candidate against an empty context."""
+
+    return asyncio.run(
+        (runner if runner is not None else WorkflowRunner()).run(
+            candidate,
+            Context(),
+        )
+    )
+
+
+def test_step_timeout_records_a_timeout_failure() -> None:
+    run = run_candidate(
+        create_candidate(
+            WorkflowCandidateStep(
+                id=FIRST_STEP_ID,
+                strategy=DelayedStrategy(name="Hung", delays=(5.0,)),
+                timeout_seconds=0.02,
+                failure_policy=WorkflowFailurePolicy.CONTINUE,
+            ),
+        )
+    )
+
+    step = run.steps[0]
+
+    assert step.status is WorkflowStepStatus.FAILED
+    assert step.attempts[0].failure is not None
+    assert step.attempts[0].failure.kind is WorkflowStepFailureKind.TIMEOUT
+    assert step.attempts[0].failure.exception_type == "WorkflowStepTimeoutError"
+
+
+def test_timed_out_attempts_are_retried() -> None:
+    strategy = DelayedStrategy(name="Slow once", delays=(5.0, 0.0))
+
+    run = run_candidate(
+        create_candidate(
+            WorkflowCandidateStep(
+                id=FIRST_STEP_ID,
+                strategy=strategy,
+                timeout_seconds=0.02,
+                retry_policy=WorkflowRetryPolicy(max_attempts=2),
+            ),
+        )
+    )
+
+    step = run.steps[0]
+
+    assert step.status is WorkflowStepStatus.EXECUTED
+    assert tuple(
+        attempt.failure.kind if attempt.failure is not None else None for attempt in step.attempts
+    ) == (WorkflowStepFailureKind.TIMEOUT, None)
+
+
+def test_errors_are_recorded_with_the_error_kind() -> None:
+    run = run_candidate(
+        create_candidate(
+            WorkflowCandidateStep(
+                id=FIRST_STEP_ID,
+                strategy=DelayedStrategy(name="Broken", delays=(0.0,), fail=True),
+                timeout_seconds=1.0,
+                failure_policy=WorkflowFailurePolicy.CONTINUE,
+            ),
+        )
+    )
+
+    assert run.steps[0].attempts[0].failure is not None
+    assert run.steps[0].attempts[0].failure.kind is WorkflowStepFailureKind.ERROR
+
+
+def test_run_deadline_stops_retries_and_later_steps() -> None:
+    hung = DelayedStrategy(name="Hung", delays=(5.0,))
+    later = DelayedStrategy(name="Later", delays=(0.0,))
+
+    started = perf_counter()
+
+    run = run_candidate(
+        create_candidate(
+            WorkflowCandidateStep(
+                id=FIRST_STEP_ID,
+                strategy=hung,
+                retry_policy=WorkflowRetryPolicy(max_attempts=3),
+                failure_policy=WorkflowFailurePolicy.CONTINUE,
+            ),
+            WorkflowCandidateStep(
+                id=SECOND_STEP_ID,
+                strategy=later,
+                depends_on=(FIRST_STEP_ID,),
+                failure_policy=WorkflowFailurePolicy.CONTINUE,
+            ),
+        ),
+        WorkflowRunner(run_timeout_seconds=0.05),
+    )
+
+    assert perf_counter() - started < 1.0
+    assert hung.calls == 1
+    assert later.calls == 0
+    assert tuple(
+        attempt.failure.exception_type
+        for step in run.steps
+        for attempt in step.attempts
+        if attempt.failure is not None
+    ) == ("WorkflowDeadlineExceededError", "WorkflowDeadlineExceededError")
+
+
+def test_runner_rejects_non_positive_run_timeouts() -> None:
+    with pytest.raises(
+        ValueError,
+        match="run_timeout_seconds must be positive",
+    ):
+        WorkflowRunner(run_timeout_seconds=0.0)
+
+
+def test_runner_passes_the_attempt_deadline_to_providers() -> None:
+    run = run_candidate(
+        create_candidate(
+            WorkflowCandidateStep(
+                id=FIRST_STEP_ID,
+                strategy=DeadlineProbeStrategy(),
+                outputs=(WorkflowValueBinding(name="remaining"),),
+                timeout_seconds=30.0,
+            ),
+        ),
+        WorkflowRunner(run_timeout_seconds=2.0),
+    )
+
+    remaining = run.values_named("remaining")[0].value
+
+    assert isinstance(remaining, float)
+    assert 0.0 < remaining <= 2.0
+
+
+@pytest.mark.parametrize(
+    "scheduling",
+    (
+        WorkflowSchedulingMode.CONCURRENT,
+        WorkflowSchedulingMode.DEPENDENCY_DRIVEN,
+    ),
+)
+def test_fail_workflow_failures_cancel_in_flight_siblings(
+    scheduling: WorkflowSchedulingMode,
+) -> None:
+    sibling = DelayedStrategy(name="Sibling", delays=(5.0,))
+
+    started = perf_counter()
+
+    with pytest.raises(
+        RuntimeError,
+        match="Broken failed",
+    ):
+        run_candidate(
+            create_candidate(
+                WorkflowCandidateStep(
+                    id=FIRST_STEP_ID,
+                    strategy=sibling,
+                ),
+                WorkflowCandidateStep(
+                    id=SECOND_STEP_ID,
+                    strategy=DelayedStrategy(name="Broken", delays=(0.01,), fail=True),
+                ),
+            ),
+            WorkflowRunner(scheduling=scheduling),
+        )
+
+    assert perf_counter() - started < 1.0
+    assert sibling.cancelled
@@ -250,3 +250,16 @@ def test_workflow_step_defaults_to_no_input_bindings() -> None:
     )
 
     assert step.inputs == ()
+
+
+def test_workflow_step_has_no_timeout_by_default() -> None:
+    assert create_step().timeout_seconds is None
+
+
+def test_workflow_step_rejects_non_positive_timeouts() -> None:
+    with pytest.raises(ValidationError):
+        WorkflowStepSpecification(
+            id=STEP_ID,
+            specification=create_prompt_specification(),
+            timeout_seconds=0.0,
+        )
@@ -0,0 +1,394 @@
+"""Tests for map steps consuming the streamed output of upstream steps."""
+
+import asyncio
+from dataclasses import replace
+from uuid import UUID
+
+import pytest
+from pydantic import JsonValue
+
+from azathoth.context import Context, ContextEvent
+from azathoth.strategies import (
+    StrategyElementSink,
+    StrategyMetadata,
+    StrategyOutcome,
+    StreamingStrategy,
+)
+from azathoth.tools import ToolRequirement
+from azathoth.workflows import (
+    MapStepSpecification,
+    ToolStepSpecification,
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowInputBinding,
+    WorkflowMapStrategy,
+    WorkflowMetadata,
+    WorkflowRetryPolicy,
+    WorkflowRun,
+    WorkflowRunner,
+    WorkflowSchedulingMode,
+    WorkflowSpecification,
+    WorkflowStepSpecification,
+    WorkflowValueBinding,
+    WorkflowValueReference,
+)
+
+WORKFLOW_ID = UUID("a7b8c9d0-e1f2-4a3b-8c4d-5e6f7a8b9c0d")
+
+LIST_STEP_ID = UUID("b8c9d0e1-f2a3-4b4c-9d5e-6f7a8b9c0d1e")
+EXTRACT_STEP_ID = UUID("c9d0e1f2-a3b4-4c5d-8e6f-7a8b9c0d1e2f")
+TITLE_STEP_ID = UUID("d0e1f2a3-b4c5-4d6e-9f7a-8b9c0d1e2f3a")
+
+LIST_STRATEGY_ID = UUID("e1f2a3b4-c5d6-4e7f-8a8b-9c0d1e2f3a4b")
+EXTRACT_STRATEGY_ID = UUID("f2a3b4c5-d6e7-4f8a-9b9c-0d1e2f3a4b5c")
+
+
+class ListingStrategy:
+    """Produce a list one element at a time, optionally failing once."""
+
+    def __init__(
+        self,
+        log: list[str],
+        *,
+        elements: tuple[str, ...] = ("a", "b", "c"),
+        first_attempt: tuple[str, ...] | None = None,
+    ) -> None:
+        self._metadata = StrategyMetadata(
+            id=LIST_STRATEGY_ID,
+            name="List",
+            description="List elements slowly.",
+        )
+        self._log = log
+        self._elements = elements
+        self._first_attempt = first_attempt
+        self.calls = 0
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Produce the whole list without emitting elements."""
+
+        return await self.run_streaming(context, lambda element: None)
+
+    async def run_streaming(
+        self,
+        context: Context,
+        emit: StrategyElementSink,
+    ) -> StrategyOutcome:
+        """Emit each element after a short delay, then return the list."""
+
+        self.calls += 1
+
+        if self.calls == 1 and self._first_attempt is not None:
+            for element in self._first_attempt:
+                emit(element)
+
+            raise TimeoutError("Listing was interrupted.")
+
+        for element in self._elements:
+            await asyncio.sleep(0.01)
+            self._log.append(f"emitted {element}")
+            emit(element)
+
+        self._log.append("listed")
+
+        return StrategyOutcome(
+            output=list(self._elements),
+            events=(
+                ContextEvent(
+                    event_type="test.listed",
+                    payload={"count": len(self._elements)},
+                    producer="test",
+                ),
+            ),
+        )
+
+
+class ExtractingStrategy:
+    """Upper-case the bound element and log when each element starts."""
+
+    def __init__(self, log: list[str]) -> None:
+        self._metadata = StrategyMetadata(
+            id=EXTRACT_STRATEGY_ID,
+            name="Extract",
+            description="Extract one element.",
+        )
+        self._log = log
+        self.elements: list[str] = []
+        self.bound: list[dict[str, JsonValue]] = []
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Return the upper-cased element."""
+
+        event = context.latest("workflow.input.bound")
+
+        assert event is not None
+
+        element = event.payload["value"]
+
+        assert isinstance(element, str)
+
+        self._log.append(f"extracting {element}")
+        self.elements.append(element)
+        self.bound.append(event.payload)
+
+        await asyncio.sleep(0.01)
+
+        return StrategyOutcome(
+            output=element.upper(),
+            events=(
+                ContextEvent(
+                    event_type="test.extracted",
+                    payload={"element": element, "index": event.payload["index"]},
+                    producer="test",
+                ),
+            ),
+        )
+
+
+def create_candidate(
+    producer: ListingStrategy,
+    extractor: ExtractingStrategy,
+    *,
+    streaming: bool = True,
+) -> WorkflowCandidate:
+    """Create a listing step feeding a map step that extracts every element."""
+
+    return WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="List and extract",
+            description="List elements and extract each one.",
+        ),
+        steps=(
+            WorkflowCandidateStep(
+                id=LIST_STEP_ID,
+                strategy=producer,
+                outputs=(WorkflowValueBinding(name="elements"),),
+            ),
+            WorkflowCandidateStep(
+                id=EXTRACT_STEP_ID,
+                strategy=WorkflowMapStrategy(
+                    extractor,
+                    input_name="element",
+                    streaming=streaming,
+                ),
+                depends_on=(LIST_STEP_ID,),
+                inputs=(
+                    WorkflowInputBinding(
+                        name="element",
+                        source=WorkflowValueReference(
+                            producer_step_id=LIST_STEP_ID,
+                            name="elements",
+                        ),
+                    ),
+                ),
+                outputs=(WorkflowValueBinding(name="extracted"),),
+            ),
+        ),
+    )
+
+
+def observed(run: WorkflowRun) -> tuple[object, ...]:
+    """Return the committed evidence of a run, without identifiers or timestamps."""
+
+    return (
+        run.values,
+        tuple((step.status, len(step.attempts)) for step in run.steps),
+        tuple(
+            (event.event_type, event.payload)
+            for event in run.final_context.events
+            if event.producer != "strategy-executor"
+        ),
+    )
+
+
+def test_listing_strategies_stream() -> None:
+    assert isinstance(ListingStrategy([]), StreamingStrategy)
+    assert not isinstance(ExtractingStrategy([]), StreamingStrategy)
+
+
+@pytest.mark.parametrize(
+    "scheduling",
+    tuple(WorkflowSchedulingMode),
+)
+def test_streaming_map_steps_start_elements_as_they_arrive(
+    scheduling: WorkflowSchedulingMode,
+) -> None:
+    log: list[str] = []
+
+    run = asyncio.run(
+        WorkflowRunner(scheduling=scheduling).run(
+            create_candidate(ListingStrategy(log), ExtractingStrategy(log)),
+            Context(),
+        )
+    )
+
+    assert log.index("extracting a") < log.index("listed")
+    assert log.count("extracting a") == 1
+    assert run.values_named("extracted")[0].value == ["A", "B", "C"]
+
+
+@pytest.mark.parametrize(
+    "scheduling",
+    tuple(WorkflowSchedulingMode),
+)
+def test_streamed_runs_commit_the_same_evidence(
+    scheduling: WorkflowSchedulingMode,
+) -> None:
+    runner = WorkflowRunner(scheduling=scheduling)
+
+    streamed = asyncio.run(
+        runner.run(
+            create_candidate(ListingStrategy([]), ExtractingStrategy([])),
+            Context(),
+        )
+    )
+    unstreamed = asyncio.run(
+        runner.run(
+            create_candidate(ListingStrategy([]), ExtractingStrategy([]), streaming=False),
+            Context(),
+        )
+    )
+
+    assert observed(streamed) == observed(unstreamed)
+
+
+def test_started_elements_see_the_bound_events_of_committed_elements() -> None:
+    log: list[str] = []
+    streamed = ExtractingStrategy(log)
+    unstreamed = ExtractingStrategy([])
+
+    run = asyncio.run(
+        WorkflowRunner().run(
+            create_candidate(ListingStrategy(log), streamed),
+            Context(),
+        )
+    )
+    asyncio.run(
+        WorkflowRunner().run(
+            create_candidate(ListingStrategy([]), unstreamed, streaming=False),
+            Context(),
+        )
+    )
+
+    execution = run.steps[1].execution
+    assert execution is not None
+    source = execution.initial_context.latest("workflow.input.bound")
+    assert source is not None
+
+    assert log.index("extracting a") < log.index("listed")
+    assert len(streamed.bound) == 3
+    assert {payload["source_event_id"] for payload in streamed.bound} == {str(source.id)}
+    assert [
+        {key: value for key, value in payload.items() if key != "source_event_id"}
+        for payload in streamed.bound
+    ] == [
+        {key: value for key, value in payload.items() if key != "source_event_id"}
+        for payload in unstreamed.bound
+    ]
+
+
+def test_unstreamed_map_steps_wait_for_their_input() -> None:
+    log: list[str] = []
+
+    asyncio.run(
+        WorkflowRunner().run(
+            create_candidate(ListingStrategy(log), ExtractingStrategy(log), streaming=False),
+            Context(),
+        )
+    )
+
+    assert log.index("extracting a") > log.index("listed")
+
+
+def test_elements_that_differ_from_the_committed_list_run_again() -> None:
+    extractor = ExtractingStrategy([])
+    candidate = create_candidate(
+        ListingStrategy([], first_attempt=("a", "x")),
+        extractor,
+    )
+
+    run = asyncio.run(
+        WorkflowRunner().run(
+            WorkflowCandidate(
+                metadata=candidate.metadata,
+                steps=(
+                    replace(
+                        candidate.steps[0],
+                        retry_policy=WorkflowRetryPolicy(max_attempts=2),
+                    ),
+                    candidate.steps[1],
+                ),
+            ),
+            Context(),
+        )
+    )
+
+    assert len(run.steps[0].attempts) == 2
+    assert run.values_named("extracted")[0].value == ["A", "B", "C"]
+    assert sorted(extractor.elements) == ["a", "b", "c", "x"]
+
+
+def test_streaming_map_steps_must_bind_only_their_mapped_input() -> None:
+    def tool_step(
+        step_id: UUID,
+        name: str,
+    ) -> WorkflowStepSpecification:
+        return WorkflowStepSpecification(
+            id=step_id,
+            specification=ToolStepSpecification(
+                requirement=ToolRequirement(name=name),
+            ),
+            outputs=(WorkflowValueBinding(name=name),),
+        )
+
+    with pytest.raises(ValueError, match="must bind only their mapped input"):
+        WorkflowSpecification(
+            metadata=WorkflowMetadata(
+                id=WORKFLOW_ID,
+                name="List and extract",
+                description="List elements and extract each one.",
+            ),
+            steps=(
+                tool_step(TITLE_STEP_ID, "title"),
+                tool_step(LIST_STEP_ID, "elements"),
+                WorkflowStepSpecification(
+                    id=EXTRACT_STEP_ID,
+                    specification=MapStepSpecification(
+                        specification=ToolStepSpecification(
+                            requirement=ToolRequirement(name="extract"),
+                        ),
+                        input_name="element",
+                        streaming=True,
+                    ),
+                    depends_on=(TITLE_STEP_ID, LIST_STEP_ID),
+                    inputs=(
+                        WorkflowInputBinding(
+                            name="element",
+                            source=WorkflowValueReference(
+                                producer_step_id=LIST_STEP_ID,
+                                name="elements",
+                            ),
+                        ),
+                        WorkflowInputBinding(
+                            name="title",
+                            source=WorkflowValueReference(
+                                producer_step_id=TITLE_STEP_ID,
+                                name="title",
+                            ),
+                        ),
+                    ),
+                ),
+            ),
+        )
@@ -0,0 +1,270 @@
+"""Tests for workflow runs that execute only the steps their targets need."""
+
+import asyncio
+from uuid import UUID, uuid5
+
+import pytest
+
+from azathoth.context import Context, ContextEvent
+from azathoth.evaluation import (
+    BenchmarkCase,
+    BenchmarkDataset,
+    ExpectedOutcome,
+    OutcomeComparison,
+)
+from azathoth.strategies import StrategyMetadata, StrategyOutcome
+from azathoth.workflows import (
+    WorkflowBenchmarkRunner,
+    WorkflowCandidate,
+    WorkflowCandidateStep,
+    WorkflowInputBinding,
+    WorkflowMetadata,
+    WorkflowRunner,
+    WorkflowSchedulingMode,
+    WorkflowStepSkipReason,
+    WorkflowStepStatus,
+    WorkflowValueBinding,
+    WorkflowValueReference,
+)
+
+WORKFLOW_ID = UUID("c2d3e4f5-a6b7-4c8d-9e0f-1a2b3c4d5e6f")
+DATASET_ID = UUID("d3e4f5a6-b7c8-4d9e-8f0a-2b3c4d5e6f7a")
+CASE_ID = UUID("e4f5a6b7-c8d9-4e0f-9a1b-3c4d5e6f7a8b")
+
+SOURCE_ID = UUID("f5a6b7c8-d9e0-4f1a-8b2c-4d5e6f7a8b9c")
+ANSWER_ID = UUID("a6b7c8d9-e0f1-4a2b-9c3d-5e6f7a8b9c0d")
+DIAGNOSTICS_ID = UUID("b7c8d9e0-f1a2-4b3c-8d4e-6f7a8b9c0d1e")
+REPORT_ID = UUID("c8d9e0f1-a2b3-4c4d-9e5f-7a8b9c0d1e2f")
+
+ANSWER = WorkflowValueReference(producer_step_id=ANSWER_ID, name="answer")
+
+
+class CountingStrategy:
+    """Return a configured output and count calls."""
+
+    def __init__(
+        self,
+        name: str,
+        output: str,
+    ) -> None:
+        self._metadata = StrategyMetadata(
+            id=uuid5(WORKFLOW_ID, name),
+            name=name,
+            description=f"Execute the {name} step.",
+        )
+        self._output = output
+        self.calls = 0
+
+    @property
+    def metadata(self) -> StrategyMetadata:
+        """Return strategy metadata."""
+
+        return self._metadata
+
+    async def run(self, context: Context) -> StrategyOutcome:
+        """Return the configured output."""
+
+        self.calls += 1
+
+        return StrategyOutcome(
+            output=self._output,
+            events=(
+                ContextEvent(
+                    event_type="test.step.completed",
+                    payload={"step": self.metadata.name},
+                    producer="test",
+                ),
+            ),
+        )
+
+
+def create_candidate() -> WorkflowCandidate:
+    """Create a source feeding an answer and a diagnostic side branch."""
+
+    def step(
+        step_id: UUID,
+        name: str,
+        output: str,
+        upstream_id: UUID | None = None,
+    ) -> WorkflowCandidateStep:
+        return WorkflowCandidateStep(
+            id=step_id,
+            strategy=CountingStrategy(name, output),
+            depends_on=(upstream_id,) if upstream_id is not None else (),
+            inputs=(
+                (
+                    WorkflowInputBinding(
+                        name="upstream",
+                        source=WorkflowValueReference(
+                            producer_step_id=upstream_id,
+                            name="source",
+                        ),
+                    ),
+                )
+                if upstream_id == SOURCE_ID
+                else ()
+            ),
+            outputs=(WorkflowValueBinding(name=name.lower()),),
+        )
+
+    return WorkflowCandidate(
+        metadata=WorkflowMetadata(
+            id=WORKFLOW_ID,
+            name="Answer with diagnostics",
+            description="Answer a question and report diagnostics.",
+        ),
+        steps=(
+            step(SOURCE_ID, "Source", "question"),
+            step(ANSWER_ID, "Answer", "positive", SOURCE_ID),
+            step(DIAGNOSTICS_ID, "Diagnostics", "trace", SOURCE_ID),
+            step(REPORT_ID, "Report", "report", DIAGNOSTICS_ID),
+        ),
+    )
+
+
+def calls(candidate: WorkflowCandidate) -> dict[UUID, int]:
+    """Return how often each step strategy was called."""
+
+    counts: dict[UUID, int] = {}
+
+    for step in candidate.steps:
+        assert isinstance(step.strategy, CountingStrategy)
+        counts[step.id] = step.strategy.calls
+
+    return counts
+
+
+@pytest.mark.parametrize(
+    "scheduling",
+    tuple(WorkflowSchedulingMode),
+)
+def test_targeted_runs_skip_steps_the_targets_do_not_need(
+    scheduling: WorkflowSchedulingMode,
+) -> None:
+    candidate = create_candidate()
+
+    run = asyncio.run(
+        WorkflowRunner(scheduling=scheduling).run(
+            candidate,
+            Context(),
+            targets=(ANSWER,),
+        )
+    )
+
+    assert calls(candidate) == {
+        SOURCE_ID: 1,
+        ANSWER_ID: 1,
+        DIAGNOSTICS_ID: 0,
+        REPORT_ID: 0,
+    }
+    assert tuple((step.status, step.skip_reason) for step in run.steps) == (
+        (WorkflowStepStatus.EXECUTED, None),
+        (WorkflowStepStatus.EXECUTED, None),
+        (WorkflowStepStatus.SKIPPED, WorkflowStepSkipReason.NOT_REQUIRED),
+        (WorkflowStepStatus.SKIPPED, WorkflowStepSkipReason.NOT_REQUIRED),
+    )
+    assert run.values_named("answer")[0].value == "positive"
+
+
+def test_targets_include_every_ancestor() -> None:
+    candidate = create_candidate()
+
+    asyncio.run(
+        WorkflowRunner().run(
+            candidate,
+            Context(),
+            targets=(WorkflowValueReference(producer_step_id=REPORT_ID, name="report"),),
+        )
+    )
+
+    assert calls(candidate) == {
+        SOURCE_ID: 1,
+        ANSWER_ID: 0,
+        DIAGNOSTICS_ID: 1,
+        REPORT_ID: 1,
+    }
+
+
+def test_untargeted_runs_execute_every_step() -> None:
+    candidate = create_candidate()
+
+    asyncio.run(WorkflowRunner().run(candidate, Context()))
+
+    assert set(calls(candidate).values()) == {1}
+
+
+def test_targets_must_reference_produced_values() -> None:
+    with pytest.raises(ValueError, match="must reference values produced by workflow steps"):
+        asyncio.run(
+            WorkflowRunner().run(
+                create_candidate(),
+                Context(),
+                targets=(WorkflowValueReference(producer_step_id=ANSWER_ID, name="report"),),
+            )
+        )
+
+
+def test_population_targets_are_given_per_candidate() -> None:
+    with pytest.raises(ValueError, match="must be given for every candidate"):
+        asyncio.run(
+            WorkflowRunner().run_population(
+                (create_candidate(), create_candidate()),
+                Context(),
+                targets=((ANSWER,),),
+            )
+        )
+
+
+@pytest.mark.parametrize(
+    ("prune_to_outputs", "diagnostic_calls"),
+    ((False, 1), (True, 0)),
+)
+def test_benchmarks_pruned_to_outputs_execute_only_the_steps_their_output_needs(
+    prune_to_outputs: bool,
+    diagnostic_calls: int,
+) -> None:
+    candidate = create_candidate()
+
+    result = asyncio.run(
+        WorkflowBenchmarkRunner(prune_to_outputs=prune_to_outputs).run(
+            BenchmarkDataset(
+                id=DATASET_ID,
+                name="answers",
+                description="Deterministic answers.",
+                cases=(
+                    BenchmarkCase(
+                        id=CASE_ID,
+                        input="Is this positive?",
+                        expected=ExpectedOutcome(
+                            description="Positive answer",
+                            value="positive",
+                            comparison=OutcomeComparison.EXACT,
+                        ),
+                    ),
+                ),
+            ),
+            lambda case: candidate,
+            output_name="answer",
+        )
+    )
+
+    assert result.cases[0].evaluation.passed
+    assert calls(candidate)[DIAGNOSTICS_ID] == diagnostic_calls
+    assert calls(candidate)[REPORT_ID] == diagnostic_calls
+
+
+def test_reruns_of_targeted_runs_execute_the_steps_they_skipped() -> None:
+    candidate = create_candidate()
+    runner = WorkflowRunner()
+
+    parent = asyncio.run(runner.run(candidate, Context(), targets=(ANSWER,)))
+    rerun = asyncio.run(runner.rerun(parent, candidate))
+
+    assert calls(candidate) == {
+        SOURCE_ID: 1,
+        ANSWER_ID: 1,
+        DIAGNOSTICS_ID: 1,
+        REPORT_ID: 1,
+    }
+    assert {step.status for step in rerun.steps} == {WorkflowStepStatus.EXECUTED}
+    assert rerun.values_named("report")[0].value == "report"
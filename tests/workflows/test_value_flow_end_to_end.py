@@ -125,7 +125,6 @@ class ValueFlowExecutor(StrategyExecutor):
             strategy_version=strategy.metadata.version,
             output=output,
             initial_context=context,
-            final_context=context,
             started_at=started_at,
             completed_at=completed_at,
         )
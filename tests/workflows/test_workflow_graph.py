@@ -0,0 +1,70 @@
+"""Tests for the dependency graph engine shared by workflows and candidates."""
+
+from uuid import UUID
+
+import pytest
+
+from azathoth.workflows import WorkflowGraph, WorkflowGraphCycleError
+
+A = UUID("a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d")
+B = UUID("b2c3d4e5-f6a7-4b8c-9d0e-1f2a3b4c5d6e")
+C = UUID("c3d4e5f6-a7b8-4c9d-8e1f-2a3b4c5d6e7f")
+D = UUID("d4e5f6a7-b8c9-4d0e-9f2a-3b4c5d6e7f8a")
+
+
+def test_layers_group_steps_by_longest_dependency_chain() -> None:
+    graph = WorkflowGraph.build(
+        (
+            (D, (B, C)),
+            (C, (A,)),
+            (B, ()),
+            (A, ()),
+        )
+    )
+
+    assert graph.depths == (2, 1, 0, 0)
+    assert graph.layers == ((2, 3), (1,), (0,))
+
+
+def test_upstream_steps_are_transitive() -> None:
+    graph = WorkflowGraph.build(
+        (
+            (A, ()),
+            (B, (A,)),
+            (C, (B,)),
+            (D, ()),
+        )
+    )
+
+    assert graph.is_upstream(A, C)
+    assert graph.is_upstream(B, C)
+    assert not graph.is_upstream(C, A)
+    assert not graph.is_upstream(D, C)
+    assert not graph.is_upstream(C, C)
+    assert graph.ancestor_masks[2] == 0b011
+
+
+def test_cycles_are_rejected() -> None:
+    with pytest.raises(WorkflowGraphCycleError, match="must be acyclic"):
+        WorkflowGraph.build(
+            (
+                (A, (C,)),
+                (B, (A,)),
+                (C, (B,)),
+            )
+        )
+
+
+def test_long_chains_are_analyzed_in_one_pass() -> None:
+    step_ids = tuple(UUID(int=index) for index in range(5000))
+
+    graph = WorkflowGraph.build(
+        tuple(
+            (step_id, (step_ids[index - 1],) if index else ())
+            for index, step_id in enumerate(step_ids)
+        )
+    )
+
+    assert len(graph.layers) == len(step_ids)
+    assert graph.is_upstream(step_ids[0], step_ids[-1])
+    assert graph.ancestor_masks[-1] == (1 << (len(step_ids) - 1)) - 1